@@ -1,13 +1,28 @@
 """AURORA CLI Commands.
 
 This module contains all command implementations for the AURORA CLI.
+
+Command modules are imported on attribute access so that importing a single
+command (as ``aurora_cli.main`` does on dispatch) does not load all of them.
 """
 
-from .goals import goals_command
-from .init import init_command
-from .memory import memory_group
-from .plan import plan_group
-from .spawn import spawn_command
+import importlib
+
+_LAZY_EXPORTS = {
+    "goals_command": ".goals",
+    "init_command": ".init",
+    "memory_group": ".memory",
+    "plan_group": ".plan",
+    "spawn_command": ".spawn",
+}
+
+
+def __getattr__(name: str):
+    """Lazily import command objects re-exported from this package."""
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "goals_command",
@@ -4,6 +4,8 @@ This module implements the 'aur mem' command group for memory management:
 - aur mem index: Index code files into memory store
 - aur mem search: Search indexed chunks
 - aur mem stats: Display memory store statistics
+- aur mem daemon: Manage the warm search daemon
+- aur mem convert-embeddings: Re-encode stored embeddings into another format
 
 Usage:
     aur mem index <path>
@@ -15,6 +17,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -30,7 +33,12 @@ from aurora_cli.memory_manager import IndexProgress, MemoryManager, SearchResult
 from aurora_core.metrics.query_metrics import QueryMetrics
 from aurora_lsp.languages import get_complexity_branch_types, get_config
 
-__all__ = ["memory_group", "run_indexing", "display_indexing_summary"]
+__all__ = [
+    "memory_group",
+    "run_indexing",
+    "display_indexing_summary",
+    "count_text_matches_batch",
+]
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -186,53 +194,113 @@ def _count_text_matches(symbol_name: str, workspace: Path) -> tuple[int, int, li
     Returns:
         Tuple of (file_count, total_matches, list_of_files)
     """
+    return count_text_matches_batch([symbol_name], workspace).get(symbol_name, (0, 0, []))
+
+
+def count_text_matches_batch(
+    symbol_names: list[str], workspace: Path, rg_types: Iterable[str] = ("py",)
+) -> dict[str, tuple[int, int, list[str]]]:
+    """Count text matches for several symbols with a single ripgrep run.
+
+    Runs one ``rg -w -o -n`` over the workspace with every symbol as a pattern
+    and attributes each match back to its symbol. Counts are matching lines
+    per file, the same as ``rg -w -c`` for each symbol on its own.
+
+    Args:
+        symbol_names: Names of the symbols to search
+        workspace: Workspace root directory
+        rg_types: ripgrep ``--type`` values to search (files of any of them)
+
+    Returns:
+        Dict mapping symbol name to (file_count, total_matches, top 5 files).
+        Symbols without matches (or on ripgrep failure) map to (0, 0, []).
+    """
+    import re
     import subprocess
 
-    if not symbol_name:
-        return 0, 0, []
+    symbols = list(dict.fromkeys(name for name in symbol_names if name))
+    counts: dict[str, tuple[int, int, list[str]]] = {name: (0, 0, []) for name in symbols}
+    if not symbols:
+        return counts
 
     try:
-        # Use ripgrep with word boundary, count matches per file
+        patterns = [arg for name in symbols for arg in ("-e", name)]
+        types = [arg for rg_type in dict.fromkeys(rg_types) for arg in ("--type", rg_type)]
         result = subprocess.run(
-            ["rg", "-w", "-c", "--type", "py", symbol_name, "."],
+            ["rg", "-w", "-o", "-n", "--no-heading", *types, *patterns, "."],
             cwd=workspace,
             capture_output=True,
             text=True,
             timeout=10,
         )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return counts
 
-        if result.returncode not in (0, 1):  # 1 means no matches
-            return 0, 0, []
-
-        # Parse output: each line is "file:count"
-        file_count = 0
-        total_matches = 0
-        files_list: list[str] = []
-        for line in result.stdout.strip().split("\n"):
-            if ":" in line:
-                file_count += 1
-                # Extract file path (everything before the last colon)
-                parts = line.rsplit(":", 1)
-                if len(parts) == 2:
-                    file_path = parts[0]
-                    # Normalize path (remove ./ prefix)
-                    if file_path.startswith("./"):
-                        file_path = file_path[2:]
-                    files_list.append(str(workspace / file_path))
-                    try:
-                        count = int(parts[1])
-                        total_matches += count
-                    except ValueError:
-                        total_matches += 1
-
-        return file_count, total_matches, files_list[:5]  # Return top 5 files
+    if result.returncode not in (0, 1):  # 1 means no matches
+        return counts
 
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return 0, 0, []
+    # Symbols are ripgrep regexes; map each matched text back to its pattern(s)
+    matchers: list[tuple[str, re.Pattern[str] | None]] = []
+    for name in symbols:
+        try:
+            matchers.append((name, re.compile(name)))
+        except re.error:
+            matchers.append((name, None))
+
+    # symbol -> file -> set of matching line numbers
+    lines_by_symbol: dict[str, dict[str, set[str]]] = {name: {} for name in symbols}
+    owners: dict[str, list[str]] = {}
+    for line in result.stdout.splitlines():
+        # Output: "file:line:matched_text"
+        parts = line.split(":", 2)
+        if len(parts) != 3:
+            continue
+        file_path, line_number, text = parts
+        owned = owners.get(text)
+        if owned is None:
+            owned = owners[text] = [
+                name
+                for name, matcher in matchers
+                if (matcher.fullmatch(text) if matcher else name == text)
+            ]
+        for name in owned:
+            lines_by_symbol[name].setdefault(file_path, set()).add(line_number)
+
+    for name, by_file in lines_by_symbol.items():
+        if not by_file:
+            continue
+        files_list = [
+            str(workspace / (path[2:] if path.startswith("./") else path)) for path in by_file
+        ]
+        total_matches = sum(len(line_numbers) for line_numbers in by_file.values())
+        counts[name] = (len(by_file), total_matches, files_list[:5])  # Top 5 files
+
+    return counts
+
+
+# Maximum in-flight LSP reference requests while enriching search results
+_LSP_CONCURRENCY = 4
+
+
+def _empty_usage() -> dict[str, Any]:
+    """Usage data for results that are not enriched."""
+    return {
+        "used_by": "-",
+        "used_by_full": "-",
+        "top_files": [],
+        "files": 0,
+        "refs": 0,
+        "complexity": -1,
+        "risk": "-",
+    }
 
 
 def _get_lsp_usage(
-    file_path: str, line_start: int, symbol_name: str = "", line_end: int = 0
+    file_path: str,
+    line_start: int,
+    symbol_name: str = "",
+    line_end: int = 0,
+    complexity_score: float | None = None,
 ) -> dict[str, Any]:
     """Get LSP usage data for a code symbol.
 
@@ -241,6 +309,7 @@ def _get_lsp_usage(
         line_start: Starting line number (1-indexed)
         symbol_name: Name of the symbol to find column position
         line_end: Ending line number (1-indexed) for complexity calculation
+        complexity_score: Index-time complexity (0.0-1.0); re-parses the file if None
 
     Returns:
         Dict with usage data:
@@ -252,29 +321,66 @@ def _get_lsp_usage(
         - complexity: Complexity percentage
         - risk: "HIGH", "MED", "LOW", or "-"
     """
-    global _lsp_instance
+    return _get_lsp_usage_batch([(file_path, line_start, symbol_name, line_end, complexity_score)])[
+        0
+    ]
 
-    empty_result = {
-        "used_by": "-",
-        "used_by_full": "-",
-        "top_files": [],
-        "files": 0,
-        "refs": 0,
-        "complexity": -1,
-        "risk": "-",
-    }
 
-    # Only try to get LSP data for code files with valid symbol names
-    if not file_path or line_start <= 0:
-        return empty_result
+def _get_lsp_usage_batch(
+    targets: list[tuple[str, int, str, int, float | None]],
+) -> list[dict[str, Any]]:
+    """Get LSP usage data for several code symbols at once.
 
-    # Skip invalid symbol names (garbage from bad indexing)
-    if _is_garbage_symbol_name(symbol_name):
-        return empty_result
+    Enrichment cost no longer grows with one subprocess and one file parse
+    per result:
+    - LSP reference lookups run concurrently (at most _LSP_CONCURRENCY in flight)
+    - Symbols with no LSP references share one ripgrep run
+    - Complexity comes from the index-time complexity_score when available
 
-    files_affected = 0
-    total_usages = 0
-    top_files: list[str] = []
+    Args:
+        targets: (file_path, line_start, symbol_name, line_end, complexity_score)
+            per symbol; lines are 1-indexed
+
+    Returns:
+        One usage dict per target, in order (see _get_lsp_usage)
+    """
+    global _lsp_instance
+
+    usages: list[dict[str, Any]] = [_empty_usage() for _ in targets]
+
+    # Only try to get LSP data for code files with valid symbol names
+    valid = [
+        i
+        for i, (file_path, line_start, symbol_name, _, _) in enumerate(targets)
+        if file_path and line_start > 0 and not _is_garbage_symbol_name(symbol_name)
+    ]
+    if not valid:
+        return usages
+
+    files_affected = dict.fromkeys(valid, 0)
+    total_usages = dict.fromkeys(valid, 0)
+    top_files: dict[int, list[str]] = {i: [] for i in valid}
+
+    # Find column position of symbol name in its line (each file read once)
+    file_lines: dict[str, list[str]] = {}
+    lsp_targets: list[tuple[str, int, int]] = []
+    for i in valid:
+        file_path, line_start, symbol_name, _, _ = targets[i]
+        # LSP uses 0-indexed lines
+        line_0indexed = line_start - 1
+        col = 0
+        try:
+            if file_path not in file_lines:
+                file_p = Path(file_path)
+                file_lines[file_path] = file_p.read_text().splitlines() if file_p.exists() else []
+            lines = file_lines[file_path]
+            if 0 <= line_0indexed < len(lines):
+                symbol_pos = lines[line_0indexed].find(symbol_name)
+                if symbol_pos >= 0:
+                    col = symbol_pos
+        except Exception:
+            pass  # Fall back to col=0
+        lsp_targets.append((file_path, line_0indexed, col))
 
     try:
         if _lsp_instance is None:
@@ -284,74 +390,83 @@ def _get_lsp_usage(
             logger.debug("Initialized LSP for usage enrichment")
 
         # Suppress noisy logs during LSP operations
-        import logging as _logging
-
-        multilspy_logger = _logging.getLogger("multilspy")
+        multilspy_logger = logging.getLogger("multilspy")
         old_multilspy_level = multilspy_logger.level
-        multilspy_logger.setLevel(_logging.WARNING)
+        multilspy_logger.setLevel(logging.WARNING)
 
-        lsp_client_logger = _logging.getLogger("aurora_lsp.client")
+        lsp_client_logger = logging.getLogger("aurora_lsp.client")
         old_lsp_client_level = lsp_client_logger.level
-        lsp_client_logger.setLevel(_logging.ERROR)
-
-        # LSP uses 0-indexed lines
-        line_0indexed = line_start - 1
+        lsp_client_logger.setLevel(logging.ERROR)
 
-        # Find column position of symbol name in the line
-        col = 0
-        if symbol_name:
-            try:
-                # Read the line to find symbol position
-                file_p = Path(file_path)
-                if file_p.exists():
-                    lines = file_p.read_text().splitlines()
-                    if 0 <= line_0indexed < len(lines):
-                        line_content = lines[line_0indexed]
-                        symbol_pos = line_content.find(symbol_name)
-                        if symbol_pos >= 0:
-                            col = symbol_pos
-            except Exception:
-                pass  # Fall back to col=0
-
-        # Get usage summary (with suppressed multilspy logs)
+        # Get usage summaries (with suppressed multilspy logs)
         try:
-            summary = _lsp_instance.get_usage_summary(file_path, line_0indexed, col=col)
+            summaries = _lsp_instance.get_usage_summaries(
+                lsp_targets, max_concurrency=_LSP_CONCURRENCY
+            )
         finally:
             multilspy_logger.setLevel(old_multilspy_level)
             lsp_client_logger.setLevel(old_lsp_client_level)
 
-        total_usages = summary.get("total_usages", 0)
-        files_affected = summary.get("files_affected", 0)
+        for i, summary in zip(valid, summaries, strict=True):
+            total_usages[i] = summary.get("total_usages", 0)
+            files_affected[i] = summary.get("files_affected", 0)
 
-        # Extract top files from usages_by_file (sorted by usage count)
-        usages_by_file = summary.get("usages_by_file", {})
-        sorted_files = sorted(
-            usages_by_file.keys(), key=lambda f: len(usages_by_file[f]), reverse=True
-        )
-        top_files = sorted_files[:5]  # Top 5 files
+            # Extract top files from usages_by_file (sorted by usage count)
+            usages_by_file = summary.get("usages_by_file", {})
+            sorted_files = sorted(
+                usages_by_file.keys(), key=lambda f: len(usages_by_file[f]), reverse=True
+            )
+            top_files[i] = sorted_files[:5]  # Top 5 files
 
     except ImportError:
         logger.debug("aurora-lsp not available")
     except Exception as e:
         logger.debug(f"LSP usage lookup failed: {e}")
 
-    # Hybrid fallback: if LSP found 0 refs, try text search
-    text_fallback = False
-    if total_usages == 0 and symbol_name and not _is_garbage_symbol_name(symbol_name):
-        text_file_count, text_matches, text_file_list = _count_text_matches(symbol_name, Path.cwd())
-        if text_matches > 0:
-            files_affected = text_file_count
-            total_usages = text_matches
-            top_files = text_file_list  # Use text search file list
-            text_fallback = True
-            logger.debug(
-                f"Hybrid fallback for {symbol_name}: {text_matches} text matches in {text_file_count} files"
+    # Hybrid fallback: symbols with 0 LSP refs share a single text search
+    no_refs = [i for i in valid if total_usages[i] == 0]
+    text_fallback: set[int] = set()
+    if no_refs:
+        text_counts = count_text_matches_batch([targets[i][2] for i in no_refs], Path.cwd())
+        for i in no_refs:
+            symbol_name = targets[i][2]
+            text_file_count, text_matches, text_file_list = text_counts.get(
+                symbol_name, (0, 0, [])
             )
+            if text_matches > 0:
+                files_affected[i] = text_file_count
+                total_usages[i] = text_matches
+                top_files[i] = text_file_list  # Use text search file list
+                text_fallback.add(i)
+                logger.debug(
+                    f"Hybrid fallback for {symbol_name}: {text_matches} text matches in {text_file_count} files"
+                )
+
+    for i in valid:
+        file_path, line_start, _, line_end, complexity_score = targets[i]
+
+        # Complexity: index-time score if available, else re-parse the file
+        if complexity_score is not None:
+            complexity = min(int(float(complexity_score) * 100), 99)
+        else:
+            end_line = line_end if line_end > 0 else line_start + 50
+            complexity = _get_complexity(file_path, line_start, end_line)
+
+        usages[i] = _format_usage(
+            files_affected[i], total_usages[i], complexity, top_files[i], i in text_fallback
+        )
+
+    return usages
 
-    # Calculate complexity
-    end_line = line_end if line_end > 0 else line_start + 50
-    complexity = _get_complexity(file_path, line_start, end_line)
 
+def _format_usage(
+    files_affected: int,
+    total_usages: int,
+    complexity: int,
+    top_files: list[str],
+    text_fallback: bool,
+) -> dict[str, Any]:
+    """Build the usage dict shown in search results."""
     # Calculate risk
     risk = _calculate_risk(files_affected, total_usages, complexity)
 
@@ -451,6 +566,32 @@ def _start_background_model_loading() -> None:
         logger.debug("Background model loading failed to start: %s", e)
 
 
+def _load_cached_embedding_provider() -> Any:
+    """Return an EmbeddingProvider if the model is cached locally, else None.
+
+    Never triggers a model download.
+    """
+    try:
+        from aurora_context_code.semantic.model_utils import is_model_cached
+
+        if not is_model_cached():
+            logger.debug("Model not cached, indexing documents without embeddings")
+            return None
+
+        import os
+
+        os.environ["HF_HUB_OFFLINE"] = "1"
+        from aurora_context_code.semantic import EmbeddingProvider
+
+        return EmbeddingProvider()
+
+    except ImportError:
+        logger.debug("Context code package not available")
+    except Exception as e:
+        logger.debug("Embedding provider unavailable: %s", e)
+    return None
+
+
 @click.group(name="mem")
 def memory_group() -> None:
     r"""Memory management commands for indexing and searching code.
@@ -460,6 +601,8 @@ def memory_group() -> None:
         index   - Index code files into memory store
         search  - Search indexed chunks with hybrid retrieval
         stats   - Display memory store statistics
+        daemon  - Manage the warm search daemon
+        convert-embeddings - Re-encode stored embeddings into another format
 
     \b
     Examples:
@@ -497,6 +640,7 @@ def run_indexing(
     output_console: Console | None = None,
     force: bool = False,
     max_workers: int | None = None,
+    parse_processes: bool = False,
 ) -> tuple[Any, int]:
     """Run memory indexing with progress display.
 
@@ -509,6 +653,7 @@ def run_indexing(
         output_console: Console instance for output. Uses module console if None.
         force: If True, reindex all files (disable incremental mode)
         max_workers: Max parallel workers for parsing (None = auto)
+        parse_processes: Parse in worker processes instead of threads
 
     Returns:
         Tuple of (IndexStats, total_warnings) from the indexing operation
@@ -595,6 +740,7 @@ def run_indexing(
         total_files: int = 0
         files_processed: int = 0
         current_phase: str = "discovering"
+        current_throughput: float | None = None
 
         # Phase descriptions
         phase_details = {
@@ -620,24 +766,28 @@ def run_indexing(
             files_str = f"{files_processed}/{total_files} files" if total_files > 0 else ""
             table.add_row(f"Indexing files {bar} {pct:3.0f}% {files_str}")
 
-            # Phase detail line
+            # Phase detail line (with stage throughput when pipelined)
             phase_detail = phase_details.get(current_phase, "")
+            if current_throughput:
+                phase_detail = f"{phase_detail} ({current_throughput:.0f}/s)"
             table.add_row(f"  [dim]{phase_detail}[/]")
 
             return table
 
         def progress_callback(prog: IndexProgress) -> None:
-            nonlocal total_files, files_processed, current_phase
+            nonlocal total_files, files_processed, current_phase, current_throughput
 
             current_phase = prog.phase
+            current_throughput = prog.throughput
 
             # Track total files from parsing phase
             if prog.phase == "parsing" and prog.total > 0:
                 total_files = prog.total
 
             # Track files processed (only advances during parsing/git_blame)
+            # Stages run concurrently, so keep the bar monotonic
             if prog.phase in ("parsing", "git_blame"):
-                files_processed = prog.current
+                files_processed = max(files_processed, prog.current)
 
             # When complete, ensure bar shows 100%
             if prog.phase == "complete" and total_files > 0:
@@ -652,6 +802,7 @@ def run_indexing(
                 progress_callback=progress_callback,
                 max_workers=max_workers,
                 incremental=not force,
+                parse_processes=parse_processes,
             )
     finally:
         # Always remove the filter when done
@@ -695,6 +846,10 @@ def display_indexing_summary(
     if hasattr(stats, "files_deleted") and stats.files_deleted > 0:
         out.print(f"  Files cleaned:  {stats.files_deleted} [dim](deleted)[/]")
 
+    # Show embeddings reused from the embedding cache
+    if getattr(stats, "embeddings_cached", 0) > 0:
+        out.print(f"  Embeddings reused: {stats.embeddings_cached} [dim](unchanged chunks)[/]")
+
     # Show parallel worker count
     if hasattr(stats, "parallel_workers") and stats.parallel_workers > 1:
         out.print(f"  Workers used:   {stats.parallel_workers}")
@@ -754,6 +909,12 @@ def display_indexing_summary(
     default=None,
     help="Max parallel workers for parsing (default: auto, min(8, cpu_count))",
 )
+@click.option(
+    "--processes",
+    is_flag=True,
+    default=False,
+    help="Parse in worker processes instead of threads (faster on large repos)",
+)
 @click.option(
     "--type",
     "-t",
@@ -770,6 +931,7 @@ def index_command(
     db_path: Path | None,
     force: bool,
     workers: int | None,
+    processes: bool,
     content_type: str,
 ) -> None:
     r"""Index code or document files into memory store.
@@ -784,7 +946,8 @@ def index_command(
 
     \b
     Performance optimizations:
-        - Parallel file parsing (uses multiple CPU cores)
+        - Parallel file parsing (uses multiple CPU cores; --processes
+          moves parsing into worker processes for large repos)
         - Incremental indexing (only re-indexes changed files)
         - Batch embedding generation (processes chunks in batches)
 
@@ -809,6 +972,10 @@ def index_command(
         # Limit parallel workers (default: auto)
         aur mem index --workers 4
 
+        \b
+        # Parse in worker processes (large repos)
+        aur mem index --processes
+
         \b
         # Use custom database path
         aur mem index . --db-path /tmp/test.db
@@ -829,18 +996,32 @@ def index_command(
         out = Console()
         out.print(f"\n[bold blue]Indexing documents from:[/] {path}")
 
-        # Initialize store and indexer
-        store = SQLiteStore(config.get_db_path())
-        indexer = DocumentIndexer(store)
+        # Initialize store and indexer. Document chunks are embedded only when the
+        # model is already cached; otherwise they are searchable via BM25.
+        store = SQLiteStore(config.get_db_path(), embedding_format=config.embedding_format)
+        indexer = DocumentIndexer(
+            store,
+            embedding_provider=_load_cached_embedding_provider(),
+            workers=workers,
+        )
 
         try:
             # Index file or directory
             if path.is_file():
-                chunk_count = indexer.index_file(path)
-                out.print(f"[green]✓[/] Indexed {chunk_count} chunks from {path.name}")
+                chunk_count = indexer.index_file(path, force=force)
+                if indexer.stats["files_skipped"]:
+                    out.print(f"[dim]Unchanged since last index:[/] {path.name}")
+                else:
+                    out.print(f"[green]✓[/] Indexed {chunk_count} chunks from {path.name}")
             else:
-                chunk_count = indexer.index_directory(path, recursive=True)
-                out.print(f"[green]✓[/] Indexed {chunk_count} total chunks from directory")
+                chunk_count = indexer.index_directory(path, recursive=True, force=force)
+                stats = indexer.stats
+                out.print(
+                    f"[green]✓[/] Indexed {chunk_count} chunks from "
+                    f"{stats['files_indexed']} documents "
+                    f"({stats['files_skipped']} unchanged, {stats['files_failed']} failed, "
+                    f"{stats['files_removed']} removed)"
+                )
 
         except ImportError as e:
             out.print(f"[red]✗ Error:[/] {e}")
@@ -856,7 +1037,13 @@ def index_command(
 
     else:
         # Code indexing (Python files)
-        stats, total_warnings = run_indexing(path, config=config, force=force, max_workers=workers)
+        stats, total_warnings = run_indexing(
+            path,
+            config=config,
+            force=force,
+            max_workers=workers,
+            parse_processes=processes,
+        )
 
         # Determine log path for display
         db_path_resolved = Path(config.get_db_path())
@@ -963,10 +1150,6 @@ def search_command(
         # Show detailed score explanations
         aur mem search "authentication" --show-scores
     """
-    # Start background model loading immediately (before any other work)
-    # This gives the model a head start while we do other initialization
-    _start_background_model_loading()
-
     # Load configuration
     config = Config()
 
@@ -976,6 +1159,13 @@ def search_command(
 
     db_path_resolved = Path(config.get_db_path())
 
+    # Start background model loading before any other work, unless a warm
+    # search daemon will answer the query
+    from aurora_cli.search_daemon import default_socket_path
+
+    if not default_socket_path(db_path_resolved).exists():
+        _start_background_model_loading()
+
     if not db_path_resolved.exists():
         # Custom error message for missing database
         error_msg = (
@@ -1268,6 +1458,226 @@ def stats_command(_ctx: click.Context, db_path: Path | None) -> None:
         logger.debug(f"Query metrics not available: {e}")
 
 
+def _resolve_db_path(db_path: Path | None) -> Path:
+    """Resolve the memory database path from --db-path or config."""
+    if db_path:
+        return db_path.expanduser().resolve()
+    return Path(Config().get_db_path())
+
+
+@memory_group.group(name="daemon")
+def daemon_group() -> None:
+    r"""Manage the warm search daemon.
+
+    The daemon keeps the embedding model and retriever loaded for one
+    database and answers searches over a local Unix socket. While it runs,
+    'aur mem search' and the MCP tools use it automatically.
+
+    \b
+    Examples:
+        aur mem daemon start     # Start in the background
+        aur mem daemon status    # Show pid, model and cache stats
+        aur mem daemon stop      # Stop it
+    """
+
+
+@daemon_group.command(name="start")
+@click.option(
+    "--db-path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Database path (overrides config)",
+)
+@click.option(
+    "--foreground",
+    is_flag=True,
+    default=False,
+    help="Run in the foreground instead of detaching",
+)
+@click.option(
+    "--idle-timeout",
+    type=float,
+    default=None,
+    help="Exit after this many idle seconds (default: never)",
+)
+@handle_errors
+def daemon_start_command(
+    db_path: Path | None,
+    foreground: bool,
+    idle_timeout: float | None,
+) -> None:
+    """Start the search daemon for the project database."""
+    import subprocess
+    import sys
+    import time
+
+    from aurora_cli.config import _get_aurora_home
+    from aurora_cli.search_daemon import SearchDaemon, SearchDaemonClient
+
+    db_path_resolved = _resolve_db_path(db_path)
+    if not db_path_resolved.exists():
+        console.print(f"[red]Database not found:[/] {db_path_resolved}")
+        console.print("Run [cyan]aur mem index .[/] first")
+        raise click.Abort()
+
+    client = SearchDaemonClient.connect(db_path_resolved)
+    if client is not None:
+        console.print(f"[yellow]Search daemon already running[/] (pid {client.info['pid']})")
+        return
+
+    if foreground:
+        console.print(f"[dim]Serving {db_path_resolved} (Ctrl+C to stop)...[/]")
+        SearchDaemon(db_path_resolved, idle_timeout=idle_timeout).serve_forever()
+        return
+
+    log_path = _get_aurora_home() / "logs" / "search_daemon.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    cmd = [sys.executable, "-m", "aurora_cli.search_daemon", "--db-path", str(db_path_resolved)]
+    if idle_timeout:
+        cmd += ["--idle-timeout", str(idle_timeout)]
+    with open(log_path, "ab") as log_file:
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+    # Model loading dominates startup; wait for the socket to answer
+    with console.status("[cyan]Loading embedding model in search daemon...[/]"):
+        deadline = time.monotonic() + 120.0
+        while client is None and time.monotonic() < deadline:
+            if process.poll() is not None:
+                console.print(f"[red]Search daemon exited early.[/] See {log_path}")
+                raise click.Abort()
+            time.sleep(0.2)
+            client = SearchDaemonClient.connect(db_path_resolved)
+
+    if client is None:
+        console.print(f"[red]Search daemon did not become ready.[/] See {log_path}")
+        raise click.Abort()
+
+    model = "semantic + BM25" if client.info.get("model_loaded") else "BM25 only"
+    console.print(
+        f"[green]✓[/] Search daemon running (pid {client.info['pid']}, {model}) "
+        f"on {client.socket_path}"
+    )
+
+
+@daemon_group.command(name="stop")
+@click.option(
+    "--db-path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Database path (overrides config)",
+)
+@handle_errors
+def daemon_stop_command(db_path: Path | None) -> None:
+    """Stop the search daemon for the project database."""
+    from aurora_cli.search_daemon import SearchDaemonClient
+
+    client = SearchDaemonClient.connect(_resolve_db_path(db_path))
+    if client is None:
+        console.print("[dim]No search daemon running[/]")
+        return
+
+    client.shutdown()
+    console.print(f"[green]✓[/] Stopped search daemon (pid {client.info['pid']})")
+
+
+@daemon_group.command(name="status")
+@click.option(
+    "--db-path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Database path (overrides config)",
+)
+@handle_errors
+def daemon_status_command(db_path: Path | None) -> None:
+    """Show search daemon status for the project database."""
+    from aurora_cli.search_daemon import SearchDaemonClient
+
+    client = SearchDaemonClient.connect(_resolve_db_path(db_path))
+    if client is None:
+        console.print("[dim]No search daemon running[/]")
+        return
+
+    info = client.info
+    table = Table(title="Search Daemon", show_header=False)
+    table.add_column("Field", style="cyan")
+    table.add_column("Value")
+    table.add_row("PID", str(info["pid"]))
+    table.add_row("Database", info["db_path"])
+    table.add_row("Socket", str(client.socket_path))
+    table.add_row("Embedding model", info.get("model_name") or "none (BM25 only)")
+    table.add_row("Uptime", f"{info['uptime']:.0f}s")
+    table.add_row("Requests", str(info["requests"]))
+    query_cache = info.get("query_cache") or {}
+    if query_cache.get("enabled"):
+        table.add_row(
+            "Query cache",
+            f"{query_cache['size']}/{query_cache['capacity']} "
+            f"({query_cache['hit_rate']:.0%} hit rate)",
+        )
+    console.print(table)
+
+
+@memory_group.command(name="convert-embeddings")
+@click.option(
+    "--format",
+    "embedding_format",
+    type=click.Choice(["float32", "float16", "int8"]),
+    default=None,
+    help="Target format (default: storage.embedding_format from config)",
+)
+@click.option(
+    "--db-path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Database path (overrides config)",
+)
+@handle_errors
+def convert_embeddings_command(embedding_format: str | None, db_path: Path | None) -> None:
+    r"""Re-encode stored embeddings into another storage format.
+
+    Changing storage.embedding_format only affects embeddings written from
+    then on. This converts the ones already stored, so the database shrinks
+    (float16, int8) or goes back to float32 without re-indexing. Converting
+    to float32 does not restore precision lost to quantization.
+
+    \b
+    Examples:
+        # Convert to the configured storage.embedding_format
+        aur mem convert-embeddings
+
+        \b
+        # Convert to int8
+        aur mem convert-embeddings --format int8
+    """
+    from aurora_core.store import SQLiteStore
+
+    config = Config()
+    db_path_resolved = _resolve_db_path(db_path)
+    if not db_path_resolved.exists():
+        console.print(f"[red]Database not found:[/] {db_path_resolved}")
+        console.print("Run [cyan]aur mem index .[/] first")
+        raise click.Abort()
+
+    target = embedding_format or config.embedding_format
+    store = SQLiteStore(str(db_path_resolved), embedding_format=target)
+    try:
+        with console.status(f"[cyan]Re-encoding embeddings as {target}...[/]"):
+            converted = store.convert_embeddings()
+    finally:
+        store.close()
+
+    if converted:
+        console.print(f"[green]✓[/] Re-encoded {converted} embeddings as {target}")
+    else:
+        console.print(f"[dim]All embeddings are already stored as {target}[/]")
+
+
 def _display_rich_results(
     results: list[SearchResult],
     query: str,
@@ -1328,6 +1738,28 @@ def _display_rich_results(
     # Use a threshold relative to normalized semantic scores (0-1 range after min-max normalization)
     semantic_low_threshold = 0.4  # Normalized semantic score threshold
 
+    # Get LSP "Used by" data for all code chunks in one batch (includes risk and complexity)
+    code_results = [
+        result
+        for result in results
+        if result.metadata.get("type", "unknown") in ("function", "method", "class", "code")
+    ]
+    code_usages = _get_lsp_usage_batch(
+        [
+            (
+                result.file_path,
+                result.line_range[0],
+                result.metadata.get("name", "<unnamed>"),
+                result.line_range[1],
+                result.metadata.get("complexity_score"),
+            )
+            for result in code_results
+        ],
+    )
+    usage_by_result = {
+        id(result): usage for result, usage in zip(code_results, code_usages, strict=True)
+    }
+
     for result in results:
         file_path = Path(result.file_path).name  # Just filename
         element_type_full = result.metadata.get("type", "unknown")
@@ -1337,23 +1769,10 @@ def _display_rich_results(
         line_start, line_end = result.line_range
         line_range_str = f"{line_start}-{line_end}"
 
-        # Get LSP "Used by" data for code chunks (includes risk and complexity)
-        if element_type_full in ("function", "method", "class", "code"):
-            lsp_data = _get_lsp_usage(result.file_path, line_start, raw_name, line_end)
-            risk_text = lsp_data["risk"]
-            # Store full data in result for --show-scores view
-            result.metadata["_lsp_data"] = lsp_data
-        else:
-            risk_text = "-"
-            result.metadata["_lsp_data"] = {
-                "used_by": "-",
-                "used_by_full": "-",
-                "top_files": [],
-                "files": 0,
-                "refs": 0,
-                "complexity": -1,
-                "risk": "-",
-            }
+        # Store full usage data in result for --show-scores view
+        lsp_data = usage_by_result.get(id(result), _empty_usage())
+        risk_text = lsp_data["risk"]
+        result.metadata["_lsp_data"] = lsp_data
 
         # Format git time (relative)
         last_modified = result.metadata.get("last_modified")
@@ -573,6 +573,18 @@ def soar_command(
         console.print(f"[red]Error: {e}[/]")
         raise SystemExit(1)
 
+    # Serve repeated prompts (re-runs, resumed pipelines) from the local LLM cache
+    llm_cache = None
+    if cli_config and cli_config.soar_llm_cache_enabled:
+        from aurora_reasoning.llm_cache import CachingLLMClient, LLMResponseCache
+
+        llm_cache = LLMResponseCache(
+            soar_dir / "llm_cache.db",
+            ttl_hours=cli_config.soar_llm_cache_ttl_hours,
+            max_entries=cli_config.soar_llm_cache_max_entries,
+        )
+        llm_client = CachingLLMClient(llm_client, llm_cache)
+
     # Create phase callback for terminal display
     phase_callback = _create_phase_callback(tool)
 
@@ -710,6 +722,13 @@ def soar_command(
     # Show metadata
     console.print(f"\n[dim]Completed in {elapsed_time:.1f}s[/]")
 
+    if llm_cache is not None and verbose:
+        stats = llm_cache.get_stats()
+        console.print(
+            f"[dim]LLM cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['entries']} entries)[/]"
+        )
+
     # Show log path if available
     log_path = result.get("metadata", {}).get("log_path")
     if log_path:
@@ -119,6 +119,10 @@ def _apply_env_overrides(config: dict) -> None:
         else:
             raise ConfigurationError(f"AURORA_SOAR_MODEL must be 'sonnet' or 'opus', got '{val}'")
 
+    if "AURORA_SOAR_LLM_CACHE" in os.environ:
+        enabled = os.environ["AURORA_SOAR_LLM_CACHE"].lower() in ("1", "true", "yes", "on")
+        config.setdefault("soar", {}).setdefault("llm_cache", {})["enabled"] = enabled
+
 
 def load_config(path: str | Path | None = None) -> dict[str, Any]:
     """Load configuration: defaults + user overrides + env vars.
@@ -239,6 +243,15 @@ def validate_config(config: dict[str, Any]) -> list[str]:
             val = storage["timeout_seconds"]
             if not isinstance(val, (int, float)) or val <= 0:
                 errors.append(f"storage.timeout_seconds must be positive, got {val}")
+        if "embedding_format" in storage and storage["embedding_format"] not in (
+            "float32",
+            "float16",
+            "int8",
+        ):
+            errors.append(
+                "storage.embedding_format must be 'float32', 'float16' or 'int8', "
+                f"got '{storage['embedding_format']}'"
+            )
 
     # -- llm --
     llm = config.get("llm", {})
@@ -321,6 +334,18 @@ def validate_config(config: dict[str, Any]) -> list[str]:
                 errors.append(
                     f"soar.default_model must be 'sonnet' or 'opus', got '{soar['default_model']}'"
                 )
+        llm_cache = soar.get("llm_cache", {})
+        if not isinstance(llm_cache, dict):
+            errors.append("soar.llm_cache must be a dict")
+        else:
+            if "ttl_hours" in llm_cache:
+                val = llm_cache["ttl_hours"]
+                if not isinstance(val, (int, float)) or val <= 0:
+                    errors.append(f"soar.llm_cache.ttl_hours must be positive, got {val}")
+            if "max_entries" in llm_cache:
+                val = llm_cache["max_entries"]
+                if not isinstance(val, int) or val < 1:
+                    errors.append(f"soar.llm_cache.max_entries must be >= 1, got {val}")
 
     # -- spawner --
     spawner = config.get("spawner", {})
@@ -530,6 +555,10 @@ class Config:
     def db_path(self) -> str:
         return self._data.get("storage", {}).get("path", "./.aurora/memory.db")
 
+    @property
+    def embedding_format(self) -> str:
+        return self._data.get("storage", {}).get("embedding_format", "float32")
+
     @property
     def embedding_model(self) -> str:
         return self._data.get("search", {}).get(
@@ -587,6 +616,18 @@ class Config:
     def soar_default_model(self) -> str:
         return self._data.get("soar", {}).get("default_model", "sonnet")
 
+    @property
+    def soar_llm_cache_enabled(self) -> bool:
+        return self._data.get("soar", {}).get("llm_cache", {}).get("enabled", False)
+
+    @property
+    def soar_llm_cache_ttl_hours(self) -> float:
+        return self._data.get("soar", {}).get("llm_cache", {}).get("ttl_hours", 168)
+
+    @property
+    def soar_llm_cache_max_entries(self) -> int:
+        return self._data.get("soar", {}).get("llm_cache", {}).get("max_entries", 1000)
+
     @property
     def agents_auto_refresh(self) -> bool:
         return self._data.get("agents", {}).get("auto_refresh", True)
@@ -43,6 +43,10 @@ class MemoryStoreError(AuroraError):
     """Raised when memory store operations fail."""
 
 
+class SearchDaemonError(AuroraError):
+    """Raised when the warm search daemon is unreachable or a request fails."""
+
+
 class ErrorHandler:
     """Handles formatting and presenting errors to users."""
 
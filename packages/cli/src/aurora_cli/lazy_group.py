@@ -0,0 +1,67 @@
+"""Lazy subcommand loading for the AURORA CLI.
+
+Importing every command module up front pulls in rich, SOAR, the planning
+models and the LSP integrations before a single argument is parsed. Agent hooks
+invoke ``aur`` many times per session, so the root group resolves subcommands
+from a name-to-module map and only imports the module for the command that is
+actually run (or listed in ``--help``).
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+import click
+
+__all__ = ["LazyGroup"]
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommands on first use.
+
+    Args:
+        lazy_subcommands: Mapping of command name to ``"module.path:attribute"``
+            import specs. The attribute must be a ``click.Command``.
+        *args: Positional arguments forwarded to ``click.Group``.
+        **kwargs: Keyword arguments forwarded to ``click.Group``.
+
+    Example:
+        >>> @click.group(cls=LazyGroup, lazy_subcommands={"mem": "pkg.memory:memory_group"})
+        ... def cli():
+        ...     pass
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: dict[str, str] = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return eagerly registered and lazy command names, sorted."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return the named command, importing its module if it is lazy."""
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.commands[cmd_name] = self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """Import and validate the command registered under ``cmd_name``.
+
+        Raises:
+            ValueError: If the import spec does not resolve to a ``click.Command``.
+        """
+        module_name, _, attr = self.lazy_subcommands[cmd_name].partition(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy command '{cmd_name}' ({self.lazy_subcommands[cmd_name]}) "
+                f"is not a click.Command: {type(command).__name__}"
+            )
+        return command
@@ -6,17 +6,23 @@ This module implements an LLM client that pipes prompts to external CLI tools
 
 from __future__ import annotations
 
+import asyncio
 import json
 import shutil
 import subprocess
 import threading
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, NoReturn
 
 from rich.console import Console
 
-from aurora_reasoning.llm_client import LLMClient, LLMResponse, extract_json_from_text
+from aurora_reasoning.llm_client import (
+    JSON_ONLY_INSTRUCTION,
+    LLMClient,
+    LLMResponse,
+    extract_json_from_text,
+)
 
 # Console for spinner output
 _console = Console()
@@ -124,28 +130,7 @@ class CLIPipeLLMClient(LLMClient):
             RuntimeError: If CLI tool fails
 
         """
-        if not prompt or not prompt.strip():
-            raise ValueError("Prompt cannot be empty")
-
-        soar_dir = self._ensure_soar_dir()
-
-        # Build full prompt with system message if provided
-        full_prompt = prompt
-        if system:
-            full_prompt = f"{system}\n\n{prompt}"
-
-        # Write input.json (transitory placeholder, overwritten each call)
-        input_file = soar_dir / "input.json"
-        input_data = {
-            "prompt": prompt,
-            "system": system,
-            "phase": phase_name,
-            "tool": self._tool,
-        }
-        input_file.write_text(json.dumps(input_data, indent=2))
-
-        # Update state
-        self._write_state(phase_name, "running")
+        soar_dir, full_prompt = self._start_call(prompt, system, phase_name)
 
         # Pipe to tool with spinner
         # Note: Don't pass --model to claude CLI - it generates invalid Bedrock model IDs
@@ -203,85 +188,12 @@ class CLIPipeLLMClient(LLMClient):
             self._write_state(phase_name, "timeout" if "timed out" in str(error) else "failed")
             raise error
 
-        # Check for errors
         if result.returncode != 0:
-            self._write_state(phase_name, "failed")
-            # Include both stderr and stdout in error message for debugging
-            error_details = result.stderr or result.stdout or "(no output)"
-
-            # Write debug info for troubleshooting intermittent errors
-            debug_file = soar_dir / "error_debug.json"
-            debug_data = {
-                "returncode": result.returncode,
-                "stderr": result.stderr,
-                "stdout": result.stdout[:1000] if result.stdout else None,
-                "phase": phase_name,
-            }
-            debug_file.write_text(json.dumps(debug_data, indent=2))
-
-            # Try to extract error from JSON response (Claude API returns JSON errors)
-            error_msg = None
-            try:
-                # First try: parse entire output as JSON (may be multi-line)
-                # Find the first { and last } to extract JSON object
-                first_brace = error_details.find("{")
-                last_brace = error_details.rfind("}")
-                if first_brace != -1 and last_brace > first_brace:
-                    json_str = error_details[first_brace : last_brace + 1]
-                    error_json = json.loads(json_str)
-                    # Handle different JSON error formats
-                    if "error" in error_json:
-                        err = error_json["error"]
-                        if isinstance(err, dict):
-                            error_msg = f"Tool {self._tool} API error: {err.get('message', err.get('type', str(err)))}"
-                        else:
-                            error_msg = f"Tool {self._tool} API error: {err}"
-                    elif "message" in error_json:
-                        error_msg = f"Tool {self._tool} error: {error_json['message']}"
-            except (json.JSONDecodeError, KeyError, TypeError):
-                pass  # Fall back to text extraction
-
-            if error_msg is None:
-                # Fall back to text-based extraction
-                if "API Error" in error_details:
-                    # Shorten API errors - extract just the key info
-                    parts = error_details.split(":")
-                    if len(parts) >= 2:
-                        error_msg = (
-                            f"Tool {self._tool} failed: {':'.join(parts[-2:]).strip()[:200]}"
-                        )
-                    else:
-                        error_msg = f"Tool {self._tool} failed: {error_details[:200]}"
-                else:
-                    error_msg = f"Tool {self._tool} failed (exit {result.returncode}): {error_details[:200]}"
-            raise RuntimeError(error_msg)
-
-        content = result.stdout
-
-        # Write output.json (transitory placeholder, overwritten each call)
-        output_file = soar_dir / "output.json"
-        output_data = {
-            "content": content,
-            "phase": phase_name,
-            "tool": self._tool,
-        }
-        output_file.write_text(json.dumps(output_data, indent=2))
-
-        # Update state
-        self._write_state(phase_name, "complete")
-
-        # Estimate tokens using heuristic
-        input_tokens = self.count_tokens(full_prompt)
-        output_tokens = self.count_tokens(content)
+            self._raise_tool_error(
+                soar_dir, phase_name, result.returncode, result.stdout, result.stderr
+            )
 
-        return LLMResponse(
-            content=content,
-            model=self._tool,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            finish_reason="stop",
-            metadata={"tool": self._tool, "phase": phase_name},
-        )
+        return self._finish_call(soar_dir, phase_name, full_prompt, result.stdout)
 
     def generate_json(
         self,
@@ -331,6 +243,269 @@ class CLIPipeLLMClient(LLMClient):
         except ValueError as e:
             raise ValueError(f"Failed to extract JSON from response: {e}") from e
 
+    async def agenerate(
+        self,
+        prompt: str,
+        *,
+        _model: str | None = None,
+        _max_tokens: int = 4096,
+        _temperature: float = 0.7,
+        system: str | None = None,
+        phase_name: str = "unknown",
+        **_kwargs: Any,
+    ) -> LLMResponse:
+        """Generate text completion by piping to CLI tool without blocking the event loop.
+
+        Runs the tool with asyncio.create_subprocess_exec, so independent calls
+        can run concurrently on one loop. No spinner is drawn, since concurrent
+        calls would overwrite each other's terminal line.
+
+        Args:
+            prompt: The user prompt/question
+            model: Ignored (tool determines model)
+            max_tokens: Ignored (tool determines limits)
+            temperature: Ignored (tool determines temperature)
+            system: Optional system prompt (prepended to prompt)
+            phase_name: Name of current phase for state tracking
+            **kwargs: Additional parameters (ignored)
+
+        Returns:
+            LLMResponse with generated content and metadata
+
+        Raises:
+            ValueError: If prompt is empty
+            RuntimeError: If CLI tool fails or times out
+
+        """
+        soar_dir, full_prompt = self._start_call(prompt, system, phase_name)
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self._tool,
+                "-p",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError:
+            self._write_state(phase_name, "failed")
+            raise
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(full_prompt.encode("utf-8")),
+                timeout=300,
+            )
+        except asyncio.TimeoutError:
+            self._write_state(phase_name, "timeout")
+            raise RuntimeError(f"Tool {self._tool} timed out after 300 seconds") from None
+        finally:
+            # Don't leave the tool running on timeout or cancellation
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+        stdout_text = stdout.decode("utf-8", errors="replace")
+        stderr_text = stderr.decode("utf-8", errors="replace")
+        if process.returncode != 0:
+            self._raise_tool_error(
+                soar_dir, phase_name, process.returncode, stdout_text, stderr_text
+            )
+
+        return self._finish_call(soar_dir, phase_name, full_prompt, stdout_text)
+
+    async def agenerate_json(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Generate JSON-structured output through agenerate().
+
+        Args:
+            prompt: The user prompt/question (should request JSON output)
+            model: Ignored (tool determines model)
+            max_tokens: Ignored (tool determines limits)
+            temperature: Ignored (tool determines temperature)
+            system: Optional system prompt
+            **kwargs: Additional parameters (passed to agenerate)
+
+        Returns:
+            Parsed JSON object as Python dict
+
+        Raises:
+            ValueError: If prompt is empty or output is not valid JSON
+            RuntimeError: If CLI tool fails
+
+        """
+        response = await self.agenerate(
+            prompt=prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=((system or "") + JSON_ONLY_INSTRUCTION).strip(),
+            **kwargs,
+        )
+
+        try:
+            return extract_json_from_text(response.content)
+        except ValueError as e:
+            raise ValueError(f"Failed to extract JSON from response: {e}") from e
+
+    def _start_call(self, prompt: str, system: str | None, phase_name: str) -> tuple[Path, str]:
+        """Validate a request and record it before piping it to the tool.
+
+        Args:
+            prompt: The user prompt/question
+            system: Optional system prompt (prepended to prompt)
+            phase_name: Name of current phase for state tracking
+
+        Returns:
+            Tuple of (soar directory, full prompt to pipe)
+
+        Raises:
+            ValueError: If prompt is empty
+
+        """
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+
+        soar_dir = self._ensure_soar_dir()
+
+        # Build full prompt with system message if provided
+        full_prompt = prompt
+        if system:
+            full_prompt = f"{system}\n\n{prompt}"
+
+        # Write input.json (transitory placeholder, overwritten each call)
+        input_file = soar_dir / "input.json"
+        input_data = {
+            "prompt": prompt,
+            "system": system,
+            "phase": phase_name,
+            "tool": self._tool,
+        }
+        input_file.write_text(json.dumps(input_data, indent=2))
+
+        # Update state
+        self._write_state(phase_name, "running")
+
+        return soar_dir, full_prompt
+
+    def _raise_tool_error(
+        self,
+        soar_dir: Path,
+        phase_name: str,
+        returncode: int,
+        stdout: str | None,
+        stderr: str | None,
+    ) -> NoReturn:
+        """Record a failed tool run and raise a readable error.
+
+        Args:
+            soar_dir: Directory for JSON placeholder files
+            phase_name: Name of current phase for state tracking
+            returncode: Exit code of the tool
+            stdout: Captured standard output
+            stderr: Captured standard error
+
+        Raises:
+            RuntimeError: Always, with the most specific message that can be extracted
+
+        """
+        self._write_state(phase_name, "failed")
+        # Include both stderr and stdout in error message for debugging
+        error_details = stderr or stdout or "(no output)"
+
+        # Write debug info for troubleshooting intermittent errors
+        debug_file = soar_dir / "error_debug.json"
+        debug_data = {
+            "returncode": returncode,
+            "stderr": stderr,
+            "stdout": stdout[:1000] if stdout else None,
+            "phase": phase_name,
+        }
+        debug_file.write_text(json.dumps(debug_data, indent=2))
+
+        # Try to extract error from JSON response (Claude API returns JSON errors)
+        error_msg = None
+        try:
+            # First try: parse entire output as JSON (may be multi-line)
+            # Find the first { and last } to extract JSON object
+            first_brace = error_details.find("{")
+            last_brace = error_details.rfind("}")
+            if first_brace != -1 and last_brace > first_brace:
+                json_str = error_details[first_brace : last_brace + 1]
+                error_json = json.loads(json_str)
+                # Handle different JSON error formats
+                if "error" in error_json:
+                    err = error_json["error"]
+                    if isinstance(err, dict):
+                        error_msg = f"Tool {self._tool} API error: {err.get('message', err.get('type', str(err)))}"
+                    else:
+                        error_msg = f"Tool {self._tool} API error: {err}"
+                elif "message" in error_json:
+                    error_msg = f"Tool {self._tool} error: {error_json['message']}"
+        except (json.JSONDecodeError, KeyError, TypeError):
+            pass  # Fall back to text extraction
+
+        if error_msg is None:
+            # Fall back to text-based extraction
+            if "API Error" in error_details:
+                # Shorten API errors - extract just the key info
+                parts = error_details.split(":")
+                if len(parts) >= 2:
+                    error_msg = f"Tool {self._tool} failed: {':'.join(parts[-2:]).strip()[:200]}"
+                else:
+                    error_msg = f"Tool {self._tool} failed: {error_details[:200]}"
+            else:
+                error_msg = f"Tool {self._tool} failed (exit {returncode}): {error_details[:200]}"
+        raise RuntimeError(error_msg)
+
+    def _finish_call(
+        self, soar_dir: Path, phase_name: str, full_prompt: str, content: str
+    ) -> LLMResponse:
+        """Record a successful tool run and build its response.
+
+        Args:
+            soar_dir: Directory for JSON placeholder files
+            phase_name: Name of current phase for state tracking
+            full_prompt: Prompt that was piped to the tool
+            content: Tool output
+
+        Returns:
+            LLMResponse with the tool output and estimated token counts
+
+        """
+        # Write output.json (transitory placeholder, overwritten each call)
+        output_file = soar_dir / "output.json"
+        output_data = {
+            "content": content,
+            "phase": phase_name,
+            "tool": self._tool,
+        }
+        output_file.write_text(json.dumps(output_data, indent=2))
+
+        # Update state
+        self._write_state(phase_name, "complete")
+
+        # Estimate tokens using heuristic
+        input_tokens = self.count_tokens(full_prompt)
+        output_tokens = self.count_tokens(content)
+
+        return LLMResponse(
+            content=content,
+            model=self._tool,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            finish_reason="stop",
+            metadata={"tool": self._tool, "phase": phase_name},
+        )
+
     def count_tokens(self, text: str) -> int:
         """Estimate token count for text.
 
@@ -12,26 +12,29 @@ import sys
 from pathlib import Path
 
 import click
-from rich.console import Console
-
-from aurora_cli.commands.agents import agents_group
-from aurora_cli.commands.budget import budget_group
-from aurora_cli.commands.doctor import doctor_command
-from aurora_cli.commands.friction import friction_group
-from aurora_cli.commands.goals import goals_command
-from aurora_cli.commands.init import init_command
-from aurora_cli.commands.memory import memory_group
-from aurora_cli.commands.plan import plan_group
-from aurora_cli.commands.soar import soar_command
-from aurora_cli.commands.spawn import spawn_command
+
+from aurora_cli.lazy_group import LazyGroup
 
 __all__ = ["cli"]
 
-console = Console()
 logger = logging.getLogger(__name__)
 
 AURORA_VERSION = "0.17.6"
 
+# Subcommands are imported on first use; see aurora_cli.lazy_group
+LAZY_SUBCOMMANDS = {
+    "agents": "aurora_cli.commands.agents:agents_group",
+    "budget": "aurora_cli.commands.budget:budget_group",
+    "doctor": "aurora_cli.commands.doctor:doctor_command",
+    "friction": "aurora_cli.commands.friction:friction_group",
+    "goals": "aurora_cli.commands.goals:goals_command",
+    "init": "aurora_cli.commands.init:init_command",
+    "mem": "aurora_cli.commands.memory:memory_group",
+    "plan": "aurora_cli.commands.plan:plan_group",
+    "soar": "aurora_cli.commands.soar:soar_command",
+    "spawn": "aurora_cli.commands.spawn:spawn_command",
+}
+
 
 def _version_callback(ctx: click.Context, param: click.Parameter, value: bool) -> None:
     """Show version info and exit."""
@@ -76,8 +79,11 @@ def _show_first_run_welcome_if_needed() -> None:
     Checks for the presence of a .aurora directory and config file.
     If neither exists, displays a welcome message guiding the user to run 'aur init'.
     """
+    from rich.console import Console
+
     from aurora_cli.config import _get_aurora_home
 
+    console = Console()
     aurora_home = _get_aurora_home()
     config_path = aurora_home / "config.json"
 
@@ -92,7 +98,11 @@ def _show_first_run_welcome_if_needed() -> None:
         console.print("For help with any command, use [cyan]aur <command> --help[/]\n")
 
 
-@click.group(invoke_without_command=True)
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands=LAZY_SUBCOMMANDS,
+    invoke_without_command=True,
+)
 @click.option(
     "--verbose",
     "-v",
@@ -146,18 +156,5 @@ def cli(ctx: click.Context, verbose: bool, debug: bool) -> None:
         _show_first_run_welcome_if_needed()
 
 
-# Register commands
-cli.add_command(agents_group)
-cli.add_command(budget_group)
-cli.add_command(doctor_command)
-cli.add_command(friction_group)
-cli.add_command(goals_command)
-cli.add_command(init_command)
-cli.add_command(memory_group)
-cli.add_command(plan_group)
-cli.add_command(soar_command)
-cli.add_command(spawn_command)
-
-
 if __name__ == "__main__":
     cli()
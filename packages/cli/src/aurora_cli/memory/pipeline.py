@@ -0,0 +1,230 @@
+"""Bounded-queue stage pipeline for memory indexing.
+
+Runs a chain of stages concurrently, each in its own worker thread(s), with a
+bounded queue between consecutive stages. A slow stage fills its input queue,
+which blocks the upstream stage (backpressure), so memory stays bounded while
+every stage keeps working. Wall time approaches the slowest stage rather than
+the sum of all stages.
+
+Stages are plain callables ``process(item, emit)``; ``emit`` hands a result to
+the next stage (blocking while its queue is full). An optional
+``finish(emit)`` runs once after the stage has drained its input, e.g. to
+flush a partially filled batch.
+
+Example:
+    >>> pipeline = StagePipeline(
+    ...     [
+    ...         PipelineStage("parse", parse_file, workers=4),
+    ...         PipelineStage("embed", embed_batch),
+    ...     ]
+    ... )
+    >>> pipeline.run(files)
+    >>> pipeline.stats["embed"].throughput
+
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from queue import Queue
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+Emit = Callable[[Any], None]
+
+# End-of-stream marker passed between stages
+_SENTINEL = object()
+
+
+@dataclass
+class PipelineStage:
+    """A pipeline stage.
+
+    Attributes:
+        name: Stage name (used for stats and thread names)
+        process: Called as ``process(item, emit)`` for every input item. May
+            return the number of units processed (default 1) for throughput.
+        finish: Optional ``finish(emit)`` called once after all input is processed
+        workers: Number of worker threads for this stage
+        queue_size: Capacity of this stage's input queue
+
+    """
+
+    name: str
+    process: Callable[[Any, Emit], int | None]
+    finish: Callable[[Emit], None] | None = None
+    workers: int = 1
+    queue_size: int = 4
+
+
+@dataclass
+class StageStats:
+    """Throughput statistics for a pipeline stage.
+
+    Attributes:
+        name: Stage name
+        items: Units processed so far
+        busy_seconds: Time spent inside ``process`` (summed over workers)
+        started_at: Monotonic time the stage processed its first item
+
+    """
+
+    name: str
+    items: int = 0
+    busy_seconds: float = 0.0
+    started_at: float | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def throughput(self) -> float:
+        """Units per second since the stage started."""
+        if self.started_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self.started_at
+        return self.items / elapsed if elapsed > 0 else 0.0
+
+    def record(self, units: int, started: float, busy: float) -> None:
+        """Record processed units (thread-safe)."""
+        with self._lock:
+            if self.started_at is None:
+                self.started_at = started
+            self.items += units
+            self.busy_seconds += busy
+
+
+class StagePipeline:
+    """Run stages concurrently with bounded queues between them.
+
+    If any stage raises, the pipeline stops feeding new work, the remaining
+    items are drained without processing, and ``run()`` re-raises the first
+    exception after all worker threads have exited.
+    """
+
+    def __init__(self, stages: list[PipelineStage]):
+        """Initialize the pipeline.
+
+        Args:
+            stages: Stages in order; output of stage N is input of stage N+1
+
+        Raises:
+            ValueError: If no stages are given or a stage has < 1 worker
+
+        """
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        for stage in stages:
+            if stage.workers < 1:
+                raise ValueError(f"Stage {stage.name} needs >= 1 worker, got {stage.workers}")
+
+        self.stages = stages
+        self.stats = {stage.name: StageStats(stage.name) for stage in stages}
+        self._queues: list[Queue[Any]] = [Queue(maxsize=stage.queue_size) for stage in stages]
+        self._failed = threading.Event()
+        self._error: BaseException | None = None
+        self._error_lock = threading.Lock()
+
+    def run(self, items: Iterable[Any]) -> None:
+        """Feed items through all stages and wait for completion.
+
+        Args:
+            items: Input items for the first stage
+
+        Raises:
+            Exception: The first exception raised by any stage (or the input iterable)
+
+        """
+        threads: list[threading.Thread] = []
+        for index, stage in enumerate(self.stages):
+            remaining = [stage.workers]
+            remaining_lock = threading.Lock()
+            for worker in range(stage.workers):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(index, remaining, remaining_lock),
+                    name=f"pipeline-{stage.name}-{worker}",
+                    daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+
+        first = self._queues[0]
+        try:
+            for item in items:
+                if self._failed.is_set():
+                    break
+                first.put(item)
+        except BaseException as e:
+            self._set_error(e)
+        finally:
+            for _ in range(self.stages[0].workers):
+                first.put(_SENTINEL)
+            for thread in threads:
+                thread.join()
+
+        for stats in self.stats.values():
+            logger.debug(
+                f"Pipeline stage {stats.name}: {stats.items} items, "
+                f"{stats.busy_seconds:.2f}s busy, {stats.throughput:.1f}/s",
+            )
+
+        if self._error is not None:
+            raise self._error
+
+    def _set_error(self, error: BaseException) -> None:
+        """Record the first failure and stop processing."""
+        with self._error_lock:
+            if self._error is None:
+                self._error = error
+        self._failed.set()
+
+    def _worker(self, index: int, remaining: list[int], remaining_lock: threading.Lock) -> None:
+        """Worker loop for one thread of stage ``index``."""
+        stage = self.stages[index]
+        stats = self.stats[stage.name]
+        inbox = self._queues[index]
+        outbox = self._queues[index + 1] if index + 1 < len(self._queues) else None
+
+        def emit(result: Any) -> None:
+            if outbox is not None and not self._failed.is_set():
+                outbox.put(result)
+
+        while True:
+            item = inbox.get()
+            if item is _SENTINEL:
+                break
+            if self._failed.is_set():
+                continue  # Drain without processing so upstream never blocks
+            started = time.monotonic()
+            try:
+                units = stage.process(item, emit)
+            except BaseException as e:
+                logger.debug(f"Pipeline stage {stage.name} failed: {e}")
+                self._set_error(e)
+                continue
+            stats.record(1 if units is None else units, started, time.monotonic() - started)
+
+        # Last worker of this stage flushes and signals the next stage
+        with remaining_lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if not last:
+            return
+
+        if stage.finish is not None and not self._failed.is_set():
+            try:
+                stage.finish(emit)
+            except BaseException as e:
+                logger.debug(f"Pipeline stage {stage.name} failed during finish: {e}")
+                self._set_error(e)
+
+        if outbox is not None:
+            for _ in range(self.stages[index + 1].workers):
+                outbox.put(_SENTINEL)
+
+
+__all__ = ["PipelineStage", "StagePipeline", "StageStats"]
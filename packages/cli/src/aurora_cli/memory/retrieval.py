@@ -66,6 +66,29 @@ class MemoryRetriever:
         self._store = store
         self._config = config
         self._retriever: Any = None  # Lazy-loaded HybridRetriever
+        self._daemon: Any = None  # SearchDaemonClient when a warm daemon is running
+        self._daemon_checked = False
+
+    def _get_daemon_client(self) -> Any:
+        """Get a client for a running search daemon serving this store.
+
+        Checked once per retriever; returns None when no daemon is running,
+        so callers fall back to in-process retrieval.
+
+        Returns:
+            SearchDaemonClient or None
+
+        """
+        if not self._daemon_checked:
+            self._daemon_checked = True
+            db_path = getattr(self._store, "db_path", None)
+            if isinstance(db_path, str) and db_path != ":memory:":
+                from aurora_cli.search_daemon import SearchDaemonClient
+
+                self._daemon = SearchDaemonClient.connect(db_path)
+                if self._daemon is not None:
+                    logger.debug("Using search daemon at %s", self._daemon.socket_path)
+        return self._daemon
 
     def _get_retriever(self) -> Any:
         """Get or create the HybridRetriever instance.
@@ -185,6 +208,10 @@ class MemoryRetriever:
             True if embedding model is ready for use, False otherwise
 
         """
+        daemon = self._get_daemon_client()
+        if daemon is not None:
+            return bool(daemon.info.get("model_loaded"))
+
         try:
             from aurora_context_code.semantic.model_utils import BackgroundModelLoader
 
@@ -351,20 +378,23 @@ class MemoryRetriever:
         start_time = time.time()
 
         try:
-            retriever = self._get_retriever_with_mode(wait_for_model=wait_for_model)
-
             # Use config threshold if not specified
             threshold = min_semantic_score
             if threshold is None:
                 threshold = self._config.search_min_semantic_score if self._config else 0.7
 
-            # Retrieve chunks using hybrid retriever
-            results = retriever.retrieve(
-                query,
-                top_k=limit,
-                min_semantic_score=threshold,
-                chunk_type=chunk_type,
-            )
+            # Prefer a warm search daemon; fall back to in-process retrieval
+            results = self._retrieve_via_daemon(query, limit, threshold, chunk_type)
+            if results is None:
+                retriever = self._get_retriever_with_mode(wait_for_model=wait_for_model)
+
+                # Retrieve chunks using hybrid retriever
+                results = retriever.retrieve(
+                    query,
+                    top_k=limit,
+                    min_semantic_score=threshold,
+                    chunk_type=chunk_type,
+                )
 
             # Record access for retrieved chunks
             if results and self._store:
@@ -372,10 +402,12 @@ class MemoryRetriever:
                     from datetime import datetime, timezone
 
                     now = datetime.now(timezone.utc)
+                    accesses = []
                     for r in results:
                         cid = r.get("chunk_id") if isinstance(r, dict) else getattr(r, "id", None)
                         if cid:
-                            self._store.record_access(cid, now, query)
+                            accesses.append((cid, now, query))
+                    self._store.record_access_batch(accesses)
                 except Exception:
                     pass
 
@@ -409,6 +441,37 @@ class MemoryRetriever:
             print(full_trace, file=sys.stderr)
             return []
 
+    def _retrieve_via_daemon(
+        self,
+        query: str,
+        limit: int,
+        threshold: float,
+        chunk_type: str | None,
+    ) -> list[Any] | None:
+        """Run the query in a warm search daemon if one is serving this store.
+
+        Returns:
+            Result dicts from the daemon, or None to retrieve in-process
+
+        """
+        daemon = self._get_daemon_client()
+        if daemon is None:
+            return None
+
+        from aurora_cli.errors import SearchDaemonError
+
+        try:
+            return daemon.search(
+                query,
+                top_k=limit,
+                min_semantic_score=threshold,
+                chunk_type=chunk_type,
+            )
+        except SearchDaemonError as e:
+            logger.debug("Search daemon failed, retrieving in-process: %s", e)
+            self._daemon = None
+            return None
+
     def retrieve_fast(
         self,
         query: str,
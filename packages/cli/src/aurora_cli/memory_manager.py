@@ -5,7 +5,8 @@ memory store and searching the indexed content. It handles progress reporting,
 file discovery, parsing, and embedding generation.
 
 Performance Optimizations:
-- Parallel file parsing with ThreadPoolExecutor
+- Pipelined parse -> git -> embed -> store stages with bounded queues
+- Parallel file parsing with worker threads
 - Batch embedding generation (32+ chunks at a time)
 - File-level git blame caching (one git call per file)
 - Incremental indexing with content hashing (skip unchanged files)
@@ -16,6 +17,7 @@ Performance Optimizations:
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import logging
@@ -24,7 +26,6 @@ import sqlite3
 import threading
 import time
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -34,8 +35,13 @@ from typing import TYPE_CHECKING, Any
 from aurora_cli.config import Config
 from aurora_cli.errors import ErrorHandler, MemoryStoreError
 from aurora_cli.ignore_patterns import load_ignore_patterns, should_ignore
+from aurora_cli.memory.pipeline import PipelineStage, StagePipeline
+from aurora_context_code.embedding_cache import EmbeddingCache
 from aurora_context_code.git import GitSignalExtractor
+from aurora_context_code.git_cache import GitBlameCache
+from aurora_context_code.parse_pool import ProcessPoolParser
 from aurora_context_code.registry import ParserRegistry, get_global_registry
+from aurora_context_code.relationships import extract_relationships
 from aurora_core.chunks import Chunk
 from aurora_core.store import SQLiteStore
 from aurora_core.types import ChunkID
@@ -56,6 +62,9 @@ _access_recorder_lock = threading.Lock()
 def get_access_recorder(store: Any) -> BackgroundAccessRecorder:
     """Get or create the singleton background access recorder.
 
+    The first call registers shutdown_access_recorder() with atexit, so
+    accesses still queued when the CLI process ends are written out.
+
     Args:
         store: Memory store for recording access
 
@@ -68,30 +77,45 @@ def get_access_recorder(store: Any) -> BackgroundAccessRecorder:
         if _access_recorder is None or _access_recorder._store != store:
             if _access_recorder is not None:
                 _access_recorder.shutdown()
+            else:
+                atexit.register(shutdown_access_recorder)
             _access_recorder = BackgroundAccessRecorder(store)
         return _access_recorder
 
 
+def shutdown_access_recorder() -> None:
+    """Flush and stop the singleton background access recorder, if any."""
+    global _access_recorder
+    with _access_recorder_lock:
+        if _access_recorder is not None:
+            _access_recorder.shutdown()
+            _access_recorder = None
+
+
 class BackgroundAccessRecorder:
     """Background worker for async access recording.
 
     Records chunk accesses in a background thread to avoid blocking search results.
     This improves search latency by ~13ms per search (for 10 results).
 
-    Access records are queued and processed asynchronously, with the worker
-    draining the queue in batches for efficiency.
+    The worker drains up to max_batch_size queued accesses at a time, drops
+    repeated hits on the same chunk from the same search, and writes the rest
+    with one store.record_access_batch() call, so a search costs one commit
+    instead of one per result. shutdown() writes whatever is still queued.
     """
 
-    def __init__(self, store: Any, max_queue_size: int = 1000):
+    def __init__(self, store: Any, max_queue_size: int = 1000, max_batch_size: int = 256):
         """Initialize the background access recorder.
 
         Args:
             store: Memory store instance (SQLiteStore)
             max_queue_size: Maximum items in queue before dropping oldest
+            max_batch_size: Maximum accesses written per transaction
 
         """
         self._store = store
         self._queue: Queue[tuple[ChunkID, datetime, str | None]] = Queue(maxsize=max_queue_size)
+        self._max_batch_size = max_batch_size
         self._shutdown = threading.Event()
         self._thread: threading.Thread | None = None
         self._start_worker()
@@ -103,24 +127,40 @@ class BackgroundAccessRecorder:
         logger.debug("Started background access recorder thread")
 
     def _worker_loop(self) -> None:
-        """Worker loop that processes access records from the queue."""
-        while not self._shutdown.is_set():
+        """Worker loop that writes queued access records in batches."""
+        while True:
+            batch = self._next_batch()
+            if batch:
+                self._write_batch(batch)
+            elif self._shutdown.is_set():
+                # Queue drained after shutdown was requested
+                break
+
+    def _next_batch(self) -> list[tuple[ChunkID, datetime, str | None]]:
+        """Wait for the next access, then drain the queue up to the batch size."""
+        try:
+            # Wait for items with timeout to allow shutdown check
+            batch = [self._queue.get(timeout=0.05 if self._shutdown.is_set() else 0.5)]
+        except Empty:
+            return []
+        while len(batch) < self._max_batch_size:
             try:
-                # Wait for items with timeout to allow shutdown check
-                chunk_id, access_time, context = self._queue.get(timeout=0.5)
-                try:
-                    self._store.record_access(
-                        chunk_id=chunk_id,
-                        access_time=access_time,
-                        context=context,
-                    )
-                except Exception as e:
-                    logger.debug(f"Background access recording failed for {chunk_id}: {e}")
-                finally:
-                    self._queue.task_done()
+                batch.append(self._queue.get_nowait())
             except Empty:
-                # Timeout - check shutdown flag and continue
-                continue
+                break
+        return batch
+
+    def _write_batch(self, batch: list[tuple[ChunkID, datetime, str | None]]) -> None:
+        """Coalesce a drained batch and record it in one store transaction."""
+        # Same chunk, time and query means the same search hit it twice
+        accesses = list(dict.fromkeys(batch))
+        try:
+            self._store.record_access_batch(accesses)
+        except Exception as e:
+            logger.debug(f"Background access recording failed for {len(accesses)} accesses: {e}")
+        finally:
+            for _ in batch:
+                self._queue.task_done()
 
     def record_access(
         self,
@@ -141,6 +181,7 @@ class BackgroundAccessRecorder:
             if self._queue.full():
                 try:
                     self._queue.get_nowait()  # Drop oldest
+                    self._queue.task_done()
                 except Empty:
                     pass
             self._queue.put_nowait((chunk_id, access_time, context))
@@ -148,7 +189,7 @@ class BackgroundAccessRecorder:
             logger.debug(f"Failed to queue access record: {e}")
 
     def shutdown(self, timeout: float = 2.0) -> None:
-        """Shutdown the background worker.
+        """Write any queued accesses and stop the background worker.
 
         Args:
             timeout: Maximum time to wait for queue drain
@@ -239,6 +280,9 @@ def get_git_changed_files(root: Path) -> set[str] | None:
         return None
 
 
+# Document files indexed by DocumentIndexer (they share the file_index table)
+DOCUMENT_INDEX_SUFFIXES = (".pdf", ".docx")
+
 # Directory names to skip during indexing
 SKIP_DIRS = {
     ".git",
@@ -272,6 +316,8 @@ class IndexProgress:
         total: Total items in phase
         file_path: Current file being processed (if applicable)
         detail: Additional detail string (e.g., function name)
+        throughput: Items per second for pipelined phases (files for parsing/git_blame,
+            chunks for embedding/storing), if known
 
     """
 
@@ -280,6 +326,7 @@ class IndexProgress:
     total: int
     file_path: str | None = None
     detail: str | None = None
+    throughput: float | None = None
 
 
 @dataclass
@@ -295,6 +342,7 @@ class IndexStats:
         files_skipped: Number of files skipped (unchanged in incremental mode)
         files_deleted: Number of deleted files cleaned up from index
         parallel_workers: Number of parallel workers used
+        embeddings_cached: Number of chunk embeddings reused from the embedding cache
 
     """
 
@@ -306,6 +354,7 @@ class IndexStats:
     files_skipped: int = 0
     files_deleted: int = 0
     parallel_workers: int = 1
+    embeddings_cached: int = 0
 
 
 @dataclass
@@ -407,7 +456,7 @@ class MemoryManager:
                 raise ValueError("Either config or memory_store must be provided")
             db_path = config.get_db_path()
             logger.info(f"Creating SQLiteStore at {db_path}")
-            memory_store = SQLiteStore(db_path)
+            memory_store = SQLiteStore(db_path, embedding_format=config.embedding_format)
 
         self.memory_store = memory_store
         self.store = memory_store  # Alias for compatibility
@@ -442,6 +491,7 @@ class MemoryManager:
         batch_size: int = 32,
         max_workers: int | None = None,
         incremental: bool = True,
+        parse_processes: bool = False,
     ) -> IndexStats:
         """Index all code files in the given path.
 
@@ -449,11 +499,14 @@ class MemoryManager:
         and stores chunks in the memory store. Reports progress via callback.
 
         Uses optimized pipeline:
-        1. Parallel file parsing with ThreadPoolExecutor
-        2. File-level git blame caching (one git call per file, not per function)
-        3. Batch embedding generation (32 chunks at a time by default)
-        4. Incremental indexing (skip unchanged files based on mtime)
-        5. Batched database writes
+        1. Parse -> git signals -> embed -> store stages run concurrently with
+           bounded queues (backpressure), so wall time approaches the slowest stage
+        2. Parallel file parsing (max_workers threads, or worker processes
+           with parse_processes=True)
+        3. File-level git blame caching (one git call per file, not per function)
+        4. Batch embedding generation (32 chunks at a time by default)
+        5. Incremental indexing (skip unchanged files based on mtime)
+        6. Batched database writes (one transaction per embedding batch)
 
         Args:
             path: Directory or file path to index
@@ -463,6 +516,10 @@ class MemoryManager:
             batch_size: Number of chunks to embed at once (default 32)
             max_workers: Maximum parallel workers for parsing (None = auto: min(8, cpu_count))
             incremental: Skip unchanged files based on mtime (default True)
+            parse_processes: Parse in a pool of max_workers processes instead of
+                threads (default False). Scales Python-side chunk extraction
+                across cores on large repos at the cost of worker startup time;
+                workers use the built-in parsers of the global registry.
 
         Returns:
             IndexStats with indexing results
@@ -492,16 +549,20 @@ class MemoryManager:
             actual_workers = max_workers
 
         # Detect callback type (rich vs simple)
+        # Pipeline stages report from worker threads, so calls are serialized
+        progress_lock = threading.Lock()
+
         def report_progress(progress: IndexProgress) -> None:
             """Report progress, adapting to callback type."""
             if progress_callback is None:
                 return
-            try:
-                # Try rich callback first (IndexProgress)
-                progress_callback(progress)  # type: ignore
-            except TypeError:
-                # Fall back to simple callback (current, total)
-                progress_callback(progress.current, progress.total)  # type: ignore
+            with progress_lock:
+                try:
+                    # Try rich callback first (IndexProgress)
+                    progress_callback(progress)  # type: ignore
+                except TypeError:
+                    # Fall back to simple callback (current, total)
+                    progress_callback(progress.current, progress.total)  # type: ignore
 
         try:
             # Phase 1: Discover files
@@ -592,9 +653,11 @@ class MemoryManager:
             new_file_info: dict[str, dict[str, Any]] = {}
 
             # Initialize Git signal extractor for this directory
-            # The extractor now uses file-level blame caching for efficiency
+            # The extractor uses file-level blame caching for efficiency, persisted
+            # across runs next to the memory DB (only changed files are re-blamed)
+            blame_cache = self._open_blame_cache()
             try:
-                git_extractor = GitSignalExtractor()
+                git_extractor = GitSignalExtractor(blame_cache=blame_cache)
                 logger.debug(f"Initialized GitSignalExtractor for {path}")
             except Exception as e:
                 logger.warning(
@@ -602,370 +665,297 @@ class MemoryManager:
                 )
                 git_extractor = None
 
-            # Batch accumulator for embedding generation
-            pending_chunks: list[tuple[Any, str, float, int, str]] = (
-                []
-            )  # (chunk, content, bla, commit_count, file_path)
-            total_chunks_processed = 0
-
-            def flush_batch() -> None:
-                """Process accumulated chunks with batch embedding."""
-                nonlocal pending_chunks, total_chunks_processed
-                if not pending_chunks:
-                    return
-
-                batch_len = len(pending_chunks)
-
-                report_progress(
-                    IndexProgress(
-                        "embedding",
-                        total_chunks_processed,
-                        total_chunks_processed + batch_len,
-                        detail=f"Batch of {batch_len} chunks",
-                    ),
-                )
-
-                # Extract texts for batch embedding
-                texts = [content for _, content, _, _, _ in pending_chunks]
-
-                # Batch embed all chunks at once
-                embeddings = self.embedding_provider.embed_batch(texts, batch_size=batch_size)
+            # Embeddings of previously seen chunk texts (survives database resets),
+            # so only new or edited chunks are sent to the model
+            embedding_cache = self._open_embedding_cache()
 
-                report_progress(
-                    IndexProgress(
-                        "storing",
-                        total_chunks_processed,
-                        total_chunks_processed + batch_len,
-                        detail=f"Writing {batch_len} chunks to database",
+            # Phase 2: Pipelined parse -> git signals -> embed -> store
+            # Each stage runs in its own thread(s) with bounded queues in between,
+            # so parsing continues while the model encodes and SQLite writes.
+            total_to_process = len(files_to_process)
+            state_lock = threading.Lock()
+            parsed_count = 0
+            git_count = 0
+            embedded_count = 0
+            pending_chunks: list[tuple[Any, str, float, int]] = (
+                []
+            )  # (chunk, content, bla, commit_count)
+            # Call/containment edges and chunk IDs of the processed files; written
+            # once all chunks are stored (edges may point across batches)
+            relationship_edges: list[tuple[str, str, str, float]] = []
+            indexed_chunk_ids: list[str] = []
+
+            parse_workers = max(1, min(actual_workers, total_to_process))
+            process_parser: ProcessPoolParser | None = None
+            if parse_processes and total_to_process > 0:
+                # Each parse thread blocks on one worker process at a time
+                process_parser = ProcessPoolParser(max_workers=parse_workers)
+                logger.info(f"Using {parse_workers} worker processes for parsing")
+            elif parse_workers > 1:
+                logger.info(f"Using {parse_workers} parallel workers for parsing")
+            report_progress(
+                IndexProgress(
+                    "parsing",
+                    0,
+                    total_to_process,
+                    detail=(
+                        f"Parallel parsing ({parse_workers} "
+                        f"{'processes' if process_parser else 'workers'})"
                     ),
-                )
-
-                # Store each chunk with its embedding
-                for i, (chunk, _, initial_bla, commit_count, _) in enumerate(pending_chunks):
-                    chunk.embeddings = embeddings[i].tobytes()
-                    self._save_chunk_with_retry(chunk)
-                    chunk_id = chunk.id
-
-                    # Update activation with Git-derived values
-                    if initial_bla != 0.0 or commit_count > 0:
-                        try:
-                            if hasattr(self.memory_store, "_transaction"):
-                                with self.memory_store._transaction() as conn:
-                                    conn.execute(
-                                        """
-                                        UPDATE activations
-                                        SET base_level = ?, access_count = ?
-                                        WHERE chunk_id = ?
-                                        """,
-                                        (initial_bla, commit_count, chunk_id),
-                                    )
-                        except Exception as e:
-                            logger.debug(f"Could not update activation for {chunk.name}: {e}")
-
-                    stats["chunks"] += 1
-                    total_chunks_processed += 1
+                ),
+            )
 
-                pending_chunks = []
+            def parse_stage(file_path: Path, emit: Callable[[Any], None]) -> None:
+                """Parse a single file (tree-sitter is thread-safe)."""
+                nonlocal parsed_count
+                result: dict[str, Any] = {"file_path": file_path, "chunks": [], "language": None}
+                error: str | None = None
 
-            # Phase 2: Parallel file parsing
-            # Parse files in parallel using ThreadPoolExecutor
-            # This is safe because parsing is stateless and read-only
-            processed_count = 0
-            total_to_process = len(files_to_process)
+                try:
+                    if process_parser is not None:
+                        result["language"], result["chunks"] = process_parser.parse(file_path)
+                        if result["language"] is None:
+                            error = "No parser available"
+                        elif not result["chunks"]:
+                            error = "No extractable elements"
+                    else:
+                        parser = self.parser_registry.get_parser_for_file(file_path)
+                        if not parser:
+                            error = "No parser available"
+                        else:
+                            result["language"] = parser.language
+                            result["chunks"] = parser.parse(file_path)
+                            if not result["chunks"]:
+                                error = "No extractable elements"
+                except Exception as e:
+                    error = str(e).split("\n")[0][:100]
+
+                with state_lock:
+                    parsed_count += 1
+                    current = parsed_count
+                    if error == "No extractable elements":
+                        skipped_files.append((str(file_path), error))
+                    elif error:
+                        stats["errors"] += 1
+                        failed_files.append((str(file_path), error))
 
-            if actual_workers > 1 and total_to_process > 1:
-                logger.info(f"Using {actual_workers} parallel workers for parsing")
                 report_progress(
                     IndexProgress(
                         "parsing",
-                        0,
+                        current,
                         total_to_process,
-                        detail=f"Parallel parsing ({actual_workers} workers)",
+                        file_path=str(file_path.name),
+                        detail=f"Parsed {current}/{total_to_process}",
+                        throughput=pipeline.stats["parsing"].throughput,
                     ),
                 )
+                if error is None:
+                    emit(result)
+
+            def git_stage(result: dict[str, Any], emit: Callable[[Any], None]) -> None:
+                """Attach Git-derived BLA to each chunk and group chunks into batches."""
+                nonlocal git_count, pending_chunks
+                file_path = result["file_path"]
+                chunks = result["chunks"]
+                git_count += 1
+
+                if git_extractor:
+                    report_progress(
+                        IndexProgress(
+                            "git_blame",
+                            git_count,
+                            total_to_process,
+                            file_path=str(file_path.name),
+                            detail=f"Git history for {file_path.name}",
+                            throughput=pipeline.stats["git_blame"].throughput,
+                        ),
+                    )
 
-                # Define the parsing function for parallel execution
-                def parse_single_file(file_path: Path) -> dict[str, Any]:
-                    """Parse a single file and return results (thread-safe)."""
-                    result: dict[str, Any] = {
-                        "file_path": file_path,
-                        "chunks": [],
-                        "language": None,
-                        "error": None,
-                        "warning": False,
-                    }
-
-                    try:
-                        parser = self.parser_registry.get_parser_for_file(file_path)
-                        if not parser:
-                            result["error"] = "No parser available"
-                            return result
-
-                        result["language"] = parser.language
-
-                        # Parse the file (tree-sitter is thread-safe)
-                        chunks = parser.parse(file_path)
-
-                        if not chunks:
-                            result["error"] = "No extractable elements"
-                            return result
-
-                        result["chunks"] = chunks
-                        return result
-
-                    except Exception as e:
-                        result["error"] = str(e).split("\n")[0][:100]
-                        return result
-
-                # Execute parsing in parallel
-                with ThreadPoolExecutor(max_workers=actual_workers) as executor:
-                    # Submit all parsing tasks
-                    future_to_file = {
-                        executor.submit(parse_single_file, fp): fp for fp in files_to_process
-                    }
-
-                    # Process results as they complete
-                    for future in as_completed(future_to_file):
-                        file_path = future_to_file[future]
-                        processed_count += 1
-
-                        # Update progress
-                        report_progress(
-                            IndexProgress(
-                                "parsing",
-                                processed_count,
-                                total_to_process,
-                                file_path=str(file_path.name),
-                                detail=f"Parsed {processed_count}/{total_to_process}",
-                            ),
-                        )
-
-                        try:
-                            result = future.result()
-
-                            if result["error"]:
-                                if result["error"] == "No extractable elements":
-                                    skipped_files.append((str(file_path), result["error"]))
-                                else:
-                                    stats["errors"] += 1
-                                    failed_files.append((str(file_path), result["error"]))
-                                continue
-
-                            chunks = result["chunks"]
-                            lang = result["language"]
-
-                            # Git blame phase (sequential, uses cache)
-                            if git_extractor and chunks:
-                                report_progress(
-                                    IndexProgress(
-                                        "git_blame",
-                                        processed_count,
-                                        total_to_process,
-                                        file_path=str(file_path.name),
-                                        detail=f"Git history for {file_path.name}",
-                                    ),
+                try:
+                    file_chunks = []
+                    for chunk in chunks:
+                        initial_bla = 0.5
+                        commit_count = 0
+
+                        if (
+                            git_extractor
+                            and hasattr(chunk, "line_start")
+                            and hasattr(chunk, "line_end")
+                        ):
+                            try:
+                                commit_times = git_extractor.get_function_commit_times(
+                                    file_path=str(file_path),
+                                    line_start=chunk.line_start,
+                                    line_end=chunk.line_end,
                                 )
 
-                            # Process all chunks for this file
-                            for chunk in chunks:
-                                initial_bla = 0.5
-                                commit_count = 0
-
-                                if (
-                                    git_extractor
-                                    and hasattr(chunk, "line_start")
-                                    and hasattr(chunk, "line_end")
-                                ):
-                                    try:
-                                        commit_times = git_extractor.get_function_commit_times(
-                                            file_path=str(file_path),
-                                            line_start=chunk.line_start,
-                                            line_end=chunk.line_end,
-                                        )
-
-                                        if commit_times:
-                                            initial_bla = git_extractor.calculate_bla(
-                                                commit_times,
-                                                decay=0.5,
-                                            )
-                                            commit_count = len(commit_times)
-
-                                            if (
-                                                not hasattr(chunk, "metadata")
-                                                or chunk.metadata is None
-                                            ):
-                                                chunk.metadata = {}
-
-                                            chunk.metadata["git_hash"] = commit_times[0]
-                                            chunk.metadata["last_modified"] = commit_times[0]
-                                            chunk.metadata["commit_count"] = commit_count
-                                    except Exception as e:
-                                        logger.debug(
-                                            f"Could not extract Git signals for {chunk.name}: {e}",
-                                        )
-
-                                # Build content and add to batch
-                                content_to_embed = self._build_chunk_content(chunk)
-                                pending_chunks.append(
-                                    (
-                                        chunk,
-                                        content_to_embed,
-                                        initial_bla,
-                                        commit_count,
-                                        str(file_path),
-                                    ),
-                                )
+                                if commit_times:
+                                    initial_bla = git_extractor.calculate_bla(
+                                        commit_times,
+                                        decay=0.5,
+                                    )
+                                    commit_count = len(commit_times)
 
-                                # Flush batch when it reaches batch_size
-                                if len(pending_chunks) >= batch_size:
-                                    flush_batch()
+                                    if not hasattr(chunk, "metadata") or chunk.metadata is None:
+                                        chunk.metadata = {}
 
-                            stats["files"] += 1
-                            files_by_language[lang] = files_by_language.get(lang, 0) + 1
+                                    chunk.metadata["git_hash"] = commit_times[0]
+                                    chunk.metadata["last_modified"] = commit_times[0]
+                                    chunk.metadata["commit_count"] = commit_count
+                            except Exception as e:
+                                logger.debug(
+                                    f"Could not extract Git signals for {chunk.name}: {e}",
+                                )
 
-                            # Record file info for incremental indexing (hash + mtime + chunk count)
-                            try:
-                                file_key = str(file_path)
-                                new_file_info[file_key] = {
-                                    "hash": compute_file_hash(file_path),
-                                    "mtime": file_path.stat().st_mtime,
-                                    "chunk_count": len(chunks),
-                                }
-                            except OSError:
-                                pass
-
-                            logger.debug(f"Indexed {file_path}: {len(chunks)} chunks")
-
-                        except Exception as e:
-                            logger.debug(f"Failed to index {file_path}: {e}")
-                            stats["errors"] += 1
-                            error_msg = str(e).split("\n")[0][:100]
-                            failed_files.append((str(file_path), error_msg))
+                        # Build content to embed
+                        content_to_embed = self._build_chunk_content(chunk)
+                        file_chunks.append((chunk, content_to_embed, initial_bla, commit_count))
 
-            else:
-                # Sequential processing (single worker or single file)
-                for i, file_path in enumerate(files_to_process):
+                    # Record file info for incremental indexing (hash + mtime + chunk count)
+                    file_info = None
                     try:
-                        # Report parsing progress
-                        report_progress(
-                            IndexProgress(
-                                "parsing",
-                                i,
-                                total_to_process,
-                                file_path=str(file_path.name),
-                                detail=f"Parsing {file_path.name}",
-                            ),
-                        )
-
-                        # Parse file
-                        parser = self.parser_registry.get_parser_for_file(file_path)
-                        if not parser:
-                            logger.debug(f"No parser for {file_path}, skipping")
-                            continue
-
-                        chunks = parser.parse(file_path)
+                        file_info = {
+                            "hash": compute_file_hash(file_path),
+                            "mtime": file_path.stat().st_mtime,
+                            "chunk_count": len(chunks),
+                        }
+                    except OSError:
+                        pass
+                except Exception as e:
+                    logger.debug(f"Failed to index {file_path}: {e}")
+                    with state_lock:
+                        stats["errors"] += 1
+                        failed_files.append((str(file_path), str(e).split("\n")[0][:100]))
+                    return
 
-                        if not chunks:
-                            logger.debug(f"No chunks extracted from {file_path}")
-                            skipped_files.append((str(file_path), "No extractable elements"))
-                            continue
+                lang = result["language"] or "unknown"
+                with state_lock:
+                    stats["files"] += 1
+                    files_by_language[lang] = files_by_language.get(lang, 0) + 1
+                    if file_info is not None:
+                        new_file_info[str(file_path)] = file_info
+                    relationship_edges.extend(extract_relationships(chunks))
+                    indexed_chunk_ids.extend(chunk.id for chunk in chunks)
+                logger.debug(f"Indexed {file_path}: {len(chunks)} chunks")
+
+                # Hand full batches to the embedding stage
+                pending_chunks.extend(file_chunks)
+                while len(pending_chunks) >= batch_size:
+                    emit(pending_chunks[:batch_size])
+                    pending_chunks = pending_chunks[batch_size:]
+
+            def git_stage_finish(emit: Callable[[Any], None]) -> None:
+                """Flush the last partial batch."""
+                nonlocal pending_chunks
+                if pending_chunks:
+                    emit(pending_chunks)
+                    pending_chunks = []
+
+            def embed_stage(batch: list[Any], emit: Callable[[Any], None]) -> int:
+                """Embed a batch of chunks at once."""
+                nonlocal embedded_count
+                batch_len = len(batch)
+                report_progress(
+                    IndexProgress(
+                        "embedding",
+                        embedded_count,
+                        embedded_count + batch_len,
+                        detail=f"Batch of {batch_len} chunks",
+                        throughput=pipeline.stats["embedding"].throughput,
+                    ),
+                )
 
-                        # Report git blame phase
-                        if git_extractor and chunks:
-                            report_progress(
-                                IndexProgress(
-                                    "git_blame",
-                                    i,
-                                    total_to_process,
-                                    file_path=str(file_path.name),
-                                    detail=f"Git history for {file_path.name}",
-                                ),
-                            )
-
-                        # Process all chunks for this file
-                        for chunk in chunks:
-                            initial_bla = 0.5
-                            commit_count = 0
-
-                            if (
-                                git_extractor
-                                and hasattr(chunk, "line_start")
-                                and hasattr(chunk, "line_end")
-                            ):
-                                try:
-                                    commit_times = git_extractor.get_function_commit_times(
-                                        file_path=str(file_path),
-                                        line_start=chunk.line_start,
-                                        line_end=chunk.line_end,
-                                    )
+                texts = [content for _, content, _, _ in batch]
+                embeddings = self._embed_with_cache(texts, batch_size, embedding_cache)
+                for i, (chunk, _, _, _) in enumerate(batch):
+                    chunk.embeddings = embeddings[i]
 
-                                    if commit_times:
-                                        initial_bla = git_extractor.calculate_bla(
-                                            commit_times,
-                                            decay=0.5,
-                                        )
-                                        commit_count = len(commit_times)
-
-                                        if not hasattr(chunk, "metadata") or chunk.metadata is None:
-                                            chunk.metadata = {}
-
-                                        chunk.metadata["git_hash"] = commit_times[0]
-                                        chunk.metadata["last_modified"] = commit_times[0]
-                                        chunk.metadata["commit_count"] = commit_count
-                                except Exception as e:
-                                    logger.debug(
-                                        f"Could not extract Git signals for {chunk.name}: {e}",
-                                    )
+                embedded_count += batch_len
+                emit(batch)
+                return batch_len
 
-                            # Build content and add to batch
-                            content_to_embed = self._build_chunk_content(chunk)
-                            pending_chunks.append(
-                                (
-                                    chunk,
-                                    content_to_embed,
-                                    initial_bla,
-                                    commit_count,
-                                    str(file_path),
-                                ),
-                            )
-
-                            # Flush batch when it reaches batch_size
-                            if len(pending_chunks) >= batch_size:
-                                flush_batch()
-
-                        stats["files"] += 1
-                        lang = parser.language if parser else "unknown"
-                        files_by_language[lang] = files_by_language.get(lang, 0) + 1
-
-                        # Record file info for incremental indexing (hash + mtime + chunk count)
-                        try:
-                            file_key = str(file_path)
-                            new_file_info[file_key] = {
-                                "hash": compute_file_hash(file_path),
-                                "mtime": file_path.stat().st_mtime,
-                                "chunk_count": len(chunks),
-                            }
-                        except OSError:
-                            pass
-
-                        logger.debug(f"Indexed {file_path}: {len(chunks)} chunks")
-
-                    except MemoryStoreError:
-                        raise
-                    except Exception as e:
-                        logger.debug(f"Failed to index {file_path}: {e}")
-                        stats["errors"] += 1
-                        error_msg = str(e).split("\n")[0][:100]
-                        failed_files.append((str(file_path), error_msg))
-                        continue
+            def store_stage(batch: list[Any], _emit: Callable[[Any], None]) -> int:
+                """Store the whole batch (chunks, activations, FTS5 rows) in one transaction."""
+                batch_len = len(batch)
+                report_progress(
+                    IndexProgress(
+                        "storing",
+                        stats["chunks"],
+                        stats["chunks"] + batch_len,
+                        detail=f"Writing {batch_len} chunks to database",
+                        throughput=pipeline.stats["storing"].throughput,
+                    ),
+                )
 
-            # Flush any remaining chunks
-            flush_batch()
+                # Seed activations with Git-derived values
+                initial_activations: dict[str, tuple[float, int]] = {
+                    chunk.id: (initial_bla, commit_count)
+                    for chunk, _, initial_bla, commit_count in batch
+                    if initial_bla != 0.0 or commit_count > 0
+                }
+                self._save_chunks_with_retry([chunk for chunk, *_ in batch], initial_activations)
+
+                with state_lock:
+                    stats["chunks"] += batch_len
+                return batch_len
+
+            pipeline = StagePipeline(
+                [
+                    PipelineStage(
+                        "parsing",
+                        parse_stage,
+                        workers=parse_workers,
+                        queue_size=2 * actual_workers,
+                    ),
+                    PipelineStage(
+                        "git_blame",
+                        git_stage,
+                        finish=git_stage_finish,
+                        queue_size=2 * actual_workers,
+                    ),
+                    PipelineStage("embedding", embed_stage, queue_size=2),
+                    PipelineStage("storing", store_stage, queue_size=2),
+                ],
+            )
+            try:
+                pipeline.run(files_to_process)
+            finally:
+                if process_parser is not None:
+                    process_parser.shutdown()
+                if blame_cache is not None:
+                    blame_cache.close()
+                if embedding_cache is not None:
+                    stats["embeddings_cached"] = embedding_cache.hits
+                    embedding_cache.close()
 
             # Save file index for incremental indexing (content hashes + mtimes)
             if incremental and new_file_info:
                 self._save_file_index(new_file_info)
 
+            # Rebuild the relationship edges of the processed files
+            if stats["chunks"] > 0:
+                report_progress(
+                    IndexProgress(
+                        "relationships",
+                        stats["chunks"],
+                        stats["chunks"],
+                        detail="Linking relationships",
+                    ),
+                )
+                self._link_relationships(relationship_edges, indexed_chunk_ids)
+
+            # Assign new vectors to IVF lists (and retrain when the corpus has grown)
+            if stats["chunks"] > 0 or deleted_count > 0:
+                report_progress(
+                    IndexProgress(
+                        "vector_index",
+                        stats["chunks"],
+                        stats["chunks"],
+                        detail="Updating vector index",
+                    ),
+                )
+                self._sync_vector_index()
+
             # Build and save BM25 index for faster search (eliminates 51% of search time)
             if stats["chunks"] > 0:
                 report_progress(
@@ -1023,6 +1013,7 @@ class MemoryManager:
                 files_skipped=stats["skipped"],
                 files_deleted=stats.get("deleted", 0),
                 parallel_workers=actual_workers,
+                embeddings_cached=stats.get("embeddings_cached", 0),
             )
 
         except MemoryStoreError:
@@ -1389,13 +1380,51 @@ class MemoryManager:
         Raises:
             MemoryStoreError: If all retries exhausted or non-retryable error
 
+        """
+        self._write_with_retry(lambda: self.memory_store.save_chunk(chunk), max_retries)
+
+    def _save_chunks_with_retry(
+        self,
+        chunks: list[Chunk],
+        initial_activations: dict[str, tuple[float, int]] | None = None,
+        max_retries: int = 5,
+    ) -> None:
+        """Save a batch of chunks in one transaction with retry logic for database locks.
+
+        Args:
+            chunks: Chunk objects to save (with embeddings already set)
+            initial_activations: Optional chunk_id -> (base_level, access_count)
+                seeds, e.g. Git-derived BLA
+            max_retries: Maximum retry attempts for database locks (default: 5)
+
+        Raises:
+            MemoryStoreError: If all retries exhausted or non-retryable error
+
+        """
+        self._write_with_retry(
+            lambda: self.memory_store.save_chunks_bulk(chunks, initial_activations),
+            max_retries,
+        )
+
+    def _write_with_retry(self, write: Callable[[], Any], max_retries: int = 5) -> None:
+        """Run a store write, retrying on SQLite database locks.
+
+        Uses exponential backoff to wait for lock to be released.
+
+        Args:
+            write: Callable performing the write
+            max_retries: Maximum retry attempts for database locks (default: 5)
+
+        Raises:
+            MemoryStoreError: If all retries exhausted or non-retryable error
+
         """
         base_delay = 0.1  # Start with 100ms
         last_error: Exception | None = None
 
         for attempt in range(max_retries):
             try:
-                self.memory_store.save_chunk(chunk)
+                write()
                 return  # Success
 
             except sqlite3.OperationalError as e:
@@ -1497,6 +1526,88 @@ class MemoryManager:
         except Exception as e:
             logger.warning(f"Failed to save mtime cache: {e}")
 
+    def _open_blame_cache(self) -> GitBlameCache | None:
+        """Open the persistent git blame cache stored next to the memory DB.
+
+        Returns:
+            GitBlameCache, or None for in-memory/non-SQLite stores or on error
+
+        """
+        db_path = getattr(self.memory_store, "db_path", None)
+        if not db_path or db_path == ":memory:":
+            return None
+
+        try:
+            return GitBlameCache(Path(db_path).parent / "git_signals.db")
+        except Exception as e:
+            logger.warning(f"Could not open git blame cache: {e}")
+            return None
+
+    def _open_embedding_cache(self) -> EmbeddingCache | None:
+        """Open the persistent embedding cache stored next to the memory DB.
+
+        Returns:
+            EmbeddingCache, or None for in-memory/non-SQLite stores or on error
+
+        """
+        db_path = getattr(self.memory_store, "db_path", None)
+        if not db_path or db_path == ":memory:":
+            return None
+
+        try:
+            return EmbeddingCache(Path(db_path).parent / "embedding_cache.db")
+        except Exception as e:
+            logger.warning(f"Could not open embedding cache: {e}")
+            return None
+
+    def _embed_with_cache(
+        self,
+        texts: list[str],
+        batch_size: int,
+        cache: EmbeddingCache | None,
+    ) -> list[bytes]:
+        """Embed texts, sending only embedding cache misses to the model.
+
+        The model is not loaded at all when every text is a cache hit.
+
+        Args:
+            texts: Chunk contents to embed
+            batch_size: Model batch size
+            cache: Embedding cache, or None to embed everything
+
+        Returns:
+            Raw float32 embedding bytes aligned with ``texts``
+
+        """
+        model = getattr(self.embedding_provider, "model_name", None)
+        if cache is None or not isinstance(model, str):
+            embeddings = self.embedding_provider.embed_batch(texts, batch_size=batch_size)
+            return [embedding.tobytes() for embedding in embeddings]
+
+        try:
+            cached = cache.get_many(model, texts)
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache lookup failed: {e}")
+            cached = [None] * len(texts)
+
+        misses = [i for i, embedding in enumerate(cached) if embedding is None]
+        if misses:
+            miss_texts = [texts[i] for i in misses]
+            fresh = [
+                embedding.tobytes()
+                for embedding in self.embedding_provider.embed_batch(
+                    miss_texts, batch_size=batch_size
+                )
+            ]
+            for i, embedding in zip(misses, fresh, strict=True):
+                cached[i] = embedding
+            try:
+                cache.put_many(model, miss_texts, fresh)
+            except sqlite3.Error as e:
+                logger.debug(f"Embedding cache write failed: {e}")
+
+        return [embedding for embedding in cached if embedding is not None]
+
     def _load_file_index(self) -> dict[str, dict[str, Any]]:
         """Load file index from database for incremental indexing.
 
@@ -1610,8 +1721,13 @@ class MemoryManager:
         """
         deleted_count = 0
 
-        # Find files in index that are no longer present
-        indexed_paths = set(file_index.keys())
+        # Find files in index that are no longer present. Documents (PDF/DOCX)
+        # share file_index but are tracked by DocumentIndexer, not code indexing.
+        indexed_paths = {
+            path
+            for path in file_index
+            if not path.lower().endswith(DOCUMENT_INDEX_SUFFIXES)
+        }
         deleted_paths = indexed_paths - current_files
 
         if not deleted_paths:
@@ -1783,6 +1899,71 @@ class MemoryManager:
         except Exception as e:
             logger.warning(f"Failed to write index log: {e}")
 
+    def _link_relationships(
+        self,
+        edges: list[tuple[str, str, str, float]],
+        chunk_ids: list[str],
+    ) -> int:
+        """Write the relationship edges of the (re-)indexed files.
+
+        Saving a chunk replaces its row, which drops every edge touching it
+        (ON DELETE CASCADE). This writes the files' own call/containment edges
+        and re-resolves cross-file import edges for their chunks in both
+        directions, so only the changed files' part of the graph is rebuilt.
+
+        Args:
+            edges: Call and containment edges extracted from the files' chunks
+            chunk_ids: IDs of all chunks of the files
+
+        Returns:
+            Number of edges added (0 if failed)
+
+        """
+        counts: list[int] = []
+        try:
+            self._write_with_retry(
+                lambda: counts.append(self.memory_store.add_relationships_bulk(edges)),
+            )
+            if hasattr(self.memory_store, "link_symbol_references"):
+                self._write_with_retry(
+                    lambda: counts.append(self.memory_store.link_symbol_references(chunk_ids)),
+                )
+            added = int(sum(counts))
+        except Exception as e:
+            # Non-fatal: retrieval works without spreading activation
+            logger.warning(f"Failed to link relationships: {e}")
+            return 0
+        logger.info(f"Linked {added} relationship edges for {len(chunk_ids)} chunks")
+        return added
+
+    def _sync_vector_index(self) -> bool:
+        """Bring the IVF vector index up to date after indexing.
+
+        New embeddings are queued automatically by SQLite triggers in save_chunk()
+        and deleted chunks drop out via ON DELETE CASCADE; this assigns queued
+        vectors to centroids and retrains once the corpus is large enough.
+
+        Returns:
+            True if the vector index was synced, False if unsupported or failed
+
+        """
+        try:
+            from aurora_context_code.semantic.vector_index import VectorIndex
+
+            index = VectorIndex.for_store(self.memory_store)
+            if index is None:
+                return False
+            result = index.sync()
+            logger.info(
+                f"Vector index synced: {result['vectors']} vectors, "
+                f"{result['lists']} lists, {result['assigned']} assigned",
+            )
+            return True
+        except Exception as e:
+            # Non-fatal: unassigned vectors are still searched exactly
+            logger.warning(f"Failed to sync vector index: {e}")
+            return False
+
     def _build_bm25_index(self) -> bool:
         """No-op: FTS5 replaces the pkl-based BM25 index.
 
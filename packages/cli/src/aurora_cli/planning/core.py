@@ -2167,7 +2167,7 @@ Important:
 - Return ONLY valid JSON, no markdown formatting"""
 
     # Call LLM via CLI pipe
-    response = await llm_client.generate(prompt, phase_name="decompose")
+    response = await llm_client.agenerate(prompt, phase_name="decompose")
 
     # Parse JSON response
     try:
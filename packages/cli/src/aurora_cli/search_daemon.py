@@ -0,0 +1,449 @@
+"""Warm search daemon for AURORA memory.
+
+Every ``aur mem search`` and every fresh MCP server process pays for loading
+the embedding model and opening the store before it can answer a query. The
+search daemon is an optional long-lived local process that keeps the embedding
+model, the ``HybridRetriever`` and its query embedding cache warm for one
+database and serves requests over a Unix domain socket.
+
+Clients never depend on it: ``SearchDaemonClient.connect`` returns None when no
+daemon is listening for the database, and callers fall back to in-process
+retrieval. ``MemoryRetriever`` and ``AuroraMCPTools`` do this automatically.
+
+Protocol:
+    One JSON object per line in each direction, one request per connection::
+
+        {"op": "search", "query": "...", "top_k": 10, ...}
+        {"ok": true, "results": [...]}
+
+    Supported ops: ``ping``, ``search``, ``embed`` and ``shutdown``. Failures
+    are returned as ``{"ok": false, "error": "..."}``. Embeddings travel as
+    base64-encoded float32 buffers with a shape. Framing, socket ownership and
+    the serve loop come from ``aurora_core.socket_service``.
+
+Usage:
+    aur mem daemon start          # background, for the project database
+    aur mem daemon status
+    aur mem daemon stop
+
+    python -m aurora_cli.search_daemon --db-path .aurora/memory.db
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from aurora_cli.errors import SearchDaemonError
+from aurora_core.socket_service import SocketService, SocketServiceClient
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+logger = logging.getLogger(__name__)
+
+# Set to "0" to make clients ignore a running daemon
+DAEMON_ENV_VAR = "AURORA_SEARCH_DAEMON"
+
+PROTOCOL_VERSION = 1
+CONNECT_TIMEOUT = 0.5  # seconds, for the availability probe
+REQUEST_TIMEOUT = 30.0  # seconds
+
+
+def default_socket_path(db_path: str | Path) -> Path:
+    """Return the socket path the daemon for ``db_path`` listens on.
+
+    Sockets live under ``$AURORA_HOME/run`` and are keyed by the resolved
+    database path, so each project database gets its own daemon.
+
+    Args:
+        db_path: Path to the SQLite memory database
+
+    Returns:
+        Unix socket path
+    """
+    from aurora_cli.config import _get_aurora_home
+
+    resolved = str(Path(db_path).expanduser().resolve())
+    digest = hashlib.sha256(resolved.encode("utf-8")).hexdigest()[:16]
+    return _get_aurora_home() / "run" / f"search-{digest}.sock"
+
+
+def encode_array(array: npt.NDArray[np.float32]) -> dict[str, Any]:
+    """Encode a float32 array for transport."""
+    import numpy as np
+
+    data = np.ascontiguousarray(array, dtype=np.float32)
+    return {
+        "shape": list(data.shape),
+        "data": base64.b64encode(data.tobytes()).decode("ascii"),
+    }
+
+
+def decode_array(payload: dict[str, Any]) -> npt.NDArray[np.float32]:
+    """Decode an array produced by ``encode_array``."""
+    import numpy as np
+
+    buffer = base64.b64decode(payload["data"])
+    return np.frombuffer(buffer, dtype=np.float32).reshape(payload["shape"]).copy()
+
+
+class SearchDaemonClient(SocketServiceClient):
+    """Client for a running search daemon.
+
+    Each request opens a fresh connection, so one client can be shared freely
+    and a daemon restart never leaves it holding a dead socket.
+
+    Attributes:
+        socket_path: Unix socket the daemon listens on
+        info: Result of the last ``ping`` (pid, db_path, model_loaded, ...)
+
+    Example:
+        >>> client = SearchDaemonClient.connect(".aurora/memory.db")
+        >>> if client is not None:
+        ...     results = client.search("authentication", top_k=5)
+    """
+
+    service_name = "Search daemon"
+    error_class = SearchDaemonError
+
+    def __init__(self, socket_path: str | Path, timeout: float = REQUEST_TIMEOUT) -> None:
+        """Initialize the client.
+
+        Args:
+            socket_path: Unix socket the daemon listens on
+            timeout: Per-request socket timeout in seconds
+        """
+        super().__init__(socket_path, timeout)
+
+    @classmethod
+    def connect(
+        cls,
+        db_path: str | Path,
+        socket_path: str | Path | None = None,
+    ) -> SearchDaemonClient | None:
+        """Return a client if a daemon is serving ``db_path``, else None.
+
+        Never raises: a missing socket, a stale socket or a daemon serving a
+        different database all mean "no daemon".
+
+        Args:
+            db_path: Path to the SQLite memory database
+            socket_path: Socket path override (default: ``default_socket_path``)
+
+        Returns:
+            Connected client, or None if no usable daemon is running
+        """
+        if os.environ.get(DAEMON_ENV_VAR, "1").strip().lower() in ("0", "false", "no", "off"):
+            return None
+
+        path = Path(socket_path) if socket_path else default_socket_path(db_path)
+        if not path.exists():
+            return None
+
+        client = cls(path, timeout=CONNECT_TIMEOUT)
+        try:
+            info = client.ping()
+        except SearchDaemonError as e:
+            logger.debug(f"Search daemon at {path} not usable: {e}")
+            return None
+
+        expected = str(Path(db_path).expanduser().resolve())
+        if info.get("db_path") != expected or info.get("protocol") != PROTOCOL_VERSION:
+            logger.debug(f"Search daemon at {path} serves {info.get('db_path')}, not {expected}")
+            return None
+
+        client.timeout = REQUEST_TIMEOUT
+        return client
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        min_semantic_score: float | None = None,
+        chunk_type: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run ``HybridRetriever.retrieve`` in the daemon.
+
+        Returns:
+            Result dicts in the same shape as ``HybridRetriever.retrieve``
+        """
+        response = self.request(
+            "search",
+            query=query,
+            top_k=top_k,
+            min_semantic_score=min_semantic_score,
+            chunk_type=chunk_type,
+        )
+        return response["results"]
+
+    def embed(self, texts: list[str], kind: str = "batch") -> npt.NDArray[np.float32]:
+        """Embed texts with the daemon's warm model.
+
+        Args:
+            texts: Texts to embed
+            kind: ``"query"``, ``"chunk"`` or ``"batch"`` (selects the provider method)
+
+        Returns:
+            Array of shape (len(texts), embedding_dim)
+        """
+        return decode_array(self.request("embed", texts=texts, kind=kind)["embeddings"])
+
+
+class DaemonEmbeddingProvider:
+    """EmbeddingProvider stand-in that embeds through a search daemon.
+
+    Lets a process use the daemon's warm model without importing
+    sentence-transformers or loading the model itself. If the daemon stops
+    or a request fails, the daemon is dropped and embeddings fall back to an
+    in-process ``EmbeddingProvider`` for the same model, created on first use.
+    """
+
+    def __init__(self, client: SearchDaemonClient) -> None:
+        """Initialize with a connected client."""
+        self._client: SearchDaemonClient | None = client
+        self._fallback: Any = None
+        self.model_name = client.info.get("model_name")
+        self.embedding_dim = client.info.get("embedding_dim")
+
+    def _local_provider(self) -> Any:
+        """Get the in-process EmbeddingProvider used once the daemon is gone."""
+        if self._fallback is None:
+            from aurora_context_code.semantic import EmbeddingProvider
+
+            if self.model_name:
+                self._fallback = EmbeddingProvider(model_name=self.model_name)
+            else:
+                self._fallback = EmbeddingProvider()
+        return self._fallback
+
+    def _embed_via_daemon(self, texts: list[str], kind: str) -> npt.NDArray[np.float32] | None:
+        """Embed through the daemon, or return None to embed in-process."""
+        if self._client is None:
+            return None
+        try:
+            return self._client.embed(texts, kind=kind)
+        except SearchDaemonError as e:
+            logger.warning(f"Search daemon failed, embedding in-process: {e}")
+            self._client = None
+            return None
+
+    def embed_query(self, query: str) -> npt.NDArray[np.float32]:
+        """Embed a query (see ``EmbeddingProvider.embed_query``)."""
+        embeddings = self._embed_via_daemon([query], kind="query")
+        if embeddings is None:
+            return self._local_provider().embed_query(query)
+        return embeddings[0]
+
+    def embed_chunk(self, text: str) -> npt.NDArray[np.float32]:
+        """Embed a chunk (see ``EmbeddingProvider.embed_chunk``)."""
+        embeddings = self._embed_via_daemon([text], kind="chunk")
+        if embeddings is None:
+            return self._local_provider().embed_chunk(text)
+        return embeddings[0]
+
+    def embed_batch(self, texts: list[str], batch_size: int = 32) -> npt.NDArray[np.float32]:
+        """Embed texts in one round trip (see ``EmbeddingProvider.embed_batch``)."""
+        embeddings = self._embed_via_daemon(texts, kind="batch")
+        if embeddings is None:
+            return self._local_provider().embed_batch(texts, batch_size=batch_size)
+        return embeddings
+
+
+class SearchDaemon(SocketService):
+    """Long-lived process holding a warm retriever for one database.
+
+    Requests are handled one at a time on a single thread, which keeps the
+    store's SQLite connection and the retriever caches free of cross-thread
+    sharing; a warm query takes tens of milliseconds.
+
+    Attributes:
+        db_path: Resolved database path
+        socket_path: Unix socket the daemon listens on
+        idle_timeout: Exit after this many idle seconds (None = never)
+    """
+
+    service_name = "Search daemon"
+    error_class = SearchDaemonError
+    client_class = SearchDaemonClient
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        socket_path: str | Path | None = None,
+        idle_timeout: float | None = None,
+        embedding_provider: Any = None,
+    ) -> None:
+        """Initialize the daemon (nothing is loaded until ``start``).
+
+        Args:
+            db_path: Path to the SQLite memory database
+            socket_path: Socket path override (default: ``default_socket_path``)
+            idle_timeout: Exit after this many idle seconds (None = never)
+            embedding_provider: Provider to use instead of loading the default model
+        """
+        super().__init__(socket_path or default_socket_path(db_path), idle_timeout)
+        self.db_path = str(Path(db_path).expanduser().resolve())
+        self._embedding_provider = embedding_provider
+        self._store: Any = None
+        self._retriever: Any = None
+
+    def start(self) -> None:
+        """Load the store, model and retriever, then bind the socket.
+
+        Raises:
+            SearchDaemonError: If another daemon is already serving this socket
+        """
+        from aurora_context_code.semantic.hybrid_retriever import get_cached_retriever
+        from aurora_core.activation.engine import get_cached_engine
+        from aurora_core.store.sqlite import SQLiteStore
+
+        self._claim_socket()
+
+        start = time.perf_counter()
+        self._store = SQLiteStore(self.db_path)
+        if self._embedding_provider is None:
+            self._embedding_provider = _load_embedding_provider()
+        self._retriever = get_cached_retriever(
+            self._store,
+            get_cached_engine(self._store),
+            self._embedding_provider,
+        )
+
+        self._bind()
+        logger.info(
+            f"Search daemon ready on {self.socket_path} for {self.db_path} "
+            f"(model={'yes' if self._embedding_provider else 'no'}, "
+            f"{time.perf_counter() - start:.1f}s)"
+        )
+
+    def close(self) -> None:
+        """Close the socket and the store."""
+        super().close()
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Dispatch one decoded request.
+
+        Args:
+            request: Request object with an ``op`` field
+
+        Returns:
+            Response object
+        """
+        op = request.get("op")
+
+        if op == "ping":
+            return {"ok": True, **self.status()}
+
+        if op == "search":
+            results = self._retriever.retrieve(
+                request["query"],
+                top_k=int(request.get("top_k", 10)),
+                min_semantic_score=request.get("min_semantic_score"),
+                chunk_type=request.get("chunk_type"),
+            )
+            return {"ok": True, "results": results}
+
+        if op == "embed":
+            return {"ok": True, "embeddings": encode_array(self._embed(request))}
+
+        if op == "shutdown":
+            self.stop()
+            return {"ok": True}
+
+        return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+    def status(self) -> dict[str, Any]:
+        """Return daemon status as reported by ``ping``."""
+        provider = self._embedding_provider
+        return {
+            "protocol": PROTOCOL_VERSION,
+            "pid": os.getpid(),
+            "db_path": self.db_path,
+            "model_loaded": provider is not None,
+            "model_name": getattr(provider, "model_name", None),
+            "embedding_dim": getattr(provider, "embedding_dim", None),
+            "uptime": self._uptime(),
+            "requests": self._requests,
+            "query_cache": self._retriever.get_cache_stats() if self._retriever else {},
+        }
+
+    def _embed(self, request: dict[str, Any]) -> npt.NDArray[np.float32]:
+        import numpy as np
+
+        if self._embedding_provider is None:
+            raise SearchDaemonError("Embedding model not available in search daemon")
+
+        texts = list(request.get("texts", []))
+        kind = request.get("kind", "batch")
+        if kind == "query":
+            return np.stack([self._embedding_provider.embed_query(t) for t in texts])
+        if kind == "chunk":
+            return np.stack([self._embedding_provider.embed_chunk(t) for t in texts])
+        return self._embedding_provider.embed_batch(texts)
+
+
+def _load_embedding_provider() -> Any:
+    """Load and warm the default embedding model, or None for BM25-only serving."""
+    try:
+        from aurora_context_code.semantic.model_utils import is_model_cached
+
+        if not is_model_cached():
+            logger.warning(
+                "Embedding model not cached; search daemon will serve BM25-only results. "
+                "Run 'aur mem index .' to download the embedding model."
+            )
+            return None
+
+        os.environ["HF_HUB_OFFLINE"] = "1"
+
+        from aurora_context_code.semantic import EmbeddingProvider
+
+        provider = EmbeddingProvider()
+        provider.preload_model()
+        return provider
+    except ImportError:
+        logger.info("sentence-transformers not installed; search daemon is BM25-only")
+        return None
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run a search daemon in the foreground."""
+    parser = argparse.ArgumentParser(description="AURORA warm search daemon")
+    parser.add_argument("--db-path", required=True, help="Path to the memory database")
+    parser.add_argument("--socket", default=None, help="Unix socket path override")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=None,
+        help="Exit after this many idle seconds (default: never)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    SearchDaemon(args.db_path, args.socket, idle_timeout=args.idle_timeout).serve_forever()
+
+
+__all__ = [
+    "DAEMON_ENV_VAR",
+    "DaemonEmbeddingProvider",
+    "SearchDaemon",
+    "SearchDaemonClient",
+    "decode_array",
+    "default_socket_path",
+    "encode_array",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,10 @@ It provides usage impact analysis before Claude edits code files.
 Receives Edit tool input on stdin, runs LSP usage analysis via the
 aurora MCP lsp tool, and returns context for Claude to see before
 the edit proceeds.
+
+Language servers stay warm between edits in the shared LSP broker
+(aurora_lsp.broker), which the lsp tool starts on first use; set
+AURORA_LSP_BROKER=0 to run every check in-process instead.
 """
 
 import json
@@ -5,6 +5,9 @@ storage, search, and stats. Uses a dummy embedding provider to avoid
 ML dependencies (sentence-transformers).
 """
 
+import os
+import time
+
 import numpy as np
 import pytest
 
@@ -165,6 +168,36 @@ class TestIndexPath:
         assert "discovering" in phases_seen
         assert "parsing" in phases_seen
 
+    def test_pipelined_stages_report_throughput(self, manager, sample_project):
+        stages = {}
+
+        def on_progress(prog: IndexProgress):
+            if prog.throughput is not None:
+                stages[prog.phase] = prog.throughput
+
+        stats = manager.index_path(
+            sample_project, progress_callback=on_progress, max_workers=4, batch_size=2
+        )
+
+        assert stats.chunks_created == manager.get_stats().total_chunks
+        assert {"parsing", "embedding", "storing"} <= set(stages)
+
+    def test_parallel_matches_sequential(self, manager, sample_project):
+        sequential = manager.index_path(sample_project, max_workers=1, incremental=False)
+        parallel = manager.index_path(sample_project, max_workers=4, incremental=False)
+
+        assert parallel.files_indexed == sequential.files_indexed
+        assert parallel.chunks_created == sequential.chunks_created
+
+    def test_process_parsing_matches_threads(self, manager, sample_project):
+        threaded = manager.index_path(sample_project, max_workers=2, incremental=False)
+        processes = manager.index_path(
+            sample_project, max_workers=2, incremental=False, parse_processes=True
+        )
+
+        assert processes.files_indexed == threaded.files_indexed
+        assert processes.chunks_created == threaded.chunks_created
+
     def test_incremental_skips_unchanged(self, manager, sample_project):
         # First pass indexes everything
         stats1 = manager.index_path(sample_project, max_workers=1, incremental=True)
@@ -183,6 +216,91 @@ class TestIndexPath:
         assert stats2.files_indexed >= 2
         assert stats2.files_skipped == 0
 
+    def test_relationship_graph_rebuilt_for_changed_files(self, manager, store, tmp_path):
+        src = tmp_path / "graph"
+        src.mkdir()
+        util = src / "util.py"
+        util.write_text("def helper():\n    return 1\n")
+        (src / "app.py").write_text(
+            "from util import helper\n\n\n"
+            "class App:\n"
+            "    def run(self):\n"
+            "        return helper()\n",
+        )
+
+        def edges():
+            rows = store._get_connection().execute(
+                """
+                SELECT json_extract(f.content, '$.function'), r.relationship_type,
+                       json_extract(t.content, '$.function')
+                FROM relationships r
+                JOIN chunks f ON f.id = r.from_chunk
+                JOIN chunks t ON t.id = r.to_chunk
+                """,
+            )
+            return {tuple(row) for row in rows}
+
+        manager.index_path(src, max_workers=1)
+        expected = {
+            ("App", "contains", "App.run"),
+            ("App", "imports", "helper"),
+            ("App.run", "imports", "helper"),
+        }
+        assert edges() == expected
+
+        # Only util.py is re-indexed; the incoming edge from app.py is restored
+        util.write_text("def helper():\n    return 2\n")
+        os.utime(util, (time.time() + 10, time.time() + 10))
+        stats = manager.index_path(src, max_workers=1, incremental=True)
+
+        assert stats.files_indexed == 1
+        assert edges() == expected
+
+    def test_embedding_cache_embeds_only_changed_chunks(self, store, config, tmp_path):
+        class CountingProvider(DummyEmbeddingProvider):
+            model_name = "dummy-model"
+
+            def __init__(self):
+                self.embedded: list[str] = []
+
+            def embed_batch(self, texts, batch_size=32):
+                self.embedded.extend(texts)
+                return super().embed_batch(texts, batch_size)
+
+        provider = CountingProvider()
+        manager = MemoryManager(config=config, memory_store=store, embedding_provider=provider)
+        src = tmp_path / "cached"
+        src.mkdir()
+        module = src / "mod.py"
+        functions = [f'def func{i}():\n    """Return {i}."""\n    return {i}\n' for i in range(5)]
+        module.write_text("\n\n".join(functions))
+
+        first = manager.index_path(src, max_workers=1)
+        assert len(provider.embedded) == first.chunks_created == 5
+        assert first.embeddings_cached == 0
+        original = store.get_chunk(store.retrieve_by_fts("func0")[0].id).embeddings
+
+        # Editing one docstring re-embeds only that chunk
+        provider.embedded.clear()
+        functions[2] = 'def func2():\n    """Return two."""\n    return 2\n'
+        module.write_text("\n\n".join(functions))
+        os.utime(module, (time.time() + 10, time.time() + 10))
+        second = manager.index_path(src, max_workers=1)
+
+        assert second.chunks_created == 5
+        assert second.embeddings_cached == 4
+        assert len(provider.embedded) == 1
+        assert "Return two." in provider.embedded[0]
+
+        # A full re-index after a reset is served from the cache
+        provider.embedded.clear()
+        store.reset_database()
+        third = manager.index_path(src, max_workers=1)
+
+        assert third.chunks_created == 5
+        assert provider.embedded == []
+        assert store.get_chunk(store.retrieve_by_fts("func0")[0].id).embeddings == original
+
 
 class TestGetStats:
     """Tests for MemoryManager.get_stats()."""
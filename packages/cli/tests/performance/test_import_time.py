@@ -0,0 +1,82 @@
+"""Import-time regression tests for the ``aur`` entry point.
+
+Agent hooks run ``aur`` many times per session, so the root CLI must stay cheap
+to import and dispatching a subcommand must only load that subcommand. Each
+check runs in a fresh interpreter with ``-X importtime``; the module budgets are
+generous ceilings meant to catch an eager import creeping back in, not to
+benchmark the machine.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from aurora_cli.main import LAZY_SUBCOMMANDS
+
+# Cumulative import-time ceilings in microseconds
+ENTRY_POINT_BUDGET_US = 250_000
+COMMAND_BUDGET_US = 3_000_000
+
+COMMAND_MODULES = {spec.partition(":")[0] for spec in LAZY_SUBCOMMANDS.values()}
+
+
+def _import_profile(code: str) -> tuple[dict[str, int], set[str]]:
+    """Run ``code`` under ``-X importtime``.
+
+    Returns:
+        Cumulative import time per module (microseconds) and the set of
+        modules loaded once ``code`` has finished.
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import sys\n{code}\nprint('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        timeout=60,
+    )
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, module = (part.strip() for part in line[12:].split("|"))
+        cumulative[module] = int(cumulative_us)
+    return cumulative, set(result.stdout.split())
+
+
+@pytest.mark.performance
+@pytest.mark.startup
+def test_entry_point_imports_no_subcommands() -> None:
+    timings, loaded = _import_profile("import aurora_cli.main")
+
+    assert not loaded & COMMAND_MODULES
+    assert not {m for m in loaded if m.startswith(("aurora_soar", "aurora_lsp", "rich"))}
+    assert timings["aurora_cli.main"] < ENTRY_POINT_BUDGET_US
+
+
+@pytest.mark.performance
+@pytest.mark.startup
+@pytest.mark.parametrize("name", sorted(LAZY_SUBCOMMANDS))
+def test_subcommand_resolution_loads_only_that_command(name: str) -> None:
+    module = LAZY_SUBCOMMANDS[name].partition(":")[0]
+    # importlib.import_module is not reported by -X importtime, so the
+    # command module is imported by name before resolving it through the group
+    timings, loaded = _import_profile(
+        "import click\n"
+        "from aurora_cli.main import cli\n"
+        f"import {module}\n"
+        f"cli.get_command(click.Context(cli), {name!r})"
+    )
+
+    assert loaded & COMMAND_MODULES == {module}
+    assert timings[module] < COMMAND_BUDGET_US
@@ -133,6 +133,15 @@ class TestLoadConfigEnvOverrides:
         with pytest.raises(ConfigurationError, match="must be 'sonnet' or 'opus'"):
             load_config()
 
+    def test_soar_llm_cache_enabled(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("AURORA_SOAR_LLM_CACHE", "1")
+
+        config = load_config()
+        assert config["soar"]["llm_cache"]["enabled"] is True
+        assert config["soar"]["llm_cache"]["max_entries"] == 1000
+
     def test_env_overrides_file(self, tmp_path, monkeypatch):
         """Env vars take precedence over config file values."""
         aurora_dir = tmp_path / ".aurora"
@@ -174,6 +183,10 @@ class TestValidateConfig:
         errors = validate_config({"storage": {"timeout_seconds": -1}})
         assert any("storage.timeout_seconds" in e for e in errors)
 
+    def test_storage_embedding_format_unknown(self):
+        errors = validate_config({"storage": {"embedding_format": "int4"}})
+        assert any("storage.embedding_format" in e for e in errors)
+
     # -- llm --
     def test_llm_invalid_provider(self):
         errors = validate_config({"llm": {"provider": "openai"}})
@@ -240,6 +253,11 @@ class TestValidateConfig:
         errors = validate_config({"soar": {"default_model": "gpt4"}})
         assert any("soar.default_model" in e for e in errors)
 
+    def test_soar_llm_cache_invalid_limits(self):
+        errors = validate_config({"soar": {"llm_cache": {"ttl_hours": 0, "max_entries": 0}}})
+        assert any("soar.llm_cache.ttl_hours" in e for e in errors)
+        assert any("soar.llm_cache.max_entries" in e for e in errors)
+
     # -- spawner --
     def test_spawner_max_concurrent_zero(self):
         errors = validate_config({"spawner": {"max_concurrent": 0}})
@@ -365,6 +383,7 @@ class TestConfigClass:
         assert config.budget_limit == 10.0
         assert config.soar_default_tool == "claude"
         assert config.soar_default_model == "sonnet"
+        assert config.soar_llm_cache_enabled is False
         assert "aurora/plans" in config.planning_base_dir
 
     def test_validate_valid(self):
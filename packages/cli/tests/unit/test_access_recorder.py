@@ -0,0 +1,90 @@
+"""Unit tests for the batched BackgroundAccessRecorder.
+
+Tests that queued accesses are drained in batches, repeated hits from the
+same search are coalesced, every batch goes through one
+record_access_batch() call and shutdown() flushes what is still queued.
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+from aurora_cli import memory_manager
+from aurora_cli.memory_manager import BackgroundAccessRecorder
+
+
+class RecordingStore:
+    """Store stub that records each record_access_batch() call."""
+
+    def __init__(self, gate: threading.Event | None = None):
+        self.batches: list[list[tuple]] = []
+        self._gate = gate
+
+    def record_access_batch(self, accesses):
+        if self._gate is not None:
+            self._gate.wait(timeout=5)
+        self.batches.append(list(accesses))
+        return len(accesses)
+
+
+def test_search_results_written_in_one_batch():
+    gate = threading.Event()
+    store = RecordingStore(gate)
+    recorder = BackgroundAccessRecorder(store)
+    now = datetime.now(timezone.utc)
+
+    # The worker blocks on the first item until the gate opens, so the
+    # remaining results of the search pile up and are drained together
+    recorder.record_access("warmup", now)
+    for i in range(10):
+        recorder.record_access(f"c{i}", now, "query")
+    gate.set()
+    recorder.shutdown()
+
+    assert sum(len(batch) for batch in store.batches) == 11
+    assert len(store.batches) <= 2
+
+
+def test_duplicate_hits_are_coalesced():
+    gate = threading.Event()
+    store = RecordingStore(gate)
+    recorder = BackgroundAccessRecorder(store)
+    now = datetime.now(timezone.utc)
+
+    recorder.record_access("warmup", now)
+    recorder.record_access("c1", now, "query")
+    recorder.record_access("c1", now, "query")
+    recorder.record_access("c1", now + timedelta(seconds=1), "other query")
+    gate.set()
+    recorder.shutdown()
+
+    recorded = [access for batch in store.batches for access in batch]
+    assert recorded.count(("c1", now, "query")) == 1
+    assert ("c1", now + timedelta(seconds=1), "other query") in recorded
+
+
+def test_shutdown_flushes_queued_accesses():
+    store = RecordingStore()
+    recorder = BackgroundAccessRecorder(store, max_batch_size=3)
+    now = datetime.now(timezone.utc)
+
+    for i in range(20):
+        recorder.record_access(f"c{i}", now + timedelta(seconds=i))
+    recorder.shutdown()
+
+    recorded = [access[0] for batch in store.batches for access in batch]
+    assert sorted(recorded) == sorted(f"c{i}" for i in range(20))
+    assert all(len(batch) <= 3 for batch in store.batches)
+    assert not recorder._thread.is_alive()
+
+
+def test_shutdown_access_recorder_flushes_singleton(monkeypatch):
+    monkeypatch.setattr(memory_manager, "_access_recorder", None)
+    monkeypatch.setattr(memory_manager.atexit, "register", lambda func: func)
+    store = RecordingStore()
+
+    recorder = memory_manager.get_access_recorder(store)
+    recorder.record_access("c1", datetime.now(timezone.utc))
+    memory_manager.shutdown_access_recorder()
+
+    assert [access[0] for batch in store.batches for access in batch] == ["c1"]
+    assert memory_manager._access_recorder is None
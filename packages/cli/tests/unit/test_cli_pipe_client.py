@@ -0,0 +1,79 @@
+"""Unit tests for CLIPipeLLMClient generate() and agenerate().
+
+Uses small shell scripts on PATH in place of a real CLI tool.
+"""
+
+import asyncio
+import json
+import os
+import stat
+import time
+
+import pytest
+
+from aurora_cli.llm.cli_pipe_client import CLIPipeLLMClient
+
+
+def _install_tool(tmp_path, monkeypatch, name: str, script: str) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir(exist_ok=True)
+    tool = bin_dir / name
+    tool.write_text(f"#!/bin/sh\n{script}\n")
+    tool.chmod(tool.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+
+def test_generate_pipes_prompt_to_tool(tmp_path, monkeypatch):
+    _install_tool(tmp_path, monkeypatch, "echo-tool", "cat")
+    client = CLIPipeLLMClient(tool="echo-tool", soar_dir=tmp_path / "soar")
+
+    response = client.generate("hello", system="be brief", phase_name="verify")
+
+    assert response.content == "be brief\n\nhello"
+    assert response.model == "echo-tool"
+
+
+@pytest.mark.asyncio
+async def test_agenerate_pipes_prompt_to_tool(tmp_path, monkeypatch):
+    _install_tool(tmp_path, monkeypatch, "echo-tool", "cat")
+    client = CLIPipeLLMClient(tool="echo-tool", soar_dir=tmp_path / "soar")
+
+    response = await client.agenerate("hello", system="be brief", phase_name="verify")
+
+    assert response.content == "be brief\n\nhello"
+    assert response.metadata == {"tool": "echo-tool", "phase": "verify"}
+    state = json.loads((tmp_path / "soar" / "state.json").read_text())
+    assert state["status"] == "complete"
+
+
+@pytest.mark.asyncio
+async def test_agenerate_json(tmp_path, monkeypatch):
+    _install_tool(tmp_path, monkeypatch, "json-tool", "cat > /dev/null; echo '{\"ok\": true}'")
+    client = CLIPipeLLMClient(tool="json-tool", soar_dir=tmp_path / "soar")
+
+    assert await client.agenerate_json("decompose") == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_agenerate_failure_raises(tmp_path, monkeypatch):
+    _install_tool(tmp_path, monkeypatch, "bad-tool", "echo 'boom' >&2; exit 3")
+    client = CLIPipeLLMClient(tool="bad-tool", soar_dir=tmp_path / "soar")
+
+    with pytest.raises(RuntimeError, match=r"failed \(exit 3\): boom"):
+        await client.agenerate("hello")
+
+    debug = json.loads((tmp_path / "soar" / "error_debug.json").read_text())
+    assert debug["returncode"] == 3
+
+
+@pytest.mark.asyncio
+async def test_agenerate_calls_run_concurrently(tmp_path, monkeypatch):
+    _install_tool(tmp_path, monkeypatch, "slow-tool", "sleep 0.5; cat")
+    client = CLIPipeLLMClient(tool="slow-tool", soar_dir=tmp_path / "soar")
+
+    start = time.monotonic()
+    responses = await asyncio.gather(*(client.agenerate(f"p{i}") for i in range(4)))
+    elapsed = time.monotonic() - start
+
+    assert [r.content for r in responses] == ["p0", "p1", "p2", "p3"]
+    assert elapsed < 1.5  # serial execution would take at least 2s
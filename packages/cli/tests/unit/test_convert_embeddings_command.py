@@ -0,0 +1,78 @@
+"""Unit tests for 'aur mem convert-embeddings'."""
+
+import json
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from aurora_cli.commands.memory import memory_group
+from aurora_core.chunks import CodeChunk
+from aurora_core.store.quantization import stored_format
+from aurora_core.store.sqlite import SQLiteStore
+
+
+@pytest.fixture
+def aurora_home(tmp_path, monkeypatch):
+    home = tmp_path / "home"
+    home.mkdir()
+    (home / "config.json").write_text(json.dumps({"storage": {"embedding_format": "float16"}}))
+    monkeypatch.setenv("AURORA_HOME", str(home))
+    monkeypatch.chdir(tmp_path)
+    return home
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    db_path = tmp_path / "memory.db"
+    store = SQLiteStore(str(db_path))
+    rng = np.random.default_rng(0)
+    for i in range(5):
+        chunk = CodeChunk(
+            chunk_id=f"code:mod.py:fn{i}",
+            file_path="/test/mod.py",
+            element_type="function",
+            name=f"fn{i}",
+            line_start=1,
+            line_end=2,
+        )
+        chunk.embeddings = rng.standard_normal(16).astype(np.float32).tobytes()
+        store.save_chunk(chunk)
+    store.close()
+    return db_path
+
+
+def stored_formats(db_path):
+    store = SQLiteStore(str(db_path))
+    blobs = [row[0] for row in store._get_connection().execute("SELECT embeddings FROM chunks")]
+    store.close()
+    return {stored_format(blob) for blob in blobs}
+
+
+class TestConvertEmbeddingsCommand:
+    """Re-encoding stored embeddings from the CLI."""
+
+    def test_defaults_to_configured_format(self, aurora_home, db_path):
+        result = CliRunner().invoke(memory_group, ["convert-embeddings", "--db-path", str(db_path)])
+
+        assert result.exit_code == 0, result.output
+        assert "Re-encoded 5 embeddings as float16" in result.output
+        assert stored_formats(db_path) == {"float16"}
+
+    def test_format_option_and_rerun(self, aurora_home, db_path):
+        args = ["convert-embeddings", "--format", "int8", "--db-path", str(db_path)]
+
+        assert CliRunner().invoke(memory_group, args).exit_code == 0
+        result = CliRunner().invoke(memory_group, args)
+
+        assert "already stored as int8" in result.output
+        assert stored_formats(db_path) == {"int8"}
+
+    def test_missing_database(self, aurora_home, tmp_path):
+        result = CliRunner().invoke(
+            memory_group,
+            ["convert-embeddings", "--db-path", str(tmp_path / "missing.db")],
+        )
+
+        assert result.exit_code != 0
+        assert "Database not found" in result.output
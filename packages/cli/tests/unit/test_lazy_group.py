@@ -0,0 +1,84 @@
+"""Unit tests for aurora_cli.lazy_group."""
+
+from __future__ import annotations
+
+import sys
+import types
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from aurora_cli.lazy_group import LazyGroup
+
+
+@pytest.fixture
+def fake_module(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """Register a throwaway module exposing a command and a non-command."""
+    module = types.ModuleType("fake_lazy_commands")
+
+    @click.command()
+    def hello() -> None:
+        """Say hello."""
+        click.echo("hello")
+
+    module.hello = hello
+    module.not_a_command = object()
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    return module
+
+
+def _make_group(**lazy: str) -> click.Group:
+    @click.group(cls=LazyGroup, lazy_subcommands=lazy)
+    def root() -> None:
+        """Root group."""
+
+    @root.command()
+    def eager() -> None:
+        """Eager command."""
+
+    return root
+
+
+class TestLazyGroup:
+    """Tests for on-demand subcommand resolution."""
+
+    def test_lists_lazy_and_eager_commands(self) -> None:
+        group = _make_group(zeta="missing.module:cmd", alpha="missing.module:cmd")
+
+        assert group.list_commands(click.Context(group)) == ["alpha", "eager", "zeta"]
+
+    def test_listing_does_not_import(self) -> None:
+        group = _make_group(hello="fake_lazy_never_imported:hello")
+
+        group.list_commands(click.Context(group))
+
+        assert "fake_lazy_never_imported" not in sys.modules
+
+    def test_invokes_lazy_command(self, fake_module: types.ModuleType) -> None:
+        group = _make_group(hi="fake_lazy_commands:hello")
+
+        result = CliRunner().invoke(group, ["hi"])
+
+        assert result.exit_code == 0
+        assert result.output == "hello\n"
+        assert group.commands["hi"] is fake_module.hello
+
+    def test_unknown_command_is_usage_error(self) -> None:
+        result = CliRunner().invoke(_make_group(), ["nope"])
+
+        assert result.exit_code == 2
+        assert "No such command" in result.output
+
+    def test_rejects_non_command_target(self, fake_module: types.ModuleType) -> None:
+        group = _make_group(bad="fake_lazy_commands:not_a_command")
+
+        with pytest.raises(ValueError, match="is not a click.Command"):
+            group.get_command(click.Context(group), "bad")
+
+    def test_aur_registers_every_subcommand(self) -> None:
+        from aurora_cli.main import LAZY_SUBCOMMANDS, cli
+
+        ctx = click.Context(cli)
+        for name in LAZY_SUBCOMMANDS:
+            assert isinstance(cli.get_command(ctx, name), click.Command)
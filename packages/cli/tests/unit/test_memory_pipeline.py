@@ -0,0 +1,136 @@
+"""Unit tests for the bounded-queue indexing pipeline.
+
+Tests the StagePipeline used by MemoryManager.index_path: ordering through
+stages, finish() flushing, backpressure and error propagation.
+"""
+
+import threading
+import time
+
+import pytest
+
+from aurora_cli.memory.pipeline import PipelineStage, StagePipeline
+
+
+class TestStagePipeline:
+    """Test StagePipeline execution."""
+
+    def test_items_flow_through_all_stages(self):
+        """Every item reaches the last stage, transformed by each stage."""
+        collected = []
+        lock = threading.Lock()
+
+        def collect(item, _emit):
+            with lock:
+                collected.append(item)
+
+        pipeline = StagePipeline(
+            [
+                PipelineStage("double", lambda item, emit: emit(item * 2), workers=3),
+                PipelineStage("increment", lambda item, emit: emit(item + 1)),
+                PipelineStage("collect", collect),
+            ]
+        )
+        pipeline.run(range(50))
+
+        assert sorted(collected) == [i * 2 + 1 for i in range(50)]
+        assert pipeline.stats["double"].items == 50
+        assert pipeline.stats["collect"].items == 50
+
+    def test_finish_flushes_partial_batch(self):
+        """finish() runs once after input is drained and can emit a final batch."""
+        batches = []
+        pending = []
+
+        def batch(item, emit):
+            pending.append(item)
+            if len(pending) == 4:
+                emit(list(pending))
+                pending.clear()
+
+        def flush(emit):
+            if pending:
+                emit(list(pending))
+
+        pipeline = StagePipeline(
+            [
+                PipelineStage("batch", batch, finish=flush),
+                PipelineStage("sink", lambda item, _emit: batches.append(item) or len(item)),
+            ]
+        )
+        pipeline.run(range(10))
+
+        assert batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+        assert pipeline.stats["sink"].items == 10, "Returned unit counts feed throughput"
+
+    def test_stages_overlap(self):
+        """Downstream starts while upstream is still producing (stages run concurrently)."""
+        producer_done = threading.Event()
+        consumed_early = []
+
+        def produce(item, emit):
+            time.sleep(0.01)
+            emit(item)
+            if item == 9:
+                producer_done.set()
+
+        def consume(item, _emit):
+            consumed_early.append(not producer_done.is_set())
+
+        pipeline = StagePipeline(
+            [
+                PipelineStage("produce", produce),
+                PipelineStage("consume", consume),
+            ]
+        )
+        pipeline.run(range(10))
+
+        assert consumed_early[0], "First item should be consumed before producer finishes"
+
+    def test_backpressure_bounds_in_flight_items(self):
+        """Bounded queues keep a slow stage from buffering the whole input."""
+        produced = []
+        max_ahead = []
+
+        def produce(item, emit):
+            produced.append(item)
+            emit(item)
+
+        def slow(item, _emit):
+            max_ahead.append(len(produced) - item)
+            time.sleep(0.002)
+
+        pipeline = StagePipeline(
+            [
+                PipelineStage("produce", produce, queue_size=2),
+                PipelineStage("slow", slow, queue_size=2),
+            ]
+        )
+        pipeline.run(range(40))
+
+        assert max(max_ahead) <= 4
+
+    def test_stage_error_is_reraised(self):
+        """The first stage failure is re-raised by run() after threads exit."""
+
+        def explode(item, emit):
+            if item == 5:
+                raise RuntimeError("boom")
+            emit(item)
+
+        pipeline = StagePipeline(
+            [
+                PipelineStage("explode", explode, workers=2),
+                PipelineStage("sink", lambda item, _emit: None),
+            ]
+        )
+
+        with pytest.raises(RuntimeError, match="boom"):
+            pipeline.run(range(100))
+
+    def test_invalid_stage_configuration(self):
+        """Empty pipelines and stages without workers are rejected."""
+        with pytest.raises(ValueError):
+            StagePipeline([])
+        with pytest.raises(ValueError):
+            StagePipeline([PipelineStage("none", lambda item, emit: None, workers=0)])
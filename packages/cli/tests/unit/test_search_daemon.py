@@ -0,0 +1,227 @@
+"""Unit tests for the warm search daemon.
+
+A real daemon is served on a background thread against a small SQLite store;
+the embedding model is replaced by a deterministic stub.
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from aurora_cli.errors import SearchDaemonError
+from aurora_cli.memory.retrieval import MemoryRetriever
+from aurora_cli.search_daemon import (
+    DaemonEmbeddingProvider,
+    SearchDaemon,
+    SearchDaemonClient,
+    decode_array,
+    default_socket_path,
+    encode_array,
+)
+from aurora_context_code.semantic.hybrid_retriever import HybridRetriever
+from aurora_core.activation.engine import ActivationEngine
+from aurora_core.chunks import CodeChunk
+from aurora_core.store.sqlite import SQLiteStore
+
+
+class StubEmbeddingProvider:
+    """Deterministic 8-dimensional embeddings keyed on text length."""
+
+    model_name = "stub-model"
+    embedding_dim = 8
+
+    def embed_query(self, query: str) -> np.ndarray:
+        return np.full(8, len(query), dtype=np.float32)
+
+    def embed_chunk(self, text: str) -> np.ndarray:
+        return self.embed_query(text)
+
+    def embed_batch(self, texts: list[str], batch_size: int = 32) -> np.ndarray:
+        return np.stack([self.embed_query(t) for t in texts])
+
+
+@pytest.fixture
+def aurora_home(monkeypatch):
+    # Short path: AF_UNIX socket paths are limited to ~100 bytes
+    home = tempfile.mkdtemp(prefix="aur-")
+    monkeypatch.setenv("AURORA_HOME", home)
+    monkeypatch.delenv("AURORA_SEARCH_DAEMON", raising=False)
+    yield Path(home)
+    shutil.rmtree(home, ignore_errors=True)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "memory.db"
+    store = SQLiteStore(str(path))
+    for i, name in enumerate(["authenticate_user", "parse_config", "render_template"]):
+        store.save_chunk(
+            CodeChunk(
+                chunk_id=f"chunk-{i}",
+                file_path=f"/src/module{i}.py",
+                element_type="function",
+                name=name,
+                line_start=1,
+                line_end=10,
+                signature=f"def {name}():",
+                docstring=f"{name.replace('_', ' ')} helper",
+                language="python",
+            )
+        )
+    store.close()
+    return path
+
+
+@pytest.fixture
+def daemon(aurora_home, db_path):
+    daemon = SearchDaemon(db_path, embedding_provider=StubEmbeddingProvider())
+    daemon.start()
+    thread = threading.Thread(
+        target=daemon.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield daemon
+    if daemon.socket_path.exists():
+        SearchDaemonClient(daemon.socket_path).shutdown()
+    thread.join(timeout=5)
+
+
+def _wait_for_exit(daemon: SearchDaemon, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while daemon.socket_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+
+class TestSearchDaemonClient:
+    """Tests for discovery and the request protocol."""
+
+    def test_connect_without_daemon_returns_none(self, aurora_home, db_path):
+        assert SearchDaemonClient.connect(db_path) is None
+
+    def test_connect_reports_daemon_info(self, daemon, db_path):
+        client = SearchDaemonClient.connect(db_path)
+
+        assert client is not None
+        assert client.socket_path == default_socket_path(db_path)
+        assert client.info["db_path"] == str(db_path.resolve())
+        assert client.info["model_name"] == "stub-model"
+
+    def test_connect_ignores_daemon_for_other_database(self, daemon, tmp_path):
+        other = tmp_path / "other.db"
+
+        assert SearchDaemonClient.connect(other, socket_path=daemon.socket_path) is None
+
+    def test_env_var_disables_daemon(self, daemon, db_path, monkeypatch):
+        monkeypatch.setenv("AURORA_SEARCH_DAEMON", "0")
+
+        assert SearchDaemonClient.connect(db_path) is None
+
+    def test_search_matches_in_process_retrieval(self, daemon, db_path):
+        client = SearchDaemonClient.connect(db_path)
+        store = SQLiteStore(str(db_path))
+        local = HybridRetriever(store, ActivationEngine(), StubEmbeddingProvider())
+
+        remote_results = client.search("authenticate user", top_k=2)
+        local_results = local.retrieve("authenticate user", top_k=2)
+        store.close()
+
+        assert [r["chunk_id"] for r in remote_results] == [r["chunk_id"] for r in local_results]
+        assert remote_results[0]["chunk_id"] == "chunk-0"
+
+    def test_embedding_provider_round_trip(self, daemon, db_path):
+        provider = DaemonEmbeddingProvider(SearchDaemonClient.connect(db_path))
+
+        assert provider.embedding_dim == 8
+        np.testing.assert_array_equal(provider.embed_query("abc"), np.full(8, 3.0))
+        assert provider.embed_batch(["a", "abcd"]).shape == (2, 8)
+
+    def test_embedding_provider_falls_back_when_daemon_stops(self, daemon, db_path):
+        provider = DaemonEmbeddingProvider(SearchDaemonClient.connect(db_path))
+        SearchDaemonClient.connect(db_path).shutdown()
+        _wait_for_exit(daemon)
+
+        with patch(
+            "aurora_context_code.semantic.EmbeddingProvider", return_value=StubEmbeddingProvider()
+        ) as local_provider:
+            np.testing.assert_array_equal(provider.embed_query("abc"), np.full(8, 3.0))
+            assert provider.embed_batch(["a", "abcd"]).shape == (2, 8)
+
+        local_provider.assert_called_once_with(model_name="stub-model")
+
+    def test_request_errors_raise(self, daemon, db_path):
+        client = SearchDaemonClient.connect(db_path)
+
+        with pytest.raises(SearchDaemonError, match="Unknown op"):
+            client.request("reindex")
+        with pytest.raises(SearchDaemonError, match="Query cannot be empty"):
+            client.search("   ")
+
+    def test_array_codec(self):
+        array = np.arange(6, dtype=np.float32).reshape(2, 3)
+
+        np.testing.assert_array_equal(decode_array(encode_array(array)), array)
+
+
+class TestSearchDaemonLifecycle:
+    """Tests for socket ownership and shutdown."""
+
+    def test_shutdown_removes_socket(self, daemon, db_path):
+        SearchDaemonClient.connect(db_path).shutdown()
+
+        _wait_for_exit(daemon)
+        assert not daemon.socket_path.exists()
+        assert SearchDaemonClient.connect(db_path) is None
+
+    def test_refuses_to_replace_live_daemon(self, daemon, db_path):
+        with pytest.raises(SearchDaemonError, match="already running"):
+            SearchDaemon(db_path, embedding_provider=StubEmbeddingProvider()).start()
+
+    def test_replaces_stale_socket(self, aurora_home, db_path):
+        stale = default_socket_path(db_path)
+        stale.parent.mkdir(parents=True)
+        stale.write_text("")
+        daemon = SearchDaemon(db_path, embedding_provider=StubEmbeddingProvider())
+
+        daemon.start()
+        try:
+            assert daemon.status()["model_loaded"] is True
+        finally:
+            daemon.close()
+        assert not stale.exists()
+
+
+class TestMemoryRetrieverWithDaemon:
+    """MemoryRetriever routes queries through a running daemon."""
+
+    def test_retrieve_uses_daemon(self, daemon, db_path):
+        store = SQLiteStore(str(db_path))
+        retriever = MemoryRetriever(store=store)
+
+        results = retriever.retrieve("parse config", limit=1, min_semantic_score=0.0)
+
+        assert [r["chunk_id"] for r in results] == ["chunk-1"]
+        assert retriever._retriever is None  # no in-process retriever was built
+        assert retriever.is_embedding_model_ready() is True
+        store.close()
+
+    def test_falls_back_when_daemon_stops(self, daemon, db_path):
+        store = SQLiteStore(str(db_path))
+        retriever = MemoryRetriever(store=store)
+        assert retriever._get_daemon_client() is not None
+
+        SearchDaemonClient(daemon.socket_path).shutdown()
+        _wait_for_exit(daemon)
+
+        results = retriever.retrieve("render template", limit=1, min_semantic_score=0.0)
+
+        assert [r["chunk_id"] for r in results] == ["chunk-2"]
+        assert retriever._daemon is None
+        store.close()
@@ -0,0 +1,136 @@
+"""Unit tests for batched search-result usage enrichment.
+
+Tests the count_text_matches_batch() and _get_lsp_usage_batch() helpers in
+memory.py: one ripgrep run for all symbols, bounded-concurrency LSP lookups
+and complexity read from index-time metadata instead of re-parsing files.
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from aurora_cli.commands import memory
+
+
+RG_OUTPUT = "\n".join(
+    [
+        "./pkg/a.py:3:alpha",
+        "./pkg/a.py:3:alpha",  # same line twice counts once (like rg -c)
+        "./pkg/a.py:9:beta",
+        "./pkg/b.py:1:alpha",
+        "./pkg/b.py:4:beta",
+    ],
+)
+
+
+def _completed(stdout: str, returncode: int = 0) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr="")
+
+
+class TestCountTextMatchesBatch:
+    """Single ripgrep invocation for several symbols."""
+
+    def test_one_subprocess_for_all_symbols(self, tmp_path):
+        with patch("subprocess.run", return_value=_completed(RG_OUTPUT)) as run:
+            counts = memory.count_text_matches_batch(["alpha", "beta", "gamma"], tmp_path)
+
+        assert run.call_count == 1
+        args = run.call_args.args[0]
+        assert args[:3] == ["rg", "-w", "-o"]
+        assert ["-e", "alpha"] == args[args.index("alpha") - 1 : args.index("alpha") + 1]
+
+        assert counts["alpha"] == (2, 2, [str(tmp_path / "pkg/a.py"), str(tmp_path / "pkg/b.py")])
+        assert counts["beta"][:2] == (2, 2)
+        assert counts["gamma"] == (0, 0, [])
+
+    def test_rg_missing(self, tmp_path):
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            assert memory.count_text_matches_batch(["alpha"], tmp_path) == {"alpha": (0, 0, [])}
+
+    def test_single_symbol_wrapper(self, tmp_path):
+        with patch("subprocess.run", return_value=_completed(RG_OUTPUT)):
+            assert memory._count_text_matches("beta", tmp_path)[:2] == (2, 2)
+
+
+@pytest.fixture
+def source_file(tmp_path) -> Path:
+    path = tmp_path / "mod.py"
+    path.write_text("def alpha():\n    return 1\n\n\ndef beta():\n    return 2\n")
+    return path
+
+
+@pytest.fixture
+def fake_lsp(monkeypatch):
+    lsp = MagicMock()
+    monkeypatch.setattr(memory, "_lsp_instance", lsp)
+    return lsp
+
+
+class TestGetLspUsageBatch:
+    """Batched LSP enrichment."""
+
+    def test_single_lsp_call_with_columns(self, source_file, fake_lsp):
+        fake_lsp.get_usage_summaries.return_value = [
+            {"total_usages": 3, "files_affected": 2, "usages_by_file": {"x.py": [1, 2], "y.py": [1]}},
+            {"total_usages": 1, "files_affected": 1, "usages_by_file": {"x.py": [1]}},
+        ]
+        usages = memory._get_lsp_usage_batch(
+            [
+                (str(source_file), 1, "alpha", 2, 0.5),
+                (str(source_file), 5, "beta", 6, 0.0),
+            ],
+        )
+
+        fake_lsp.get_usage_summaries.assert_called_once()
+        targets = fake_lsp.get_usage_summaries.call_args.args[0]
+        assert targets == [(str(source_file), 0, 4), (str(source_file), 4, 4)]
+        assert fake_lsp.get_usage_summaries.call_args.kwargs["max_concurrency"] == (
+            memory._LSP_CONCURRENCY
+        )
+
+        assert usages[0]["refs"] == 3
+        assert usages[0]["top_files"] == ["x.py", "y.py"]
+        assert usages[0]["used_by"] == "2f 3r c:50"
+        assert usages[1]["used_by"] == "1f 1r c:0"
+
+    def test_complexity_from_metadata_skips_parse(self, source_file, fake_lsp):
+        fake_lsp.get_usage_summaries.return_value = [
+            {"total_usages": 1, "files_affected": 1, "usages_by_file": {}},
+        ]
+        with patch.object(memory, "_get_complexity") as get_complexity:
+            usage = memory._get_lsp_usage_batch([(str(source_file), 1, "alpha", 2, 1.0)])[0]
+
+        get_complexity.assert_not_called()
+        assert usage["complexity"] == 99
+
+    def test_complexity_falls_back_to_parse(self, source_file, fake_lsp):
+        fake_lsp.get_usage_summaries.return_value = [
+            {"total_usages": 1, "files_affected": 1, "usages_by_file": {}},
+        ]
+        with patch.object(memory, "_get_complexity", return_value=42) as get_complexity:
+            usage = memory._get_lsp_usage_batch([(str(source_file), 1, "alpha", 2, None)])[0]
+
+        get_complexity.assert_called_once_with(str(source_file), 1, 2)
+        assert usage["complexity"] == 42
+
+    def test_zero_refs_share_one_text_search(self, source_file, fake_lsp):
+        fake_lsp.get_usage_summaries.return_value = [{}, {}]
+        with patch("subprocess.run", return_value=_completed(RG_OUTPUT)) as run:
+            usages = memory._get_lsp_usage_batch(
+                [
+                    (str(source_file), 1, "alpha", 2, 0.0),
+                    (str(source_file), 5, "beta", 6, 0.0),
+                ],
+            )
+
+        assert run.call_count == 1
+        assert usages[0]["used_by"] == "~2f ~2r c:0"
+        assert usages[1]["files"] == 2
+
+    def test_invalid_targets_not_enriched(self, fake_lsp):
+        usages = memory._get_lsp_usage_batch([("", 1, "alpha", 2, 0.1), ("x.py", 0, "beta", 1, 0.1)])
+
+        fake_lsp.get_usage_summaries.assert_not_called()
+        assert [u["used_by"] for u in usages] == ["-", "-"]
@@ -0,0 +1,173 @@
+"""Persistent chunk embedding cache for indexing.
+
+Re-indexing a changed file re-embeds every chunk in it, although most of
+them usually did not change. EmbeddingCache stores each embedding in a small
+SQLite database next to the memory DB, keyed by the embedding model and the
+SHA-256 of the exact text that was embedded. Only cache misses go to the
+model, and when a whole batch hits, the model is never loaded at all.
+
+The cache lives outside the memory DB, so it survives ``reset_database()``
+and a full re-index of known content costs no embedding work.
+
+Usage:
+    >>> cache = EmbeddingCache(Path("~/.aurora/embedding_cache.db").expanduser())
+    >>> vectors = cache.get_many("all-MiniLM-L6-v2", texts)  # bytes or None per text
+    >>> ...
+    >>> cache.close()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Max bound parameters per IN (...) lookup
+_LOOKUP_CHUNK = 500
+
+# Least recently used entries beyond this count are pruned on close()
+DEFAULT_MAX_ENTRIES = 500_000
+
+
+def content_hash(text: str) -> str:
+    """Return the cache key hash of an embedded text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Embeddings persisted in SQLite, keyed by (model name, content hash).
+
+    Thread-safe: a single connection is shared behind a lock. Every
+    ``put_many()`` call is committed immediately, since it follows an
+    expensive model call.
+    """
+
+    def __init__(self, db_path: str | Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Open (or create) the cache database.
+
+        Args:
+            db_path: Path of the cache database file
+            max_entries: Entries kept when pruning on close (least recently used go first)
+
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                used_at REAL NOT NULL,
+                PRIMARY KEY (model, content_hash)
+            ) WITHOUT ROWID
+            """,
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embedding_cache_used ON embedding_cache(used_at)",
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, model: str, texts: list[str]) -> list[bytes | None]:
+        """Look up cached embeddings for a batch of texts.
+
+        Args:
+            model: Embedding model name
+            texts: Texts that would be embedded
+
+        Returns:
+            Raw float32 embedding bytes per text, None on a miss
+
+        """
+        hashes = [content_hash(text) for text in texts]
+        found: dict[str, bytes] = {}
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(hashes), _LOOKUP_CHUNK):
+                block = hashes[start : start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(block))
+                cursor = self._conn.execute(
+                    f"""SELECT content_hash, embedding FROM embedding_cache
+                        WHERE model = ? AND content_hash IN ({placeholders})""",
+                    [model, *block],
+                )
+                found.update(cursor.fetchall())
+            if found:
+                self._conn.executemany(
+                    "UPDATE embedding_cache SET used_at = ? WHERE model = ? AND content_hash = ?",
+                    [(now, model, h) for h in found],
+                )
+                self._conn.commit()
+
+        embeddings = [found.get(h) for h in hashes]
+        hit_count = sum(e is not None for e in embeddings)
+        self.hits += hit_count
+        self.misses += len(embeddings) - hit_count
+        return embeddings
+
+    def put_many(self, model: str, texts: list[str], embeddings: list[bytes]) -> None:
+        """Store embeddings for a batch of texts (replaces existing entries).
+
+        Args:
+            model: Embedding model name
+            texts: Embedded texts
+            embeddings: Raw float32 embedding bytes, aligned with ``texts``
+
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                """INSERT OR REPLACE INTO embedding_cache (model, content_hash, embedding, used_at)
+                   VALUES (?, ?, ?, ?)""",
+                [
+                    (model, content_hash(text), embedding, now)
+                    for text, embedding in zip(texts, embeddings, strict=True)
+                ],
+            )
+            self._conn.commit()
+
+    def prune(self) -> int:
+        """Delete the least recently used entries beyond ``max_entries``.
+
+        Returns:
+            Number of entries deleted
+
+        """
+        with self._lock:
+            count: int = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+            excess = count - self.max_entries
+            if excess <= 0:
+                return 0
+            self._conn.execute(
+                """DELETE FROM embedding_cache WHERE (model, content_hash) IN (
+                       SELECT model, content_hash FROM embedding_cache ORDER BY used_at LIMIT ?
+                   )""",
+                (excess,),
+            )
+            self._conn.commit()
+        return excess
+
+    def close(self) -> None:
+        """Prune old entries and close the database."""
+        try:
+            self.prune()
+        except sqlite3.Error as e:
+            logger.debug(f"Embedding cache prune failed: {e}")
+        with self._lock:
+            self._conn.close()
+        logger.debug(f"Embedding cache closed ({self.hits} hits, {self.misses} misses)")
+
+
+__all__ = ["DEFAULT_MAX_ENTRIES", "EmbeddingCache", "content_hash"]
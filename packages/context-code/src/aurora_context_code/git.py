@@ -8,6 +8,9 @@ the cache in O(1) time.
 
 This optimization reduces git operations from O(functions) to O(files),
 typically a 5-10x speedup for codebases with multiple functions per file.
+With a persistent GitBlameCache, blame survives across runs and only files
+whose content changed are blamed again, so re-indexing an unchanged repo
+spawns no `git blame` processes at all.
 
 The key insight: Functions in the same file can have VERY different edit histories.
 A frequently-edited function should have higher initial activation than a
@@ -32,6 +35,8 @@ import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 
+from aurora_context_code.git_cache import GitBlameCache, git_blob_hash
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,15 +53,17 @@ class GitSignalExtractor:
     on its individual edit history, not the file-level history.
     """
 
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, blame_cache: GitBlameCache | None = None):
         """Initialize the Git signal extractor.
 
         Args:
             timeout: Timeout in seconds for Git commands (default 30, increased for full-file blame)
+            blame_cache: Optional persistent blame cache shared across runs
 
         """
         self.timeout = timeout
         self.available = True
+        self.blame_cache = blame_cache
 
         # File-level blame cache: {file_path: {line_num: (sha, timestamp)}}
         # This eliminates redundant git blame calls for functions in the same file
@@ -66,8 +73,11 @@ class GitSignalExtractor:
         # Avoids repeated `git show` calls for the same commit
         self._commit_timestamp_cache: dict[str, int] = {}
 
-        # Track which repo we're working in (for cwd in git commands)
-        self._repo_root: Path | None = None
+        # Repository root per directory (nested repos and submodules have their own)
+        self._repo_roots: dict[Path, Path | None] = {}
+
+        # HEAD commit per repository root (validates cached blame with uncommitted lines)
+        self._heads: dict[Path, str | None] = {}
 
         # Check if Git should be disabled via environment variable
         if os.getenv("AURORA_SKIP_GIT"):
@@ -78,24 +88,47 @@ class GitSignalExtractor:
             )
 
     def _get_repo_root(self, file_path: Path) -> Path | None:
-        """Find the git repository root for a file."""
-        if self._repo_root is not None:
-            return self._repo_root
+        """Find the git repository root for a file (cached per directory)."""
+        directory = file_path.parent
+        if directory in self._repo_roots:
+            return self._repo_roots[directory]
 
+        repo_root = None
         try:
             result = subprocess.run(
                 ["git", "rev-parse", "--show-toplevel"],
                 capture_output=True,
                 text=True,
                 timeout=5,
-                cwd=file_path.parent,
+                cwd=directory,
             )
             if result.returncode == 0:
-                self._repo_root = Path(result.stdout.strip())
-                return self._repo_root
+                repo_root = Path(result.stdout.strip())
         except Exception:
             pass
-        return None
+        self._repo_roots[directory] = repo_root
+        return repo_root
+
+    def _get_head(self, repo_root: Path) -> str | None:
+        """Get the HEAD commit SHA of a repository (None if there are no commits)."""
+        if repo_root in self._heads:
+            return self._heads[repo_root]
+
+        head = None
+        try:
+            result = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                cwd=repo_root,
+            )
+            if result.returncode == 0:
+                head = result.stdout.strip()
+        except Exception:
+            pass
+        self._heads[repo_root] = head
+        return head
 
     def _get_file_blame(self, file_path: Path) -> dict[int, tuple[str, int]]:
         """Get blame data for entire file, with caching.
@@ -126,6 +159,16 @@ class GitSignalExtractor:
                 logger.debug(f"Not a git repo: {file_path}")
                 return {}
 
+            # Persistent cache: valid while the file's blob hash is unchanged
+            blob_hash = head = None
+            if self.blame_cache is not None:
+                blob_hash = git_blob_hash(file_path.read_bytes())
+                head = self._get_head(repo_root)
+                cached = self.blame_cache.get(file_key, blob_hash, head)
+                if cached is not None:
+                    self._file_blame_cache[file_key] = cached
+                    return cached
+
             # Run git blame for ENTIRE file (no -L flag) - this is the key optimization
             result = subprocess.run(
                 ["git", "blame", "--line-porcelain", str(file_path)],
@@ -142,6 +185,8 @@ class GitSignalExtractor:
             # Parse the porcelain output into per-line data
             blame_data = self._parse_full_file_blame(result.stdout, repo_root)
             self._file_blame_cache[file_key] = blame_data
+            if self.blame_cache is not None and blob_hash is not None:
+                self.blame_cache.put(file_key, blob_hash, head, blame_data)
 
             logger.debug(f"Cached blame for {file_path.name}: {len(blame_data)} lines")
             return blame_data
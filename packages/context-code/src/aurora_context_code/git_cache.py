@@ -0,0 +1,198 @@
+"""Persistent Git blame cache for GitSignalExtractor.
+
+`git blame` is the dominant cost of Git signal extraction: one subprocess per
+file on every (re-)index. GitBlameCache stores each file's per-line
+attribution in a small SQLite database next to the memory DB, keyed by the
+file's Git blob hash. The blob hash is computed in-process from the file
+content (``sha1("blob <size>\\0" + content)``), so checking whether a cached
+entry is still valid costs no subprocess at all. Only files whose content
+changed since the last index are blamed again.
+
+Entries that contain uncommitted lines are additionally tied to the HEAD
+commit they were computed at: committing those lines changes their
+attribution without changing the file content.
+
+Usage:
+    >>> cache = GitBlameCache(Path("~/.aurora/git_signals.db").expanduser())
+    >>> extractor = GitSignalExtractor(blame_cache=cache)
+    >>> ...
+    >>> cache.close()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# SHA git blame reports for lines that are not committed yet
+UNCOMMITTED_SHA = "0" * 40
+
+# Pending writes are committed in batches of this size
+_FLUSH_EVERY = 200
+
+BlameData = dict[int, tuple[str, int]]
+
+
+def git_blob_hash(content: bytes) -> str:
+    """Compute the Git blob hash of file content (same as `git hash-object`)."""
+    header = f"blob {len(content)}\0".encode()
+    return hashlib.sha1(header + content, usedforsecurity=False).hexdigest()
+
+
+def _encode_blame(blame: BlameData) -> str:
+    """Encode per-line blame as run-length JSON.
+
+    Consecutive lines attributed to the same commit collapse into one
+    ``[first_line, line_count, commit_index]`` run.
+    """
+    commits: dict[str, int] = {}
+    timestamps: list[int] = []
+    runs: list[list[int]] = []
+    for line in sorted(blame):
+        sha, timestamp = blame[line]
+        index = commits.get(sha)
+        if index is None:
+            index = commits[sha] = len(timestamps)
+            timestamps.append(timestamp)
+        if runs and runs[-1][2] == index and runs[-1][0] + runs[-1][1] == line:
+            runs[-1][1] += 1
+        else:
+            runs.append([line, 1, index])
+    return json.dumps({"commits": list(commits), "times": timestamps, "runs": runs})
+
+
+def _decode_blame(payload: str) -> BlameData:
+    """Decode blame data produced by _encode_blame()."""
+    data = json.loads(payload)
+    commits = data["commits"]
+    timestamps = data["times"]
+    blame: BlameData = {}
+    for first, count, index in data["runs"]:
+        entry = (commits[index], timestamps[index])
+        for line in range(first, first + count):
+            blame[line] = entry
+    return blame
+
+
+class GitBlameCache:
+    """Per-file blame attribution persisted in SQLite, keyed by blob hash.
+
+    Thread-safe: a single connection is shared behind a lock. Writes are
+    buffered and committed in batches; call ``flush()`` or ``close()`` when
+    indexing finishes.
+    """
+
+    def __init__(self, db_path: str | Path):
+        """Open (or create) the cache database.
+
+        Args:
+            db_path: Path of the cache database file
+
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS blame_cache (
+                file_path TEXT PRIMARY KEY,
+                blob_hash TEXT NOT NULL,
+                head TEXT,
+                has_uncommitted INTEGER NOT NULL DEFAULT 0,
+                blame TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """,
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, file_path: str, blob_hash: str, head: str | None) -> BlameData | None:
+        """Return cached blame for a file if it is still valid.
+
+        Args:
+            file_path: Absolute file path (cache key)
+            blob_hash: Current Git blob hash of the file content
+            head: Current HEAD commit (None if unknown)
+
+        Returns:
+            Per-line blame data, or None on a miss or stale entry
+
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blob_hash, head, has_uncommitted, blame FROM blame_cache WHERE file_path = ?",
+                (file_path,),
+            ).fetchone()
+
+        if row is None or row[0] != blob_hash or (row[2] and (head is None or row[1] != head)):
+            self.misses += 1
+            return None
+
+        try:
+            blame = _decode_blame(row[3])
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            logger.debug(f"Discarding corrupt blame cache entry for {file_path}: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return blame
+
+    def put(self, file_path: str, blob_hash: str, head: str | None, blame: BlameData) -> None:
+        """Store blame for a file (replaces any previous entry).
+
+        Args:
+            file_path: Absolute file path (cache key)
+            blob_hash: Git blob hash of the content that was blamed
+            head: HEAD commit the blame was computed at
+            blame: Per-line blame data
+
+        """
+        has_uncommitted = any(sha == UNCOMMITTED_SHA for sha, _ in blame.values())
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO blame_cache
+                   (file_path, blob_hash, head, has_uncommitted, blame, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (file_path, blob_hash, head, int(has_uncommitted), _encode_blame(blame), time.time()),
+            )
+            self._pending += 1
+            if self._pending >= _FLUSH_EVERY:
+                self._conn.commit()
+                self._pending = 0
+
+    def invalidate(self, file_path: str) -> None:
+        """Drop the cached entry for a file."""
+        with self._lock:
+            self._conn.execute("DELETE FROM blame_cache WHERE file_path = ?", (file_path,))
+            self._pending += 1
+
+    def flush(self) -> None:
+        """Commit buffered writes."""
+        with self._lock:
+            if self._pending:
+                self._conn.commit()
+                self._pending = 0
+
+    def close(self) -> None:
+        """Flush buffered writes and close the database."""
+        self.flush()
+        with self._lock:
+            self._conn.close()
+        logger.debug(f"Git blame cache closed ({self.hits} hits, {self.misses} misses)")
+
+
+__all__ = ["GitBlameCache", "UNCOMMITTED_SHA", "git_blob_hash"]
@@ -9,6 +9,7 @@ import logging
 import os
 from pathlib import Path
 
+from aurora_context_code.languages.visitor import SyntaxIndex
 from aurora_context_code.parser import CodeParser
 from aurora_core.chunks.code_chunk import CodeChunk
 
@@ -36,6 +37,31 @@ class GoParser(CodeParser):
 
     EXTENSIONS = {".go"}
 
+    # Node types that represent branch points for complexity scoring
+    BRANCH_TYPES = {
+        "if_statement",
+        "for_statement",
+        "expression_switch_statement",
+        "type_switch_statement",
+        "select_statement",
+        "expression_case",
+        "type_case",
+        "communication_case",
+    }
+    # binary_expression nodes with these operators also count as branches
+    LOGICAL_OPERATORS = {"&&", "||"}
+
+    # Node types collected in the single indexing pass
+    INDEXED_TYPES = {
+        "function_declaration",
+        "method_declaration",
+        "type_declaration",
+    }
+    SCOPE_TYPES = {
+        "function_declaration",
+        "method_declaration",
+    }
+
     def __init__(self) -> None:
         """Initialize Go parser with tree-sitter grammar."""
         super().__init__(language="go")
@@ -86,16 +112,25 @@ class GoParser(CodeParser):
             if tree.root_node.has_error:
                 logger.warning(f"Parse errors in {file_path}, extracting partial results")
 
+            # Visit the tree once; extraction below only queries the index
+            index = SyntaxIndex(
+                tree.root_node,
+                collect=self.INDEXED_TYPES,
+                scopes=self.SCOPE_TYPES,
+                branch_types=self.BRANCH_TYPES,
+                logical_operators=self.LOGICAL_OPERATORS,
+            )
+
             chunks: list[CodeChunk] = []
 
             # Extract functions
-            chunks.extend(self._extract_functions(tree.root_node, file_path, source_code))
+            chunks.extend(self._extract_functions(index, file_path, source_code))
 
             # Extract methods (functions with receivers)
-            chunks.extend(self._extract_methods(tree.root_node, file_path, source_code))
+            chunks.extend(self._extract_methods(index, file_path, source_code))
 
             # Extract type declarations (structs, interfaces)
-            chunks.extend(self._extract_type_declarations(tree.root_node, file_path, source_code))
+            chunks.extend(self._extract_type_declarations(index, file_path, source_code))
 
             logger.debug(f"Extracted {len(chunks)} chunks from {file_path}")
             return chunks
@@ -106,14 +141,14 @@ class GoParser(CodeParser):
 
     def _extract_functions(
         self,
-        root_node: tree_sitter.Node,
+        index: SyntaxIndex,
         file_path: Path,
         source_code: str,
     ) -> list[CodeChunk]:
         """Extract top-level function declarations (no receiver)."""
         chunks: list[CodeChunk] = []
 
-        for node in self._find_nodes_by_type(root_node, "function_declaration"):
+        for node in index.nodes("function_declaration"):
             try:
                 name_node = node.child_by_field_name("name")
                 if not name_node:
@@ -132,7 +167,7 @@ class GoParser(CodeParser):
                 line_end = node.end_point[0] + 1
                 chunk_id = self._generate_chunk_id(file_path, name, line_start)
                 docstring = self._extract_go_doc(node, source_code)
-                complexity = self._calculate_complexity(node)
+                complexity = index.complexity(node)
 
                 chunks.append(
                     CodeChunk(
@@ -157,14 +192,14 @@ class GoParser(CodeParser):
 
     def _extract_methods(
         self,
-        root_node: tree_sitter.Node,
+        index: SyntaxIndex,
         file_path: Path,
         source_code: str,
     ) -> list[CodeChunk]:
         """Extract method declarations (functions with receivers)."""
         chunks: list[CodeChunk] = []
 
-        for node in self._find_nodes_by_type(root_node, "method_declaration"):
+        for node in index.nodes("method_declaration"):
             try:
                 name_node = node.child_by_field_name("name")
                 receiver_node = node.child_by_field_name("receiver")
@@ -203,7 +238,7 @@ class GoParser(CodeParser):
                 line_end = node.end_point[0] + 1
                 chunk_id = self._generate_chunk_id(file_path, qualified_name, line_start)
                 docstring = self._extract_go_doc(node, source_code)
-                complexity = self._calculate_complexity(node)
+                complexity = index.complexity(node)
 
                 chunks.append(
                     CodeChunk(
@@ -228,14 +263,14 @@ class GoParser(CodeParser):
 
     def _extract_type_declarations(
         self,
-        root_node: tree_sitter.Node,
+        index: SyntaxIndex,
         file_path: Path,
         source_code: str,
     ) -> list[CodeChunk]:
         """Extract type declarations (structs, interfaces)."""
         chunks: list[CodeChunk] = []
 
-        for node in self._find_nodes_by_type(root_node, "type_declaration"):
+        for node in index.nodes("type_declaration"):
             for child in node.children:
                 if child.type != "type_spec":
                     continue
@@ -281,19 +316,6 @@ class GoParser(CodeParser):
 
         return chunks
 
-    def _find_nodes_by_type(self, node: tree_sitter.Node, node_type: str) -> list[tree_sitter.Node]:
-        """Find all nodes of a given type in the tree."""
-        results: list[tree_sitter.Node] = []
-
-        def traverse(n: tree_sitter.Node) -> None:
-            if n.type == node_type:
-                results.append(n)
-            for child in n.children:
-                traverse(child)
-
-        traverse(node)
-        return results
-
     def _extract_go_doc(self, node: tree_sitter.Node, source_code: str) -> str | None:
         """Extract Go doc comment preceding a node."""
         try:
@@ -310,39 +332,6 @@ class GoParser(CodeParser):
         except Exception:
             return None
 
-    def _calculate_complexity(self, node: tree_sitter.Node) -> float:
-        """Calculate cyclomatic complexity for a code element."""
-        branch_types = {
-            "if_statement",
-            "for_statement",
-            "expression_switch_statement",
-            "type_switch_statement",
-            "select_statement",
-            "expression_case",
-            "type_case",
-            "communication_case",
-        }
-
-        branch_count = 0
-
-        def count_branches(n: tree_sitter.Node) -> None:
-            nonlocal branch_count
-            if n.type in branch_types:
-                branch_count += 1
-            elif n.type == "binary_expression":
-                for child in n.children:
-                    if child.type in ("&&", "||"):
-                        branch_count += 1
-                        break
-            for child in n.children:
-                count_branches(child)
-
-        count_branches(node)
-
-        if branch_count == 0:
-            return 0.0
-        return min(branch_count / (branch_count + 10), 1.0)
-
     def _generate_chunk_id(self, file_path: Path, element_name: str, line_start: int) -> str:
         """Generate a unique chunk ID."""
         unique_string = f"{file_path}:{element_name}:{line_start}"
@@ -9,6 +9,7 @@ import logging
 import os
 from pathlib import Path
 
+from aurora_context_code.languages.visitor import SyntaxIndex
 from aurora_context_code.parser import CodeParser
 from aurora_core.chunks.code_chunk import CodeChunk
 
@@ -36,6 +37,33 @@ class JavaParser(CodeParser):
 
     EXTENSIONS = {".java"}
 
+    # Node types that represent branch points for complexity scoring
+    BRANCH_TYPES = {
+        "if_statement",
+        "for_statement",
+        "enhanced_for_statement",
+        "while_statement",
+        "do_statement",
+        "switch_expression",
+        "switch_block_statement_group",
+        "catch_clause",
+        "ternary_expression",
+    }
+    # binary_expression nodes with these operators also count as branches
+    LOGICAL_OPERATORS = {"&&", "||"}
+
+    # Node types collected in the single indexing pass
+    INDEXED_TYPES = {
+        "class_declaration",
+        "interface_declaration",
+        "enum_declaration",
+    }
+    SCOPE_TYPES = {
+        "class_declaration",
+        "method_declaration",
+        "constructor_declaration",
+    }
+
     def __init__(self) -> None:
         """Initialize Java parser with tree-sitter grammar."""
         super().__init__(language="java")
@@ -86,16 +114,25 @@ class JavaParser(CodeParser):
             if tree.root_node.has_error:
                 logger.warning(f"Parse errors in {file_path}, extracting partial results")
 
+            # Visit the tree once; extraction below only queries the index
+            index = SyntaxIndex(
+                tree.root_node,
+                collect=self.INDEXED_TYPES,
+                scopes=self.SCOPE_TYPES,
+                branch_types=self.BRANCH_TYPES,
+                logical_operators=self.LOGICAL_OPERATORS,
+            )
+
             chunks: list[CodeChunk] = []
 
             # Extract classes and their methods
-            chunks.extend(self._extract_classes(tree.root_node, file_path, source_code))
+            chunks.extend(self._extract_classes(index, file_path, source_code))
 
             # Extract interfaces
-            chunks.extend(self._extract_interfaces(tree.root_node, file_path, source_code))
+            chunks.extend(self._extract_interfaces(index, file_path, source_code))
 
             # Extract enums
-            chunks.extend(self._extract_enums(tree.root_node, file_path, source_code))
+            chunks.extend(self._extract_enums(index, file_path, source_code))
 
             logger.debug(f"Extracted {len(chunks)} chunks from {file_path}")
             return chunks
@@ -106,7 +143,7 @@ class JavaParser(CodeParser):
 
     def _extract_classes(
         self,
-        root_node: tree_sitter.Node,
+        index: SyntaxIndex,
         file_path: Path,
         source_code: str,
         parent_name: str = "",
@@ -114,7 +151,7 @@ class JavaParser(CodeParser):
         """Extract class declarations and their methods."""
         chunks: list[CodeChunk] = []
 
-        for node in self._find_nodes_by_type(root_node, "class_declaration"):
+        for node in index.nodes("class_declaration"):
             try:
                 name_node = node.child_by_field_name("name")
                 if not name_node:
@@ -129,7 +166,7 @@ class JavaParser(CodeParser):
                 line_end = node.end_point[0] + 1
                 chunk_id = self._generate_chunk_id(file_path, qualified_name, line_start)
                 docstring = self._extract_javadoc(node, source_code)
-                complexity = self._calculate_complexity(node)
+                complexity = index.complexity(node)
 
                 chunks.append(
                     CodeChunk(
@@ -151,7 +188,7 @@ class JavaParser(CodeParser):
                 body_node = node.child_by_field_name("body")
                 if body_node:
                     chunks.extend(
-                        self._extract_methods(body_node, qualified_name, file_path, source_code)
+                        self._extract_methods(index, body_node, qualified_name, file_path, source_code)
                     )
 
             except Exception as e:
@@ -162,14 +199,14 @@ class JavaParser(CodeParser):
 
     def _extract_interfaces(
         self,
-        root_node: tree_sitter.Node,
+        index: SyntaxIndex,
         file_path: Path,
         source_code: str,
     ) -> list[CodeChunk]:
         """Extract interface declarations."""
         chunks: list[CodeChunk] = []
 
-        for node in self._find_nodes_by_type(root_node, "interface_declaration"):
+        for node in index.nodes("interface_declaration"):
             try:
                 name_node = node.child_by_field_name("name")
                 if not name_node:
@@ -202,7 +239,7 @@ class JavaParser(CodeParser):
                 # Extract methods in interface
                 body_node = node.child_by_field_name("body")
                 if body_node:
-                    chunks.extend(self._extract_methods(body_node, name, file_path, source_code))
+                    chunks.extend(self._extract_methods(index, body_node, name, file_path, source_code))
 
             except Exception as e:
                 logger.warning(f"Failed to extract interface: {e}")
@@ -212,14 +249,14 @@ class JavaParser(CodeParser):
 
     def _extract_enums(
         self,
-        root_node: tree_sitter.Node,
+        index: SyntaxIndex,
         file_path: Path,
         source_code: str,
     ) -> list[CodeChunk]:
         """Extract enum declarations."""
         chunks: list[CodeChunk] = []
 
-        for node in self._find_nodes_by_type(root_node, "enum_declaration"):
+        for node in index.nodes("enum_declaration"):
             try:
                 name_node = node.child_by_field_name("name")
                 if not name_node:
@@ -257,6 +294,7 @@ class JavaParser(CodeParser):
 
     def _extract_methods(
         self,
+        index: SyntaxIndex,
         class_body: tree_sitter.Node,
         class_name: str,
         file_path: Path,
@@ -290,7 +328,7 @@ class JavaParser(CodeParser):
                 line_end = child.end_point[0] + 1
                 chunk_id = self._generate_chunk_id(file_path, qualified_name, line_start)
                 docstring = self._extract_javadoc(child, source_code)
-                complexity = self._calculate_complexity(child)
+                complexity = index.complexity(child)
 
                 chunks.append(
                     CodeChunk(
@@ -330,19 +368,6 @@ class JavaParser(CodeParser):
 
         return signature
 
-    def _find_nodes_by_type(self, node: tree_sitter.Node, node_type: str) -> list[tree_sitter.Node]:
-        """Find all nodes of a given type in the tree."""
-        results: list[tree_sitter.Node] = []
-
-        def traverse(n: tree_sitter.Node) -> None:
-            if n.type == node_type:
-                results.append(n)
-            for child in n.children:
-                traverse(child)
-
-        traverse(node)
-        return results
-
     def _extract_javadoc(self, node: tree_sitter.Node, source_code: str) -> str | None:
         """Extract Javadoc comment preceding a node."""
         try:
@@ -374,40 +399,6 @@ class JavaParser(CodeParser):
         result = "\n".join(lines).strip()
         return result if result else None
 
-    def _calculate_complexity(self, node: tree_sitter.Node) -> float:
-        """Calculate cyclomatic complexity for a code element."""
-        branch_types = {
-            "if_statement",
-            "for_statement",
-            "enhanced_for_statement",
-            "while_statement",
-            "do_statement",
-            "switch_expression",
-            "switch_block_statement_group",
-            "catch_clause",
-            "ternary_expression",
-        }
-
-        branch_count = 0
-
-        def count_branches(n: tree_sitter.Node) -> None:
-            nonlocal branch_count
-            if n.type in branch_types:
-                branch_count += 1
-            elif n.type == "binary_expression":
-                for child in n.children:
-                    if child.type in ("&&", "||"):
-                        branch_count += 1
-                        break
-            for child in n.children:
-                count_branches(child)
-
-        count_branches(node)
-
-        if branch_count == 0:
-            return 0.0
-        return min(branch_count / (branch_count + 10), 1.0)
-
     def _generate_chunk_id(self, file_path: Path, element_name: str, line_start: int) -> str:
         """Generate a unique chunk ID."""
         unique_string = f"{file_path}:{element_name}:{line_start}"
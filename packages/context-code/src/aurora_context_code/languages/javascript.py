@@ -9,6 +9,7 @@ import logging
 import os
 from pathlib import Path
 
+from aurora_context_code.languages.visitor import SyntaxIndex
 from aurora_context_code.parser import CodeParser
 from aurora_core.chunks.code_chunk import CodeChunk
 
@@ -38,6 +39,37 @@ class JavaScriptParser(CodeParser):
     # Supported file extensions
     EXTENSIONS = {".js", ".jsx", ".mjs", ".cjs"}
 
+    # Node types that represent branch points for complexity scoring
+    BRANCH_TYPES = {
+        "if_statement",
+        "for_statement",
+        "for_in_statement",
+        "while_statement",
+        "do_statement",
+        "switch_statement",
+        "switch_case",
+        "catch_clause",
+        "ternary_expression",
+    }
+    # binary_expression nodes with these operators also count as branches
+    LOGICAL_OPERATORS = {"&&", "||"}
+
+    # Node types collected in the single indexing pass
+    INDEXED_TYPES = {
+        "function_declaration",
+        "lexical_declaration",
+        "variable_declaration",
+        "export_statement",
+        "class_declaration",
+    }
+    SCOPE_TYPES = {
+        "class_declaration",
+        "function_declaration",
+        "arrow_function",
+        "function_expression",
+        "method_definition",
+    }
+
     def __init__(self) -> None:
         """Initialize JavaScript parser with tree-sitter grammar."""
         super().__init__(language="javascript")
@@ -88,13 +120,22 @@ class JavaScriptParser(CodeParser):
             if tree.root_node.has_error:
                 logger.warning(f"Parse errors in {file_path}, extracting partial results")
 
+            # Visit the tree once; extraction below only queries the index
+            index = SyntaxIndex(
+                tree.root_node,
+                collect=self.INDEXED_TYPES,
+                scopes=self.SCOPE_TYPES,
+                branch_types=self.BRANCH_TYPES,
+                logical_operators=self.LOGICAL_OPERATORS,
+            )
+
             chunks: list[CodeChunk] = []
 
             # Extract functions (including arrow functions)
-            chunks.extend(self._extract_functions(tree.root_node, file_path, source_code))
+            chunks.extend(self._extract_functions(index, file_path, source_code))
 
             # Extract classes and methods
-            chunks.extend(self._extract_classes_and_methods(tree.root_node, file_path, source_code))
+            chunks.extend(self._extract_classes_and_methods(index, file_path, source_code))
 
             logger.debug(f"Extracted {len(chunks)} chunks from {file_path}")
             return chunks
@@ -105,7 +146,7 @@ class JavaScriptParser(CodeParser):
 
     def _extract_functions(
         self,
-        root_node: tree_sitter.Node,
+        index: SyntaxIndex,
         file_path: Path,
         source_code: str,
     ) -> list[CodeChunk]:
@@ -113,38 +154,38 @@ class JavaScriptParser(CodeParser):
         chunks: list[CodeChunk] = []
 
         # Function declarations: function foo() {}
-        for node in self._find_nodes_by_type(root_node, "function_declaration"):
-            if self._is_inside_class(node):
+        for node in index.nodes("function_declaration"):
+            if index.has_ancestor(node, "class_declaration"):
                 continue
-            chunk = self._extract_function_chunk(node, file_path, source_code)
+            chunk = self._extract_function_chunk(index, node, file_path, source_code)
             if chunk:
                 chunks.append(chunk)
 
         # Arrow functions assigned to variables: const foo = () => {}
-        for node in self._find_nodes_by_type(root_node, "lexical_declaration"):
-            if self._is_inside_class(node):
+        for node in index.nodes("lexical_declaration"):
+            if index.has_ancestor(node, "class_declaration"):
                 continue
-            chunk = self._extract_arrow_function(node, file_path, source_code)
+            chunk = self._extract_arrow_function(index, node, file_path, source_code)
             if chunk:
                 chunks.append(chunk)
 
         # Variable declarations with functions: var foo = function() {}
-        for node in self._find_nodes_by_type(root_node, "variable_declaration"):
-            if self._is_inside_class(node):
+        for node in index.nodes("variable_declaration"):
+            if index.has_ancestor(node, "class_declaration"):
                 continue
-            chunk = self._extract_function_expression(node, file_path, source_code)
+            chunk = self._extract_function_expression(index, node, file_path, source_code)
             if chunk:
                 chunks.append(chunk)
 
         # Export statements
-        for node in self._find_nodes_by_type(root_node, "export_statement"):
+        for node in index.nodes("export_statement"):
             for child in node.children:
                 if child.type == "function_declaration":
-                    chunk = self._extract_function_chunk(child, file_path, source_code)
+                    chunk = self._extract_function_chunk(index, child, file_path, source_code)
                     if chunk:
                         chunks.append(chunk)
                 elif child.type == "lexical_declaration":
-                    chunk = self._extract_arrow_function(child, file_path, source_code)
+                    chunk = self._extract_arrow_function(index, child, file_path, source_code)
                     if chunk:
                         chunks.append(chunk)
 
@@ -152,6 +193,7 @@ class JavaScriptParser(CodeParser):
 
     def _extract_function_chunk(
         self,
+        index: SyntaxIndex,
         node: tree_sitter.Node,
         file_path: Path,
         source_code: str,
@@ -172,7 +214,7 @@ class JavaScriptParser(CodeParser):
             line_end = node.end_point[0] + 1
             chunk_id = self._generate_chunk_id(file_path, name, line_start)
             docstring = self._extract_jsdoc(node, source_code)
-            complexity = self._calculate_complexity(node)
+            complexity = index.complexity(node)
 
             return CodeChunk(
                 chunk_id=chunk_id,
@@ -193,6 +235,7 @@ class JavaScriptParser(CodeParser):
 
     def _extract_arrow_function(
         self,
+        index: SyntaxIndex,
         node: tree_sitter.Node,
         file_path: Path,
         source_code: str,
@@ -222,7 +265,7 @@ class JavaScriptParser(CodeParser):
                     line_end = node.end_point[0] + 1
                     chunk_id = self._generate_chunk_id(file_path, name, line_start)
                     docstring = self._extract_jsdoc(node, source_code)
-                    complexity = self._calculate_complexity(value_node)
+                    complexity = index.complexity(value_node)
 
                     return CodeChunk(
                         chunk_id=chunk_id,
@@ -244,6 +287,7 @@ class JavaScriptParser(CodeParser):
 
     def _extract_function_expression(
         self,
+        index: SyntaxIndex,
         node: tree_sitter.Node,
         file_path: Path,
         source_code: str,
@@ -272,7 +316,7 @@ class JavaScriptParser(CodeParser):
                     line_end = node.end_point[0] + 1
                     chunk_id = self._generate_chunk_id(file_path, name, line_start)
                     docstring = self._extract_jsdoc(node, source_code)
-                    complexity = self._calculate_complexity(value_node)
+                    complexity = index.complexity(value_node)
 
                     return CodeChunk(
                         chunk_id=chunk_id,
@@ -294,14 +338,14 @@ class JavaScriptParser(CodeParser):
 
     def _extract_classes_and_methods(
         self,
-        root_node: tree_sitter.Node,
+        index: SyntaxIndex,
         file_path: Path,
         source_code: str,
     ) -> list[CodeChunk]:
         """Extract class definitions and their methods."""
         chunks: list[CodeChunk] = []
 
-        for class_node in self._find_nodes_by_type(root_node, "class_declaration"):
+        for class_node in index.nodes("class_declaration"):
             try:
                 name_node = class_node.child_by_field_name("name")
                 if not name_node:
@@ -318,7 +362,7 @@ class JavaScriptParser(CodeParser):
                 line_end = class_node.end_point[0] + 1
                 chunk_id = self._generate_chunk_id(file_path, class_name, line_start)
                 docstring = self._extract_jsdoc(class_node, source_code)
-                complexity = self._calculate_complexity(class_node)
+                complexity = index.complexity(class_node)
 
                 chunk = CodeChunk(
                     chunk_id=chunk_id,
@@ -339,7 +383,7 @@ class JavaScriptParser(CodeParser):
                 body_node = class_node.child_by_field_name("body")
                 if body_node:
                     chunks.extend(
-                        self._extract_methods(body_node, class_name, file_path, source_code),
+                        self._extract_methods(index, body_node, class_name, file_path, source_code),
                     )
 
             except Exception as e:
@@ -350,6 +394,7 @@ class JavaScriptParser(CodeParser):
 
     def _extract_methods(
         self,
+        index: SyntaxIndex,
         class_body: tree_sitter.Node,
         class_name: str,
         file_path: Path,
@@ -378,7 +423,7 @@ class JavaScriptParser(CodeParser):
                 line_end = child.end_point[0] + 1
                 chunk_id = self._generate_chunk_id(file_path, qualified_name, line_start)
                 docstring = self._extract_jsdoc(child, source_code)
-                complexity = self._calculate_complexity(child)
+                complexity = index.complexity(child)
 
                 chunk = CodeChunk(
                     chunk_id=chunk_id,
@@ -401,28 +446,6 @@ class JavaScriptParser(CodeParser):
 
         return chunks
 
-    def _find_nodes_by_type(self, node: tree_sitter.Node, node_type: str) -> list[tree_sitter.Node]:
-        """Find all nodes of a given type in the tree."""
-        results: list[tree_sitter.Node] = []
-
-        def traverse(n: tree_sitter.Node) -> None:
-            if n.type == node_type:
-                results.append(n)
-            for child in n.children:
-                traverse(child)
-
-        traverse(node)
-        return results
-
-    def _is_inside_class(self, node: tree_sitter.Node) -> bool:
-        """Check if a node is inside a class definition."""
-        current = node.parent
-        while current:
-            if current.type == "class_declaration":
-                return True
-            current = current.parent
-        return False
-
     def _extract_jsdoc(self, node: tree_sitter.Node, source_code: str) -> str | None:
         """Extract JSDoc comment preceding a node."""
         try:
@@ -455,42 +478,6 @@ class JavaScriptParser(CodeParser):
         result = "\n".join(lines).strip()
         return result if result else None
 
-    def _calculate_complexity(self, node: tree_sitter.Node) -> float:
-        """Calculate cyclomatic complexity for a code element."""
-        branch_types = {
-            "if_statement",
-            "for_statement",
-            "for_in_statement",
-            "while_statement",
-            "do_statement",
-            "switch_statement",
-            "switch_case",
-            "catch_clause",
-            "ternary_expression",
-            "binary_expression",
-        }
-
-        branch_count = 0
-
-        def count_branches(n: tree_sitter.Node) -> None:
-            nonlocal branch_count
-            if n.type in branch_types:
-                if n.type == "binary_expression":
-                    for child in n.children:
-                        if child.type == "&&" or child.type == "||":
-                            branch_count += 1
-                            break
-                else:
-                    branch_count += 1
-            for child in n.children:
-                count_branches(child)
-
-        count_branches(node)
-
-        if branch_count == 0:
-            return 0.0
-        return min(branch_count / (branch_count + 10), 1.0)
-
     def _generate_chunk_id(self, file_path: Path, element_name: str, line_start: int) -> str:
         """Generate a unique chunk ID."""
         unique_string = f"{file_path}:{element_name}:{line_start}"
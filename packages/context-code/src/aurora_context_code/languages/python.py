@@ -9,6 +9,7 @@ import logging
 import os
 from pathlib import Path
 
+from aurora_context_code.languages.visitor import SyntaxIndex
 from aurora_context_code.parser import CodeParser
 from aurora_core.chunks.code_chunk import CodeChunk
 
@@ -44,6 +45,30 @@ class PythonParser(CodeParser):
     # Supported file extensions
     EXTENSIONS = {".py", ".pyi"}
 
+    # Node types that represent branch points for complexity scoring
+    BRANCH_TYPES = {
+        "if_statement",
+        "for_statement",
+        "while_statement",
+        "try_statement",
+        "with_statement",
+        "match_statement",  # Python 3.10+
+        "elif_clause",
+        "except_clause",
+        "boolean_operator",  # and/or operators
+        "conditional_expression",  # ternary operator
+    }
+
+    # Node types collected in the single indexing pass
+    INDEXED_TYPES = {
+        "function_definition",
+        "class_definition",
+        "import_statement",
+        "import_from_statement",
+        "call",
+    }
+    SCOPE_TYPES = {"function_definition", "class_definition"}
+
     def __init__(self) -> None:
         """Initialize Python parser with tree-sitter grammar."""
         super().__init__(language="python")
@@ -118,28 +143,35 @@ class PythonParser(CodeParser):
             if tree.root_node.has_error:
                 logger.warning(f"Parse errors in {file_path}, extracting partial results")
 
-            # Extract all code elements
-            chunks: list[CodeChunk] = []
+            # Visit the tree once; extraction below only queries the index
+            index = SyntaxIndex(
+                tree.root_node,
+                collect=self.INDEXED_TYPES,
+                scopes=self.SCOPE_TYPES,
+                branch_types=self.BRANCH_TYPES,
+            )
+
+            # Extract all code elements as (chunk, definition node) pairs
+            elements: list[tuple[CodeChunk, tree_sitter.Node]] = []
 
             # Extract functions
-            function_chunks = self._extract_functions(tree.root_node, file_path, source_code)
-            chunks.extend(function_chunks)
+            elements.extend(self._extract_functions(index, file_path, source_code))
 
             # Extract classes and methods
-            class_and_method_chunks = self._extract_classes_and_methods(
-                tree.root_node,
-                file_path,
-                source_code,
-            )
-            chunks.extend(class_and_method_chunks)
+            elements.extend(self._extract_classes_and_methods(index, file_path, source_code))
+
+            chunks = [chunk for chunk, _ in elements]
 
             # Extract dependencies (imports and function calls) for all chunks
             # Note: This is a simple implementation. Full dependency tracking would require
             # flow analysis and tracking variable assignments.
-            imports = self._extract_imports(tree.root_node, source_code)
+            imports = self._extract_imports(index, source_code)
+            local_names: dict[str, list[str]] = {}
             for chunk in chunks:
+                local_names.setdefault(chunk.name, []).append(chunk.id)
+            for chunk, node in elements:
                 chunk.dependencies = self._identify_dependencies(
-                    chunk, imports, chunks, source_code
+                    chunk, node, imports, local_names, index
                 )
 
             logger.debug(f"Extracted {len(chunks)} chunks from {file_path}")
@@ -152,29 +184,29 @@ class PythonParser(CodeParser):
 
     def _extract_functions(
         self,
-        root_node: tree_sitter.Node,
+        index: SyntaxIndex,
         file_path: Path,
         source_code: str,
-    ) -> list[CodeChunk]:
+    ) -> list[tuple[CodeChunk, tree_sitter.Node]]:
         """Extract function definitions from the AST.
 
         Args:
-            root_node: Root node of the syntax tree
+            index: Single-pass index of the syntax tree
             file_path: Source file path
             source_code: Source code text
 
         Returns:
-            List of CodeChunk instances for functions
+            List of (CodeChunk, definition node) pairs for functions
 
         """
-        chunks: list[CodeChunk] = []
+        chunks: list[tuple[CodeChunk, tree_sitter.Node]] = []
 
         # Query for function definitions at module level
         # (Class methods will be handled separately in task 4.5)
-        for node in self._find_nodes_by_type(root_node, "function_definition"):
+        for node in index.nodes("function_definition"):
             try:
                 # Skip if this function is inside a class (it's a method)
-                if self._is_inside_class(node):
+                if index.has_ancestor(node, "class_definition"):
                     continue
 
                 # Extract function name
@@ -201,7 +233,7 @@ class PythonParser(CodeParser):
                 docstring = self._extract_docstring(node, source_code)
 
                 # Calculate complexity
-                complexity_score = self._calculate_complexity(node)
+                complexity_score = index.complexity(node)
 
                 # Create CodeChunk (dependencies added in later task)
                 chunk = CodeChunk(
@@ -218,7 +250,7 @@ class PythonParser(CodeParser):
                     language="python",
                 )
 
-                chunks.append(chunk)
+                chunks.append((chunk, node))
                 logger.debug(f"Extracted function: {name} at lines {line_start}-{line_end}")
 
             except Exception as e:
@@ -229,25 +261,25 @@ class PythonParser(CodeParser):
 
     def _extract_classes_and_methods(
         self,
-        root_node: tree_sitter.Node,
+        index: SyntaxIndex,
         file_path: Path,
         source_code: str,
-    ) -> list[CodeChunk]:
+    ) -> list[tuple[CodeChunk, tree_sitter.Node]]:
         """Extract class definitions and their methods from the AST.
 
         Args:
-            root_node: Root node of the syntax tree
+            index: Single-pass index of the syntax tree
             file_path: Source file path
             source_code: Source code text
 
         Returns:
-            List of CodeChunk instances for classes and methods
+            List of (CodeChunk, definition node) pairs for classes and methods
 
         """
-        chunks: list[CodeChunk] = []
+        chunks: list[tuple[CodeChunk, tree_sitter.Node]] = []
 
         # Find all class definitions
-        for class_node in self._find_nodes_by_type(root_node, "class_definition"):
+        for class_node in index.nodes("class_definition"):
             try:
                 # Extract class name
                 name_node = class_node.child_by_field_name("name")
@@ -275,7 +307,7 @@ class PythonParser(CodeParser):
                 docstring = self._extract_docstring(class_node, source_code)
 
                 # Calculate complexity
-                complexity_score = self._calculate_complexity(class_node)
+                complexity_score = index.complexity(class_node)
 
                 # Create CodeChunk for class
                 chunk = CodeChunk(
@@ -292,14 +324,14 @@ class PythonParser(CodeParser):
                     language="python",
                 )
 
-                chunks.append(chunk)
+                chunks.append((chunk, class_node))
                 logger.debug(f"Extracted class: {class_name} at lines {line_start}-{line_end}")
 
                 # Extract methods within this class
-                class_body = class_node.child_by_field_name("body")
-                if class_body:
+                if class_node.child_by_field_name("body"):
                     method_chunks = self._extract_methods(
-                        class_body,
+                        index,
+                        class_node,
                         class_name,
                         file_path,
                         source_code,
@@ -314,27 +346,29 @@ class PythonParser(CodeParser):
 
     def _extract_methods(
         self,
-        class_body_node: tree_sitter.Node,
+        index: SyntaxIndex,
+        class_node: tree_sitter.Node,
         class_name: str,
         file_path: Path,
         source_code: str,
-    ) -> list[CodeChunk]:
+    ) -> list[tuple[CodeChunk, tree_sitter.Node]]:
         """Extract methods from a class body.
 
         Args:
-            class_body_node: Class body node
+            index: Single-pass index of the syntax tree
+            class_node: Class definition node
             class_name: Name of the containing class
             file_path: Source file path
             source_code: Source code text
 
         Returns:
-            List of CodeChunk instances for methods
+            List of (CodeChunk, definition node) pairs for methods
 
         """
-        chunks: list[CodeChunk] = []
+        chunks: list[tuple[CodeChunk, tree_sitter.Node]] = []
 
         # Find function definitions in the class body
-        for method_node in self._find_nodes_by_type(class_body_node, "function_definition"):
+        for method_node in index.descendants(class_node, "function_definition"):
             try:
                 # Extract method name
                 name_node = method_node.child_by_field_name("name")
@@ -363,7 +397,7 @@ class PythonParser(CodeParser):
                 docstring = self._extract_docstring(method_node, source_code)
 
                 # Calculate complexity
-                complexity_score = self._calculate_complexity(method_node)
+                complexity_score = index.complexity(method_node)
 
                 # Create CodeChunk for method
                 chunk = CodeChunk(
@@ -380,7 +414,7 @@ class PythonParser(CodeParser):
                     language="python",
                 )
 
-                chunks.append(chunk)
+                chunks.append((chunk, method_node))
                 logger.debug(f"Extracted method: {qualified_name} at lines {line_start}-{line_end}")
 
             except Exception as e:
@@ -389,45 +423,6 @@ class PythonParser(CodeParser):
 
         return chunks
 
-    def _find_nodes_by_type(self, node: tree_sitter.Node, node_type: str) -> list[tree_sitter.Node]:
-        """Find all nodes of a given type in the tree.
-
-        Args:
-            node: Root node to search from
-            node_type: Node type to find (e.g., "function_definition")
-
-        Returns:
-            List of matching nodes
-
-        """
-        results: list[tree_sitter.Node] = []
-
-        def traverse(n: tree_sitter.Node) -> None:
-            if n.type == node_type:
-                results.append(n)
-            for child in n.children:
-                traverse(child)
-
-        traverse(node)
-        return results
-
-    def _is_inside_class(self, node: tree_sitter.Node) -> bool:
-        """Check if a node is inside a class definition.
-
-        Args:
-            node: Node to check
-
-        Returns:
-            True if node is inside a class, False otherwise
-
-        """
-        current = node.parent
-        while current:
-            if current.type == "class_definition":
-                return True
-            current = current.parent
-        return False
-
     def _extract_docstring(self, node: tree_sitter.Node, source_code: str) -> str | None:
         """Extract docstring from a function or class definition.
 
@@ -500,63 +495,11 @@ class PythonParser(CodeParser):
 
         return cleaned if cleaned else None
 
-    def _calculate_complexity(self, node: tree_sitter.Node) -> float:
-        """Calculate cyclomatic complexity for a code element.
-
-        Counts branch points (if, for, while, try, with, match, boolean operators)
-        and normalizes to [0.0, 1.0] range using a sigmoid-like function.
-
-        Args:
-            node: Function, class, or method definition node
-
-        Returns:
-            Normalized complexity score in range [0.0, 1.0]
-
-        """
-        # Node types that represent branch points
-        branch_types = {
-            "if_statement",
-            "for_statement",
-            "while_statement",
-            "try_statement",
-            "with_statement",
-            "match_statement",  # Python 3.10+
-            "elif_clause",
-            "except_clause",
-            "boolean_operator",  # and/or operators
-            "conditional_expression",  # ternary operator
-        }
-
-        branch_count = 0
-
-        def count_branches(n: tree_sitter.Node) -> None:
-            nonlocal branch_count
-            if n.type in branch_types:
-                branch_count += 1
-            for child in n.children:
-                count_branches(child)
-
-        count_branches(node)
-
-        # Normalize to [0.0, 1.0] range
-        # Use a sigmoid-like function: score = branch_count / (branch_count + 10)
-        # This ensures:
-        # - 0 branches = 0.0
-        # - 5 branches = ~0.33
-        # - 10 branches = 0.5
-        # - 20 branches = ~0.67
-        # - 40+ branches = ~0.8+
-        if branch_count == 0:
-            return 0.0
-
-        complexity_score = branch_count / (branch_count + 10)
-        return min(complexity_score, 1.0)  # Ensure it doesn't exceed 1.0
-
-    def _extract_imports(self, root_node: tree_sitter.Node, source_code: str) -> set[str]:
+    def _extract_imports(self, index: SyntaxIndex, source_code: str) -> set[str]:
         """Extract all imported names from the module.
 
         Args:
-            root_node: Root node of the syntax tree
+            index: Single-pass index of the syntax tree
             source_code: Source code text
 
         Returns:
@@ -566,13 +509,13 @@ class PythonParser(CodeParser):
         imports: set[str] = set()
 
         # Find import_statement and import_from_statement nodes
-        for node in self._find_nodes_by_type(root_node, "import_statement"):
+        for node in index.nodes("import_statement"):
             for child in node.children:
                 if child.type == "dotted_name":
                     name = source_code[child.start_byte : child.end_byte]
                     imports.add(name.split(".")[0])  # Add base module name
 
-        for node in self._find_nodes_by_type(root_node, "import_from_statement"):
+        for node in index.nodes("import_from_statement"):
             for child in node.children:
                 if child.type == "dotted_name":
                     # Module being imported from
@@ -593,58 +536,50 @@ class PythonParser(CodeParser):
     def _identify_dependencies(
         self,
         chunk: CodeChunk,
+        node: tree_sitter.Node,
         imports: set[str],
-        all_chunks: list[CodeChunk],
-        source_code: str,
+        local_names: dict[str, list[str]],
+        index: SyntaxIndex,
     ) -> list[str]:
         """Identify dependencies for a code chunk.
 
-        Analyzes the chunk's source code to find:
+        Analyzes the calls inside the chunk's definition to find:
         1. Calls to other functions/methods in the same file (returns chunk IDs)
         2. References to imported names (returns "import:name" format)
 
         Args:
             chunk: The chunk to analyze
+            node: The chunk's definition node
             imports: Set of imported names from the file
-            all_chunks: All chunks extracted from the file
-            source_code: Full source code of the file
+            local_names: Map from chunk name to chunk IDs (in extraction order)
+            index: Single-pass index of the syntax tree
 
         Returns:
             List of dependencies: chunk IDs for local calls, "import:name" for imports
 
         """
         dependencies: list[str] = []
+        seen_deps: set[str] = set()  # Avoid duplicates
 
-        # Extract the chunk's source code by line range
-        lines = source_code.split("\n")
-        chunk_start = chunk.line_start - 1  # Convert to 0-indexed
-        chunk_end = chunk.line_end  # line_end is inclusive
-        chunk_code = "\n".join(lines[chunk_start:chunk_end])
-
-        if not chunk_code.strip():
-            return []
+        def resolve_local(name: str) -> str | None:
+            # Latest other chunk with this name wins (matches a name -> id dict)
+            for chunk_id in reversed(local_names.get(name, ())):
+                if chunk_id != chunk.id:
+                    return chunk_id
+            return None
 
-        # Build a set of names defined in other chunks (for local dependency matching)
-        # Map from name -> chunk_id
-        local_names: dict[str, str] = {}
-        for other_chunk in all_chunks:
-            if other_chunk.id != chunk.id:
-                local_names[other_chunk.name] = other_chunk.id
+        def add(dep: str) -> None:
+            if dep not in seen_deps:
+                dependencies.append(dep)
+                seen_deps.add(dep)
 
-        # Find all identifiers/names referenced in this chunk's code
-        # We'll parse the chunk code to find function calls
-        if self.parser is None:
-            return []
+        def text(name_node: tree_sitter.Node) -> str:
+            raw = name_node.text
+            return raw.decode("utf-8") if raw is not None else ""
 
         try:
-            tree = self.parser.parse(bytes(chunk_code, "utf-8"))
-
-            # Find all call expressions
-            call_nodes = self._find_nodes_by_type(tree.root_node, "call")
-
-            seen_deps: set[str] = set()  # Avoid duplicates
-
-            for call_node in call_nodes:
+            # Call expressions inside the definition, collected in the indexing pass
+            for call_node in index.descendants(node, "call"):
                 # Extract the function being called
                 func_node = call_node.child_by_field_name("function")
                 if not func_node:
@@ -657,45 +592,34 @@ class PythonParser(CodeParser):
 
                 if func_node.type == "identifier":
                     # Simple function call: foo()
-                    func_name = chunk_code[func_node.start_byte : func_node.end_byte]
+                    func_name = text(func_node)
                 elif func_node.type == "attribute":
                     # Attribute access: obj.method() or module.func()
                     # Get the base object (first part before .)
                     obj_node = func_node.child_by_field_name("object")
                     if obj_node and obj_node.type == "identifier":
-                        base_name = chunk_code[obj_node.start_byte : obj_node.end_byte]
+                        base_name = text(obj_node)
                         # Check if base is an import (e.g., os.path.join)
                         if base_name in imports:
-                            dep_key = f"import:{base_name}"
-                            if dep_key not in seen_deps:
-                                dependencies.append(dep_key)
-                                seen_deps.add(dep_key)
+                            add(f"import:{base_name}")
                     # Also check the method name for local calls (e.g., self.helper())
                     attr_node = func_node.child_by_field_name("attribute")
                     if attr_node:
-                        method_name = chunk_code[attr_node.start_byte : attr_node.end_byte]
-                        if method_name in local_names:
-                            chunk_id = local_names[method_name]
-                            if chunk_id not in seen_deps:
-                                dependencies.append(chunk_id)
-                                seen_deps.add(chunk_id)
+                        chunk_id = resolve_local(text(attr_node))
+                        if chunk_id:
+                            add(chunk_id)
 
                 if func_name:
                     # Check if it's a local function call
-                    if func_name in local_names:
-                        chunk_id = local_names[func_name]
-                        if chunk_id not in seen_deps:
-                            dependencies.append(chunk_id)
-                            seen_deps.add(chunk_id)
+                    chunk_id = resolve_local(func_name)
+                    if chunk_id:
+                        add(chunk_id)
                     # Check if it's an imported name
                     elif func_name in imports:
-                        dep_key = f"import:{func_name}"
-                        if dep_key not in seen_deps:
-                            dependencies.append(dep_key)
-                            seen_deps.add(dep_key)
+                        add(f"import:{func_name}")
 
         except Exception as e:
-            logger.warning(f"Failed to parse chunk for dependencies: {e}")
+            logger.warning(f"Failed to identify dependencies: {e}")
             return []
 
         return dependencies
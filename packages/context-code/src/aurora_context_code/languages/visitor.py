@@ -0,0 +1,189 @@
+"""Single-pass syntax tree visitor shared by the language parsers.
+
+Walking the tree once per concern (functions, classes, methods, imports),
+then walking parents for every definition and re-walking every definition's
+subtree for complexity, costs O(nodes x definitions) per file. SyntaxIndex
+visits each node exactly once with a tree-sitter TreeCursor and records
+everything the parsers ask about afterwards:
+
+- Nodes of the requested types, in document (pre-)order
+- For every collected node, the scope nodes enclosing it
+- For every scope node, the collected nodes inside it
+- For every scope node, the number of branch points in its subtree
+
+Parsers keep their extraction logic and query the index instead of the tree.
+
+Example:
+    >>> index = SyntaxIndex(
+    ...     tree.root_node,
+    ...     collect={"function_definition", "class_definition"},
+    ...     scopes={"function_definition", "class_definition"},
+    ...     branch_types={"if_statement", "for_statement"},
+    ... )
+    >>> for node in index.nodes("function_definition"):
+    ...     if not index.has_ancestor(node, "class_definition"):
+    ...         score = index.complexity(node)
+
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Collection
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import tree_sitter
+
+
+def normalize_complexity(branch_count: int) -> float:
+    """Normalize a branch count to [0.0, 1.0].
+
+    Uses branch_count / (branch_count + 10): 0 branches = 0.0, 10 = 0.5,
+    40+ = ~0.8+.
+    """
+    if branch_count <= 0:
+        return 0.0
+    return min(branch_count / (branch_count + 10), 1.0)
+
+
+class SyntaxIndex:
+    """Node lookups collected in a single TreeCursor traversal.
+
+    Attributes:
+        root: Root node the index was built from
+
+    """
+
+    def __init__(
+        self,
+        root: tree_sitter.Node,
+        collect: Collection[str],
+        scopes: Collection[str] = (),
+        branch_types: Collection[str] = (),
+        logical_operators: Collection[str] = (),
+    ):
+        """Build the index by visiting every node under ``root`` once.
+
+        Args:
+            root: Root node to index
+            collect: Node types to collect (queried with ``nodes()``/``descendants()``)
+            scopes: Node types that enclose other nodes (classes, functions).
+                Branch counts and descendants are recorded for these.
+            branch_types: Node types that count as one branch point
+            logical_operators: Operator tokens (e.g. ``&&``, ``||``) that make a
+                ``binary_expression`` count as one branch point
+
+        """
+        self.root = root
+        self._collect = frozenset(collect)
+        self._scopes = frozenset(scopes)
+        self._branch_types = frozenset(branch_types)
+        self._logical_operators = frozenset(logical_operators)
+
+        self._nodes: dict[str, list[tree_sitter.Node]] = defaultdict(list)
+        self._enclosing: dict[int, tuple[tree_sitter.Node, ...]] = {}
+        self._descendants: dict[int, dict[str, list[tree_sitter.Node]]] = {}
+        self._branch_counts: dict[int, int] = {}
+
+        self._visit()
+
+    def _is_branch(self, node: tree_sitter.Node, node_type: str) -> bool:
+        if node_type in self._branch_types:
+            return True
+        if self._logical_operators and node_type == "binary_expression":
+            return any(child.type in self._logical_operators for child in node.children)
+        return False
+
+    def _visit(self) -> None:
+        """Pre-order walk with a TreeCursor; subtree branch counts roll up on exit."""
+        collect = self._collect
+        scopes = self._scopes
+        scope_stack: list[tree_sitter.Node] = []
+        # One entry per node on the current path: [node, is_scope, subtree branch count]
+        path: list[list[Any]] = []
+
+        def enter(node: tree_sitter.Node) -> None:
+            node_type = node.type
+            if node_type in collect:
+                self._nodes[node_type].append(node)
+                self._enclosing[node.id] = tuple(scope_stack)
+                for scope in scope_stack:
+                    self._descendants[scope.id][node_type].append(node)
+            is_scope = node_type in scopes
+            if is_scope:
+                scope_stack.append(node)
+                self._descendants[node.id] = defaultdict(list)
+            path.append([node, is_scope, 1 if self._is_branch(node, node_type) else 0])
+
+        def leave() -> None:
+            node, is_scope, count = path.pop()
+            if path:
+                path[-1][2] += count
+            if is_scope:
+                self._branch_counts[node.id] = count
+                scope_stack.pop()
+
+        cursor = self.root.walk()
+        while True:
+            current = cursor.node
+            if current is None:
+                return
+            enter(current)
+            if cursor.goto_first_child():
+                continue
+            leave()
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return
+                leave()
+
+    def nodes(self, node_type: str) -> list[tree_sitter.Node]:
+        """All collected nodes of ``node_type`` in document order."""
+        return self._nodes.get(node_type, [])
+
+    def descendants(self, scope: tree_sitter.Node, node_type: str) -> list[tree_sitter.Node]:
+        """Collected nodes of ``node_type`` strictly inside ``scope``, in document order.
+
+        Args:
+            scope: A node whose type is one of the index's scope types
+            node_type: A collected node type
+
+        """
+        by_type = self._descendants.get(scope.id)
+        if by_type is None:
+            raise KeyError(f"{scope.type} is not an indexed scope")
+        return by_type.get(node_type, [])
+
+    def has_ancestor(self, node: tree_sitter.Node, scope_type: str) -> bool:
+        """Whether a collected node is enclosed by a scope of ``scope_type``."""
+        return any(scope.type == scope_type for scope in self._enclosing[node.id])
+
+    def branch_count(self, node: tree_sitter.Node) -> int:
+        """Number of branch points in the subtree of ``node`` (including itself).
+
+        Scope nodes are answered from the index; any other node is counted
+        directly, which walks its subtree.
+        """
+        count = self._branch_counts.get(node.id)
+        if count is not None:
+            return count
+
+        count = 0
+        cursor = node.walk()
+        while True:
+            current = cursor.node
+            if current is not None and self._is_branch(current, current.type):
+                count += 1
+            if cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return count
+
+    def complexity(self, node: tree_sitter.Node) -> float:
+        """Normalized complexity score in [0.0, 1.0] for ``node``."""
+        return normalize_complexity(self.branch_count(node))
+
+
+__all__ = ["SyntaxIndex", "normalize_complexity"]
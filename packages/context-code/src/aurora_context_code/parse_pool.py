@@ -0,0 +1,197 @@
+"""Process-pool parsing for tree-sitter extraction.
+
+Tree-sitter releases the GIL while parsing, but chunk extraction (walking the
+tree, building signatures, docstrings and dependency lists) is pure Python and
+serializes on the GIL when run from threads. ProcessPoolParser moves parsing
+into worker processes so extraction scales across cores on large repositories.
+
+Each worker builds the global ParserRegistry once (in the pool initializer)
+and keeps it warm for every file it parses. Results cross the process boundary
+as compact tuples of builtins rather than pickled CodeChunk objects, which
+keeps IPC cheap and avoids depending on CodeChunk's pickling behaviour.
+
+Example:
+    >>> with ProcessPoolParser(max_workers=4) as pool:
+    ...     language, chunks = pool.parse(Path("example.py"))
+
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from aurora_core.chunks.code_chunk import CodeChunk
+
+logger = logging.getLogger(__name__)
+
+# Compact, picklable chunk record. Field order matches _chunk_to_record().
+ChunkRecord = tuple[
+    str,  # chunk_id
+    str,  # file_path
+    str,  # element_type
+    str,  # name
+    int,  # line_start
+    int,  # line_end
+    str | None,  # signature
+    str | None,  # docstring
+    list[str],  # dependencies
+    float,  # complexity_score
+    str,  # language
+    str,  # chunk type ("code", "kb", ...)
+    dict[str, Any] | None,  # metadata
+]
+
+
+def _chunk_to_record(chunk: CodeChunk) -> ChunkRecord:
+    """Flatten a parsed CodeChunk into a picklable record.
+
+    Embeddings are not included; parsers never produce them.
+    """
+    return (
+        chunk.id,
+        chunk.file_path,
+        chunk.element_type,
+        chunk.name,
+        chunk.line_start,
+        chunk.line_end,
+        chunk.signature,
+        chunk.docstring,
+        list(chunk.dependencies),
+        chunk.complexity_score,
+        chunk.language,
+        chunk.type,
+        chunk.metadata,
+    )
+
+
+def _record_to_chunk(record: ChunkRecord) -> CodeChunk:
+    """Rebuild a CodeChunk from a record produced by _chunk_to_record()."""
+    (
+        chunk_id,
+        file_path,
+        element_type,
+        name,
+        line_start,
+        line_end,
+        signature,
+        docstring,
+        dependencies,
+        complexity_score,
+        language,
+        chunk_type,
+        metadata,
+    ) = record
+    chunk = CodeChunk(
+        chunk_id=chunk_id,
+        file_path=file_path,
+        element_type=element_type,
+        name=name,
+        line_start=line_start,
+        line_end=line_end,
+        signature=signature,
+        docstring=docstring,
+        dependencies=dependencies,
+        complexity_score=complexity_score,
+        language=language,
+        metadata=metadata,
+    )
+    chunk.type = chunk_type
+    return chunk
+
+
+def _init_worker() -> None:
+    """Pool initializer: build the parser registry once per worker process."""
+    from aurora_context_code.registry import get_global_registry
+
+    registry = get_global_registry()
+    logger.debug(f"Parse worker ready with languages: {registry.list_languages()}")
+
+
+def _parse_in_worker(file_path: str) -> tuple[str | None, list[ChunkRecord]]:
+    """Parse one file inside a worker process.
+
+    Args:
+        file_path: Path of the file to parse
+
+    Returns:
+        Tuple of (language, records); language is None if no parser handles the file
+
+    """
+    from aurora_context_code.registry import get_global_registry
+
+    parser = get_global_registry().get_parser_for_file(Path(file_path))
+    if parser is None:
+        return None, []
+    return parser.language, [_chunk_to_record(chunk) for chunk in parser.parse(Path(file_path))]
+
+
+class ProcessPoolParser:
+    """Parse files in a pool of worker processes with warm parser registries.
+
+    ``parse()`` blocks until the file is parsed, so calling it from N threads
+    keeps up to N worker processes busy. Use as a context manager (or call
+    ``shutdown()``) to stop the workers.
+
+    Note:
+        Workers use the built-in parsers from the global registry. Parsers
+        registered on a custom ParserRegistry in the parent process are not
+        visible to the workers.
+
+    """
+
+    def __init__(self, max_workers: int | None = None, start_method: str = "spawn"):
+        """Initialize the pool.
+
+        Worker processes start lazily as work is submitted.
+
+        Args:
+            max_workers: Number of worker processes (None = cpu_count)
+            start_method: multiprocessing start method. "spawn" is the default
+                because the pool is typically used from a multi-threaded
+                indexing pipeline, where forking is unsafe.
+
+        """
+        self.max_workers = max_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+        )
+
+    def submit(self, file_path: Path) -> Future[tuple[str | None, list[ChunkRecord]]]:
+        """Submit a file for parsing and return a future of raw records."""
+        return self._executor.submit(_parse_in_worker, str(file_path))
+
+    def parse(self, file_path: Path) -> tuple[str | None, list[CodeChunk]]:
+        """Parse a file in a worker process.
+
+        Args:
+            file_path: Path of the file to parse
+
+        Returns:
+            Tuple of (language, chunks); language is None if no parser handles the file
+
+        Raises:
+            Exception: Any error raised by the parser in the worker, or
+                BrokenProcessPool if a worker died
+
+        """
+        language, records = self.submit(file_path).result()
+        return language, [_record_to_chunk(record) for record in records]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __enter__(self) -> ProcessPoolParser:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+
+__all__ = ["ChunkRecord", "ProcessPoolParser"]
@@ -0,0 +1,71 @@
+"""Relationship edges between the chunks of a parsed file.
+
+Feeds the ``relationships`` table that spreading activation traverses. Edges
+are derived from what the parsers already record, so no second pass over the
+source is needed:
+
+- ``calls``: a chunk's dependencies that are chunk IDs of the same file
+  (the Python parser resolves local calls, including ``self.method()``).
+- ``contains``: the innermost chunk whose line range encloses another
+  (class -> method), for every language.
+
+Cross-file ``imports`` edges are resolved by the store from the
+``import:<name>`` dependencies once all chunks are saved (see
+``SQLiteStore.link_symbol_references``).
+
+Usage:
+    >>> chunks = parser.parse(file_path)
+    >>> store.save_chunks_bulk(chunks)
+    >>> store.add_relationships_bulk(extract_relationships(chunks))
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Edge weights (spreading activation follows edges with weight >= 0.1)
+CALL_WEIGHT = 1.0
+CONTAINS_WEIGHT = 0.5
+
+Edge = tuple[str, str, str, float]
+
+
+def extract_relationships(chunks: list[Any]) -> list[Edge]:
+    """Extract call and containment edges between chunks of one file.
+
+    Args:
+        chunks: Chunks parsed from a single file
+
+    Returns:
+        List of (from_id, to_id, rel_type, weight) tuples
+
+    """
+    chunk_ids = {chunk.id for chunk in chunks}
+    edges: list[Edge] = []
+
+    for chunk in chunks:
+        for dep in getattr(chunk, "dependencies", None) or ():
+            if dep in chunk_ids and dep != chunk.id:
+                edges.append((chunk.id, dep, "calls", CALL_WEIGHT))
+
+    # Sorted by start line (outer ranges first), the enclosing chunks of each
+    # chunk form a stack; the top of the stack is the innermost container
+    spans = [
+        chunk
+        for chunk in chunks
+        if getattr(chunk, "line_start", None) is not None
+        and getattr(chunk, "line_end", None) is not None
+    ]
+    spans.sort(key=lambda chunk: (chunk.line_start, -chunk.line_end))
+    enclosing: list[Any] = []
+    for chunk in spans:
+        while enclosing and enclosing[-1].line_end < chunk.line_end:
+            enclosing.pop()
+        if enclosing:
+            edges.append((enclosing[-1].id, chunk.id, "contains", CONTAINS_WEIGHT))
+        enclosing.append(chunk)
+
+    return edges
+
+
+__all__ = ["CALL_WEIGHT", "CONTAINS_WEIGHT", "extract_relationships"]
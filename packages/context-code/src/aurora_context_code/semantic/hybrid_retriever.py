@@ -1,7 +1,8 @@
 """Hybrid retrieval combining BM25, semantic similarity, and activation.
 
 This module implements tri-hybrid retrieval with staged architecture:
-- Stage 1: BM25 filtering (keyword exact match, top_k=100)
+- Stage 1: BM25 filtering (keyword exact match, top_k=100), merged with
+  approximate nearest-neighbour hits from the IVF vector index (pure semantic recall)
 - Stage 2: Re-ranking with chunk-type-aware tri-hybrid scoring:
   * Code chunks: BM25 50% / ACT-R 30% / Semantic 20% (identifiers are exact tokens)
   * KB chunks:   BM25 30% / ACT-R 30% / Semantic 40% (prose benefits from embeddings)
@@ -11,6 +12,10 @@ Performance optimizations (Epic 1 + Epic 2):
 - Query embedding cache (LRU, configurable size)
 - Persistent BM25 index (load once, rebuild on reindex)
 - Activation score caching via CacheManager
+- Batched Stage 2 scoring: one matmul for all candidate similarities, vectorized
+  normalization and chunk-type weighting
+- Spreading activation from the top Stage 2 hits along the relationship graph
+  (calls / imports / contains edges written at index time)
 - Dual-hybrid fallback: BM25+Activation when embeddings unavailable (85% quality vs 95% tri-hybrid)
 
 Classes:
@@ -26,11 +31,13 @@ import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, cast
 
 import numpy as np
 import numpy.typing as npt
 
+from aurora_core.store.quantization import decode_embedding, decode_embedding_matrix
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,6 +76,11 @@ class HybridConfig:
         fallback_to_activation: If True, fall back to activation-only if embeddings unavailable
         use_staged_retrieval: Enable staged retrieval (BM25 filter → re-rank)
         mmr_lambda: MMR diversity parameter (0.0=pure diversity, 1.0=pure relevance, default 0.5)
+        ann_top_k: Vector-index neighbours merged into Stage 1 candidates (default 50, 0=disabled)
+        ann_nprobe: Number of IVF lists scanned per query (default 8)
+        spreading_top_k: Top Stage 2 hits that spread activation to related candidates
+            (default 5, 0=disabled)
+        spreading_max_hops: Relationship hops activation spreads from the top hits (default 2)
 
     Example (tri-hybrid):
         >>> config = HybridConfig(bm25_weight=0.3, activation_weight=0.3, semantic_weight=0.4)
@@ -97,6 +109,14 @@ class HybridConfig:
     # MMR (Maximal Marginal Relevance) configuration
     # Default lambda=0.5 balances relevance and diversity
     mmr_lambda: float = 0.5
+    # Approximate nearest-neighbour recall (IVF vector index)
+    # Surfaces semantically relevant chunks that share no keyword with the query
+    ann_top_k: int = 50
+    ann_nprobe: int = 8
+    # Spreading activation (ACT-R: activation = base level + spreading)
+    # Candidates related to the best hits (callers, callees, importers) are boosted
+    spreading_top_k: int = 5
+    spreading_max_hops: int = 2
 
     def __post_init__(self) -> None:
         """Validate configuration."""
@@ -128,6 +148,16 @@ class HybridConfig:
             raise ValueError(
                 f"mmr_lambda must be in [0, 1], got {self.mmr_lambda}",
             )
+        if self.ann_top_k < 0:
+            raise ValueError(f"ann_top_k must be >= 0, got {self.ann_top_k}")
+        if self.ann_nprobe < 1:
+            raise ValueError(f"ann_nprobe must be >= 1, got {self.ann_nprobe}")
+        if self.spreading_top_k < 0:
+            raise ValueError(f"spreading_top_k must be >= 0, got {self.spreading_top_k}")
+        if not (1 <= self.spreading_max_hops <= 5):
+            raise ValueError(
+                f"spreading_max_hops must be in [1, 5], got {self.spreading_max_hops}",
+            )
 
 
 @dataclass
@@ -335,6 +365,10 @@ def _compute_config_hash(config: "HybridConfig") -> str:
         "enable_query_cache": config.enable_query_cache,
         "query_cache_size": config.query_cache_size,
         "query_cache_ttl_seconds": config.query_cache_ttl_seconds,
+        "ann_top_k": config.ann_top_k,
+        "ann_nprobe": config.ann_nprobe,
+        "spreading_top_k": config.spreading_top_k,
+        "spreading_max_hops": config.spreading_max_hops,
     }
     config_json = json.dumps(config_dict, sort_keys=True)
     return hashlib.md5(config_json.encode(), usedforsecurity=False).hexdigest()
@@ -466,8 +500,10 @@ class HybridRetriever:
        - Build BM25 index from candidates
        - Score candidates with BM25 keyword matching
        - Select top stage1_top_k candidates (default 100)
+       - Merge ann_top_k nearest neighbours from the IVF vector index
     2. Stage 2: Tri-hybrid Re-ranking
        - Calculate semantic similarity for Stage 1 candidates
+       - Add spreading activation from the top hits to related candidates
        - Normalize BM25, semantic, and activation scores independently
        - Combine scores: 30% BM25 + 40% semantic + 30% activation (configurable)
        - Return top-N results by tri-hybrid score
@@ -478,6 +514,7 @@ class HybridRetriever:
         embedding_provider: Provider for generating embeddings
         config: Hybrid retrieval configuration
         bm25_scorer: BM25 scorer for keyword matching (lazy-initialized)
+        vector_index: IVF vector index for semantic recall (lazy-initialized, None if unsupported)
 
     Example (tri-hybrid):
         >>> from aurora_core.store import SQLiteStore
@@ -529,6 +566,13 @@ class HybridRetriever:
         # BM25 scorer (used as fallback when FTS5 unavailable)
         self.bm25_scorer: Any = None  # BM25Scorer from aurora_context_code.semantic.bm25_scorer
 
+        # IVF vector index (resolved lazily on first retrieve() to keep creation cheap)
+        self._vector_index: Any = None  # VectorIndex from aurora_context_code.semantic.vector_index
+        self._vector_index_resolved = False
+
+        # Spreading activation calculator (created on first use)
+        self._spreading: Any = None  # CSRSpreadingActivation from aurora_core.activation
+
         # Query embedding cache (shared across all retrievers - Task 4.0)
         if self.config.enable_query_cache:
             self._query_cache = get_shared_query_cache(
@@ -600,12 +644,29 @@ class HybridRetriever:
         # Fallback: Activation-based retrieval (for old DBs without FTS5)
         use_fts5 = hasattr(self.store, "retrieve_by_fts")
 
-        # Two-phase optimization: fetch embeddings separately after filtering
-        use_two_phase = self.config.use_staged_retrieval and hasattr(
-            self.store, "fetch_embeddings_for_chunks"
+        # Late materialization: score lightweight FTS5 rows (id, type, activation,
+        # rank, embedding) and deserialize only the winners via retrieve_by_ids()
+        use_candidate_rows = (
+            use_fts5
+            and hasattr(self.store, "retrieve_fts_candidates")
+            and hasattr(self.store, "retrieve_by_ids")
         )
 
-        if use_fts5:
+        # Two-phase optimization: fetch embeddings separately after filtering.
+        # FTS5 candidate rows are all scored, so their embeddings come in the same query.
+        use_two_phase = (
+            self.config.use_staged_retrieval
+            and not use_candidate_rows
+            and hasattr(self.store, "fetch_embeddings_for_chunks")
+        )
+
+        if use_candidate_rows:
+            activation_candidates = self.store.retrieve_fts_candidates(
+                query=query,
+                limit=self.config.stage1_top_k,
+                chunk_type=chunk_type,
+            )
+        elif use_fts5:
             # FTS5 gate: keyword relevance determines candidates
             activation_candidates = self.store.retrieve_by_fts(
                 query=query,
@@ -622,8 +683,8 @@ class HybridRetriever:
                 chunk_type=chunk_type,
             )
 
-        # If no chunks available, return empty list
-        if not activation_candidates:
+        # If no chunks available, return empty list (unless the vector index can still recall)
+        if not activation_candidates and self.vector_index is None:
             return []
 
         # Step 2: Generate query embedding for semantic similarity (with caching)
@@ -664,6 +725,18 @@ class HybridRetriever:
         else:
             stage1_candidates = activation_candidates
 
+        # ========== ANN RECALL: MERGE VECTOR INDEX NEIGHBOURS ==========
+        # Keyword gating cannot surface chunks that share no token with the query;
+        # merge the approximate nearest neighbours so stage 2 can score them too
+        stage1_candidates = self._merge_ann_candidates(
+            query_embedding,
+            stage1_candidates,
+            chunk_type=chunk_type,
+            include_embeddings=not use_two_phase,
+        )
+        if not stage1_candidates:
+            return []
+
         # ========== PHASE 2: FETCH EMBEDDINGS FOR TOP CANDIDATES ==========
         # Only fetch embeddings for chunks that passed BM25 filtering
         if use_two_phase and stage1_candidates:
@@ -678,76 +751,71 @@ class HybridRetriever:
                 if chunk.id in embeddings_map:
                     chunk.embeddings = embeddings_map[chunk.id]
 
-        # ========== STAGE 2: TRI-HYBRID RE-RANKING ==========
-        results = []
-
-        for chunk in stage1_candidates:
-            # Get activation score (from chunk's activation attribute)
-            activation_score = getattr(chunk, "activation", 0.0)
-
-            # Calculate semantic similarity
-            chunk_embedding = getattr(chunk, "embeddings", None)
-            if chunk_embedding is not None:
-                from aurora_context_code.semantic.embedding_provider import cosine_similarity
-
-                # Convert embedding bytes to numpy array if needed
-                if isinstance(chunk_embedding, bytes):
-                    chunk_embedding = np.frombuffer(chunk_embedding, dtype=np.float32)
-
-                semantic_score = cosine_similarity(query_embedding, chunk_embedding)
-                # Cosine similarity is in [-1, 1], normalize to [0, 1]
-                semantic_score = (semantic_score + 1.0) / 2.0
-            # No embedding available, use 0 or fallback
-            elif self.config.fallback_to_activation:
-                semantic_score = 0.0
-            else:
-                continue  # Skip chunks without embeddings
-
-            # Calculate BM25 score
-            # When FTS5 is used, use its rank as the BM25 component
-            # FTS5 rank is negative (lower=better), so negate it for scoring
-            fts_rank = getattr(chunk, "fts_rank", None)
-            if use_fts5 and fts_rank is not None:
-                bm25_score = -fts_rank  # Negate: FTS5 rank is negative=better
-            elif self.config.bm25_weight > 0 and self.bm25_scorer is not None:
-                chunk_content = self._get_chunk_content_for_bm25(chunk)
-                bm25_score = self.bm25_scorer.score(query, chunk_content)
-            else:
-                bm25_score = 0.0
-
-            # Store for later normalization
-            results.append(
-                {
-                    "chunk": chunk,
-                    "raw_activation": activation_score,
-                    "raw_semantic": semantic_score,
-                    "raw_bm25": bm25_score,
-                },
-            )
+        # ========== STAGE 2: TRI-HYBRID RE-RANKING (BATCHED) ==========
+        # Score every candidate with array operations: one matmul for semantic
+        # similarity, vectorized normalization and chunk-type weighting
+        raw_semantic, has_embedding = self._batch_semantic_scores(
+            query_embedding, stage1_candidates
+        )
 
-        # If no valid results, return empty
-        if not results:
-            return []
+        # Chunks without a usable embedding score 0 semantically, or are skipped
+        if self.config.fallback_to_activation:
+            keep = np.arange(len(stage1_candidates))
+        else:
+            keep = np.flatnonzero(has_embedding)
 
         # NOTE: Semantic threshold filtering is disabled when BM25 is enabled (tri-hybrid mode)
         # to allow keyword matches with low semantic similarity to be retrieved.
         # In tri-hybrid mode, the hybrid score (BM25 + semantic + activation) determines relevance.
         # Only filter by semantic score in dual-hybrid mode (when bm25_weight == 0)
         if min_semantic_score is not None and self.config.bm25_weight == 0.0:
-            results = [r for r in results if r["raw_semantic"] >= min_semantic_score]
-            if not results:
-                return []  # All results below threshold
+            keep = keep[raw_semantic[keep] >= min_semantic_score]
+
+        # If no valid results (or all below threshold), return empty
+        if keep.size == 0:
+            return []
+
+        chunks = [stage1_candidates[i] for i in keep]
+        raw_semantic = raw_semantic[keep]
+        raw_activation = np.fromiter(
+            (getattr(chunk, "activation", 0.0) for chunk in chunks),
+            dtype=np.float64,
+            count=len(chunks),
+        )
+        raw_bm25 = self._batch_bm25_scores(query, chunks, use_fts5)
 
         # Normalize scores independently to [0, 1] range
-        activation_scores_normalized = self._normalize_scores(
-            [r["raw_activation"] for r in results],
+        activation_norm = self._normalize_array(raw_activation)
+        semantic_norm = self._normalize_array(raw_semantic)
+        bm25_norm = self._normalize_array(raw_bm25)
+
+        # Chunk-type-aware scoring: code chunks favor BM25, KB chunks favor semantic
+        is_code = np.fromiter(
+            (getattr(chunk, "type", "unknown") == "code" for chunk in chunks),
+            dtype=bool,
+            count=len(chunks),
         )
-        semantic_scores_normalized = self._normalize_scores([r["raw_semantic"] for r in results])
-        bm25_scores_normalized = self._normalize_scores([r["raw_bm25"] for r in results])
+        weights = np.where(is_code[:, np.newaxis], _CODE_WEIGHTS, _KB_WEIGHTS)
+        base = weights[:, 0] * bm25_norm + weights[:, 2] * semantic_norm
+        hybrid = base + weights[:, 1] * activation_norm
+
+        # Spread activation from the top hits to related candidates and re-score
+        spreading = self._spreading_from_top_hits(chunks, hybrid)
+        if spreading is not None:
+            activation_norm = self._normalize_array(raw_activation + spreading)
+            hybrid = base + weights[:, 1] * activation_norm
+
+        # Sort by hybrid score (descending, ties keep candidate order)
+        order = np.argsort(-hybrid, kind="stable")
+
+        # MMR needs the full ranking; otherwise only materialize the top K
+        apply_mmr = diverse and len(order) > 1
+        if not apply_mmr:
+            order = order[:top_k]
 
         # ========== BATCH FETCH ACCESS STATS (N+1 QUERY OPTIMIZATION) ==========
-        # Pre-fetch access stats for all result chunks in a single query
-        chunk_ids = [r["chunk"].id for r in results]
+        # Pre-fetch access stats for all returned chunks in a single query
+        chunk_ids = [chunks[i].id for i in order]
         access_stats_cache: dict[str, dict[str, Any]] = {}
         if hasattr(self.store, "get_access_stats_batch"):
             try:
@@ -756,19 +824,15 @@ class HybridRetriever:
             except Exception as e:
                 logger.debug(f"Batch access stats failed, falling back to per-chunk: {e}")
 
-        # Calculate tri-hybrid scores and prepare output
-        final_results = []
-        for i, result_data in enumerate(results):
-            chunk = result_data["chunk"]
-            activation_norm = activation_scores_normalized[i]
-            semantic_norm = semantic_scores_normalized[i]
-            bm25_norm = bm25_scores_normalized[i]
-
-            # Chunk-type-aware scoring: code chunks favor BM25, KB chunks favor semantic
-            chunk_type = getattr(chunk, "type", "unknown")
-            bm25_w, act_w, sem_w = _CODE_WEIGHTS if chunk_type == "code" else _KB_WEIGHTS
+        # Deserialize only the ranked winners (no-op for already materialized chunks)
+        winners = self._materialize([chunks[i] for i in order])
 
-            hybrid_score = bm25_w * bm25_norm + act_w * activation_norm + sem_w * semantic_norm
+        # Prepare output for the ranked chunks
+        final_results = []
+        for i in order:
+            chunk = winners.get(chunks[i].id)
+            if chunk is None:
+                continue  # Deleted since candidate retrieval
 
             # Extract content and metadata from chunk (using cached access stats)
             content, metadata = self._extract_chunk_content_metadata(
@@ -780,19 +844,16 @@ class HybridRetriever:
                 {
                     "chunk_id": chunk.id,
                     "content": content,
-                    "bm25_score": bm25_norm,
-                    "activation_score": activation_norm,
-                    "semantic_score": semantic_norm,
-                    "hybrid_score": hybrid_score,
+                    "bm25_score": float(bm25_norm[i]),
+                    "activation_score": float(activation_norm[i]),
+                    "semantic_score": float(semantic_norm[i]),
+                    "hybrid_score": float(hybrid[i]),
                     "metadata": metadata,
                 },
             )
 
-        # Sort by hybrid score (descending)
-        final_results.sort(key=lambda x: x["hybrid_score"], reverse=True)
-
         # Apply MMR reranking for diversity if requested
-        if diverse and len(final_results) > 1:
+        if apply_mmr:
             lambda_val = mmr_lambda if mmr_lambda is not None else self.config.mmr_lambda
             final_results = self._apply_mmr_reranking(
                 results=final_results,
@@ -800,10 +861,147 @@ class HybridRetriever:
                 top_k=top_k,
                 mmr_lambda=lambda_val,
             )
-            return final_results
 
-        # Return top K results
-        return final_results[:top_k]
+        return final_results
+
+    def _materialize(self, chunks: list[Any]) -> dict[str, Any]:
+        """Map chunk IDs to full chunks, deserializing candidate rows in one batch.
+
+        Args:
+            chunks: Ranked chunks, possibly ``CandidateRow`` entries from
+                ``retrieve_fts_candidates()``
+
+        Returns:
+            Dict of chunk ID to chunk; rows whose chunk no longer exists are absent
+
+        """
+        from aurora_core.store.sqlite import CandidateRow
+
+        materialized = {chunk.id: chunk for chunk in chunks if not isinstance(chunk, CandidateRow)}
+        row_ids = [chunk.id for chunk in chunks if isinstance(chunk, CandidateRow)]
+        if row_ids:
+            for chunk in self.store.retrieve_by_ids(row_ids, include_embeddings=False):
+                materialized[chunk.id] = chunk
+        return materialized
+
+    @property
+    def vector_index(self) -> Any:
+        """IVF vector index for the store, or None if disabled or unsupported."""
+        if not self._vector_index_resolved:
+            self._vector_index_resolved = True
+            if self.config.ann_top_k > 0:
+                from aurora_context_code.semantic.vector_index import VectorIndex
+
+                self._vector_index = VectorIndex.for_store(
+                    self.store,
+                    nprobe=self.config.ann_nprobe,
+                )
+        return self._vector_index
+
+    def _spreading_from_top_hits(
+        self,
+        chunks: list[Any],
+        hybrid: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64] | None:
+        """Calculate spreading activation from the top-scored candidates.
+
+        Loads the relationship edges around the spreading_top_k best hits in
+        one store call and spreads activation along them; candidates that call,
+        import or contain a top hit (or are reached from one) get a boost.
+
+        Args:
+            chunks: Stage 2 candidates
+            hybrid: Hybrid scores of the candidates before spreading
+
+        Returns:
+            Spreading activation per candidate, or None if nothing spread
+
+        """
+        if self.config.spreading_top_k == 0 or len(chunks) < 2:
+            return None
+        if not hasattr(self.store, "get_relationships"):
+            return None
+
+        from aurora_core.activation.csr_spreading import CSRGraph, CSRSpreadingActivation
+        from aurora_core.activation.spreading import SpreadingConfig
+
+        if self._spreading is None:
+            self._spreading = CSRSpreadingActivation(
+                SpreadingConfig(max_hops=self.config.spreading_max_hops),
+            )
+
+        top = np.argsort(-hybrid, kind="stable")[: self.config.spreading_top_k]
+        sources = [chunks[i].id for i in top]
+        try:
+            edges = self.store.get_relationships(
+                sources,
+                max_hops=self.config.spreading_max_hops,
+                limit=self._spreading.config.max_edges,
+            )
+        except Exception as e:
+            logger.debug(f"Spreading activation skipped: {e}")
+            return None
+        if not edges:
+            return None
+
+        graph = CSRGraph.from_edges(edges, min_weight=self._spreading.config.min_weight)
+        _, nodes, scores = self._spreading.calculate_arrays([sources], graph)
+        if scores.size == 0:
+            return None
+        activation_by_node = np.zeros(graph.node_count(), dtype=np.float64)
+        activation_by_node[nodes] = scores
+        return np.fromiter(
+            (
+                activation_by_node[graph.index[chunk.id]] if chunk.id in graph.index else 0.0
+                for chunk in chunks
+            ),
+            dtype=np.float64,
+            count=len(chunks),
+        )
+
+    def _merge_ann_candidates(
+        self,
+        query_embedding: npt.NDArray[np.float32],
+        candidates: list[Any],
+        chunk_type: str | None = None,
+        include_embeddings: bool = True,
+    ) -> list[Any]:
+        """Merge vector-index nearest neighbours into the Stage 1 candidates.
+
+        Neighbours already present in ``candidates`` are kept as-is (they carry
+        their FTS5 rank). New neighbours are materialized without an fts_rank, so
+        their BM25 component is 0 and they compete on semantic + activation.
+
+        Args:
+            query_embedding: Query embedding vector
+            candidates: Stage 1 candidates (keyword or activation gated)
+            chunk_type: Optional filter by chunk type ('code' or 'kb')
+            include_embeddings: Whether to load embeddings for new candidates
+
+        Returns:
+            Candidates extended with ANN-only chunks
+
+        """
+        index = self.vector_index
+        if index is None or not hasattr(self.store, "retrieve_by_ids"):
+            return candidates
+
+        try:
+            neighbours = index.search(query_embedding, k=self.config.ann_top_k, chunk_type=chunk_type)
+        except Exception as e:
+            logger.debug(f"Vector index search failed, using keyword candidates only: {e}")
+            return candidates
+
+        seen = {chunk.id for chunk in candidates}
+        new_ids = [chunk_id for chunk_id, _ in neighbours if chunk_id not in seen]
+        if not new_ids:
+            return candidates
+
+        extra: list[Any] = self.store.retrieve_by_ids(
+            new_ids, include_embeddings=include_embeddings
+        )
+        logger.debug(f"Vector index added {len(extra)} candidates beyond keyword gate")
+        return list(candidates) + extra
 
     def _apply_mmr_reranking(
         self,
@@ -845,7 +1043,7 @@ class HybridRetriever:
             chunk_embedding = getattr(chunk, "embeddings", None)
             if chunk_embedding is not None:
                 if isinstance(chunk_embedding, bytes):
-                    chunk_embedding = np.frombuffer(chunk_embedding, dtype=np.float32)
+                    chunk_embedding = decode_embedding(chunk_embedding)
                 embedding_map[chunk.id] = chunk_embedding
             else:
                 embedding_map[chunk.id] = None
@@ -917,6 +1115,97 @@ class HybridRetriever:
             return 0.0
         return float(np.dot(vec1, vec2) / (norm1 * norm2))
 
+    def _batch_semantic_scores(
+        self,
+        query_embedding: npt.NDArray[np.float32],
+        chunks: list[Any],
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+        """Score all candidates against the query with a single matmul.
+
+        Embeddings are stacked into one float32 matrix: bytes are grouped by
+        storage format and each group is decoded (and int8 dequantized) in one
+        vectorized step instead of per chunk. The query is never quantized.
+        Chunks without an embedding, or with one whose dimension differs from
+        the query, are flagged as missing.
+
+        Args:
+            query_embedding: Query embedding vector
+            chunks: Candidate chunks (``embeddings`` as bytes or array, or None)
+
+        Returns:
+            Tuple of (semantic scores normalized from [-1, 1] to [0, 1], mask of
+            chunks that had a usable embedding). Missing entries score 0.0.
+
+        """
+        query = np.asarray(query_embedding, dtype=np.float32).ravel()
+        dim = query.shape[0]
+
+        blobs: list[bytes | None] = []
+        for chunk in chunks:
+            chunk_embedding = getattr(chunk, "embeddings", None)
+            if chunk_embedding is not None and not isinstance(chunk_embedding, bytes):
+                chunk_embedding = np.asarray(chunk_embedding, dtype=np.float32).tobytes()
+            blobs.append(chunk_embedding)
+
+        scores = np.zeros(len(chunks), dtype=np.float64)
+        if dim == 0:
+            return scores, np.zeros(len(chunks), dtype=bool)
+        matrix, has_embedding = decode_embedding_matrix(blobs, dim)
+        if not has_embedding.any():
+            return scores, has_embedding
+
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+
+        # Zero vectors get similarity 0 (same as _cosine_similarity)
+        similarity = np.zeros(matrix.shape[0], dtype=np.float64)
+        nonzero = norms >= 1e-9
+        similarity[nonzero] = (matrix[nonzero] @ query) / norms[nonzero]
+
+        # Cosine similarity is in [-1, 1], normalize to [0, 1]
+        scores[has_embedding] = (similarity + 1.0) / 2.0
+        return scores, has_embedding
+
+    def _batch_bm25_scores(
+        self,
+        query: str,
+        chunks: list[Any],
+        use_fts5: bool,
+    ) -> npt.NDArray[np.float64]:
+        """Collect raw BM25 scores for the Stage 2 candidates.
+
+        When FTS5 is used, its rank is the BM25 component. FTS5 rank is negative
+        (lower=better), so it is negated; vector-index hits without a keyword
+        match have no rank and score 0. Old databases fall back to the BM25 scorer.
+
+        Args:
+            query: User query string
+            chunks: Candidate chunks
+            use_fts5: Whether candidates came from the FTS5 gate
+
+        Returns:
+            Raw (unnormalized) BM25 scores aligned with ``chunks``
+
+        """
+        if use_fts5:
+            ranks = (getattr(chunk, "fts_rank", None) for chunk in chunks)
+            return np.fromiter(
+                (-rank if rank is not None else 0.0 for rank in ranks),
+                dtype=np.float64,
+                count=len(chunks),
+            )
+
+        if self.config.bm25_weight > 0 and self.bm25_scorer is not None:
+            return np.fromiter(
+                (
+                    self.bm25_scorer.score(query, self._get_chunk_content_for_bm25(chunk))
+                    for chunk in chunks
+                ),
+                dtype=np.float64,
+                count=len(chunks),
+            )
+
+        return np.zeros(len(chunks), dtype=np.float64)
+
     def _stage1_bm25_filter(self, query: str, candidates: list[Any]) -> list[Any]:
         """Stage 1: Filter candidates using BM25 keyword matching.
 
@@ -1019,6 +1308,8 @@ class HybridRetriever:
                 "file_path": getattr(chunk, "file_path", ""),
                 "line_start": getattr(chunk, "line_start", 0),
                 "line_end": getattr(chunk, "line_end", 0),
+                # Index-time complexity, so callers need not re-parse the file
+                "complexity_score": getattr(chunk, "complexity_score", None),
             }
 
             # Include access count from activation stats (use cache if available)
@@ -1150,8 +1441,20 @@ class HybridRetriever:
         )
         bm25_scores_normalized = self._normalize_scores([r["raw_bm25"] for r in results])
 
+        # Dual-hybrid scoring: weighted BM25 + activation (no semantic)
+        hybrid_scores = [
+            bm25_dual * bm25_norm + activation_dual * activation_norm
+            for bm25_norm, activation_norm in zip(
+                bm25_scores_normalized, activation_scores_normalized, strict=True
+            )
+        ]
+
+        # Keep the top K by hybrid score (descending, ties keep candidate order)
+        top = sorted(range(len(results)), key=lambda i: hybrid_scores[i], reverse=True)[:top_k]
+        winners = self._materialize([results[i]["chunk"] for i in top])
+
         # Batch fetch access stats (N+1 query optimization)
-        chunk_ids = [r["chunk"].id for r in results]
+        chunk_ids = [results[i]["chunk"].id for i in top]
         access_stats_cache: dict[str, dict[str, Any]] = {}
         if hasattr(self.store, "get_access_stats_batch"):
             try:
@@ -1159,15 +1462,14 @@ class HybridRetriever:
             except Exception as e:
                 logger.debug(f"Batch access stats failed: {e}")
 
-        # Calculate dual-hybrid scores
         final_results = []
-        for i, result_data in enumerate(results):
-            chunk = result_data["chunk"]
+        for i in top:
+            chunk = winners.get(results[i]["chunk"].id)
+            if chunk is None:
+                continue  # Deleted since candidate retrieval
             activation_norm = activation_scores_normalized[i]
             bm25_norm = bm25_scores_normalized[i]
-
-            # Dual-hybrid scoring: weighted BM25 + activation (no semantic)
-            hybrid_score = bm25_dual * bm25_norm + activation_dual * activation_norm
+            hybrid_score = hybrid_scores[i]
 
             content, metadata = self._extract_chunk_content_metadata(
                 chunk,
@@ -1186,11 +1488,7 @@ class HybridRetriever:
                 }
             )
 
-        # Sort by hybrid score (descending)
-        final_results.sort(key=lambda x: x["hybrid_score"], reverse=True)
-
-        # Return top K results
-        return final_results[:top_k]
+        return final_results
 
     def _normalize_scores(self, scores: list[float]) -> list[float]:
         """Normalize scores to [0, 1] range using min-max scaling.
@@ -1209,15 +1507,31 @@ class HybridRetriever:
         if not scores:
             return []
 
-        min_score = min(scores)
-        max_score = max(scores)
+        normalized = self._normalize_array(np.asarray(scores, dtype=np.float64))
+        return cast(list[float], normalized.tolist())
+
+    def _normalize_array(self, scores: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Vectorized min-max normalization (same semantics as _normalize_scores).
+
+        Args:
+            scores: Raw scores to normalize
+
+        Returns:
+            Normalized scores in [0, 1] range (a new array)
+
+        """
+        if scores.size == 0:
+            return cast(npt.NDArray[np.float64], scores.copy())
+
+        min_score = float(scores.min())
+        max_score = float(scores.max())
 
         if max_score - min_score < 1e-9:
             # All scores equal - preserve original values
             # This prevents [0.0, 0.0, 0.0] from becoming [1.0, 1.0, 1.0]
-            return list(scores)
+            return cast(npt.NDArray[np.float64], scores.copy())
 
-        return [(s - min_score) / (max_score - min_score) for s in scores]
+        return (scores - min_score) / (max_score - min_score)
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get query embedding cache statistics.
@@ -0,0 +1,441 @@
+"""Approximate nearest-neighbour vector index (IVF-flat) over chunk embeddings.
+
+FTS5 candidate gating only surfaces chunks that share a keyword with the query.
+This module adds a pure-NumPy IVF-flat index so that semantically relevant
+chunks without keyword overlap can still reach stage-2 scoring.
+
+Layout (persisted in the memory database, see aurora_core.store.schema v7):
+- ``vector_centroids``: one unit-norm centroid per inverted list
+- ``vector_index``: chunk_id -> list_id assignment (-1 = not yet assigned)
+
+SQLite triggers queue every saved embedding as list -1 and ON DELETE CASCADE
+drops rows for deleted chunks, so the index never references stale vectors.
+``sync()`` (called after indexing) assigns queued vectors to their nearest
+centroid and (re)trains the centroids when the corpus has grown enough.
+
+Search probes the ``nprobe`` closest lists plus the unassigned list, so recently
+saved chunks are always searchable (exactly) before the next sync.
+
+Classes:
+    VectorIndex: IVF-flat index bound to a SQLiteStore
+"""
+
+import logging
+import math
+import threading
+from datetime import datetime, timezone
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from aurora_core.store.quantization import decode_embedding, decode_embedding_matrix
+
+logger = logging.getLogger(__name__)
+
+# List id for vectors that have not been assigned to a centroid yet
+UNASSIGNED_LIST = -1
+
+# Minimum corpus size before clustering pays off (below this, a flat scan is faster)
+MIN_TRAIN_SIZE = 1024
+
+# Bounds for the number of inverted lists (sqrt(N) heuristic)
+MIN_LISTS = 16
+MAX_LISTS = 4096
+
+# Row batch size for assignment writes and SQL IN clauses
+_BATCH_SIZE = 900
+
+
+def _normalize_rows(matrix: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+    """L2-normalize rows in place (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms < 1e-9] = 1.0
+    matrix /= norms
+    return matrix
+
+
+def _kmeans(
+    vectors: npt.NDArray[np.float32],
+    n_lists: int,
+    iterations: int = 10,
+    seed: int = 0,
+) -> npt.NDArray[np.float32]:
+    """Spherical k-means on unit-norm vectors.
+
+    Args:
+        vectors: (N, D) unit-norm training vectors
+        n_lists: Number of centroids to produce
+        iterations: Lloyd iterations
+        seed: RNG seed for reproducible centroids
+
+    Returns:
+        (n_lists, D) unit-norm centroids
+
+    """
+    rng = np.random.default_rng(seed)
+    n = vectors.shape[0]
+    seeds = rng.choice(n, size=n_lists, replace=False)
+    centroids: npt.NDArray[np.float32] = vectors[seeds].copy()
+
+    for _ in range(iterations):
+        assignments = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, vectors)
+        counts = np.bincount(assignments, minlength=n_lists)
+
+        # Re-seed empty lists with random vectors so every list stays useful
+        empty = np.flatnonzero(counts == 0)
+        if empty.size:
+            sums[empty] = vectors[rng.choice(n, size=empty.size, replace=False)]
+
+        centroids = _normalize_rows(sums)
+
+    return centroids
+
+
+class VectorIndex:
+    """IVF-flat approximate nearest-neighbour index stored in SQLite.
+
+    List members are cached in memory as normalized float32 matrices and the
+    cache is invalidated whenever the ``vector_index`` table changes, so warm
+    searches cost one small signature query plus a few matrix products.
+
+    Attributes:
+        store: SQLiteStore holding chunks, vector_index and vector_centroids
+        nprobe: Number of closest lists scanned per query
+
+    Example:
+        >>> index = VectorIndex(store)
+        >>> index.sync()  # after indexing
+        >>> hits = index.search(query_embedding, k=50)
+        >>> # [("code:auth.py:login", 0.82), ...]
+
+    """
+
+    def __init__(self, store: Any, nprobe: int = 8):
+        """Initialize the index for a store.
+
+        Args:
+            store: SQLiteStore instance (schema v7+)
+            nprobe: Number of closest lists scanned per query (default 8)
+
+        """
+        if nprobe < 1:
+            raise ValueError(f"nprobe must be >= 1, got {nprobe}")
+
+        self.store = store
+        self.nprobe = nprobe
+
+        self._lock = threading.Lock()
+        self._signature: tuple[Any, ...] | None = None
+        self._centroids: npt.NDArray[np.float32] | None = None
+        self._list_ids: npt.NDArray[np.int64] | None = None
+        self._list_cache: dict[int, tuple[list[str], npt.NDArray[np.float32]]] = {}
+
+    @classmethod
+    def for_store(cls, store: Any, nprobe: int = 8) -> "VectorIndex | None":
+        """Create an index if the store supports one.
+
+        Args:
+            store: Storage backend
+            nprobe: Number of closest lists scanned per query
+
+        Returns:
+            VectorIndex for SQLite stores with a vector_index table, else None
+
+        """
+        from aurora_core.store.sqlite import SQLiteStore
+
+        if not isinstance(store, SQLiteStore):
+            return None
+
+        try:
+            cursor = store._get_connection().execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='vector_index'",
+            )
+            if cursor.fetchone() is None:
+                return None
+        except Exception as e:
+            logger.debug(f"Vector index unavailable: {e}")
+            return None
+
+        return cls(store, nprobe=nprobe)
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query_embedding: npt.NDArray[np.float32],
+        k: int,
+        chunk_type: str | None = None,
+    ) -> list[tuple[str, float]]:
+        """Find approximate nearest neighbours of a query embedding.
+
+        Args:
+            query_embedding: Query vector (any norm)
+            k: Number of neighbours to return
+            chunk_type: Optional filter by chunk type ('code' or 'kb')
+
+        Returns:
+            List of (chunk_id, cosine_similarity) tuples, best first
+
+        """
+        if k < 1:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32).ravel()
+        query_norm = float(np.linalg.norm(query))
+        if query_norm < 1e-9:
+            return []
+        query = query / query_norm
+
+        with self._lock:
+            self._refresh()
+
+            probe_lists = [UNASSIGNED_LIST]
+            if self._centroids is not None and self._list_ids is not None:
+                centroid_scores = self._centroids @ query
+                nprobe = min(self.nprobe, len(centroid_scores))
+                closest = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+                probe_lists.extend(int(self._list_ids[i]) for i in closest)
+
+            ids: list[str] = []
+            matrices: list[npt.NDArray[np.float32]] = []
+            for list_id in probe_lists:
+                list_ids, matrix = self._load_list(list_id)
+                # Skip vectors from a different embedding model (dimension mismatch)
+                if list_ids and matrix.shape[1] == query.shape[0]:
+                    ids.extend(list_ids)
+                    matrices.append(matrix)
+
+        if not ids:
+            return []
+
+        scores = np.concatenate(matrices) @ query if len(matrices) > 1 else matrices[0] @ query
+
+        if chunk_type:
+            allowed = self._filter_by_type(ids, chunk_type)
+            mask = np.fromiter((cid in allowed for cid in ids), dtype=bool, count=len(ids))
+            scores = np.where(mask, scores, -np.inf)
+
+        top = min(k, len(ids))
+        best = np.argpartition(-scores, top - 1)[:top]
+        best = best[np.argsort(-scores[best])]
+        return [(ids[i], float(scores[i])) for i in best if np.isfinite(scores[i])]
+
+    def _refresh(self) -> None:
+        """Reload centroids and drop cached lists if the index changed."""
+        conn = self.store._get_connection()
+        row = conn.execute(
+            """
+            SELECT (SELECT COUNT(*) FROM vector_index),
+                   (SELECT MAX(rowid) FROM vector_index),
+                   (SELECT COUNT(*) FROM vector_index WHERE list_id = ?),
+                   (SELECT MAX(trained_at) FROM vector_centroids)
+            """,
+            (UNASSIGNED_LIST,),
+        ).fetchone()
+        signature = tuple(row)
+        if signature == self._signature:
+            return
+
+        self._signature = signature
+        self._list_cache.clear()
+
+        cursor = conn.execute("SELECT list_id, centroid FROM vector_centroids ORDER BY list_id")
+        rows = cursor.fetchall()
+        if rows:
+            self._list_ids = np.array([r[0] for r in rows], dtype=np.int64)
+            self._centroids = np.vstack([np.frombuffer(r[1], dtype=np.float32) for r in rows])
+        else:
+            self._list_ids = None
+            self._centroids = None
+
+    def _load_list(self, list_id: int) -> tuple[list[str], npt.NDArray[np.float32]]:
+        """Load (and cache) the normalized member vectors of one list."""
+        cached = self._list_cache.get(list_id)
+        if cached is not None:
+            return cached
+
+        cursor = self.store._get_connection().execute(
+            """
+            SELECT c.id, c.embeddings
+            FROM vector_index v
+            JOIN chunks c ON c.id = v.chunk_id
+            WHERE v.list_id = ? AND c.embeddings IS NOT NULL
+            """,
+            (list_id,),
+        )
+        ids, matrix = self._rows_to_matrix(cursor)
+        self._list_cache[list_id] = (ids, matrix)
+        return ids, matrix
+
+    @staticmethod
+    def _rows_to_matrix(rows: Any) -> tuple[list[str], npt.NDArray[np.float32]]:
+        """Convert (id, embedding BLOB) rows into ids and a normalized matrix.
+
+        Blobs may be in any storage format (float32, float16 or int8). Vectors
+        whose dimension differs from the first row (e.g. left over from a
+        different embedding model) are skipped.
+        """
+        rows = list(rows)
+        if not rows:
+            return [], np.empty((0, 0), dtype=np.float32)
+        dim = decode_embedding(rows[0][1]).shape[0]
+        matrix, mask = decode_embedding_matrix([blob for _, blob in rows], dim)
+        ids = [chunk_id for (chunk_id, _), keep in zip(rows, mask, strict=True) if keep]
+        return ids, _normalize_rows(np.require(matrix, requirements="W"))
+
+    def _filter_by_type(self, chunk_ids: list[str], chunk_type: str) -> set[str]:
+        """Return the subset of chunk_ids with the given chunk type."""
+        conn = self.store._get_connection()
+        allowed: set[str] = set()
+        for start in range(0, len(chunk_ids), _BATCH_SIZE):
+            batch = chunk_ids[start : start + _BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            cursor = conn.execute(
+                f"SELECT id FROM chunks WHERE type = ? AND id IN ({placeholders})",
+                [chunk_type, *batch],
+            )
+            allowed.update(row[0] for row in cursor)
+        return allowed
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def sync(self, min_train_size: int = MIN_TRAIN_SIZE) -> dict[str, int]:
+        """Bring the index up to date after chunks were saved or deleted.
+
+        Trains centroids once the corpus reaches ``min_train_size`` vectors,
+        retrains when the corpus has outgrown the current list count
+        (sqrt(N) > 2 × lists), and otherwise assigns queued vectors to their
+        nearest existing centroid.
+
+        Args:
+            min_train_size: Minimum vectors before clustering (default 1024)
+
+        Returns:
+            Dict with ``vectors``, ``lists`` and ``assigned`` counts
+
+        """
+        conn = self.store._get_connection()
+        total = conn.execute("SELECT COUNT(*) FROM vector_index").fetchone()[0]
+        n_lists = conn.execute("SELECT COUNT(*) FROM vector_centroids").fetchone()[0]
+
+        if total < min_train_size:
+            # Flat scan of the unassigned list is exact and fast at this size
+            return {"vectors": total, "lists": n_lists, "assigned": 0}
+
+        if n_lists == 0 or math.sqrt(total) > 2 * n_lists:
+            return self.train()
+
+        centroids_rows = conn.execute(
+            "SELECT list_id, centroid FROM vector_centroids ORDER BY list_id",
+        ).fetchall()
+        list_ids = np.array([r[0] for r in centroids_rows], dtype=np.int64)
+        centroids = np.vstack([np.frombuffer(r[1], dtype=np.float32) for r in centroids_rows])
+
+        cursor = conn.execute(
+            """
+            SELECT c.id, c.embeddings
+            FROM vector_index v
+            JOIN chunks c ON c.id = v.chunk_id
+            WHERE v.list_id = ? AND c.embeddings IS NOT NULL
+            """,
+            (UNASSIGNED_LIST,),
+        )
+        ids, vectors = self._rows_to_matrix(cursor.fetchall())
+        if ids and vectors.shape[1] != centroids.shape[1]:
+            # Embedding model changed since training — start over
+            return self.train()
+
+        assigned = self._assign(ids, vectors, list_ids, centroids)
+        return {"vectors": total, "lists": len(list_ids), "assigned": assigned}
+
+    def train(
+        self,
+        n_lists: int | None = None,
+        sample_size: int = 65536,
+        iterations: int = 10,
+    ) -> dict[str, int]:
+        """(Re)train centroids on the stored embeddings and reassign all vectors.
+
+        Args:
+            n_lists: Number of lists (default: sqrt(N) clamped to [16, 4096])
+            sample_size: Maximum vectors used for k-means training
+            iterations: k-means iterations
+
+        Returns:
+            Dict with ``vectors``, ``lists`` and ``assigned`` counts
+
+        """
+        conn = self.store._get_connection()
+        cursor = conn.execute(
+            """
+            SELECT c.id, c.embeddings
+            FROM vector_index v
+            JOIN chunks c ON c.id = v.chunk_id
+            WHERE c.embeddings IS NOT NULL
+            """,
+        )
+        ids, vectors = self._rows_to_matrix(cursor.fetchall())
+        total = len(ids)
+        if total == 0:
+            return {"vectors": 0, "lists": 0, "assigned": 0}
+
+        if n_lists is None:
+            n_lists = int(math.sqrt(total))
+        n_lists = max(1, min(max(n_lists, MIN_LISTS), MAX_LISTS, total))
+
+        if total > sample_size:
+            rng = np.random.default_rng(0)
+            sample = vectors[rng.choice(total, size=sample_size, replace=False)]
+        else:
+            sample = vectors
+
+        centroids = _kmeans(sample, n_lists, iterations=iterations)
+        list_ids = np.arange(n_lists, dtype=np.int64)
+        trained_at = datetime.now(timezone.utc).isoformat()
+
+        with self.store._transaction() as txn:
+            txn.execute("DELETE FROM vector_centroids")
+            txn.executemany(
+                "INSERT INTO vector_centroids (list_id, centroid, trained_at) VALUES (?, ?, ?)",
+                [
+                    (int(list_id), centroids[i].astype(np.float32).tobytes(), trained_at)
+                    for i, list_id in enumerate(list_ids)
+                ],
+            )
+
+        assigned = self._assign(ids, vectors, list_ids, centroids)
+        logger.info(f"Trained vector index: {total} vectors in {n_lists} lists")
+        return {"vectors": total, "lists": n_lists, "assigned": assigned}
+
+    def _assign(
+        self,
+        ids: list[str],
+        vectors: npt.NDArray[np.float32],
+        list_ids: npt.NDArray[np.int64],
+        centroids: npt.NDArray[np.float32],
+    ) -> int:
+        """Write nearest-centroid assignments for the given vectors."""
+        if not ids:
+            return 0
+
+        with self.store._transaction() as txn:
+            for start in range(0, len(ids), _BATCH_SIZE):
+                block = vectors[start : start + _BATCH_SIZE]
+                nearest = list_ids[np.argmax(block @ centroids.T, axis=1)]
+                txn.executemany(
+                    "UPDATE vector_index SET list_id = ? WHERE chunk_id = ?",
+                    zip((int(n) for n in nearest), ids[start : start + _BATCH_SIZE]),
+                )
+
+        return len(ids)
+
+
+__all__ = ["VectorIndex", "UNASSIGNED_LIST", "MIN_TRAIN_SIZE"]
@@ -144,3 +144,140 @@ class TestFTS5HybridRetrieval:
         # Should still work via activation fallback
         results = retriever.retrieve("func1", top_k=5)
         assert isinstance(results, list)
+
+    def test_vector_index_recalls_chunk_without_keyword_match(self, tmp_path):
+        """A semantically close chunk with no shared keyword should still be retrieved."""
+        db_path = str(tmp_path / "test.db")
+        store = SQLiteStore(db_path)
+
+        provider = MockEmbeddingProvider()
+        query = "verify login credentials"
+
+        # No token overlap with the query, but its embedding equals the query's
+        chunk = _make_code_chunk(
+            "code:auth.py:check_password",
+            "check_password",
+            "def check_password(user, secret):",
+            "Compare a secret against the stored hash.",
+            "/test/auth.py",
+        )
+        chunk.embeddings = provider.embed_query(query).tobytes()
+        store.save_chunk(chunk)
+
+        unrelated = _make_code_chunk(
+            "code:db.py:connect",
+            "connect",
+            "def connect(host):",
+            "Connect to database server.",
+            "/test/db.py",
+        )
+        unrelated.embeddings = np.random.randn(384).astype(np.float32).tobytes()
+        store.save_chunk(unrelated)
+
+        assert store.retrieve_by_fts(query) == []
+
+        retriever = HybridRetriever(
+            store=store,
+            activation_engine=MockActivationEngine(),
+            embedding_provider=provider,
+            config=HybridConfig(),
+        )
+        results = retriever.retrieve(query, top_k=5)
+
+        assert results[0]["chunk_id"] == "code:auth.py:check_password"
+        assert results[0]["bm25_score"] == 0.0
+
+    def test_vector_index_disabled_keeps_keyword_gate(self, tmp_path):
+        """With ann_top_k=0 only FTS5 candidates are scored."""
+        db_path = str(tmp_path / "test.db")
+        store = SQLiteStore(db_path)
+
+        provider = MockEmbeddingProvider()
+        query = "verify login credentials"
+
+        chunk = _make_code_chunk(
+            "code:auth.py:check_password",
+            "check_password",
+            "def check_password(user, secret):",
+            "Compare a secret against the stored hash.",
+            "/test/auth.py",
+        )
+        chunk.embeddings = provider.embed_query(query).tobytes()
+        store.save_chunk(chunk)
+
+        retriever = HybridRetriever(
+            store=store,
+            activation_engine=MockActivationEngine(),
+            embedding_provider=provider,
+            config=HybridConfig(ann_top_k=0),
+        )
+
+        assert retriever.retrieve(query, top_k=5) == []
+
+
+class TestLateMaterialization:
+    """FTS5 candidates are scored as rows; only the winners are deserialized."""
+
+    def _populate(self, store, count=30):
+        rng = np.random.RandomState(7)
+        for i in range(count):
+            chunk = _make_code_chunk(
+                f"code:mod{i}.py:parse_item{i}",
+                f"parse_item{i}",
+                f"def parse_item{i}(raw):",
+                f"Parse item number {i} from raw input.",
+                f"/test/mod{i}.py",
+            )
+            chunk.embeddings = rng.randn(384).astype(np.float32).tobytes()
+            store.save_chunk(chunk)
+
+    def _retriever(self, store, **config):
+        return HybridRetriever(
+            store=store,
+            activation_engine=MockActivationEngine(),
+            embedding_provider=MockEmbeddingProvider(),
+            config=HybridConfig(ann_top_k=0, **config),
+        )
+
+    def test_deserializes_only_top_k(self, tmp_path, monkeypatch):
+        store = SQLiteStore(str(tmp_path / "test.db"))
+        self._populate(store)
+        calls = []
+        original = SQLiteStore._deserialize_chunk
+
+        def counting(self, row_data):
+            calls.append(row_data["id"])
+            return original(self, row_data)
+
+        monkeypatch.setattr(SQLiteStore, "_deserialize_chunk", counting)
+
+        results = self._retriever(store).retrieve("parse item", top_k=3)
+
+        assert len(results) == 3
+        assert sorted(calls) == sorted(r["chunk_id"] for r in results)
+
+    def test_matches_full_chunk_retrieval(self, tmp_path, monkeypatch):
+        store = SQLiteStore(str(tmp_path / "test.db"))
+        self._populate(store)
+
+        late = self._retriever(store).retrieve("parse item", top_k=5)
+        monkeypatch.delattr(SQLiteStore, "retrieve_fts_candidates")
+        full = self._retriever(store).retrieve("parse item", top_k=5)
+
+        assert late == full
+
+    def test_dual_hybrid_fallback_materializes_winners(self, tmp_path):
+        store = SQLiteStore(str(tmp_path / "test.db"))
+        self._populate(store)
+        retriever = HybridRetriever(
+            store=store,
+            activation_engine=MockActivationEngine(),
+            embedding_provider=None,
+            config=HybridConfig(ann_top_k=0),
+        )
+
+        results = retriever.retrieve("parse item", top_k=4)
+
+        assert len(results) == 4
+        assert all(r["content"].startswith("def parse_item") for r in results)
+        assert all(r["metadata"]["file_path"].startswith("/test/mod") for r in results)
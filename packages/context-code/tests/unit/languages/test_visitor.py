@@ -0,0 +1,138 @@
+"""Tests for the single-pass SyntaxIndex shared by the language parsers.
+
+Verifies that one TreeCursor traversal answers the same questions the parsers
+used to answer with repeated tree walks: nodes by type, enclosing scopes,
+nested descendants and subtree branch counts.
+"""
+
+import pytest
+
+tree_sitter = pytest.importorskip("tree_sitter")
+tree_sitter_python = pytest.importorskip("tree_sitter_python")
+tree_sitter_javascript = pytest.importorskip("tree_sitter_javascript")
+
+from aurora_context_code.languages.visitor import SyntaxIndex, normalize_complexity  # noqa: E402
+
+
+PYTHON_SOURCE = b'''
+def top(x):
+    if x and x > 1:
+        return helper(x)
+    return None
+
+
+class Outer:
+    def method(self):
+        for i in range(3):
+            print(i)
+
+    class Inner:
+        def nested(self):
+            while True:
+                break
+'''
+
+PYTHON_BRANCHES = {
+    "if_statement",
+    "for_statement",
+    "while_statement",
+    "boolean_operator",
+}
+
+
+def _parse(source: bytes, language_module) -> "tree_sitter.Node":
+    parser = tree_sitter.Parser(tree_sitter.Language(language_module.language()))
+    return parser.parse(source).root_node
+
+
+@pytest.fixture
+def python_index():
+    return SyntaxIndex(
+        _parse(PYTHON_SOURCE, tree_sitter_python),
+        collect={"function_definition", "class_definition", "call"},
+        scopes={"function_definition", "class_definition"},
+        branch_types=PYTHON_BRANCHES,
+    )
+
+
+def _name(node) -> str:
+    return node.child_by_field_name("name").text.decode()
+
+
+class TestSyntaxIndex:
+    """SyntaxIndex queries on a Python tree."""
+
+    def test_nodes_in_document_order(self, python_index):
+        names = [_name(n) for n in python_index.nodes("function_definition")]
+        assert names == ["top", "method", "nested"]
+        assert python_index.nodes("lambda") == []
+
+    def test_has_ancestor(self, python_index):
+        top, method, nested = python_index.nodes("function_definition")
+        assert not python_index.has_ancestor(top, "class_definition")
+        assert python_index.has_ancestor(method, "class_definition")
+        assert python_index.has_ancestor(nested, "class_definition")
+
+    def test_descendants_include_nested_scopes(self, python_index):
+        outer, inner = python_index.nodes("class_definition")
+        assert [_name(n) for n in python_index.descendants(outer, "function_definition")] == [
+            "method",
+            "nested",
+        ]
+        assert [_name(n) for n in python_index.descendants(inner, "function_definition")] == [
+            "nested"
+        ]
+
+    def test_descendants_of_non_scope_raises(self, python_index):
+        call = python_index.nodes("call")[0]
+        with pytest.raises(KeyError):
+            python_index.descendants(call, "call")
+
+    def test_calls_grouped_by_definition(self, python_index):
+        top = python_index.nodes("function_definition")[0]
+        calls = [
+            c.child_by_field_name("function").text.decode()
+            for c in python_index.descendants(top, "call")
+        ]
+        assert calls == ["helper"]
+
+    def test_branch_counts_roll_up(self, python_index):
+        top, method, nested = python_index.nodes("function_definition")
+        outer, inner = python_index.nodes("class_definition")
+        assert python_index.branch_count(top) == 2  # if + and
+        assert python_index.branch_count(method) == 1
+        assert python_index.branch_count(nested) == 1
+        assert python_index.branch_count(outer) == 2
+        assert python_index.branch_count(inner) == 1
+        assert python_index.complexity(top) == normalize_complexity(2)
+
+    def test_branch_count_for_unindexed_node(self, python_index):
+        if_node = python_index.root.children[0].child_by_field_name("body").children[0]
+        assert if_node.type == "if_statement"
+        assert python_index.branch_count(if_node) == 2
+
+    def test_logical_operators(self):
+        root = _parse(
+            b"function f(a, b) { if (a && b) {} return a + b || a; }",
+            tree_sitter_javascript,
+        )
+        index = SyntaxIndex(
+            root,
+            collect={"function_declaration"},
+            scopes={"function_declaration"},
+            branch_types={"if_statement"},
+            logical_operators={"&&", "||"},
+        )
+        # if + (a && b) + (... || a); the "a + b" expression is not a branch
+        assert index.branch_count(index.nodes("function_declaration")[0]) == 3
+
+
+class TestNormalizeComplexity:
+    """Branch count normalization."""
+
+    @pytest.mark.parametrize(
+        ("branches", "expected"),
+        [(0, 0.0), (10, 0.5), (30, 0.75)],
+    )
+    def test_values(self, branches, expected):
+        assert normalize_complexity(branches) == pytest.approx(expected)
@@ -8,15 +8,17 @@ Tests include:
 - Integration with activation engine and embedding provider
 """
 
+import numpy as np
 import pytest
 
-from aurora_context_code.semantic.embedding_provider import EmbeddingProvider
+from aurora_context_code.semantic.embedding_provider import EmbeddingProvider, cosine_similarity
 from aurora_context_code.semantic.hybrid_retriever import (
     _CODE_WEIGHTS,
     _KB_WEIGHTS,
     HybridConfig,
     HybridRetriever,
 )
+from aurora_core.store.quantization import encode_embedding
 
 
 # Mock classes for testing
@@ -275,6 +277,175 @@ class TestChunkTypeAwareWeights:
         assert kb_score > code_score
 
 
+class TestBatchedStage2Scoring:
+    """Test the batched Stage 2 scoring engine."""
+
+    @staticmethod
+    def _retriever(chunks=None, **config):
+        class StubStore(MockStore):
+            def retrieve_by_activation(self, min_activation=0.0, limit=100, **_kwargs):
+                return self.chunks[:limit]
+
+        class StubProvider:
+            def embed_query(self, _query):
+                return np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32)
+
+        return HybridRetriever(
+            StubStore(chunks),
+            MockActivationEngine(),
+            StubProvider(),
+            config=HybridConfig(bm25_weight=0.0, activation_weight=0.5, semantic_weight=0.5, **config),
+        )
+
+    def test_batch_semantic_matches_pairwise_cosine(self):
+        """Matmul scores equal per-chunk cosine similarity mapped to [0, 1]."""
+        rng = np.random.default_rng(0)
+        query = rng.standard_normal(16).astype(np.float32)
+        vectors = rng.standard_normal((20, 16)).astype(np.float32)
+        chunks = [
+            MockChunk(f"c{i}", "", embeddings=vec.tobytes() if i % 2 else vec)
+            for i, vec in enumerate(vectors)
+        ]
+
+        scores, has_embedding = self._retriever()._batch_semantic_scores(query, chunks)
+
+        expected = [(cosine_similarity(query, vec) + 1.0) / 2.0 for vec in vectors]
+        assert has_embedding.all()
+        assert scores == pytest.approx(expected, abs=1e-6)
+
+    def test_batch_semantic_flags_missing_and_mismatched(self):
+        """Missing or wrong-dimension embeddings score 0 and are flagged."""
+        query = np.ones(4, dtype=np.float32)
+        chunks = [
+            MockChunk("ok", "", embeddings=np.ones(4, dtype=np.float32).tobytes()),
+            MockChunk("none", "", embeddings=None),
+            MockChunk("short", "", embeddings=np.ones(3, dtype=np.float32).tobytes()),
+            MockChunk("zero", "", embeddings=np.zeros(4, dtype=np.float32).tobytes()),
+        ]
+
+        scores, has_embedding = self._retriever()._batch_semantic_scores(query, chunks)
+
+        assert has_embedding.tolist() == [True, False, False, True]
+        assert scores.tolist() == pytest.approx([1.0, 0.0, 0.0, 0.5])
+
+    def test_batch_semantic_scores_quantized_embeddings(self):
+        """float16 and int8 blobs are dequantized and scored against the float32 query."""
+        rng = np.random.default_rng(1)
+        query = rng.standard_normal(32).astype(np.float32)
+        vectors = rng.standard_normal((30, 32)).astype(np.float32)
+        formats = ["float32", "float16", "int8"]
+        chunks = [
+            MockChunk(f"c{i}", "", embeddings=encode_embedding(vec, formats[i % 3]))
+            for i, vec in enumerate(vectors)
+        ]
+
+        scores, has_embedding = self._retriever()._batch_semantic_scores(query, chunks)
+
+        expected = [(cosine_similarity(query, vec) + 1.0) / 2.0 for vec in vectors]
+        assert has_embedding.all()
+        assert scores == pytest.approx(expected, abs=5e-3)
+        assert np.argsort(-scores)[:5].tolist() == np.argsort(expected)[::-1][:5].tolist()
+
+    def test_normalize_array_matches_list_normalization(self):
+        """Vectorized normalization keeps the equal-scores rule."""
+        retriever = self._retriever()
+        assert retriever._normalize_array(np.array([0.2, 0.6, 1.0])).tolist() == pytest.approx(
+            [0.0, 0.5, 1.0]
+        )
+        assert retriever._normalize_array(np.array([0.5, 0.5])).tolist() == [0.5, 0.5]
+        assert retriever._normalize_array(np.array([])).size == 0
+
+    def test_retrieve_ranks_and_truncates(self):
+        """retrieve() ranks by hybrid score and materializes only top_k results."""
+        chunks = [
+            MockChunk("far", "", activation=0.0, embeddings=np.array([0, 1, 0, 0], np.float32)),
+            MockChunk("near", "", activation=1.0, embeddings=np.array([1, 0, 0, 0], np.float32)),
+            MockChunk("mid", "", activation=0.5, embeddings=np.array([1, 1, 0, 0], np.float32)),
+        ]
+        retriever = self._retriever(chunks, enable_query_cache=False, ann_top_k=0)
+
+        results = retriever.retrieve("query", top_k=2)
+
+        assert [r["chunk_id"] for r in results] == ["near", "mid"]
+        assert results[0]["hybrid_score"] == pytest.approx(_CODE_WEIGHTS[1] + _CODE_WEIGHTS[2])
+        assert all(isinstance(r["hybrid_score"], float) for r in results)
+
+    def test_retrieve_skips_missing_embeddings_without_fallback(self):
+        """Chunks without embeddings are dropped when fallback is disabled."""
+        chunks = [
+            MockChunk("embedded", "", embeddings=np.array([1, 0, 0, 0], np.float32)),
+            MockChunk("bare", "", embeddings=None),
+        ]
+        retriever = self._retriever(
+            chunks, enable_query_cache=False, ann_top_k=0, fallback_to_activation=False
+        )
+
+        results = retriever.retrieve("query", top_k=5)
+
+        assert [r["chunk_id"] for r in results] == ["embedded"]
+
+
+class TestSpreadingActivation:
+    """Test spreading activation from the top hits in Stage 2."""
+
+    @staticmethod
+    def _retrieve(edges, **config):
+        class GraphStore(MockStore):
+            def __init__(self, chunks):
+                super().__init__(chunks)
+                self.relationship_calls = []
+
+            def retrieve_by_activation(self, min_activation=0.0, limit=100, **_kwargs):
+                return self.chunks[:limit]
+
+            def get_relationships(self, chunk_ids, max_hops=1, limit=1000):
+                self.relationship_calls.append((list(chunk_ids), max_hops))
+                return edges
+
+        class StubProvider:
+            def embed_query(self, _query):
+                return np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32)
+
+        chunks = [
+            MockChunk("top", "", activation=1.0, embeddings=np.array([1, 0, 0, 0], np.float32)),
+            MockChunk("other", "", activation=0.0, embeddings=np.array([0, 1, 0, 0], np.float32)),
+            MockChunk("callee", "", activation=0.0, embeddings=np.array([0, 1, 0, 0], np.float32)),
+        ]
+        store = GraphStore(chunks)
+        retriever = HybridRetriever(
+            store,
+            MockActivationEngine(),
+            StubProvider(),
+            config=HybridConfig(enable_query_cache=False, ann_top_k=0, **config),
+        )
+        return retriever.retrieve("query", top_k=3), store
+
+    def test_related_candidate_is_boosted(self):
+        """A candidate called by the top hit outranks an otherwise equal one."""
+        results, store = self._retrieve(
+            [("top", "callee", "calls", 1.0)], spreading_top_k=1, spreading_max_hops=2
+        )
+
+        assert [r["chunk_id"] for r in results] == ["top", "callee", "other"]
+        assert results[1]["activation_score"] > results[2]["activation_score"]
+        assert store.relationship_calls == [(["top"], 2)]
+
+    def test_disabled_or_without_edges(self):
+        """Ranking is unchanged when spreading is disabled or no edges exist."""
+        disabled, store = self._retrieve([("top", "callee", "calls", 1.0)], spreading_top_k=0)
+        no_edges, _ = self._retrieve([])
+
+        assert [r["chunk_id"] for r in disabled] == ["top", "other", "callee"]
+        assert store.relationship_calls == []
+        assert [r["chunk_id"] for r in no_edges] == ["top", "other", "callee"]
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError, match="spreading_top_k"):
+            HybridConfig(spreading_top_k=-1)
+        with pytest.raises(ValueError, match="spreading_max_hops"):
+            HybridConfig(spreading_max_hops=0)
+
+
 class TestHybridRetrieverFallback:
     """Test fallback behavior when embeddings unavailable."""
 
@@ -0,0 +1,159 @@
+"""Unit tests for the IVF-flat VectorIndex.
+
+Tests use a real SQLiteStore so the schema triggers that keep the index in
+sync with save_chunk() and chunk deletion are exercised as well.
+"""
+
+import numpy as np
+import pytest
+
+from aurora_context_code.semantic.vector_index import UNASSIGNED_LIST, VectorIndex
+from aurora_core.store.memory import MemoryStore
+from aurora_core.store.sqlite import SQLiteStore
+
+
+def _make_chunk(i: int, vector: np.ndarray, chunk_type: str = "code"):
+    from aurora_core.chunks import CodeChunk
+
+    chunk = CodeChunk(
+        chunk_id=f"code:mod{i % 10}.py:fn{i}",
+        name=f"fn{i}",
+        element_type="function",
+        signature=f"def fn{i}():",
+        docstring=None,
+        file_path=f"/test/mod{i % 10}.py",
+        line_start=1,
+        line_end=5,
+        language="python",
+    )
+    chunk.type = chunk_type
+    chunk.embeddings = vector.astype(np.float32).tobytes()
+    return chunk
+
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(42)
+    return rng.standard_normal((300, 32)).astype(np.float32)
+
+
+@pytest.fixture
+def store(tmp_path, vectors):
+    store = SQLiteStore(str(tmp_path / "vectors.db"))
+    for i, vec in enumerate(vectors):
+        store.save_chunk(_make_chunk(i, vec))
+    return store
+
+
+class TestVectorIndexSync:
+    """Schema triggers keep vector_index rows in sync with chunks."""
+
+    def test_save_chunk_queues_vector(self, store, vectors):
+        conn = store._get_connection()
+        count, min_list = conn.execute("SELECT COUNT(*), MIN(list_id) FROM vector_index").fetchone()
+        assert count == len(vectors)
+        assert min_list == UNASSIGNED_LIST
+
+    def test_deleted_chunk_leaves_index(self, store, vectors):
+        with store._transaction() as conn:
+            conn.execute("DELETE FROM chunks WHERE id = ?", ("code:mod3.py:fn3",))
+
+        index = VectorIndex(store)
+        hits = index.search(vectors[3], k=5)
+        assert "code:mod3.py:fn3" not in [chunk_id for chunk_id, _ in hits]
+
+    def test_resaved_chunk_is_requeued(self, store, vectors):
+        index = VectorIndex(store)
+        index.train(n_lists=16)
+
+        store.save_chunk(_make_chunk(7, vectors[7]))
+
+        row = (
+            store._get_connection()
+            .execute("SELECT list_id FROM vector_index WHERE chunk_id = ?", ("code:mod7.py:fn7",))
+            .fetchone()
+        )
+        assert row[0] == UNASSIGNED_LIST
+
+    def test_sync_below_threshold_keeps_flat_scan(self, store):
+        result = VectorIndex(store).sync()
+        assert result["lists"] == 0
+        assert result["assigned"] == 0
+
+    def test_sync_trains_and_assigns(self, store, vectors):
+        result = VectorIndex(store).sync(min_train_size=100)
+        assert result["lists"] >= 16
+        assert result["assigned"] == len(vectors)
+
+        unassigned = (
+            store._get_connection()
+            .execute("SELECT COUNT(*) FROM vector_index WHERE list_id = ?", (UNASSIGNED_LIST,))
+            .fetchone()[0]
+        )
+        assert unassigned == 0
+
+
+class TestVectorIndexSearch:
+    """Nearest-neighbour search before and after training."""
+
+    def test_flat_search_is_exact(self, store, vectors):
+        index = VectorIndex(store)
+        hits = index.search(vectors[42], k=3)
+        assert hits[0][0] == "code:mod2.py:fn42"
+        assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+
+    def test_trained_search_finds_self(self, store, vectors):
+        index = VectorIndex(store, nprobe=4)
+        index.train(n_lists=16)
+        for i in (0, 99, 250):
+            hits = index.search(vectors[i], k=1)
+            assert hits[0][0] == f"code:mod{i % 10}.py:fn{i}"
+
+    def test_unassigned_vectors_searchable_after_training(self, store):
+        index = VectorIndex(store, nprobe=1)
+        index.train(n_lists=16)
+
+        new_vec = np.ones(32, dtype=np.float32)
+        store.save_chunk(_make_chunk(1000, new_vec))
+
+        hits = index.search(new_vec, k=1)
+        assert hits[0][0] == "code:mod0.py:fn1000"
+
+    def test_quantized_store_search(self, tmp_path, vectors):
+        store = SQLiteStore(str(tmp_path / "int8.db"), embedding_format="int8")
+        for i, vec in enumerate(vectors):
+            store.save_chunk(_make_chunk(i, vec))
+
+        index = VectorIndex(store, nprobe=4)
+        index.train(n_lists=16)
+        for i in (0, 99, 250):
+            hits = index.search(vectors[i], k=1)
+            assert hits[0][0] == f"code:mod{i % 10}.py:fn{i}"
+            assert hits[0][1] == pytest.approx(1.0, abs=1e-3)
+
+    def test_results_sorted_by_similarity(self, store, vectors):
+        hits = VectorIndex(store).search(vectors[10], k=10)
+        scores = [score for _, score in hits]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_chunk_type_filter(self, store, vectors):
+        store.save_chunk(_make_chunk(500, vectors[10], chunk_type="kb"))
+        hits = VectorIndex(store).search(vectors[10], k=5, chunk_type="kb")
+        assert [chunk_id for chunk_id, _ in hits] == ["code:mod0.py:fn500"]
+
+    def test_zero_query_returns_empty(self, store):
+        assert VectorIndex(store).search(np.zeros(32, dtype=np.float32), k=5) == []
+
+
+class TestVectorIndexForStore:
+    """Factory only binds to stores that support the index."""
+
+    def test_sqlite_store_supported(self, store):
+        assert isinstance(VectorIndex.for_store(store), VectorIndex)
+
+    def test_memory_store_unsupported(self):
+        assert VectorIndex.for_store(MemoryStore()) is None
+
+    def test_invalid_nprobe(self, store):
+        with pytest.raises(ValueError):
+            VectorIndex(store, nprobe=0)
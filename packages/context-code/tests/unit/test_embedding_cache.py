@@ -0,0 +1,91 @@
+"""Unit tests for the persistent EmbeddingCache.
+
+Tests (model, content hash) keying, persistence across instances and
+least-recently-used pruning.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from aurora_context_code.embedding_cache import EmbeddingCache, content_hash
+
+
+def _vector(value: float) -> bytes:
+    return np.full(4, value, dtype=np.float32).tobytes()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embedding_cache.db")
+    yield cache
+    cache.close()
+
+
+class TestEmbeddingCache:
+    """Lookup and storage of embeddings."""
+
+    def test_miss_then_hit(self, cache):
+        assert cache.get_many("model-a", ["def f(): pass"]) == [None]
+
+        cache.put_many("model-a", ["def f(): pass"], [_vector(1.0)])
+
+        assert cache.get_many("model-a", ["def f(): pass"]) == [_vector(1.0)]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_results_align_with_texts(self, cache):
+        cache.put_many("model-a", ["a", "c"], [_vector(1.0), _vector(3.0)])
+
+        assert cache.get_many("model-a", ["c", "b", "a", "c"]) == [
+            _vector(3.0),
+            None,
+            _vector(1.0),
+            _vector(3.0),
+        ]
+
+    def test_keyed_by_model(self, cache):
+        cache.put_many("model-a", ["text"], [_vector(1.0)])
+
+        assert cache.get_many("model-b", ["text"]) == [None]
+
+    def test_content_change_is_a_miss(self, cache):
+        cache.put_many("model-a", ["return 1"], [_vector(1.0)])
+
+        assert cache.get_many("model-a", ["return 2"]) == [None]
+        assert content_hash("return 1") != content_hash("return 2")
+
+    def test_large_batch_lookup(self, cache):
+        texts = [f"chunk {i}" for i in range(1200)]
+        cache.put_many("model-a", texts, [_vector(float(i)) for i in range(1200)])
+
+        found = cache.get_many("model-a", texts)
+
+        assert found[1100] == _vector(1100.0)
+        assert all(v is not None for v in found)
+
+    def test_persists_across_instances(self, tmp_path):
+        first = EmbeddingCache(tmp_path / "embedding_cache.db")
+        first.put_many("model-a", ["text"], [_vector(2.0)])
+        first.close()
+
+        second = EmbeddingCache(tmp_path / "embedding_cache.db")
+        try:
+            assert second.get_many("model-a", ["text"]) == [_vector(2.0)]
+        finally:
+            second.close()
+
+    def test_prune_keeps_recently_used(self, tmp_path):
+        cache = EmbeddingCache(tmp_path / "embedding_cache.db", max_entries=2)
+        cache.put_many("model-a", ["old", "used"], [_vector(1.0), _vector(2.0)])
+        time.sleep(0.01)
+        cache.get_many("model-a", ["used"])
+        cache.put_many("model-a", ["new"], [_vector(3.0)])
+
+        assert cache.prune() == 1
+        assert cache.get_many("model-a", ["old", "used", "new"]) == [
+            None,
+            _vector(2.0),
+            _vector(3.0),
+        ]
+        cache.close()
@@ -0,0 +1,145 @@
+"""Unit tests for the persistent GitBlameCache.
+
+Tests blob-hash keyed validity, HEAD binding for uncommitted lines and reuse
+of cached blame by GitSignalExtractor across instances (no `git blame`
+subprocess on a cache hit).
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from aurora_context_code.git import GitSignalExtractor
+from aurora_context_code.git_cache import (
+    UNCOMMITTED_SHA,
+    GitBlameCache,
+    _decode_blame,
+    _encode_blame,
+    git_blob_hash,
+)
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = GitBlameCache(tmp_path / "git_signals.db")
+    yield cache
+    cache.close()
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init")
+    _git(repo, "config", "user.name", "Test User")
+    _git(repo, "config", "user.email", "test@example.com")
+    (repo / "mod.py").write_text("def a():\n    return 1\n\n\ndef b():\n    return 2\n")
+    _git(repo, "add", "mod.py")
+    _git(repo, "commit", "-m", "initial")
+    return repo
+
+
+class TestBlameEncoding:
+    """Run-length encoding of per-line blame."""
+
+    def test_round_trip(self):
+        blame = {1: (SHA_A, 100), 2: (SHA_A, 100), 3: (SHA_B, 200), 5: (SHA_A, 100)}
+        assert _decode_blame(_encode_blame(blame)) == blame
+
+    def test_blob_hash_matches_git(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_bytes(b"hello\n")
+        expected = subprocess.run(
+            ["git", "hash-object", str(path)], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        assert git_blob_hash(b"hello\n") == expected
+
+
+class TestGitBlameCache:
+    """Entry validity rules."""
+
+    def test_hit_requires_same_blob(self, cache):
+        cache.put("/r/f.py", "blob1", "head1", {1: (SHA_A, 100)})
+        assert cache.get("/r/f.py", "blob1", "head2") == {1: (SHA_A, 100)}
+        assert cache.get("/r/f.py", "blob2", "head1") is None
+        assert cache.get("/r/other.py", "blob1", "head1") is None
+
+    def test_uncommitted_lines_bound_to_head(self, cache):
+        cache.put("/r/f.py", "blob1", "head1", {1: (UNCOMMITTED_SHA, 100)})
+        assert cache.get("/r/f.py", "blob1", "head1") is not None
+        assert cache.get("/r/f.py", "blob1", "head2") is None
+
+    def test_persists_across_instances(self, tmp_path):
+        first = GitBlameCache(tmp_path / "git_signals.db")
+        first.put("/r/f.py", "blob1", "head1", {1: (SHA_A, 100)})
+        first.close()
+
+        second = GitBlameCache(tmp_path / "git_signals.db")
+        try:
+            assert second.get("/r/f.py", "blob1", "head1") == {1: (SHA_A, 100)}
+        finally:
+            second.close()
+
+    def test_invalidate(self, cache):
+        cache.put("/r/f.py", "blob1", "head1", {1: (SHA_A, 100)})
+        cache.invalidate("/r/f.py")
+        assert cache.get("/r/f.py", "blob1", "head1") is None
+
+
+class TestExtractorWithCache:
+    """GitSignalExtractor reuses persisted blame."""
+
+    def test_second_run_skips_git_blame(self, git_repo, cache):
+        path = str(git_repo / "mod.py")
+        first = GitSignalExtractor(blame_cache=cache).get_function_commit_times(path, 1, 2)
+        assert len(first) == 1
+
+        real_run = subprocess.run
+        with patch("aurora_context_code.git.subprocess.run", side_effect=real_run) as run:
+            second = GitSignalExtractor(blame_cache=cache).get_function_commit_times(path, 1, 2)
+
+        assert second == first
+        assert not any("blame" in call.args[0] for call in run.call_args_list)
+
+    def test_changed_file_is_blamed_again(self, git_repo, cache):
+        path = git_repo / "mod.py"
+        GitSignalExtractor(blame_cache=cache).get_function_commit_times(str(path), 1, 2)
+
+        path.write_text(path.read_text() + "\n\ndef c():\n    return 3\n")
+        _git(git_repo, "commit", "-am", "add c")
+
+        times = GitSignalExtractor(blame_cache=cache).get_function_commit_times(str(path), 9, 10)
+        assert len(times) == 1
+        assert cache.misses == 2
+
+    def test_nested_repo_uses_its_own_head(self, git_repo, cache):
+        nested = git_repo / "vendor" / "lib"
+        nested.mkdir(parents=True)
+        _git(nested, "init")
+        _git(nested, "config", "user.name", "Test User")
+        _git(nested, "config", "user.email", "test@example.com")
+        (nested / "lib.py").write_text("def c():\n    return 3\n")
+        _git(nested, "add", "lib.py")
+        _git(nested, "commit", "-m", "nested initial")
+
+        extractor = GitSignalExtractor(blame_cache=cache)
+        with patch.object(cache, "put", wraps=cache.put) as put:
+            assert extractor.get_function_commit_times(str(git_repo / "mod.py"), 1, 2)
+            assert extractor.get_function_commit_times(str(nested / "lib.py"), 1, 2)
+
+        heads = {Path(call.args[0]).name: call.args[2] for call in put.call_args_list}
+        assert heads == {
+            "mod.py": _git(git_repo, "rev-parse", "HEAD"),
+            "lib.py": _git(nested, "rev-parse", "HEAD"),
+        }
@@ -0,0 +1,92 @@
+"""Unit tests for process-pool parsing.
+
+Tests the compact chunk records that cross the process boundary and parsing
+through a real ProcessPoolParser.
+"""
+
+import pytest
+
+from aurora_context_code.parse_pool import (
+    ProcessPoolParser,
+    _chunk_to_record,
+    _record_to_chunk,
+)
+from aurora_context_code.registry import get_global_registry
+
+SAMPLE_SOURCE = '''
+import os
+
+
+def helper(x):
+    """Return x doubled."""
+    return x * 2
+
+
+class Greeter:
+    """Say hello."""
+
+    def greet(self, name):
+        if name:
+            return helper(name)
+        return os.getcwd()
+'''
+
+
+@pytest.fixture
+def sample_file(tmp_path):
+    path = tmp_path / "sample.py"
+    path.write_text(SAMPLE_SOURCE)
+    return path
+
+
+def _summary(chunks):
+    return sorted(
+        (c.id, c.element_type, c.name, c.line_start, c.line_end, c.signature, c.docstring)
+        for c in chunks
+    )
+
+
+class TestChunkRecords:
+    """Chunk <-> record round trip."""
+
+    def test_round_trip_preserves_fields(self, sample_file):
+        chunks = get_global_registry().get_parser_for_file(sample_file).parse(sample_file)
+        assert chunks
+
+        for chunk in chunks:
+            rebuilt = _record_to_chunk(_chunk_to_record(chunk))
+            assert _summary([rebuilt]) == _summary([chunk])
+            assert rebuilt.type == chunk.type
+            assert rebuilt.language == chunk.language
+            assert rebuilt.complexity_score == chunk.complexity_score
+            assert rebuilt.metadata == chunk.metadata
+            assert rebuilt.dependencies == chunk.dependencies
+
+    def test_record_keeps_chunk_type(self, sample_file):
+        chunk = get_global_registry().get_parser_for_file(sample_file).parse(sample_file)[0]
+        chunk.type = "kb"
+        chunk.metadata = {"section_path": ["Intro"]}
+
+        rebuilt = _record_to_chunk(_chunk_to_record(chunk))
+        assert rebuilt.type == "kb"
+        assert rebuilt.metadata == {"section_path": ["Intro"]}
+
+
+class TestProcessPoolParser:
+    """Parsing in worker processes."""
+
+    def test_matches_in_process_parsing(self, sample_file):
+        expected = get_global_registry().get_parser_for_file(sample_file).parse(sample_file)
+
+        with ProcessPoolParser(max_workers=1) as pool:
+            language, chunks = pool.parse(sample_file)
+
+        assert language == "python"
+        assert _summary(chunks) == _summary(expected)
+
+    def test_unsupported_file_returns_no_language(self, tmp_path):
+        path = tmp_path / "data.unknown"
+        path.write_text("nothing to parse")
+
+        with ProcessPoolParser(max_workers=1) as pool:
+            assert pool.parse(path) == (None, [])
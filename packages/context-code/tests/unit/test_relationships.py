@@ -0,0 +1,80 @@
+"""Unit tests for relationship edge extraction.
+
+Tests that extract_relationships() turns parsed chunks into call edges
+(local dependencies) and containment edges (innermost enclosing chunk).
+"""
+
+from aurora_context_code.languages.python import PythonParser
+from aurora_context_code.relationships import (
+    CALL_WEIGHT,
+    CONTAINS_WEIGHT,
+    extract_relationships,
+)
+from aurora_core.chunks.code_chunk import CodeChunk
+
+SOURCE = '''
+import os
+from pkg.util import helper
+
+
+def load(path):
+    return helper(os.path.join(path, "x"))
+
+
+class Service:
+    def run(self):
+        return self.prepare() + load("a")
+
+    def prepare(self):
+        return 1
+'''
+
+
+def _chunk(chunk_id, line_start, line_end, dependencies=None):
+    return CodeChunk(
+        chunk_id=chunk_id,
+        file_path="/repo/mod.py",
+        element_type="function",
+        name=chunk_id,
+        line_start=line_start,
+        line_end=line_end,
+        dependencies=dependencies,
+    )
+
+
+def test_edges_from_parsed_python_file(tmp_path):
+    path = tmp_path / "mod.py"
+    path.write_text(SOURCE)
+    chunks = PythonParser().parse(path)
+    by_name = {chunk.name: chunk.id for chunk in chunks}
+
+    edges = set(extract_relationships(chunks))
+
+    assert (by_name["Service.run"], by_name["load"], "calls", CALL_WEIGHT) in edges
+    assert (by_name["Service"], by_name["Service.run"], "contains", CONTAINS_WEIGHT) in edges
+    assert (by_name["Service"], by_name["Service.prepare"], "contains", CONTAINS_WEIGHT) in edges
+    # Imported names are resolved across files by the store, not here
+    assert not any(to_id.startswith("import:") for _, to_id, _, _ in edges)
+
+
+def test_containment_uses_innermost_chunk():
+    outer = _chunk("outer", 1, 20)
+    inner = _chunk("inner", 2, 10)
+    leaf = _chunk("leaf", 3, 5)
+    sibling = _chunk("sibling", 11, 19)
+    after = _chunk("after", 21, 30)
+
+    edges = extract_relationships([leaf, after, outer, sibling, inner])
+
+    assert sorted((f, t) for f, t, rel, _ in edges if rel == "contains") == [
+        ("inner", "leaf"),
+        ("outer", "inner"),
+        ("outer", "sibling"),
+    ]
+
+
+def test_calls_ignore_self_and_unknown_ids():
+    a = _chunk("a", 1, 2, dependencies=["a", "b", "code:elsewhere", "import:os"])
+    b = _chunk("b", 4, 5)
+
+    assert extract_relationships([a, b]) == [("a", "b", "calls", CALL_WEIGHT)]
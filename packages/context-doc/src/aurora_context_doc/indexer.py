@@ -1,15 +1,86 @@
-"""Document indexer for orchestrating parsing and storage."""
+"""Document indexer for orchestrating parsing and storage.
 
+Re-indexing a folder is incremental: every indexed document is recorded in the
+store's ``file_index`` table with its content hash and mtime, and unchanged
+files are skipped without being opened by a parser. Changed files are parsed in
+a pool of worker processes (PDF and DOCX parsing is CPU-bound Python and does
+not scale across threads), then embedded and written in batches.
+"""
+
+import hashlib
 import logging
+import multiprocessing
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from aurora_context_doc.chunker import DocumentChunker
 from aurora_context_doc.parser.base import DocumentParser
+from aurora_core.chunks import DocChunk
 from aurora_core.store import Store
 
 logger = logging.getLogger(__name__)
 
+SUPPORTED_EXTENSIONS = ("pdf", "docx")
+
+# Chunks per embedding/storage batch
+DEFAULT_BATCH_SIZE = 64
+
+# Parsers cached per process (one set in the parent, one per pool worker)
+_worker_parsers: dict[str, DocumentParser] = {}
+
+
+def _create_parser(extension: str) -> Optional[DocumentParser]:
+    """Create the parser for a file extension, or None if unsupported."""
+    if extension == "pdf":
+        from aurora_context_doc.parser.pdf import PDFParser
+
+        return PDFParser()
+    if extension == "docx":
+        from aurora_context_doc.parser.docx import DOCXParser
+
+        return DOCXParser()
+    return None
+
+
+def _parse_in_worker(file_path: str) -> list[dict[str, Any]]:
+    """Parse one document inside a worker process.
+
+    Chunks cross the process boundary as ``DocChunk.to_json()`` records.
+
+    Args:
+        file_path: Path of the document to parse
+
+    Returns:
+        Serialized chunks
+
+    """
+    path = Path(file_path)
+    extension = path.suffix.lstrip(".").lower()
+    if extension not in _worker_parsers:
+        parser = _create_parser(extension)
+        if parser is None:
+            raise ValueError(f"Unsupported file format: {path.suffix}")
+        _worker_parsers[extension] = parser
+    return [chunk.to_json() for chunk in _worker_parsers[extension].parse(path)]
+
+
+def _file_hash(file_path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _embedding_text(chunk: DocChunk) -> str:
+    """Text embedded for a chunk: section breadcrumb plus body."""
+    breadcrumb = " > ".join(chunk.section_path or [])
+    return "\n\n".join(part for part in (breadcrumb, chunk.content.strip()) if part)
+
 
 class DocumentIndexer:
     """Orchestrates document parsing and storage.
@@ -18,24 +89,39 @@ class DocumentIndexer:
     - Parser selection based on file extension
     - Chunk splitting and merging
     - Incremental indexing with content hash tracking
-    - Batch storage operations
+    - Process-pool parsing and batch storage operations
+
+    After each call, ``stats`` holds counts for that run: ``files_indexed``,
+    ``files_skipped``, ``files_failed``, ``files_removed`` and ``chunks``.
     """
 
     def __init__(
         self,
         store: Store,
         chunker: Optional[DocumentChunker] = None,
+        embedding_provider: Any = None,
+        workers: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ):
         """Initialize document indexer.
 
         Args:
             store: Storage backend for saving chunks
             chunker: Optional custom chunker (defaults to DocumentChunker())
+            embedding_provider: Optional provider with ``embed_batch()``; chunks are
+                stored without embeddings (BM25-only) if None
+            workers: Parser processes for directory indexing (None = CPU count,
+                1 = parse in this process)
+            batch_size: Chunks per embedding and storage batch
 
         """
         self.store = store
         self.chunker = chunker or DocumentChunker()
+        self.embedding_provider = embedding_provider
+        self.workers = workers
+        self.batch_size = batch_size
         self._parsers: dict[str, DocumentParser] = {}
+        self.stats: dict[str, int] = {}
 
     def _get_parser(self, file_path: Path) -> Optional[DocumentParser]:
         """Get appropriate parser for file extension.
@@ -50,30 +136,22 @@ class DocumentIndexer:
         extension = file_path.suffix.lstrip(".").lower()
 
         # Lazy load parsers on demand
-        if extension == "pdf":
-            if "pdf" not in self._parsers:
-                from aurora_context_doc.parser.pdf import PDFParser
-
-                self._parsers["pdf"] = PDFParser()
-            return self._parsers["pdf"]
-
-        elif extension == "docx":
-            if "docx" not in self._parsers:
-                from aurora_context_doc.parser.docx import DOCXParser
-
-                self._parsers["docx"] = DOCXParser()
-            return self._parsers["docx"]
-
-        return None
-
-    def index_file(self, file_path: Path | str) -> int:
+        if extension not in self._parsers:
+            parser = _create_parser(extension)
+            if parser is None:
+                return None
+            self._parsers[extension] = parser
+        return self._parsers[extension]
+
+    def index_file(self, file_path: Path | str, force: bool = False) -> int:
         """Index a single document file.
 
         Args:
             file_path: Path to document file
+            force: Re-index even if the file is unchanged since the last run
 
         Returns:
-            Number of chunks created
+            Number of chunks created (0 if the file was unchanged)
 
         Raises:
             FileNotFoundError: If file does not exist
@@ -91,56 +169,39 @@ class DocumentIndexer:
         if parser is None:
             raise ValueError(f"Unsupported file format: {file_path.suffix}. Supported: .pdf, .docx")
 
-        logger.info(f"Indexing document: {file_path}")
-
-        # Parse document
-        chunks = parser.parse(file_path)
-
-        if not chunks:
-            logger.warning(f"No chunks extracted from: {file_path}")
+        self._reset_stats()
+        changed = self._select_changed([file_path], self._load_file_index(), force)
+        if not changed:
+            logger.info(f"Skipping unchanged document: {file_path}")
             return 0
 
-        # Process chunks (split large, merge small)
-        processed_chunks = []
-        for chunk in chunks:
-            # Split if too large
-            split_chunks = self.chunker.split_large_section(chunk)
-            processed_chunks.extend(split_chunks)
-
-        # Optionally merge small chunks
-        # processed_chunks = self.chunker.merge_small_sections(processed_chunks)
-
-        # Save to store
-        saved_count = 0
-        for chunk in processed_chunks:
-            try:
-                # Use store's doc-specific save method if available
-                if hasattr(self.store, "save_doc_chunk"):
-                    self.store.save_doc_chunk(chunk)
-                else:
-                    # Fallback to generic save_chunk
-                    self.store.save_chunk(chunk)
-
-                saved_count += 1
+        logger.info(f"Indexing document: {file_path}")
 
-            except Exception as e:
-                logger.error(f"Failed to save chunk {chunk.id}: {e}")
+        # Parse document (errors propagate for single-file indexing)
+        chunks = parser.parse(file_path)
+        self._store_parsed([(file_path, chunks)], changed)
 
-        logger.info(f"Indexed {saved_count} chunks from {file_path}")
-        return saved_count
+        logger.info(f"Indexed {self.stats['chunks']} chunks from {file_path}")
+        return self.stats["chunks"]
 
     def index_directory(
         self,
         dir_path: Path | str,
         recursive: bool = True,
         extensions: Optional[list[str]] = None,
+        force: bool = False,
     ) -> int:
         """Index all documents in a directory.
 
+        Unchanged documents are skipped, documents that were indexed before but
+        no longer exist are removed, and changed documents are parsed in
+        parallel.
+
         Args:
             dir_path: Path to directory
             recursive: If True, index subdirectories recursively
             extensions: Optional list of extensions to index (e.g., ["pdf", "docx"])
+            force: Re-index every document, even unchanged ones
 
         Returns:
             Total number of chunks created
@@ -160,33 +221,268 @@ class DocumentIndexer:
 
         # Default to supported extensions
         if extensions is None:
-            extensions = ["pdf", "docx"]
+            extensions = list(SUPPORTED_EXTENSIONS)
 
         # Normalize extensions
         extensions = [ext.lower().lstrip(".") for ext in extensions]
 
-        # Find all matching files
-        total_chunks = 0
-
-        if recursive:
-            pattern = "**/*"
-        else:
-            pattern = "*"
+        pattern = "**/*" if recursive else "*"
+        files = sorted(
+            file_path
+            for file_path in dir_path.glob(pattern)
+            if file_path.is_file() and file_path.suffix.lstrip(".").lower() in extensions
+        )
+
+        self._reset_stats()
+        file_index = self._load_file_index()
+        changed = self._select_changed(files, file_index, force)
+        self._remove_deleted(dir_path, recursive, extensions, files, file_index)
+
+        logger.info(
+            f"Documents: {len(changed)} changed, {self.stats['files_skipped']} unchanged, "
+            f"{self.stats['files_removed']} removed"
+        )
+        self._store_parsed(self._parse_files(list(changed)), changed)
+
+        logger.info(f"Indexed {self.stats['chunks']} total chunks from {dir_path}")
+        return self.stats["chunks"]
+
+    def _reset_stats(self) -> None:
+        self.stats = {
+            "files_indexed": 0,
+            "files_skipped": 0,
+            "files_failed": 0,
+            "files_removed": 0,
+            "chunks": 0,
+        }
+
+    def _select_changed(
+        self,
+        files: list[Path],
+        file_index: dict[str, dict[str, Any]],
+        force: bool,
+    ) -> dict[Path, dict[str, Any]]:
+        """Return the files that need parsing, with their new file_index info.
+
+        A file is unchanged if its mtime is not newer than the indexed mtime, or
+        if its content hash matches (the mtime is then refreshed).
+        """
+        changed: dict[Path, dict[str, Any]] = {}
+        touched: dict[str, float] = {}
 
-        for file_path in dir_path.glob(pattern):
-            if not file_path.is_file():
+        for file_path in files:
+            key = str(file_path.absolute())
+            try:
+                mtime = file_path.stat().st_mtime
+                cached = None if force else file_index.get(key)
+                if cached is not None and mtime <= cached["mtime"]:
+                    self.stats["files_skipped"] += 1
+                    continue
+
+                content_hash = _file_hash(file_path)
+                if cached is not None and content_hash == cached["hash"]:
+                    self.stats["files_skipped"] += 1
+                    touched[key] = mtime
+                    continue
+            except OSError as e:
+                logger.warning(f"Cannot read {file_path}: {e}")
+                self.stats["files_failed"] += 1
                 continue
 
-            extension = file_path.suffix.lstrip(".").lower()
-            if extension in extensions:
+            changed[file_path] = {"hash": content_hash, "mtime": mtime}
+
+        if touched:
+            self._update_file_index("update_file_index_mtimes", touched)
+        return changed
+
+    def _parse_files(self, files: list[Path]) -> Iterator[tuple[Path, list[DocChunk] | None]]:
+        """Parse documents, yielding (path, chunks) in completion order.
+
+        Uses a process pool when there is more than one file and more than one
+        worker; chunks is None for files that failed to parse.
+        """
+        workers = min(self.workers or os.cpu_count() or 1, len(files))
+        if workers <= 1:
+            for file_path in files:
                 try:
-                    chunk_count = self.index_file(file_path)
-                    total_chunks += chunk_count
+                    parser = self._get_parser(file_path)
+                    if parser is None:
+                        logger.warning(f"No parser available for {file_path}, skipping")
+                        self.stats["files_skipped"] += 1
+                        continue
+                    chunks = parser.parse(file_path)
                 except Exception as e:
                     logger.error(f"Failed to index {file_path}: {e}")
+                    yield file_path, None
+                    continue
+                yield file_path, chunks
+            return
+
+        logger.info(f"Parsing {len(files)} documents in {workers} worker processes")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures = {executor.submit(_parse_in_worker, str(f)): f for f in files}
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    records = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to index {file_path}: {e}")
+                    yield file_path, None
+                    continue
+                yield file_path, [DocChunk.from_json(record) for record in records]
+
+    def _store_parsed(
+        self,
+        parsed: Iterator[tuple[Path, list[DocChunk] | None]] | list[tuple[Path, Any]],
+        file_info: dict[Path, dict[str, Any]],
+    ) -> None:
+        """Split, embed and save parsed documents in batches.
+
+        A document is recorded in file_index only once all of its chunks are
+        stored, so a failed batch is retried on the next run.
+        """
+        pending: list[DocChunk] = []
+        pending_files: dict[Path, int] = {}
+
+        for file_path, chunks in parsed:
+            if chunks is None:
+                self.stats["files_failed"] += 1
+                continue
+            if not chunks:
+                logger.warning(f"No chunks extracted from: {file_path}")
+
+            # Process chunks (split large sections)
+            processed_chunks = []
+            for chunk in chunks:
+                processed_chunks.extend(self.chunker.split_large_section(chunk))
 
-        logger.info(f"Indexed {total_chunks} total chunks from {dir_path}")
-        return total_chunks
+            self._remove_stale_chunks(file_path, {chunk.id for chunk in processed_chunks})
+            pending.extend(processed_chunks)
+            pending_files[file_path] = len(processed_chunks)
+
+            if len(pending) >= self.batch_size:
+                self._flush(pending, pending_files, file_info)
+                pending, pending_files = [], {}
+
+        if pending_files:
+            self._flush(pending, pending_files, file_info)
+
+    def _flush(
+        self,
+        chunks: list[DocChunk],
+        files: dict[Path, int],
+        file_info: dict[Path, dict[str, Any]],
+    ) -> None:
+        """Embed and save one batch of chunks, then record their files."""
+        self._embed(chunks)
+        try:
+            if hasattr(self.store, "save_doc_chunks_bulk"):
+                self.store.save_doc_chunks_bulk(chunks)
+            else:
+                for chunk in chunks:
+                    self.store.save_chunk(chunk)
+        except Exception as e:
+            logger.error(f"Failed to save {len(chunks)} chunks from {len(files)} documents: {e}")
+            self.stats["files_failed"] += len(files)
+            return
+
+        self.stats["files_indexed"] += len(files)
+        self.stats["chunks"] += len(chunks)
+
+        self._update_file_index(
+            "save_file_index",
+            {
+                str(file_path.absolute()): {**file_info[file_path], "chunk_count": chunk_count}
+                for file_path, chunk_count in files.items()
+            },
+        )
+
+    def _embed(self, chunks: list[DocChunk]) -> None:
+        """Attach embeddings to a batch of chunks with one embed_batch() call."""
+        if self.embedding_provider is None:
+            return
+
+        targets = [(chunk, _embedding_text(chunk)) for chunk in chunks]
+        targets = [(chunk, text) for chunk, text in targets if text]
+        if not targets:
+            return
+
+        try:
+            embeddings = self.embedding_provider.embed_batch(
+                [text for _, text in targets],
+                batch_size=self.batch_size,
+            )
+        except Exception as e:
+            logger.warning(f"Embedding failed, storing {len(targets)} chunks without: {e}")
+            return
+
+        for i, (chunk, _) in enumerate(targets):
+            chunk.embeddings = embeddings[i].tobytes()
+
+    # ------------------------------------------------------------------
+    # file_index and stale chunk bookkeeping (SQLite stores only)
+    # ------------------------------------------------------------------
+
+    def _load_file_index(self) -> dict[str, dict[str, Any]]:
+        """Load indexed document hashes and mtimes keyed by absolute path."""
+        if not hasattr(self.store, "load_file_index"):
+            return {}
+        try:
+            file_index: dict[str, dict[str, Any]] = self.store.load_file_index(
+                SUPPORTED_EXTENSIONS
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load file index, re-indexing all documents: {e}")
+            return {}
+        return file_index
+
+    def _update_file_index(self, method: str, records: Any) -> None:
+        """Call a store file_index method, logging failures."""
+        if not records or not hasattr(self.store, method):
+            return
+        try:
+            getattr(self.store, method)(records)
+        except Exception as e:
+            logger.warning(f"Failed to update document file index: {e}")
+
+    def _remove_stale_chunks(self, file_path: Path, keep_ids: set[str]) -> None:
+        """Delete a document's chunks that are not in its new chunk set."""
+        if not hasattr(self.store, "delete_doc_chunks"):
+            return
+        try:
+            removed = self.store.delete_doc_chunks(str(file_path.absolute()), keep_ids)
+            if removed:
+                logger.debug(f"Removed {removed} stale chunks from {file_path}")
+        except Exception as e:
+            logger.warning(f"Failed to remove stale chunks for {file_path}: {e}")
+
+    def _remove_deleted(
+        self,
+        dir_path: Path,
+        recursive: bool,
+        extensions: list[str],
+        files: list[Path],
+        file_index: dict[str, dict[str, Any]],
+    ) -> None:
+        """Drop chunks and file_index rows of documents deleted from ``dir_path``."""
+        root = dir_path.absolute()
+        current = {str(f.absolute()) for f in files}
+        for indexed_path in file_index:
+            path = Path(indexed_path)
+            in_scope = path.parent == root or (recursive and root in path.parents)
+            if (
+                indexed_path in current
+                or not in_scope
+                or path.suffix.lstrip(".").lower() not in extensions
+                or path.exists()
+            ):
+                continue
+            self._remove_stale_chunks(path, set())
+            self._update_file_index("delete_file_index", [indexed_path])
+            self.stats["files_removed"] += 1
 
 
 __all__ = ["DocumentIndexer"]
@@ -0,0 +1,187 @@
+"""Tests for incremental document indexing (aurora_context_doc.indexer).
+
+A stub parser stands in for the PDF parser: every ``Title: body`` line of a
+``.pdf`` file becomes one section chunk, so documents can be written as text.
+Chunks are stored in a real SQLiteStore in a temporary directory.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from aurora_context_doc import indexer as indexer_module
+from aurora_context_doc.indexer import DocumentIndexer
+from aurora_context_doc.parser.base import DocumentParser
+from aurora_core.chunks import DocChunk
+from aurora_core.store.sqlite import SQLiteStore
+
+
+class StubParser(DocumentParser):
+    """Parses ``Title: body`` lines into section chunks and counts calls."""
+
+    def __init__(self):
+        self.parsed: list[Path] = []
+
+    def supported_extensions(self) -> list[str]:
+        return ["pdf"]
+
+    def parse(self, file_path: Path) -> list[DocChunk]:
+        self.parsed.append(file_path)
+        chunks = []
+        for line in file_path.read_text().splitlines():
+            title, _, body = line.partition(":")
+            chunks.append(
+                DocChunk(
+                    chunk_id=f"doc:{file_path.stem}:{title}",
+                    file_path=str(file_path.absolute()),
+                    name=title,
+                    content=body.strip(),
+                    section_path=[title],
+                    section_level=1,
+                ),
+            )
+        return chunks
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    parser = StubParser()
+    monkeypatch.setattr(indexer_module, "_create_parser", lambda extension: parser)
+    monkeypatch.setattr(indexer_module, "_worker_parsers", {})
+    return parser
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteStore(str(tmp_path / "memory.db"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def docs(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "guide.pdf").write_text("Install: pip install aurora\nUsage: aur mem index\n")
+    (docs / "notes.pdf").write_text("Notes: remember the milk\n")
+    return docs
+
+
+def doc_chunk_ids(store: SQLiteStore) -> set[str]:
+    rows = store._get_connection().execute("SELECT id FROM chunks WHERE type = 'doc'")
+    return {row[0] for row in rows}
+
+
+def bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+
+class TestIncrementalIndexing:
+    """Unchanged, edited and deleted documents."""
+
+    def test_unchanged_files_skipped_by_mtime(self, parser, store, docs):
+        indexer = DocumentIndexer(store, workers=1)
+        assert indexer.index_directory(docs) == 3
+
+        assert indexer.index_directory(docs) == 0
+        assert indexer.stats["files_skipped"] == 2
+        assert len(parser.parsed) == 2
+
+    def test_touched_files_skipped_by_hash(self, parser, store, docs):
+        indexer = DocumentIndexer(store, workers=1)
+        indexer.index_directory(docs)
+        guide = docs / "guide.pdf"
+        bump_mtime(guide)
+
+        assert indexer.index_directory(docs) == 0
+        assert indexer.stats["files_skipped"] == 2
+        assert len(parser.parsed) == 2
+        # The new mtime is recorded, so the next run skips without hashing
+        recorded = store.load_file_index()[str(guide.absolute())]
+        assert recorded["mtime"] == guide.stat().st_mtime
+
+    def test_edited_document_drops_stale_chunks(self, parser, store, docs):
+        indexer = DocumentIndexer(store, workers=1)
+        indexer.index_directory(docs)
+        guide = docs / "guide.pdf"
+        guide.write_text("Install: uv pip install aurora\nTroubleshooting: run aur doctor\n")
+        bump_mtime(guide)
+
+        assert indexer.index_directory(docs) == 2
+        assert doc_chunk_ids(store) == {
+            "doc:guide:Install",
+            "doc:guide:Troubleshooting",
+            "doc:notes:Notes",
+        }
+        assert store.get_chunk("doc:guide:Install").content == "uv pip install aurora"
+        assert store.load_file_index()[str(guide.absolute())]["chunk_count"] == 2
+
+    def test_deleted_document_removed(self, parser, store, docs):
+        indexer = DocumentIndexer(store, workers=1)
+        indexer.index_directory(docs)
+        guide = docs / "guide.pdf"
+        guide.unlink()
+
+        indexer.index_directory(docs)
+
+        assert indexer.stats["files_removed"] == 1
+        assert doc_chunk_ids(store) == {"doc:notes:Notes"}
+        assert set(store.load_file_index()) == {str((docs / "notes.pdf").absolute())}
+
+    def test_force_reparses_unchanged_files(self, parser, store, docs):
+        indexer = DocumentIndexer(store, workers=1)
+        indexer.index_directory(docs)
+
+        assert indexer.index_directory(docs, force=True) == 3
+        assert len(parser.parsed) == 4
+
+
+class TestParsing:
+    """Worker pool versus in-process parsing."""
+
+    @pytest.fixture
+    def pool(self, monkeypatch):
+        # Threads stand in for spawned processes, which would not see the stub parser
+        created = []
+
+        def executor(max_workers, mp_context):
+            created.append(max_workers)
+            return ThreadPoolExecutor(max_workers)
+
+        monkeypatch.setattr(indexer_module, "ProcessPoolExecutor", executor)
+        return created
+
+    def test_single_worker_parses_in_process(self, parser, pool, store, docs):
+        indexer = DocumentIndexer(store, workers=1)
+
+        assert indexer.index_directory(docs) == 3
+        assert pool == []
+        assert len(parser.parsed) == 2
+
+    def test_pool_results_match_in_process(self, parser, pool, store, docs, tmp_path):
+        DocumentIndexer(store, workers=1).index_directory(docs)
+        in_process = doc_chunk_ids(store)
+        pooled_store = SQLiteStore(str(tmp_path / "pooled.db"))
+
+        indexer = DocumentIndexer(pooled_store, workers=4)
+        assert indexer.index_directory(docs) == 3
+
+        assert pool == [2]  # capped at the number of changed files
+        assert doc_chunk_ids(pooled_store) == in_process
+        assert pooled_store.get_chunk("doc:guide:Usage").section_path == ["Usage"]
+        pooled_store.close()
+
+    def test_failed_parse_is_counted_and_retried(self, parser, pool, store, docs):
+        (docs / "broken.pdf").write_bytes(b"\xff\xfe not text")
+        indexer = DocumentIndexer(store, workers=4)
+
+        indexer.index_directory(docs)
+        assert indexer.stats["files_failed"] == 1
+        assert indexer.stats["files_indexed"] == 2
+
+        indexer.index_directory(docs)
+        assert indexer.stats["files_failed"] == 1
+        assert indexer.stats["files_skipped"] == 2
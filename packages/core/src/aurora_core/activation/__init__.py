@@ -16,6 +16,7 @@ Where:
 Components:
     - base_level: Base-level activation calculation (BLA)
     - spreading: Spreading activation via relationships
+    - csr_spreading: NumPy CSR engine for spreading activation (loaded lazily)
     - context_boost: Context boost from keyword overlap
     - decay: Decay penalty calculation
     - engine: Main ActivationEngine integrating all formulas
@@ -51,6 +52,7 @@ __all__ = [
     "ActivationEngine",
     "ActivationConfig",
     "ActivationComponents",
+    "ActivationArrays",
     "DEFAULT_CONFIG",
     "AGGRESSIVE_CONFIG",
     "CONSERVATIVE_CONFIG",
@@ -66,11 +68,14 @@ __all__ = [
     "BLAConfig",
     "AccessHistoryEntry",
     "calculate_bla",
+    "calculate_bla_hybrid",
     "SpreadingActivation",
     "SpreadingConfig",
     "Relationship",
     "RelationshipGraph",
     "calculate_spreading",
+    "CSRGraph",
+    "CSRSpreadingActivation",
     "ContextBoost",
     "ContextBoostConfig",
     "KeywordExtractor",
@@ -85,8 +90,16 @@ __all__ = [
     "ActivationConfig",
 ]
 
+from typing import Any
+
 # Import implemented components
-from .base_level import AccessHistoryEntry, BaseLevelActivation, BLAConfig, calculate_bla
+from .base_level import (
+    AccessHistoryEntry,
+    BaseLevelActivation,
+    BLAConfig,
+    calculate_bla,
+    calculate_bla_hybrid,
+)
 from .context_boost import (
     ContextBoost,
     ContextBoostConfig,
@@ -107,6 +120,7 @@ from .engine import (
     CONSERVATIVE_CONFIG,
     CONTEXT_FOCUSED_CONFIG,
     DEFAULT_CONFIG,
+    ActivationArrays,
     ActivationComponents,
     ActivationConfig,
     ActivationEngine,
@@ -125,3 +139,12 @@ from .spreading import (
     SpreadingConfig,
     calculate_spreading,
 )
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the NumPy-backed CSR spreading engine."""
+    if name in ("CSRGraph", "CSRSpreadingActivation"):
+        from . import csr_spreading
+
+        return getattr(csr_spreading, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -23,9 +23,14 @@ Reference:
 
 import math
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field, field_validator
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
 
 class AccessHistoryEntry(BaseModel):
     """Represents a single access to a chunk in memory.
@@ -151,6 +156,53 @@ class BaseLevelActivation:
         # Clamp to minimum activation
         return max(bla, self.config.min_activation)
 
+    def calculate_batch(
+        self,
+        access_times: "npt.NDArray[np.float64]",
+        access_offsets: "npt.NDArray[np.int64]",
+        current_time: datetime | None = None,
+    ) -> "npt.NDArray[np.float64]":
+        """Calculate Base-Level Activation for many chunks in one vectorized pass.
+
+        The accesses of chunk i are access_times[access_offsets[i]:access_offsets[i + 1]],
+        so a candidate set is described by one flat array instead of a list of
+        AccessHistoryEntry objects per chunk.
+
+        Args:
+            access_times: Epoch seconds of all accesses, grouped by chunk
+            access_offsets: Start offset of each chunk's accesses (length n + 1)
+            current_time: Current time for calculating recency (defaults to now)
+
+        Returns:
+            BLA value per chunk, equal to calculate() on each chunk's history
+
+        """
+        import numpy as np
+
+        if current_time is None:
+            current_time = datetime.now(timezone.utc)
+        elif current_time.tzinfo is None:
+            current_time = current_time.replace(tzinfo=timezone.utc)
+
+        access_times = np.asarray(access_times, dtype=np.float64)
+        access_offsets = np.asarray(access_offsets, dtype=np.int64)
+        counts = np.diff(access_offsets)
+        owner = np.repeat(np.arange(len(counts)), counts)
+
+        # Non-positive lags are treated as "just accessed" (1 second ago)
+        lags = current_time.timestamp() - access_times[access_offsets[0] : access_offsets[-1]]
+        lags[lags <= 0] = 1.0
+        power_law_sum = np.bincount(
+            owner,
+            weights=np.power(lags, -self.config.decay_rate),
+            minlength=len(counts),
+        )
+
+        bla = np.full(len(counts), self.config.default_activation, dtype=np.float64)
+        positive = power_law_sum > 0
+        bla[positive] = np.log(power_law_sum[positive])
+        return np.maximum(bla, self.config.min_activation)
+
     def calculate_from_timestamps(
         self,
         timestamps: list[datetime],
@@ -169,6 +221,40 @@ class BaseLevelActivation:
         history = [AccessHistoryEntry(timestamp=ts) for ts in timestamps]
         return self.calculate(history, current_time)
 
+    def calculate_hybrid(
+        self,
+        recent_times: list[float],
+        access_count: int,
+        first_access: float,
+        current_time: float,
+    ) -> float:
+        """Approximate BLA from the most recent accesses plus an access count.
+
+        Uses Petrov's (2006) hybrid approximation: the k most recent accesses
+        are summed exactly and the remaining n - k older accesses are assumed
+        to be spread evenly between the first access and the k-th most recent
+        one. Cost is O(k) however many accesses a chunk has.
+
+        Args:
+            recent_times: Epoch seconds of the k most recent accesses
+            access_count: Total number of accesses n (n >= k)
+            first_access: Epoch seconds of the first access
+            current_time: Epoch seconds to measure recency from
+
+        Returns:
+            Approximate BLA value (log space); exact when n == k
+
+        """
+        return calculate_bla_hybrid(
+            recent_times,
+            access_count,
+            first_access,
+            current_time,
+            decay_rate=self.config.decay_rate,
+            min_activation=self.config.min_activation,
+            default_activation=self.config.default_activation,
+        )
+
     def calculate_from_access_counts(
         self,
         access_count: int,
@@ -245,3 +331,59 @@ def calculate_bla(
     config = BLAConfig(decay_rate=decay_rate)
     calculator = BaseLevelActivation(config)
     return calculator.calculate(access_history, current_time)
+
+
+def calculate_bla_hybrid(
+    recent_times: list[float],
+    access_count: int,
+    first_access: float,
+    current_time: float,
+    decay_rate: float = 0.5,
+    min_activation: float = -10.0,
+    default_activation: float = -5.0,
+) -> float:
+    """Approximate BLA from recent accesses and a count (Petrov, 2006).
+
+    BLA ≈ ln(Σ_{j≤k} t_j^(-d) + (n - k)(t_n^(1-d) - t_k^(1-d)) / ((1 - d)(t_n - t_k)))
+
+    where t_j are the lags of the k most recent accesses, t_k the oldest of
+    them and t_n the lag of the first access. Pure float arithmetic, so it is
+    cheap enough to run on every recorded access.
+
+    Args:
+        recent_times: Epoch seconds of the k most recent accesses
+        access_count: Total number of accesses n (n >= k)
+        first_access: Epoch seconds of the first access
+        current_time: Epoch seconds to measure recency from
+        decay_rate: Decay rate parameter (default 0.5)
+        min_activation: Lower clamp of the result
+        default_activation: Value returned when there are no accesses
+
+    Returns:
+        BLA value (log space)
+
+    """
+    if not recent_times or access_count <= 0:
+        return default_activation
+
+    # Non-positive lags are treated as "just accessed" (1 second ago), as in calculate()
+    lags = [lag if lag > 0 else 1.0 for lag in (current_time - t for t in recent_times)]
+    power_law_sum = sum(math.pow(lag, -decay_rate) for lag in lags)
+
+    older = access_count - len(lags)
+    if older > 0:
+        t_k = max(lags)
+        t_n = max(current_time - first_access, t_k)
+        if t_n - t_k < 1e-9:
+            power_law_sum += older * math.pow(t_k, -decay_rate)
+        elif decay_rate == 1.0:
+            power_law_sum += older * (math.log(t_n) - math.log(t_k)) / (t_n - t_k)
+        else:
+            power_law_sum += (
+                older
+                * (math.pow(t_n, 1 - decay_rate) - math.pow(t_k, 1 - decay_rate))
+                / ((1 - decay_rate) * (t_n - t_k))
+            )
+
+    bla = math.log(power_law_sum) if power_law_sum > 0 else default_activation
+    return max(bla, min_activation)
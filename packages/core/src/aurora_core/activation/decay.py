@@ -44,9 +44,14 @@ Reference:
 
 import math
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field, field_validator
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
 # Default decay rates by chunk type (ACT-R cognitive modeling)
 # Lower values = "stickier" memories (slower forgetting)
 # Higher values = more volatile (faster forgetting)
@@ -199,6 +204,42 @@ class DecayCalculator:
         # Clamp to minimum penalty
         return max(penalty, self.config.min_penalty)
 
+    def calculate_batch(
+        self,
+        last_access: "npt.NDArray[np.float64]",
+        current_time: datetime | None = None,
+    ) -> "npt.NDArray[np.float64]":
+        """Calculate decay penalties for many chunks in one vectorized pass.
+
+        Args:
+            last_access: Epoch seconds of each chunk's last access (NaN if never
+                accessed, which gets no penalty)
+            current_time: Current time for calculation (defaults to now)
+
+        Returns:
+            Decay penalty per chunk, equal to calculate() on each timestamp
+
+        """
+        import numpy as np
+
+        if current_time is None:
+            current_time = datetime.now(timezone.utc)
+        elif current_time.tzinfo is None:
+            current_time = current_time.replace(tzinfo=timezone.utc)
+
+        last_access = np.asarray(last_access, dtype=np.float64)
+        hours_since_access = (current_time.timestamp() - last_access) / 3600.0
+        days_since_access = np.clip(hours_since_access / 24.0, 1.0, self.config.max_days)
+
+        penalty = np.maximum(
+            -self.config.decay_factor * np.log10(days_since_access),
+            self.config.min_penalty,
+        )
+        # Grace period (and never-accessed chunks): no decay
+        within_grace = ~(hours_since_access > self.config.grace_period_hours)
+        penalty[within_grace] = 0.0
+        return penalty
+
     def calculate_from_hours(self, hours_since_access: float) -> float:
         """Calculate decay penalty from hours since access.
 
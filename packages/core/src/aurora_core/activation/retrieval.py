@@ -24,11 +24,18 @@ from typing import Any, Protocol
 from pydantic import BaseModel, Field
 
 from aurora_core.activation.base_level import AccessHistoryEntry
-from aurora_core.activation.engine import ActivationComponents, ActivationEngine
+from aurora_core.activation.engine import ActivationArrays, ActivationComponents, ActivationEngine
 from aurora_core.activation.spreading import RelationshipGraph
 from aurora_core.types import ChunkID
 
 
+def _epoch(timestamp: datetime) -> float:
+    """Convert a timestamp to epoch seconds, treating naive values as UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
 class ChunkData(Protocol):
     """Protocol for chunk data required for activation calculation.
 
@@ -163,6 +170,8 @@ class ActivationRetriever:
             - Rank is 1-indexed
 
         """
+        import numpy as np
+
         if threshold is None:
             threshold = self.config.threshold
         if max_results is None:
@@ -172,38 +181,25 @@ class ActivationRetriever:
         if spreading_scores is None:
             spreading_scores = {}
 
-        # Calculate activation for all candidates
-        results: list[RetrievalResult] = []
-
-        for chunk in candidates:
-            # Get spreading activation for this chunk
-            spreading = spreading_scores.get(chunk.id, 0.0)
-
-            # Calculate total activation
-            activation = self.engine.calculate_total(
-                access_history=chunk.access_history,
-                last_access=chunk.last_access,
-                spreading_activation=spreading,
-                query_keywords=query_keywords,
-                chunk_keywords=chunk.keywords,
-                current_time=current_time,
-            )
-
-            # Filter by threshold
-            if activation.total >= threshold:
-                result = RetrievalResult(
-                    chunk_id=chunk.id,
-                    activation=activation.total,
-                    components=activation if self.config.include_components else None,
-                )
-                results.append(result)
+        # Calculate activation for all candidates in one vectorized pass
+        activations = self._activation_arrays(
+            candidates, query_keywords, spreading_scores, current_time
+        )
 
-        # Sort by activation if enabled
+        # Filter by threshold, sort and limit before materializing results
+        selected = np.flatnonzero(activations.total >= threshold)
         if self.config.sort_by_activation:
-            results.sort(key=lambda r: r.activation, reverse=True)
-
-        # Limit to max_results
-        results = results[:max_results]
+            selected = selected[np.argsort(-activations.total[selected], kind="stable")]
+        selected = selected[:max_results]
+
+        results = [
+            RetrievalResult(
+                chunk_id=candidates[i].id,
+                activation=float(activations.total[i]),
+                components=activations.components(i) if self.config.include_components else None,
+            )
+            for i in selected.tolist()
+        ]
 
         # Assign ranks
         for i, result in enumerate(results, start=1):
@@ -322,23 +318,55 @@ class ActivationRetriever:
         if spreading_scores is None:
             spreading_scores = {}
 
-        activations = {}
+        activations = self._activation_arrays(
+            candidates, query_keywords, spreading_scores, current_time
+        )
 
-        for chunk in candidates:
-            spreading = spreading_scores.get(chunk.id, 0.0)
+        return {chunk.id: activations.components(i) for i, chunk in enumerate(candidates)}
 
-            activation = self.engine.calculate_total(
-                access_history=chunk.access_history,
-                last_access=chunk.last_access,
-                spreading_activation=spreading,
-                query_keywords=query_keywords,
-                chunk_keywords=chunk.keywords,
-                current_time=current_time,
-            )
+    def _activation_arrays(
+        self,
+        candidates: list[ChunkData],
+        query_keywords: set[str] | None,
+        spreading_scores: dict[ChunkID, float],
+        current_time: datetime,
+    ) -> ActivationArrays:
+        """Flatten candidate access data into arrays and score them in one pass.
 
-            activations[chunk.id] = activation
+        Args:
+            candidates: List of candidate chunks
+            query_keywords: Keywords from the query
+            spreading_scores: Pre-calculated spreading scores
+            current_time: Current time for calculations
+
+        Returns:
+            ActivationArrays aligned with candidates
 
-        return activations
+        """
+        import numpy as np
+
+        n = len(candidates)
+        access_offsets = np.zeros(n + 1, dtype=np.int64)
+        last_access = np.full(n, np.nan)
+        spreading = np.zeros(n)
+        access_times: list[float] = []
+
+        for i, chunk in enumerate(candidates):
+            access_times.extend(_epoch(entry.timestamp) for entry in chunk.access_history)
+            access_offsets[i + 1] = len(access_times)
+            if chunk.last_access is not None:
+                last_access[i] = _epoch(chunk.last_access)
+            spreading[i] = spreading_scores.get(chunk.id, 0.0)
+
+        return self.engine.calculate_total_batch(
+            access_times=np.asarray(access_times, dtype=np.float64),
+            access_offsets=access_offsets,
+            last_access=last_access,
+            spreading_activation=spreading,
+            query_keywords=query_keywords,
+            chunk_keywords=[chunk.keywords for chunk in candidates],
+            current_time=current_time,
+        )
 
     def explain_retrieval(
         self,
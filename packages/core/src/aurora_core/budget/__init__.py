@@ -1,5 +1,6 @@
 """Budget tracking and cost estimation for AURORA."""
 
+from aurora_core.budget.ledger import BudgetLedger
 from aurora_core.budget.tracker import BudgetExceededError, BudgetTracker, CostTracker
 
-__all__ = ["BudgetExceededError", "BudgetTracker", "CostTracker"]
+__all__ = ["BudgetExceededError", "BudgetLedger", "BudgetTracker", "CostTracker"]
@@ -0,0 +1,268 @@
+"""Append-only SQLite ledger backing CostTracker.
+
+The JSON tracker rewrote every entry of the month on each recorded cost and
+parsed all of them back at startup, so both grew with usage. The ledger keeps:
+
+- ``budget_period``: a single header row with the period, limit and a running
+  total (consumed USD and entry count), updated in the same transaction as
+  each append. Startup and budget checks read only this row.
+- ``cost_entries``: one row per recorded cost. Appends are O(1); covering
+  indexes on (period, operation) and (period, model) serve the breakdowns.
+
+All writes run in ``BEGIN IMMEDIATE`` transactions with a busy timeout, so
+concurrent ``aur`` processes serialize their appends instead of overwriting
+each other. ``PRAGMA data_version`` tells a tracker whether another process
+committed since it last read the header.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+# Seconds to wait for another process holding the write lock
+_BUSY_TIMEOUT = 10.0
+
+_ENTRY_COLUMNS = (
+    "timestamp",
+    "model",
+    "input_tokens",
+    "output_tokens",
+    "cost_usd",
+    "operation",
+    "query_id",
+)
+
+
+class BudgetLedger:
+    """Period header plus append-only cost entries in SQLite.
+
+    Entries are passed in and returned as plain dicts with the CostEntry
+    fields, so the ledger does not depend on the tracker's dataclasses.
+    """
+
+    def __init__(self, db_path: str | Path):
+        """Open (or create) the ledger database.
+
+        Args:
+            db_path: Path of the ledger database file
+
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=_BUSY_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._lock:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS budget_period (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    period TEXT NOT NULL,
+                    limit_usd REAL NOT NULL,
+                    consumed_usd REAL NOT NULL DEFAULT 0,
+                    entry_count INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TABLE IF NOT EXISTS cost_entries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    period TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    input_tokens INTEGER NOT NULL,
+                    output_tokens INTEGER NOT NULL,
+                    cost_usd REAL NOT NULL,
+                    operation TEXT NOT NULL,
+                    query_id TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_cost_entries_operation
+                    ON cost_entries(period, operation, cost_usd);
+                CREATE INDEX IF NOT EXISTS idx_cost_entries_model
+                    ON cost_entries(period, model, cost_usd);
+                """,
+            )
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction (serialized across processes)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def data_version(self) -> int:
+        """Return a counter that changes when another connection commits."""
+        with self._lock:
+            return int(self._conn.execute("PRAGMA data_version").fetchone()[0])
+
+    def header(self) -> dict[str, Any] | None:
+        """Return the period header, or None if the ledger is empty."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT period, limit_usd, consumed_usd, entry_count FROM budget_period",
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "period": row[0],
+            "limit_usd": row[1],
+            "consumed_usd": row[2],
+            "entry_count": row[3],
+        }
+
+    def import_period(
+        self,
+        period: str,
+        limit_usd: float,
+        consumed_usd: float,
+        entries: Iterable[dict[str, Any]],
+    ) -> bool:
+        """Seed an empty ledger with an existing period (e.g. a legacy JSON file).
+
+        Args:
+            period: Period identifier (YYYY-MM)
+            limit_usd: Budget limit for the period
+            consumed_usd: Consumed total of the period
+            entries: CostEntry fields of the period's entries
+
+        Returns:
+            True if imported, False if the ledger already had a period
+
+        """
+        rows = [(period, *(entry.get(col) for col in _ENTRY_COLUMNS)) for entry in entries]
+        with self.transaction() as conn:
+            if conn.execute("SELECT 1 FROM budget_period").fetchone() is not None:
+                return False
+            conn.executemany(
+                "INSERT INTO cost_entries (period, timestamp, model, input_tokens, "
+                "output_tokens, cost_usd, operation, query_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute(
+                "INSERT INTO budget_period (id, period, limit_usd, consumed_usd, entry_count) "
+                "VALUES (1, ?, ?, ?, ?)",
+                (period, limit_usd, consumed_usd, len(rows)),
+            )
+        return True
+
+    def rollover(self, period: str, limit_usd: float) -> dict[str, Any] | None:
+        """Make `period` the current period, closing the previous one atomically.
+
+        Concurrent processes crossing a month boundary roll over exactly once:
+        the header is re-checked inside the write transaction.
+
+        Args:
+            period: Current period identifier (YYYY-MM)
+            limit_usd: Limit for a newly started period
+
+        Returns:
+            The closed period (header fields plus "entries") if one was closed,
+            otherwise None
+
+        """
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT period, limit_usd, consumed_usd FROM budget_period",
+            ).fetchone()
+            if row is not None and row[0] == period:
+                return None
+
+            closed = None
+            if row is not None:
+                closed = {
+                    "period": row[0],
+                    "limit_usd": row[1],
+                    "consumed_usd": row[2],
+                    "entries": self._select_entries(row[0]),
+                }
+            conn.execute("DELETE FROM cost_entries")
+            conn.execute(
+                "INSERT OR REPLACE INTO budget_period "
+                "(id, period, limit_usd, consumed_usd, entry_count) VALUES (1, ?, ?, 0, 0)",
+                (period, limit_usd),
+            )
+        return closed
+
+    def append(self, period: str, entry: dict[str, Any], counted: bool = True) -> float:
+        """Append one entry and update the running total.
+
+        Args:
+            period: Period the entry belongs to
+            entry: CostEntry fields
+            counted: Whether cost_usd adds to the consumed total
+                (blocked and failed queries are logged but not charged)
+
+        Returns:
+            Consumed total after the append (includes other processes' appends)
+
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO cost_entries (period, timestamp, model, input_tokens, "
+                "output_tokens, cost_usd, operation, query_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (period, *(entry.get(col) for col in _ENTRY_COLUMNS)),
+            )
+            row = conn.execute(
+                "UPDATE budget_period SET consumed_usd = consumed_usd + ?, "
+                "entry_count = entry_count + 1 WHERE period = ? RETURNING consumed_usd",
+                (entry["cost_usd"] if counted else 0.0, period),
+            ).fetchone()
+        return float(row[0]) if row else 0.0
+
+    def set_limit(self, limit_usd: float) -> None:
+        """Update the budget limit of the current period."""
+        with self.transaction() as conn:
+            conn.execute("UPDATE budget_period SET limit_usd = ?", (limit_usd,))
+
+    def reset(self, period: str) -> None:
+        """Clear all entries and the consumed total of a period."""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM cost_entries WHERE period = ?", (period,))
+            conn.execute(
+                "UPDATE budget_period SET consumed_usd = 0, entry_count = 0 WHERE period = ?",
+                (period,),
+            )
+
+    def entries(self, period: str) -> list[dict[str, Any]]:
+        """Return all entries of a period in insertion order."""
+        with self._lock:
+            return self._select_entries(period)
+
+    def _select_entries(self, period: str) -> list[dict[str, Any]]:
+        rows = self._conn.execute(
+            f"SELECT {', '.join(_ENTRY_COLUMNS)} FROM cost_entries WHERE period = ? ORDER BY id",
+            (period,),
+        ).fetchall()
+        return [dict(zip(_ENTRY_COLUMNS, row, strict=True)) for row in rows]
+
+    def breakdown(self, period: str, column: str) -> dict[str, float]:
+        """Sum entry costs of a period grouped by "operation" or "model"."""
+        if column not in ("operation", "model"):
+            raise ValueError(f"Unsupported breakdown column: {column}")
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {column}, SUM(cost_usd) FROM cost_entries "
+                f"WHERE period = ? GROUP BY {column}",
+                (period,),
+            ).fetchall()
+        return {key: float(total) for key, total in rows}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["BudgetLedger"]
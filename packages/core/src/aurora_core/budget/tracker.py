@@ -1,11 +1,13 @@
 """Cost tracking and budget enforcement for AURORA LLM usage."""
 
 import json
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from aurora_core.budget.ledger import BudgetLedger
+
 
 class BudgetExceededError(Exception):
     """Raised when an operation would exceed the budget limit."""
@@ -116,7 +118,8 @@ class CostTracker:
     - Provider-specific pricing (Anthropic, OpenAI, Ollama)
     - Per-model cost calculation
     - Monthly budget tracking with soft/hard limits
-    - Persistent tracking in ~/.aurora/budget_tracker.json
+    - Persistent append-only ledger in ~/.aurora/budget_tracker.db (next to
+      tracker_path; a legacy budget_tracker.json is imported once)
 
     Example:
         >>> tracker = CostTracker(monthly_limit_usd=10.0)
@@ -162,51 +165,87 @@ class CostTracker:
             tracker_path = aurora_dir / "budget_tracker.json"
 
         self.tracker_path = tracker_path
+        self.ledger = BudgetLedger(tracker_path.with_suffix(".db"))
         self.current_period = self._get_current_period()
-        self.budget = self._load_or_create_budget()
+        self._entries_loaded = False
+        self._data_version = 0
+        self._budget = self._load_or_create_budget()
 
         # Sync instance variables with loaded budget
-        self.monthly_limit_usd = self.budget.limit_usd
-        self.total_budget = self.budget.limit_usd
+        self.monthly_limit_usd = self._budget.limit_usd
+        self.total_budget = self._budget.limit_usd
 
     def _get_current_period(self) -> str:
         """Get current period identifier (YYYY-MM)."""
         return datetime.now().strftime("%Y-%m")
 
+    @property
+    def budget(self) -> PeriodBudget:
+        """Budget of the current period.
+
+        Entries are read from the ledger on first access; budget checks and
+        status only need the running total kept in the ledger header.
+        """
+        if not self._entries_loaded:
+            self._budget.entries = [
+                CostEntry(**entry) for entry in self.ledger.entries(self._budget.period)
+            ]
+            self._entries_loaded = True
+        return self._budget
+
     def _load_or_create_budget(self) -> PeriodBudget:
         """Load existing budget or create new one for current period."""
-        if self.tracker_path.exists():
-            try:
-                with open(self.tracker_path) as f:
-                    data = json.load(f)
-
-                # Check if we need to roll over to new period
-                if data.get("period") != self.current_period:
-                    # New period - archive old data and start fresh
-                    self._archive_old_period(data)
-                    return PeriodBudget(
-                        period=self.current_period,
-                        limit_usd=self.monthly_limit_usd,
-                    )
-
-                # Same period - load existing data
-                entries = [CostEntry(**entry) for entry in data.get("entries", [])]
-                return PeriodBudget(
-                    period=data["period"],
-                    limit_usd=data.get("limit_usd", self.monthly_limit_usd),
-                    consumed_usd=data.get("consumed_usd", 0.0),
-                    entries=entries,
-                )
-            except (json.JSONDecodeError, KeyError, TypeError) as e:
-                # Corrupted file - start fresh
-                print(f"Warning: Could not load budget tracker ({e}), starting fresh")
-
-        # Create new budget
+        if self.ledger.header() is None and self.tracker_path.exists():
+            self._import_legacy_tracker()
+
+        # Roll over to the current period, archiving the previous one
+        closed = self.ledger.rollover(self.current_period, self.monthly_limit_usd)
+        if closed is not None:
+            self._archive_old_period(closed)
+
+        self._entries_loaded = False
+        return self._read_header()
+
+    def _read_header(self) -> PeriodBudget:
+        """Build the current PeriodBudget from the ledger header (no entries)."""
+        self._data_version = self.ledger.data_version()
+        header = self.ledger.header() or {}
         return PeriodBudget(
-            period=self.current_period,
-            limit_usd=self.monthly_limit_usd,
+            period=header.get("period", self.current_period),
+            limit_usd=header.get("limit_usd", self.monthly_limit_usd),
+            consumed_usd=header.get("consumed_usd", 0.0),
         )
 
+    def _sync(self) -> None:
+        """Pick up costs recorded by other processes since the last read."""
+        if self.ledger.data_version() != self._data_version:
+            self._budget = self._read_header()
+            self._entries_loaded = False
+
+    def _import_legacy_tracker(self) -> None:
+        """Import a JSON tracker file written by earlier versions into the ledger."""
+        try:
+            with open(self.tracker_path) as f:
+                data = json.load(f)
+            entries = [asdict(CostEntry(**entry)) for entry in data.get("entries", [])]
+            imported = self.ledger.import_period(
+                period=data["period"],
+                limit_usd=data.get("limit_usd", self.monthly_limit_usd),
+                consumed_usd=data.get("consumed_usd", 0.0),
+                entries=entries,
+            )
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            # Corrupted file - start fresh
+            print(f"Warning: Could not load budget tracker ({e}), starting fresh")
+            return
+
+        if imported:
+            try:
+                migrated_path = self.tracker_path.with_name(f"{self.tracker_path.name}.migrated")
+                self.tracker_path.rename(migrated_path)
+            except OSError as e:
+                print(f"Warning: Could not rename migrated budget tracker: {e}")
+
     def _archive_old_period(self, old_data: dict[str, Any]) -> None:
         """Archive old period data to archive file."""
         archive_dir = self.tracker_path.parent / "budget_archives"
@@ -221,31 +260,25 @@ class CostTracker:
         except Exception as e:
             print(f"Warning: Could not archive old budget data: {e}")
 
-    def _save_budget(self) -> None:
-        """Save current budget to disk."""
-        data = {
-            "period": self.budget.period,
-            "limit_usd": self.budget.limit_usd,
-            "consumed_usd": self.budget.consumed_usd,
-            "entries": [
-                {
-                    "timestamp": entry.timestamp,
-                    "model": entry.model,
-                    "input_tokens": entry.input_tokens,
-                    "output_tokens": entry.output_tokens,
-                    "cost_usd": entry.cost_usd,
-                    "operation": entry.operation,
-                    "query_id": entry.query_id,
-                }
-                for entry in self.budget.entries
-            ],
-        }
+    def _append_entry(self, entry: CostEntry, counted: bool = True) -> None:
+        """Append an entry to the ledger and refresh the running total.
+
+        Args:
+            entry: Entry to record
+            counted: Whether the entry's cost counts towards consumption
 
+        """
         try:
-            with open(self.tracker_path, "w") as f:
-                json.dump(data, f, indent=2)
+            consumed = self.ledger.append(self._budget.period, asdict(entry), counted=counted)
         except Exception as e:
             print(f"Warning: Could not save budget tracker: {e}")
+            if counted:
+                self._budget.consumed_usd += entry.cost_usd
+        else:
+            # Running total includes costs recorded by other processes
+            self._budget.consumed_usd = consumed
+        if self._entries_loaded:
+            self._budget.entries.append(entry)
 
     def get_model_pricing(self, model: str) -> ModelPricing:
         """Get pricing for a model.
@@ -325,16 +358,17 @@ class CostTracker:
 
         """
         # Check if we need to roll over to new period
-        if self.budget.period != self.current_period:
-            self.budget = self._load_or_create_budget()
+        if self._budget.period != self.current_period:
+            self._budget = self._load_or_create_budget()
+        self._sync()
 
-        projected_cost = self.budget.consumed_usd + estimated_cost
-        projected_percent = (projected_cost / self.budget.limit_usd) * 100.0
+        projected_cost = self._budget.consumed_usd + estimated_cost
+        projected_percent = (projected_cost / self._budget.limit_usd) * 100.0
 
         # Hard limit - block query
         if projected_percent >= 100.0:
             message = (
-                f"Budget exceeded: ${projected_cost:.4f} / ${self.budget.limit_usd:.2f} "
+                f"Budget exceeded: ${projected_cost:.4f} / ${self._budget.limit_usd:.2f} "
                 f"({projected_percent:.1f}%). Query blocked."
             )
 
@@ -348,8 +382,7 @@ class CostTracker:
                 operation="blocked_query",
                 query_id=None,
             )
-            self.budget.entries.append(entry)
-            self._save_budget()
+            self._append_entry(entry, counted=False)
 
             if raise_on_exceeded:
                 raise BudgetExceededError(message)
@@ -359,7 +392,7 @@ class CostTracker:
         if projected_percent >= 80.0:
             return (
                 True,
-                f"Budget warning: ${projected_cost:.4f} / ${self.budget.limit_usd:.2f} "
+                f"Budget warning: ${projected_cost:.4f} / ${self._budget.limit_usd:.2f} "
                 f"({projected_percent:.1f}%). Approaching limit.",
             )
 
@@ -399,9 +432,7 @@ class CostTracker:
             query_id=query_id,
         )
 
-        self.budget.entries.append(entry)
-        self.budget.consumed_usd += cost
-        self._save_budget()
+        self._append_entry(entry)
 
         return cost
 
@@ -412,15 +443,17 @@ class CostTracker:
             Dictionary with budget status information
 
         """
+        self._sync()
+        header = self.ledger.header() or {}
         return {
-            "period": self.budget.period,
-            "limit_usd": self.budget.limit_usd,
-            "consumed_usd": self.budget.consumed_usd,
-            "remaining_usd": self.budget.remaining_usd,
-            "percent_consumed": self.budget.percent_consumed,
-            "at_soft_limit": self.budget.is_at_soft_limit(),
-            "at_hard_limit": self.budget.is_at_hard_limit(),
-            "total_entries": len(self.budget.entries),
+            "period": self._budget.period,
+            "limit_usd": self._budget.limit_usd,
+            "consumed_usd": self._budget.consumed_usd,
+            "remaining_usd": self._budget.remaining_usd,
+            "percent_consumed": self._budget.percent_consumed,
+            "at_soft_limit": self._budget.is_at_soft_limit(),
+            "at_hard_limit": self._budget.is_at_hard_limit(),
+            "total_entries": header.get("entry_count", 0),
         }
 
     def get_breakdown_by_operation(self) -> dict[str, float]:
@@ -430,10 +463,7 @@ class CostTracker:
             Dictionary mapping operation names to total costs
 
         """
-        breakdown: dict[str, float] = {}
-        for entry in self.budget.entries:
-            breakdown[entry.operation] = breakdown.get(entry.operation, 0.0) + entry.cost_usd
-        return breakdown
+        return self.ledger.breakdown(self._budget.period, "operation")
 
     def get_breakdown_by_model(self) -> dict[str, float]:
         """Get cost breakdown by model.
@@ -442,10 +472,7 @@ class CostTracker:
             Dictionary mapping model names to total costs
 
         """
-        breakdown: dict[str, float] = {}
-        for entry in self.budget.entries:
-            breakdown[entry.model] = breakdown.get(entry.model, 0.0) + entry.cost_usd
-        return breakdown
+        return self.ledger.breakdown(self._budget.period, "model")
 
     # Compatibility methods for integration tests
 
@@ -456,16 +483,17 @@ class CostTracker:
             amount: New budget limit in USD
 
         """
-        self.budget.limit_usd = amount
+        self._budget.limit_usd = amount
         self.monthly_limit_usd = amount
         self.total_budget = amount
-        self._save_budget()
+        self.ledger.set_limit(amount)
 
     def reset_spending(self) -> None:
         """Reset spending to zero (clears all entries)."""
-        self.budget.consumed_usd = 0.0
-        self.budget.entries = []
-        self._save_budget()
+        self.ledger.reset(self._budget.period)
+        self._budget.consumed_usd = 0.0
+        self._budget.entries = []
+        self._entries_loaded = True
 
     def get_total_spent(self) -> float:
         """Get total amount spent in current period.
@@ -474,7 +502,8 @@ class CostTracker:
             Total spent in USD
 
         """
-        return self.budget.consumed_usd
+        self._sync()
+        return self._budget.consumed_usd
 
     def get_history(self) -> list[dict[str, Any]]:
         """Get query history with costs.
@@ -526,10 +555,7 @@ class CostTracker:
             query_id=None,
         )
 
-        self.budget.entries.append(entry)
-        if status == "success":
-            self.budget.consumed_usd += cost
-        self._save_budget()
+        self._append_entry(entry, counted=status == "success")
 
 
 class BudgetTracker(CostTracker):
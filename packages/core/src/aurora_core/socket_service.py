@@ -0,0 +1,293 @@
+"""Local request/response services over a Unix domain socket.
+
+Shared plumbing for AURORA's long-lived helper processes (the warm search
+daemon in ``aurora_cli.search_daemon`` and the LSP broker in
+``aurora_lsp.broker``): socket ownership, message framing, the serve loop
+with its idle timeout, and the matching client. Only the standard library is
+imported, so hooks can use a client without loading anything heavy.
+
+Protocol:
+    One JSON object per line in each direction, one request per connection::
+
+        {"op": "ping"}
+        {"ok": true, ...}
+
+    Failures are returned as ``{"ok": false, "error": "..."}``. When ``handle``
+    raised, the response also carries the exception's ``error_type`` (class
+    name) and ``message``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+PROBE_TIMEOUT = 0.5  # seconds, for checking whether a socket is live
+
+
+class SocketServiceError(Exception):
+    """Raised when a socket service is unreachable or a request fails."""
+
+
+class SocketServiceClient:
+    """Client for a ``SocketService``.
+
+    Each request opens a fresh connection, so one client can be shared freely
+    and a service restart never leaves it holding a dead socket. Subclasses
+    set ``service_name`` (used in error messages) and ``error_class``, and
+    may override ``_remote_error`` to raise failures reported by the service
+    differently from connection failures.
+
+    Attributes:
+        socket_path: Unix socket the service listens on
+        timeout: Per-request socket timeout in seconds
+        info: Result of the last ``ping``
+    """
+
+    service_name = "Socket service"
+    error_class: type[Exception] = SocketServiceError
+
+    def __init__(self, socket_path: str | Path, timeout: float) -> None:
+        """Initialize the client.
+
+        Args:
+            socket_path: Unix socket the service listens on
+            timeout: Per-request socket timeout in seconds
+        """
+        self.socket_path = Path(socket_path)
+        self.timeout = timeout
+        self.info: dict[str, Any] = {}
+
+    def request(self, op: str, **params: Any) -> dict[str, Any]:
+        """Send one request and return the decoded response.
+
+        Args:
+            op: Operation name
+            **params: Operation parameters (JSON-serializable; others become strings)
+
+        Returns:
+            Response object (``ok`` is always True)
+
+        Raises:
+            error_class: If the service is unreachable or times out, or (unless
+                ``_remote_error`` is overridden) if the service reports a failure
+        """
+        payload = json.dumps({"op": op, **params}, default=str).encode("utf-8") + b"\n"
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(str(self.socket_path))
+                sock.sendall(payload)
+                with sock.makefile("rb") as reader:
+                    line = reader.readline(MAX_MESSAGE_BYTES)
+        except OSError as e:
+            raise self.error_class(f"{self.service_name} unreachable: {e}") from e
+
+        if not line:
+            raise self.error_class(f"{self.service_name} closed the connection")
+        try:
+            response: dict[str, Any] = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise self.error_class(f"Invalid response from {self.service_name}: {e}") from e
+        if not response.get("ok"):
+            raise self._remote_error(response)
+        return response
+
+    def _remote_error(self, response: dict[str, Any]) -> Exception:
+        """Build the exception for a failure response from the service."""
+        return self.error_class(response.get("error", f"{self.service_name} request failed"))
+
+    def ping(self) -> dict[str, Any]:
+        """Return service status and refresh ``info``."""
+        self.info = self.request("ping")
+        return self.info
+
+    def shutdown(self) -> None:
+        """Ask the service to exit after answering this request."""
+        self.request("shutdown")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers one JSON request per connection."""
+
+    server: _ServiceServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline(MAX_MESSAGE_BYTES)
+        if not line:
+            return
+        service = self.server.service
+        with service._in_flight():
+            try:
+                response = service.handle(json.loads(line))
+            except Exception as e:
+                logger.warning(f"{service.service_name} request failed: {e}")
+                response = {
+                    "ok": False,
+                    "error": f"{type(e).__name__}: {e}",
+                    "error_type": type(e).__name__,
+                    "message": str(e),
+                }
+        self.wfile.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+
+
+class _ServiceServer(socketserver.UnixStreamServer):
+    """Serves one connection at a time on the serve loop's thread."""
+
+    def __init__(self, socket_path: str, service: SocketService) -> None:
+        self.service = service
+        super().__init__(socket_path, _RequestHandler)
+
+    def verify_request(self, request: Any, client_address: Any) -> bool:
+        # Runs on the serve loop's thread, so the idle check sees every connection
+        self.service._requests += 1
+        return True
+
+
+class _ThreadingServiceServer(socketserver.ThreadingMixIn, _ServiceServer):
+    """Serves each connection on its own thread."""
+
+    daemon_threads = True
+    block_on_close = False
+
+
+class SocketService:
+    """Base class for a long-lived process answering requests on a Unix socket.
+
+    Subclasses implement ``handle`` and usually extend ``start`` (call
+    ``_claim_socket``, load state, then ``_bind``) and ``close``. Connections
+    are served one at a time unless ``threaded`` is set, in which case
+    ``handle`` runs on a thread per connection and must be thread-safe.
+
+    Attributes:
+        socket_path: Unix socket the service listens on
+        idle_timeout: Exit after this many idle seconds (None = never)
+    """
+
+    service_name = "Socket service"
+    error_class: type[Exception] = SocketServiceError
+    client_class: type[SocketServiceClient] = SocketServiceClient
+    threaded = False
+
+    def __init__(self, socket_path: str | Path, idle_timeout: float | None = None) -> None:
+        """Initialize the service (the socket is not bound until ``start``).
+
+        Args:
+            socket_path: Unix socket to listen on
+            idle_timeout: Exit after this many idle seconds (None = never)
+        """
+        self.socket_path = Path(socket_path)
+        self.idle_timeout = idle_timeout
+        self._server: _ServiceServer | None = None
+        self._stop = False
+        self._started_at = 0.0
+        self._requests = 0
+        self._active = 0
+        self._active_lock = threading.Lock()
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Dispatch one decoded request.
+
+        Args:
+            request: Request object with an ``op`` field
+
+        Returns:
+            Response object
+        """
+        raise NotImplementedError
+
+    def start(self) -> None:
+        """Bind the socket.
+
+        Raises:
+            error_class: If another instance is already serving this socket
+        """
+        self._claim_socket()
+        self._bind()
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Serve requests until shutdown, idle timeout or interrupt."""
+        if self._server is None:
+            self.start()
+        assert self._server is not None
+
+        self._server.timeout = poll_interval
+        last_request = time.monotonic()
+        try:
+            while not self._stop:
+                handled = self._requests
+                self._server.handle_request()
+                if self._requests != handled or self._active:
+                    last_request = time.monotonic()
+                elif self.idle_timeout and time.monotonic() - last_request > self.idle_timeout:
+                    logger.info(f"{self.service_name} idle for {self.idle_timeout:.0f}s, exiting")
+                    break
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the socket and remove the socket file."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+
+    def stop(self) -> None:
+        """Make the serve loop exit after the current request."""
+        self._stop = True
+
+    def _bind(self) -> None:
+        """Start listening on the socket path (owner-only permissions)."""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        server_class = _ThreadingServiceServer if self.threaded else _ServiceServer
+        self._server = server_class(str(self.socket_path), self)
+        os.chmod(self.socket_path, 0o600)
+        self._started_at = time.time()
+
+    def _claim_socket(self) -> None:
+        """Remove a stale socket file, refusing if a live service owns it."""
+        if not self.socket_path.exists():
+            return
+        try:
+            self.client_class(self.socket_path, timeout=PROBE_TIMEOUT).ping()
+        except self.error_class:
+            self.socket_path.unlink(missing_ok=True)
+            return
+        raise self.error_class(f"{self.service_name} already running on {self.socket_path}")
+
+    @contextmanager
+    def _in_flight(self) -> Iterator[None]:
+        """Track a request being handled, so the idle timeout does not fire."""
+        with self._active_lock:
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._active_lock:
+                self._active -= 1
+
+    def _uptime(self) -> float:
+        return time.time() - self._started_at if self._started_at else 0.0
+
+
+__all__ = [
+    "MAX_MESSAGE_BYTES",
+    "PROBE_TIMEOUT",
+    "SocketService",
+    "SocketServiceClient",
+    "SocketServiceError",
+]
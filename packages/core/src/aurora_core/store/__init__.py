@@ -5,7 +5,12 @@ Provides abstract Store interface and concrete implementations.
 
 from aurora_core.store.base import Store
 from aurora_core.store.memory import MemoryStore
-from aurora_core.store.migrations import Migration, MigrationManager, get_migration_manager
+from aurora_core.store.migrations import (
+    Migration,
+    MigrationManager,
+    get_migration_manager,
+    migrate_embedding_format,
+)
 from aurora_core.store.schema import SCHEMA_VERSION, get_init_statements
 from aurora_core.store.sqlite import SQLiteStore
 
@@ -18,4 +23,5 @@ __all__ = [
     "Migration",
     "MigrationManager",
     "get_migration_manager",
+    "migrate_embedding_format",
 ]
@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING, Any, Optional
 if TYPE_CHECKING:
     from aurora_core.chunks.base import Chunk
 
+from aurora_core.exceptions import ChunkNotFoundError
 from aurora_core.types import ChunkID
 
 
@@ -46,6 +47,36 @@ class Store(ABC):
 
         """
 
+    def save_chunks_bulk(
+        self,
+        chunks: list["Chunk"],
+        initial_activations: dict[ChunkID, tuple[float, int]] | None = None,
+    ) -> int:
+        """Save a batch of chunks.
+
+        Args:
+            chunks: The chunks to save. Each must have a valid ID and pass validation.
+            initial_activations: Optional mapping of chunk_id to
+                (base_level, access_count) used to seed activation records.
+
+        Returns:
+            Number of chunks saved
+
+        Note:
+            - Default implementation saves chunks one at a time and ignores
+              initial_activations; backends that track activation records
+              should override to apply them (and to batch the writes)
+
+        Raises:
+            StorageError: If storage operation fails
+            ValidationError: If a chunk fails validation
+
+        """
+        # Default implementation - subclasses should override for efficiency
+        for chunk in chunks:
+            self.save_chunk(chunk)
+        return len(chunks)
+
     @abstractmethod
     def get_chunk(self, chunk_id: ChunkID) -> Optional["Chunk"]:
         """Retrieve a chunk by its ID.
@@ -125,6 +156,68 @@ class Store(ABC):
 
         """
 
+    def add_relationships_bulk(
+        self,
+        relationships: list[tuple[ChunkID, ChunkID, str, float]],
+    ) -> int:
+        """Add a batch of relationships.
+
+        Args:
+            relationships: (from_id, to_id, rel_type, weight) tuples
+
+        Returns:
+            Number of relationships added
+
+        Note:
+            - Relationships whose endpoints do not exist are skipped, so edges
+              extracted at parse time can be written without pre-checks
+            - Default implementation adds relationships one at a time;
+              subclasses should override to batch the writes (and to skip
+              duplicates)
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        # Default implementation - subclasses should override for efficiency
+        added = 0
+        for from_id, to_id, rel_type, weight in relationships:
+            try:
+                self.add_relationship(from_id, to_id, rel_type, weight)
+                added += 1
+            except ChunkNotFoundError:
+                pass
+        return added
+
+    def get_relationships(
+        self,
+        chunk_ids: list[ChunkID],
+        max_hops: int = 1,
+        limit: int = 1000,
+    ) -> list[tuple[ChunkID, ChunkID, str, float]]:
+        """Get the relationship edges around a set of chunks.
+
+        Follows edges in both directions, so the result is the subgraph that
+        spreading activation from chunk_ids can reach within max_hops.
+
+        Args:
+            chunk_ids: Chunk IDs to start from
+            max_hops: Number of hops to expand (default: 1)
+            limit: Maximum number of edges to return (default: 1000)
+
+        Returns:
+            List of (from_id, to_id, rel_type, weight) tuples
+
+        Note:
+            - Default implementation returns no edges; backends that persist
+              relationships should override
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        return []
+
     @abstractmethod
     def get_related_chunks(self, chunk_id: ChunkID, max_depth: int = 2) -> list["Chunk"]:
         """Get related chunks via relationships (for spreading activation).
@@ -168,6 +261,38 @@ class Store(ABC):
 
         """
 
+    def record_access_batch(
+        self,
+        accesses: list[tuple[ChunkID, datetime, str | None]],
+    ) -> int:
+        """Record several chunk accesses.
+
+        Args:
+            accesses: (chunk_id, access_time, context) tuples
+
+        Returns:
+            Number of accesses recorded
+
+        Note:
+            - Accesses to chunks that no longer exist are skipped, so queued
+              accesses can be written after a re-index removed their chunk
+            - Default implementation records accesses one at a time;
+              subclasses should override to write them in one transaction
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        # Default implementation - subclasses should override for efficiency
+        recorded = 0
+        for chunk_id, access_time, context in accesses:
+            try:
+                self.record_access(chunk_id, access_time, context)
+                recorded += 1
+            except ChunkNotFoundError:
+                pass
+        return recorded
+
     @abstractmethod
     def get_access_history(
         self,
@@ -94,6 +94,38 @@ class MemoryStore(Store):
 
         return True
 
+    def save_chunks_bulk(
+        self,
+        chunks: list["Chunk"],
+        initial_activations: dict[ChunkID, tuple[float, int]] | None = None,
+    ) -> int:
+        """Save a batch of chunks to memory.
+
+        Args:
+            chunks: The chunks to save
+            initial_activations: Optional mapping of chunk_id to
+                (base_level, access_count) to set on the activation records
+
+        Returns:
+            Number of chunks saved
+
+        Raises:
+            StorageError: If store is closed
+            ValidationError: If chunk validation fails
+
+        """
+        self._check_closed()
+
+        for chunk in chunks:
+            self.save_chunk(chunk)
+
+        for chunk_id, (base_level, access_count) in (initial_activations or {}).items():
+            if chunk_id in self._activations:
+                self._activations[chunk_id]["base_level"] = base_level
+                self._activations[chunk_id]["access_count"] = access_count
+
+        return len(chunks)
+
     def get_chunk(self, chunk_id: ChunkID) -> Optional["Chunk"]:
         """Retrieve a chunk by ID.
 
@@ -257,6 +289,61 @@ class MemoryStore(Store):
         # Return chunks for all visited IDs
         return [self._chunks[cid] for cid in visited if cid in self._chunks]
 
+    def get_relationships(
+        self,
+        chunk_ids: list[ChunkID],
+        max_hops: int = 1,
+        limit: int = 1000,
+    ) -> list[tuple[ChunkID, ChunkID, str, float]]:
+        """Get the relationship edges around a set of chunks (both directions).
+
+        Args:
+            chunk_ids: Chunk IDs to start from
+            max_hops: Number of hops to expand
+            limit: Maximum number of edges to return
+
+        Returns:
+            List of (from_id, to_id, rel_type, weight) tuples
+
+        Raises:
+            StorageError: If store is closed
+
+        """
+        self._check_closed()
+
+        edges: list[tuple[ChunkID, ChunkID, str, float]] = []
+        seen_edges: set[int] = set()
+        visited = {str(chunk_id) for chunk_id in chunk_ids}
+        frontier = set(visited)
+
+        for _ in range(max_hops):
+            next_frontier: set[str] = set()
+            for index, rel in enumerate(self._relationships):
+                if index in seen_edges:
+                    continue
+                if rel["from_chunk"] not in frontier and rel["to_chunk"] not in frontier:
+                    continue
+                seen_edges.add(index)
+                edges.append(
+                    (
+                        rel["from_chunk"],
+                        rel["to_chunk"],
+                        rel["relationship_type"],
+                        rel["weight"],
+                    ),
+                )
+                if len(edges) >= limit:
+                    return edges
+                for endpoint in (rel["from_chunk"], rel["to_chunk"]):
+                    if endpoint not in visited:
+                        visited.add(endpoint)
+                        next_frontier.add(endpoint)
+            frontier = next_frontier
+            if not frontier:
+                break
+
+        return edges
+
     def record_access(
         self,
         chunk_id: ChunkID,
@@ -9,6 +9,12 @@ from collections.abc import Callable
 from pathlib import Path
 
 from aurora_core.exceptions import StorageError
+from aurora_core.store.quantization import (
+    check_embedding_format,
+    decode_embedding,
+    encode_embedding,
+    stored_format,
+)
 from aurora_core.store.schema import SCHEMA_VERSION
 
 
@@ -286,6 +292,90 @@ class MigrationManager:
             raise StorageError(f"Failed to backup database: {db_path}", details=str(e))
 
 
+def migrate_embedding_format(
+    conn: sqlite3.Connection,
+    embedding_format: str,
+    batch_size: int = 500,
+) -> int:
+    """Re-encode stored chunk embeddings into another storage format.
+
+    Embedding blobs are self-describing, so this is a data migration rather
+    than a schema version bump: rows already in the target format are left
+    alone and the migration can be interrupted and re-run. Converting to
+    ``float32`` widens quantized blobs but cannot restore the lost precision.
+
+    Vector index list assignments are kept; the update trigger would
+    otherwise queue every re-encoded chunk for re-assignment.
+
+    Args:
+        conn: SQLite database connection
+        embedding_format: Target format ("float32", "float16" or "int8")
+        batch_size: Rows re-encoded per transaction
+
+    Returns:
+        Number of embeddings re-encoded
+
+    Raises:
+        ValueError: If the format is unknown
+        StorageError: If the migration fails
+
+    """
+    check_embedding_format(embedding_format)
+    has_vector_index = (
+        conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'vector_index'",
+        ).fetchone()
+        is not None
+    )
+
+    converted = 0
+    last_id = ""
+    try:
+        while True:
+            rows = conn.execute(
+                """
+                SELECT id, embeddings FROM chunks
+                WHERE embeddings IS NOT NULL AND id > ?
+                ORDER BY id LIMIT ?
+                """,
+                (last_id, batch_size),
+            ).fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            updates = [
+                (encode_embedding(decode_embedding(blob), embedding_format), chunk_id)
+                for chunk_id, blob in rows
+                if stored_format(blob) != embedding_format
+            ]
+            if not updates:
+                continue
+
+            ids = [chunk_id for _, chunk_id in updates]
+            placeholders = ",".join("?" * len(ids))
+            lists = (
+                conn.execute(
+                    f"""SELECT list_id, chunk_id FROM vector_index
+                        WHERE list_id >= 0 AND chunk_id IN ({placeholders})""",
+                    ids,
+                ).fetchall()
+                if has_vector_index
+                else []
+            )
+            conn.executemany("UPDATE chunks SET embeddings = ? WHERE id = ?", updates)
+            conn.executemany("UPDATE vector_index SET list_id = ? WHERE chunk_id = ?", lists)
+            conn.commit()
+            converted += len(updates)
+    except sqlite3.Error as e:
+        conn.rollback()
+        raise StorageError(
+            f"Failed to migrate embeddings to {embedding_format}",
+            details=str(e),
+        )
+    return converted
+
+
 # Global migration manager instance
 _migration_manager = MigrationManager()
 
@@ -304,4 +394,5 @@ __all__ = [
     "Migration",
     "MigrationManager",
     "get_migration_manager",
+    "migrate_embedding_format",
 ]
@@ -0,0 +1,190 @@
+"""Embedding storage formats for the ``chunks.embeddings`` column.
+
+Embeddings are stored in one of three formats:
+
+- ``float32``: raw ``tobytes()`` of the vector, untagged (the original format)
+- ``float16``: 4-byte tag followed by half-precision values (half the size)
+- ``int8``: 4-byte tag, a float32 scale, then one signed byte per value
+  (about a quarter of the size; symmetric per-vector scale ``max|x| / 127``)
+
+The tag is the format code, a version byte and ``C0 7F``. Read as float32 it
+is a NaN, which real embeddings never contain, so every blob is
+self-describing and untagged blobs are always float32. Scores are computed
+in float32 against dequantized vectors with an unquantized query.
+
+Usage:
+    >>> blob = encode_embedding(vector, "int8")
+    >>> vector = decode_embedding(blob)
+    >>> matrix, mask = decode_embedding_matrix(blobs, dim=384)
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+EMBEDDING_FORMATS = ("float32", "float16", "int8")
+
+_FORMAT_CODES = {"float16": 1, "int8": 2}
+_TAG_VERSION = 1
+_TAG_SUFFIX = b"\xc0\x7f"
+_TAGS = {
+    name: bytes((code, _TAG_VERSION)) + _TAG_SUFFIX for name, code in _FORMAT_CODES.items()
+}
+_TAG_FORMATS = {tag: name for name, tag in _TAGS.items()}
+_TAG_SIZE = 4
+
+
+def check_embedding_format(embedding_format: str) -> str:
+    """Validate an embedding format name.
+
+    Raises:
+        ValueError: If the format is not one of EMBEDDING_FORMATS
+
+    """
+    if embedding_format not in EMBEDDING_FORMATS:
+        raise ValueError(
+            f"Unknown embedding format '{embedding_format}', "
+            f"expected one of {', '.join(EMBEDDING_FORMATS)}",
+        )
+    return embedding_format
+
+
+def stored_format(blob: bytes) -> str:
+    """Return the storage format of an embedding blob."""
+    return _TAG_FORMATS.get(bytes(blob[:_TAG_SIZE]), "float32")
+
+
+def self_describing(blob: bytes) -> bool:
+    """Return True if the blob carries a format tag (i.e. is quantized)."""
+    return bytes(blob[:_TAG_SIZE]) in _TAG_FORMATS
+
+
+def _row_dtype(embedding_format: str, dim: int) -> np.dtype:
+    """Structured dtype of one tagged row, so a batch decodes with one frombuffer."""
+    if embedding_format == "float16":
+        return np.dtype([("tag", "V4"), ("values", "<f2", (dim,))])
+    return np.dtype([("tag", "V4"), ("scale", "<f4"), ("values", "i1", (dim,))])
+
+
+def encoded_size(embedding_format: str, dim: int) -> int:
+    """Return the blob size in bytes of a ``dim``-dimensional embedding."""
+    if embedding_format == "float32":
+        return 4 * dim
+    return _row_dtype(embedding_format, dim).itemsize
+
+
+def encode_embedding(vector: Any, embedding_format: str = "float32") -> bytes:
+    """Encode an embedding for storage.
+
+    Blobs that are already tagged are returned unchanged (they are never
+    re-quantized or widened), as are untagged float32 bytes when the target
+    is ``float32``.
+
+    Args:
+        vector: Float vector (array-like) or stored embedding bytes
+        embedding_format: Target format, one of EMBEDDING_FORMATS
+
+    Returns:
+        Embedding bytes in the target format
+
+    """
+    check_embedding_format(embedding_format)
+    if isinstance(vector, (bytes, bytearray, memoryview)):
+        blob = bytes(vector)
+        if embedding_format == "float32" or self_describing(blob):
+            return blob
+        values = np.frombuffer(blob, dtype=np.float32)
+    else:
+        values = np.asarray(vector, dtype=np.float32).ravel()
+        if embedding_format == "float32":
+            return values.tobytes()
+
+    row = np.zeros(1, dtype=_row_dtype(embedding_format, values.shape[0]))
+    row["tag"] = np.frombuffer(_TAGS[embedding_format], dtype="V4")
+    if embedding_format == "float16":
+        row["values"][0] = values.astype(np.float16)
+    else:
+        peak = float(np.max(np.abs(values))) if values.size else 0.0
+        scale = peak / 127.0 if peak > 0.0 else 1.0
+        row["scale"] = scale
+        row["values"][0] = np.clip(np.rint(values / scale), -127, 127).astype(np.int8)
+    return row.tobytes()
+
+
+def decode_embedding(blob: bytes) -> npt.NDArray[np.float32]:
+    """Decode one stored embedding into a float32 vector."""
+    fmt = stored_format(blob)
+    if fmt == "float32":
+        return np.frombuffer(blob, dtype=np.float32)
+    itemsize = np.dtype("<f2" if fmt == "float16" else "i1").itemsize
+    dim = (len(blob) - encoded_size(fmt, 0)) // itemsize
+    matrix, _ = decode_embedding_matrix([blob], dim)
+    vector: npt.NDArray[np.float32] = matrix[0]
+    return vector
+
+
+def decode_embedding_matrix(
+    blobs: Sequence[bytes | None],
+    dim: int,
+) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.bool_]]:
+    """Decode a batch of stored embeddings into one float32 matrix.
+
+    Blobs are grouped by format and each group is joined and decoded with a
+    single ``frombuffer`` (int8 groups are dequantized with one broadcast
+    multiply). Missing blobs, and blobs whose dimension differs from ``dim``,
+    are flagged in the mask and left out of the matrix.
+
+    Args:
+        blobs: Stored embedding bytes (None for chunks without an embedding)
+        dim: Expected embedding dimension
+
+    Returns:
+        Tuple of ((mask.sum(), dim) float32 matrix in input order, mask of
+        blobs that were decoded). When every blob is untagged float32 the
+        matrix is a read-only view of the joined bytes.
+
+    """
+    sizes = {fmt: encoded_size(fmt, dim) for fmt in EMBEDDING_FORMATS}
+    groups: dict[str, list[int]] = {fmt: [] for fmt in EMBEDDING_FORMATS}
+    mask = np.zeros(len(blobs), dtype=bool)
+    for i, blob in enumerate(blobs):
+        if blob is None:
+            continue
+        fmt = stored_format(blob)
+        if len(blob) == sizes[fmt]:
+            groups[fmt].append(i)
+            mask[i] = True
+
+    total = int(mask.sum())
+    matrix = np.empty((total, dim), dtype=np.float32)
+    rows = np.cumsum(mask) - 1
+    for fmt, indices in groups.items():
+        if not indices:
+            continue
+        joined = b"".join(blobs[i] for i in indices)  # type: ignore[misc]
+        if fmt == "float32":
+            values = np.frombuffer(joined, dtype=np.float32).reshape(-1, dim)
+        else:
+            records = np.frombuffer(joined, dtype=_row_dtype(fmt, dim))
+            values = records["values"].astype(np.float32)
+            if fmt == "int8":
+                values *= records["scale"][:, None]
+        if len(indices) == total:
+            # Single format (the common case): no scatter copy needed
+            return values, mask
+        matrix[rows[indices]] = values
+    return matrix, mask
+
+
+__all__ = [
+    "EMBEDDING_FORMATS",
+    "check_embedding_format",
+    "decode_embedding",
+    "decode_embedding_matrix",
+    "encode_embedding",
+    "encoded_size",
+    "self_describing",
+    "stored_format",
+]
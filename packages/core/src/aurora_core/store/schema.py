@@ -6,7 +6,7 @@ storage implementations.
 """
 
 # Schema version for migration tracking
-SCHEMA_VERSION = 6  # FTS5 full-text search for keyword retrieval
+SCHEMA_VERSION = 10  # Code-aware sub-token column in the FTS5 index
 
 # SQL statements for creating tables and indexes
 CREATE_CHUNKS_TABLE = """
@@ -15,7 +15,7 @@ CREATE TABLE IF NOT EXISTS chunks (
     type TEXT NOT NULL,               -- "code" | "reasoning" | "knowledge"
     content JSON NOT NULL,            -- Chunk-specific JSON structure
     metadata JSON,                    -- Optional metadata
-    embeddings BLOB,                  -- Embedding vector as serialized numpy array (for semantic retrieval)
+    embeddings BLOB,                  -- Embedding vector: float32 bytes or tagged float16/int8
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     first_access TIMESTAMP,           -- First time chunk was accessed
@@ -37,7 +37,9 @@ CREATE TABLE IF NOT EXISTS activations (
     base_level REAL NOT NULL,         -- Base-level activation (BLA)
     last_access TIMESTAMP NOT NULL,   -- Most recent access timestamp
     access_count INTEGER DEFAULT 1,   -- Total number of accesses
-    access_history JSON,              -- Full access history as JSON array
+    recent_accesses JSON,             -- Epoch seconds of the last few recorded accesses
+    history_count INTEGER DEFAULT 0,  -- Recorded accesses (excludes seeded counts)
+    first_access_at REAL,             -- Epoch seconds of the first recorded access
     FOREIGN KEY (chunk_id) REFERENCES chunks(id) ON DELETE CASCADE
 );
 """
@@ -50,6 +52,22 @@ CREATE_ACTIVATIONS_LAST_ACCESS_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_activations_last_access ON activations(last_access DESC);
 """
 
+# One row per recorded access, never rewritten. record_access() appends here
+# and keeps only a bounded summary (recent_accesses, history_count,
+# first_access_at) on the activations row, so each access writes O(1) bytes.
+CREATE_ACCESS_LOG_TABLE = """
+CREATE TABLE IF NOT EXISTS access_log (
+    chunk_id TEXT NOT NULL,           -- FK to chunks.id
+    accessed_at REAL NOT NULL,        -- Epoch seconds (UTC)
+    context TEXT,                     -- Optional context (e.g., query)
+    FOREIGN KEY (chunk_id) REFERENCES chunks(id) ON DELETE CASCADE
+);
+"""
+
+CREATE_ACCESS_LOG_CHUNK_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_access_log_chunk ON access_log(chunk_id, accessed_at DESC);
+"""
+
 CREATE_RELATIONSHIPS_TABLE = """
 CREATE TABLE IF NOT EXISTS relationships (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -110,7 +128,15 @@ CREATE_DOC_HIERARCHY_TYPE_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_doc_type ON doc_hierarchy(document_type);
 """
 
+# Partial expression index for finding a document's chunks by source file
+CREATE_DOC_CHUNKS_FILE_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_chunks_doc_file
+ON chunks(json_extract(content, '$.file_path')) WHERE type = 'doc';
+"""
+
 # FTS5 full-text search index for keyword retrieval (v6+)
+# subtokens (v10+) holds the lowercased parts of camelCase/acronym identifiers
+# ("getUserData" -> "get user data"), which unicode61 would keep as one token.
 CREATE_CHUNKS_FTS_TABLE = """
 CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
     chunk_id UNINDEXED,
@@ -118,10 +144,89 @@ CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
     name,
     body,
     file_path,
+    subtokens,
     tokenize='porter unicode61'
 );
 """
 
+# IVF (inverted file) vector index for approximate nearest-neighbour recall (v7+)
+# Every chunk with an embedding gets a row; list_id -1 marks vectors that have
+# not been assigned to a centroid yet. Rows are removed by ON DELETE CASCADE and
+# (re)queued by the triggers below, so save_chunk() and file deletion keep the
+# index in sync without any Python-side bookkeeping.
+CREATE_VECTOR_INDEX_TABLE = """
+CREATE TABLE IF NOT EXISTS vector_index (
+    chunk_id TEXT PRIMARY KEY,            -- FK to chunks.id
+    list_id INTEGER NOT NULL DEFAULT -1,  -- IVF list (centroid) id, -1 = unassigned
+    FOREIGN KEY (chunk_id) REFERENCES chunks(id) ON DELETE CASCADE
+);
+"""
+
+CREATE_VECTOR_INDEX_LIST_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_vector_index_list ON vector_index(list_id);
+"""
+
+CREATE_VECTOR_CENTROIDS_TABLE = """
+CREATE TABLE IF NOT EXISTS vector_centroids (
+    list_id INTEGER PRIMARY KEY,      -- IVF list id
+    centroid BLOB NOT NULL,           -- Unit-norm float32 centroid vector
+    trained_at TIMESTAMP NOT NULL     -- When the centroid set was trained
+);
+"""
+
+CREATE_VECTOR_INDEX_INSERT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS trg_chunks_vector_insert
+AFTER INSERT ON chunks
+WHEN NEW.embeddings IS NOT NULL
+BEGIN
+    INSERT OR REPLACE INTO vector_index (chunk_id, list_id) VALUES (NEW.id, -1);
+END;
+"""
+
+CREATE_VECTOR_INDEX_UPDATE_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS trg_chunks_vector_update
+AFTER UPDATE OF embeddings ON chunks
+BEGIN
+    DELETE FROM vector_index WHERE chunk_id = NEW.id AND NEW.embeddings IS NULL;
+    INSERT OR REPLACE INTO vector_index (chunk_id, list_id)
+    SELECT NEW.id, -1 WHERE NEW.embeddings IS NOT NULL;
+END;
+"""
+
+# Symbol table for resolving cross-file relationship edges (v8+)
+# One "def" row per named code chunk and one "ref" row per imported name it
+# uses ("import:<name>" dependencies). Maintained by the triggers below and
+# removed by ON DELETE CASCADE, so re-saving a file's chunks refreshes its
+# symbols; the (name, kind) index resolves references to definitions.
+CREATE_CHUNK_SYMBOLS_TABLE = """
+CREATE TABLE IF NOT EXISTS chunk_symbols (
+    chunk_id TEXT NOT NULL,           -- FK to chunks.id
+    kind TEXT NOT NULL,               -- "def" | "ref"
+    name TEXT NOT NULL,               -- Defined or referenced symbol name
+    PRIMARY KEY (chunk_id, kind, name),
+    FOREIGN KEY (chunk_id) REFERENCES chunks(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+"""
+
+CREATE_CHUNK_SYMBOLS_NAME_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_chunk_symbols_name ON chunk_symbols(name, kind);
+"""
+
+CREATE_CHUNK_SYMBOLS_INSERT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS trg_chunks_symbols_insert
+AFTER INSERT ON chunks
+WHEN NEW.type = 'code'
+BEGIN
+    INSERT OR IGNORE INTO chunk_symbols (chunk_id, kind, name)
+    SELECT NEW.id, 'def', json_extract(NEW.content, '$.function')
+    WHERE json_extract(NEW.content, '$.function') IS NOT NULL;
+    INSERT OR IGNORE INTO chunk_symbols (chunk_id, kind, name)
+    SELECT NEW.id, 'ref', substr(value, 8)
+    FROM json_each(NEW.content, '$.dependencies')
+    WHERE value LIKE 'import:%';
+END;
+"""
+
 # Schema version tracking table
 CREATE_SCHEMA_VERSION_TABLE = """
 CREATE TABLE IF NOT EXISTS schema_version (
@@ -138,6 +243,8 @@ INIT_SCHEMA = [
     CREATE_ACTIVATIONS_TABLE,
     CREATE_ACTIVATIONS_BASE_INDEX,
     CREATE_ACTIVATIONS_LAST_ACCESS_INDEX,
+    CREATE_ACCESS_LOG_TABLE,
+    CREATE_ACCESS_LOG_CHUNK_INDEX,
     CREATE_RELATIONSHIPS_TABLE,
     CREATE_RELATIONSHIPS_FROM_INDEX,
     CREATE_RELATIONSHIPS_TO_INDEX,
@@ -147,7 +254,16 @@ INIT_SCHEMA = [
     CREATE_DOC_HIERARCHY_PARENT_INDEX,
     CREATE_DOC_HIERARCHY_LEVEL_INDEX,
     CREATE_DOC_HIERARCHY_TYPE_INDEX,
+    CREATE_DOC_CHUNKS_FILE_INDEX,
     CREATE_CHUNKS_FTS_TABLE,
+    CREATE_VECTOR_INDEX_TABLE,
+    CREATE_VECTOR_INDEX_LIST_INDEX,
+    CREATE_VECTOR_CENTROIDS_TABLE,
+    CREATE_VECTOR_INDEX_INSERT_TRIGGER,
+    CREATE_VECTOR_INDEX_UPDATE_TRIGGER,
+    CREATE_CHUNK_SYMBOLS_TABLE,
+    CREATE_CHUNK_SYMBOLS_NAME_INDEX,
+    CREATE_CHUNK_SYMBOLS_INSERT_TRIGGER,
     CREATE_SCHEMA_VERSION_TABLE,
 ]
 
@@ -179,10 +295,14 @@ __all__ = [
     "SCHEMA_VERSION",
     "CREATE_CHUNKS_TABLE",
     "CREATE_ACTIVATIONS_TABLE",
+    "CREATE_ACCESS_LOG_TABLE",
     "CREATE_RELATIONSHIPS_TABLE",
     "CREATE_FILE_INDEX_TABLE",
     "CREATE_DOC_HIERARCHY_TABLE",
     "CREATE_CHUNKS_FTS_TABLE",
+    "CREATE_VECTOR_INDEX_TABLE",
+    "CREATE_VECTOR_CENTROIDS_TABLE",
+    "CREATE_CHUNK_SYMBOLS_TABLE",
     "INIT_SCHEMA",
     "get_schema_version_insert",
     "get_init_statements",
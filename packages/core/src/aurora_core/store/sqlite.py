@@ -8,11 +8,13 @@ This module provides a production-ready storage backend using SQLite with:
 """
 
 import json
+import re
 import shutil
 import sqlite3
 import threading
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator, Sequence
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -27,13 +29,133 @@ from aurora_core.exceptions import (
 )
 from aurora_core.store.base import Store
 from aurora_core.store.connection_pool import get_connection_pool
-from aurora_core.store.schema import SCHEMA_VERSION, get_init_statements
+from aurora_core.store.migrations import migrate_embedding_format
+from aurora_core.store.quantization import check_embedding_format, encode_embedding
+from aurora_core.store.schema import (
+    CREATE_CHUNKS_FTS_TABLE,
+    SCHEMA_VERSION,
+    get_init_statements,
+)
 from aurora_core.types import ChunkID
 
 if TYPE_CHECKING:
     from aurora_core.chunks.base import Chunk
     from aurora_core.chunks.doc_chunk import DocChunk
 
+# Max bound parameters per IN (...) clause in bulk statements (SQLite default limit is 999)
+_BULK_PARAM_LIMIT = 500
+
+# Exact access timestamps kept per chunk for the hybrid BLA approximation
+_RECENT_ACCESSES = 10
+
+_FTS_INSERT = (
+    "INSERT INTO chunks_fts (chunk_id, chunk_type, name, body, file_path, subtokens) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+# Alphanumeric runs (unicode61 also splits on "_" and ".")
+_FTS_WORD_RE = re.compile(r"[^\W_]+")
+
+# camelCase, acronym and digit runs; same split as the BM25 scorer's tokenize()
+_FTS_CAMEL_PART_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z]|\b)|[A-Z][a-z]+|[a-z]+|[0-9]+")
+
+
+@dataclass(slots=True)
+class CandidateRow:
+    """Ranking candidate holding only the columns hybrid scoring reads.
+
+    Returned by ``SQLiteStore.retrieve_fts_candidates()`` so that candidates
+    are scored without parsing their JSON content; the winners are then
+    deserialized with ``retrieve_by_ids()``.
+
+    Attributes:
+        id: Chunk ID
+        type: Chunk type ('code', 'kb', 'doc', ...)
+        activation: Base-level activation (0.0 if never accessed)
+        fts_rank: FTS5 rank (negative, lower is better)
+        embeddings: Stored embedding bytes (see ``aurora_core.store.quantization``),
+            or None if not loaded
+    """
+
+    id: str
+    type: str
+    activation: float
+    fts_rank: float | None
+    embeddings: bytes | None
+
+
+def _fts_subtokens(text: str) -> list[str]:
+    """Split camelCase and acronym identifiers into lowercase sub-tokens.
+
+    unicode61 already splits snake_case and dotted names but keeps
+    ``getUserData`` and ``HTTPRequest`` whole. Their parts are indexed in the
+    ``subtokens`` FTS5 column so that e.g. ``user data`` matches them.
+
+    Args:
+        text: Text containing identifiers
+
+    Returns:
+        Sub-tokens of every multi-part word, duplicates kept for term frequency
+
+    Example:
+        >>> _fts_subtokens("def getUserData(req: HTTPRequest)")
+        ['get', 'user', 'data', 'http', 'request']
+
+    """
+    subtokens: list[str] = []
+    for word in _FTS_WORD_RE.findall(text):
+        parts = _FTS_CAMEL_PART_RE.findall(word)
+        if len(parts) > 1:
+            subtokens.extend(part.lower() for part in parts)
+    return subtokens
+
+
+def _to_epoch(timestamp: datetime) -> float:
+    """Convert a timestamp to epoch seconds, treating naive values as UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
+def _summarize_accesses(
+    row: sqlite3.Row | None,
+    times: list[float],
+) -> tuple[list[float], int, float, float]:
+    """Fold new accesses into a chunk's bounded access summary.
+
+    Args:
+        row: Activation row with recent_accesses, history_count and
+            first_access_at, or None if the chunk has no activation row
+        times: Epoch seconds of the new accesses, oldest first
+
+    Returns:
+        Tuple of (recent access times, recorded access count, first access
+        time, BLA at the latest new access)
+
+    """
+    from aurora_core.activation.base_level import calculate_bla_hybrid
+
+    # Rows seeded without recorded accesses (e.g. Git-derived BLA) start
+    # their history with these accesses
+    if row is None or not row["history_count"]:
+        recent: list[float] = []
+        history_count = 0
+        first_access_at = times[0]
+    else:
+        recent = json.loads(row["recent_accesses"]) if row["recent_accesses"] else []
+        history_count = row["history_count"]
+        first_access_at = min(row["first_access_at"] or times[0], times[0])
+
+    recent = sorted(recent + times)[-_RECENT_ACCESSES:]
+    history_count += len(times)
+    base_level = calculate_bla_hybrid(
+        recent,
+        history_count,
+        first_access_at,
+        current_time=times[-1],
+    )
+    return recent, history_count, first_access_at, base_level
+
 
 class SQLiteStore(Store):
     """SQLite-based storage implementation with connection pooling.
@@ -49,6 +171,9 @@ class SQLiteStore(Store):
         db_path: Path to SQLite database file (":memory:" for in-memory)
         timeout: Connection timeout in seconds (default: 5.0)
         wal_mode: Enable Write-Ahead Logging for better concurrency (default: True)
+        embedding_format: Format embeddings are written in: "float32" (default),
+            "float16" or "int8". Stored blobs are self-describing, so reads accept
+            any format regardless of this setting.
 
     """
 
@@ -57,12 +182,14 @@ class SQLiteStore(Store):
         db_path: str = "~/.aurora/memory.db",
         timeout: float = 5.0,
         wal_mode: bool = True,
+        embedding_format: str = "float32",
     ):
         """Initialize SQLite store with connection pooling."""
         # Expand user home directory in path
         self.db_path = str(Path(db_path).expanduser())
         self.timeout = timeout
         self.wal_mode = wal_mode
+        self.embedding_format = check_embedding_format(embedding_format)
 
         # Thread-local storage for connections (one connection per thread)
         self._local = threading.local()
@@ -137,9 +264,21 @@ class SQLiteStore(Store):
         except sqlite3.Error as e:
             raise StorageError("Failed to initialize database schema", details=str(e))
 
+        # Rebuild a pre-v10 FTS5 table (no subtokens column) so it is repopulated below
+        self._migrate_fts_subtokens()
+
         # Populate FTS5 from existing chunks if migrating from older schema
         self._migrate_to_fts5()
 
+        # Queue existing embeddings for the vector index if migrating from older schema
+        self._migrate_to_vector_index()
+
+        # Extract symbols of existing code chunks if migrating from older schema
+        self._migrate_to_chunk_symbols()
+
+        # Move JSON access histories to the access log if migrating from older schema
+        self._migrate_to_access_log()
+
     def _detect_schema_version(self) -> tuple[int, int]:
         """Detect the schema version of an existing database.
 
@@ -226,9 +365,12 @@ class SQLiteStore(Store):
         if detected_version == SCHEMA_VERSION:
             return
 
-        # Allow forward-compatible upgrade from v5 to v6 (FTS5 addition only)
-        # v6 only adds a virtual table — existing tables are unchanged
-        if detected_version == 5 and SCHEMA_VERSION == 6:
+        # Allow forward-compatible upgrades from v5-v9 to v10
+        # v6 only adds the FTS5 virtual table, v7 the vector index tables and
+        # triggers, v8 the symbol table and trigger, v9 the access log and
+        # nullable summary columns on activations (added by _migrate_to_access_log),
+        # v10 the FTS5 subtokens column (added by _migrate_fts_subtokens)
+        if detected_version in (5, 6, 7, 8, 9) and SCHEMA_VERSION == 10:
             return
 
         # Schema mismatch - raise error with details
@@ -267,18 +409,22 @@ class SQLiteStore(Store):
             conn.rollback()
             raise StorageError("Transaction failed and was rolled back", details=str(e))
 
-    def save_chunk(self, chunk: "Chunk") -> bool:
-        """Save a chunk to storage with validation.
+    @staticmethod
+    def _serialize_chunk(
+        chunk: "Chunk",
+        embedding_format: str = "float32",
+    ) -> tuple[dict[str, Any], tuple[Any, ...]]:
+        """Validate a chunk and build its ``chunks`` table row.
 
         Args:
-            chunk: The chunk to save
+            chunk: The chunk to serialize
+            embedding_format: Storage format for the chunk's embedding
 
         Returns:
-            True if save was successful
+            Tuple of (content dict for FTS5, row for INSERT INTO chunks)
 
         Raises:
-            StorageError: If storage operation fails
-            ValidationError: If chunk validation fails
+            ValidationError: If chunk validation or serialization fails
 
         """
         # Validate chunk before saving
@@ -293,25 +439,46 @@ class SQLiteStore(Store):
         except Exception as e:
             raise ValidationError(f"Failed to serialize chunk: {chunk.id}", details=str(e))
 
+        content = chunk_json.get("content", {})
+        embeddings = getattr(chunk, "embeddings", None)
+        if embeddings is not None:
+            embeddings = encode_embedding(embeddings, embedding_format)
+        row = (
+            chunk.id,
+            chunk.type,
+            json.dumps(content),
+            json.dumps(chunk_json.get("metadata", {})),
+            # Embeddings are optional (BLOB in the store's embedding format, or None)
+            embeddings,
+            datetime.now(timezone.utc).isoformat(),
+        )
+        return content, row
+
+    def save_chunk(self, chunk: "Chunk") -> bool:
+        """Save a chunk to storage with validation.
+
+        Args:
+            chunk: The chunk to save
+
+        Returns:
+            True if save was successful
+
+        Raises:
+            StorageError: If storage operation fails
+            ValidationError: If chunk validation fails
+
+        """
+        content, row = self._serialize_chunk(chunk, self.embedding_format)
+
         with self._transaction() as conn:
             try:
-                # Get embeddings if available (optional field for semantic retrieval)
-                embeddings = getattr(chunk, "embeddings", None)
-
                 # Insert or replace chunk
                 conn.execute(
                     """
                     INSERT OR REPLACE INTO chunks (id, type, content, metadata, embeddings, updated_at)
                     VALUES (?, ?, ?, ?, ?, ?)
                     """,
-                    (
-                        chunk.id,
-                        chunk.type,
-                        json.dumps(chunk_json.get("content", {})),
-                        json.dumps(chunk_json.get("metadata", {})),
-                        embeddings,  # BLOB - numpy array bytes or None
-                        datetime.now(timezone.utc).isoformat(),
-                    ),
+                    row,
                 )
 
                 # Initialize activation record if not exists
@@ -329,12 +496,117 @@ class SQLiteStore(Store):
                 )
 
                 # Populate FTS5 index for keyword search
-                self._upsert_fts(conn, chunk.id, chunk.type, chunk_json.get("content", {}))
+                self._upsert_fts(conn, chunk.id, chunk.type, content)
 
                 return True
             except sqlite3.Error as e:
                 raise StorageError(f"Failed to save chunk: {chunk.id}", details=str(e))
 
+    def save_chunks_bulk(
+        self,
+        chunks: Sequence["Chunk"],
+        initial_activations: dict[ChunkID, tuple[float, int]] | None = None,
+    ) -> int:
+        """Save a batch of chunks in a single transaction.
+
+        Equivalent to calling save_chunk() for every chunk and then setting the
+        activation of each chunk in ``initial_activations``, but chunk rows,
+        activation records and FTS5 rows are each written with one
+        ``executemany`` and the FTS5 table probe runs once per batch.
+
+        Args:
+            chunks: Chunks to save (a later duplicate ID wins)
+            initial_activations: Optional mapping of chunk_id to
+                (base_level, access_count), e.g. Git-derived BLA. Overrides the
+                stored activation for those chunks.
+
+        Returns:
+            Number of chunks written
+
+        Raises:
+            StorageError: If storage operation fails (nothing is written)
+            ValidationError: If any chunk fails validation (nothing is written)
+
+        """
+        # Validate and serialize everything before touching the database
+        prepared: dict[str, tuple["Chunk", dict[str, Any], tuple[Any, ...]]] = {}
+        for chunk in chunks:
+            content, row = self._serialize_chunk(chunk, self.embedding_format)
+            prepared.pop(chunk.id, None)
+            prepared[chunk.id] = (chunk, content, row)
+
+        if not prepared:
+            return 0
+
+        now = datetime.now(timezone.utc).isoformat()
+        activation_updates = [
+            (base_level, access_count, chunk_id)
+            for chunk_id, (base_level, access_count) in (initial_activations or {}).items()
+            if chunk_id in prepared
+        ]
+
+        with self._transaction() as conn:
+            try:
+                # Only chunks that already exist can have a stale FTS5 row
+                chunk_ids = list(prepared)
+                existing_ids: list[str] = []
+                for start in range(0, len(chunk_ids), _BULK_PARAM_LIMIT):
+                    block = chunk_ids[start : start + _BULK_PARAM_LIMIT]
+                    placeholders = ",".join("?" * len(block))
+                    cursor = conn.execute(
+                        f"SELECT id FROM chunks WHERE id IN ({placeholders})",
+                        block,
+                    )
+                    existing_ids.extend(row[0] for row in cursor.fetchall())
+
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO chunks (id, type, content, metadata, embeddings, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    [row for _, _, row in prepared.values()],
+                )
+
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO activations (chunk_id, base_level, last_access, access_count)
+                    VALUES (?, 0.0, ?, 0)
+                    """,
+                    [(chunk_id, now) for chunk_id in prepared],
+                )
+
+                if activation_updates:
+                    conn.executemany(
+                        """
+                        UPDATE activations
+                        SET base_level = ?, access_count = ?
+                        WHERE chunk_id = ?
+                        """,
+                        activation_updates,
+                    )
+
+                if self._has_fts_table(conn):
+                    # chunk_id is UNINDEXED in FTS5, so each DELETE scans the table:
+                    # issue one DELETE per block instead of one per chunk
+                    for start in range(0, len(existing_ids), _BULK_PARAM_LIMIT):
+                        block = existing_ids[start : start + _BULK_PARAM_LIMIT]
+                        placeholders = ",".join("?" * len(block))
+                        conn.execute(
+                            f"DELETE FROM chunks_fts WHERE chunk_id IN ({placeholders})",
+                            block,
+                        )
+                    conn.executemany(
+                        _FTS_INSERT,
+                        [
+                            (chunk_id, chunk.type, *self._extract_fts_fields(content))
+                            for chunk_id, (chunk, content, _) in prepared.items()
+                        ],
+                    )
+
+                return len(prepared)
+            except sqlite3.Error as e:
+                raise StorageError(f"Failed to save batch of {len(prepared)} chunks", details=str(e))
+
     def get_chunk(self, chunk_id: ChunkID) -> Optional["Chunk"]:
         """Retrieve a chunk by ID.
 
@@ -604,14 +876,14 @@ class SQLiteStore(Store):
             raise StorageError("Failed to retrieve chunks by activation", details=str(e))
 
     @staticmethod
-    def _extract_fts_fields(content: dict[str, Any]) -> tuple[str, str, str]:
+    def _extract_fts_fields(content: dict[str, Any]) -> tuple[str, str, str, str]:
         """Extract FTS-indexable fields from chunk content JSON.
 
         Args:
             content: Chunk content dictionary (from chunk.to_json()["content"])
 
         Returns:
-            Tuple of (name, body, file_path) for FTS5 indexing
+            Tuple of (name, body, file_path, subtokens) for FTS5 indexing
 
         """
         name = content.get("function", "") or ""
@@ -619,7 +891,24 @@ class SQLiteStore(Store):
         doc = content.get("docstring", "") or ""
         body = f"{sig} {doc}".strip()
         file_path = content.get("file", "") or ""
-        return name, body, file_path
+        subtokens = " ".join(_fts_subtokens(f"{name} {body} {file_path}"))
+        return name, body, file_path, subtokens
+
+    @staticmethod
+    def _has_fts_table(conn: sqlite3.Connection) -> bool:
+        """Check if the FTS5 table exists (may not on old DBs before migration).
+
+        Args:
+            conn: Active database connection
+
+        Returns:
+            True if chunks_fts exists
+
+        """
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='chunks_fts'",
+        )
+        return cursor.fetchone() is not None
 
     def _upsert_fts(
         self,
@@ -640,23 +929,68 @@ class SQLiteStore(Store):
 
         """
         try:
-            # Check if FTS5 table exists (may not on old DBs before migration)
-            cursor = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='chunks_fts'",
-            )
-            if cursor.fetchone() is None:
+            if not self._has_fts_table(conn):
                 return  # FTS5 table not yet created
 
-            name, body, file_path = self._extract_fts_fields(content)
             conn.execute("DELETE FROM chunks_fts WHERE chunk_id = ?", (chunk_id,))
-            conn.execute(
-                "INSERT INTO chunks_fts (chunk_id, chunk_type, name, body, file_path) VALUES (?, ?, ?, ?, ?)",
-                (chunk_id, chunk_type, name, body, file_path),
-            )
+            conn.execute(_FTS_INSERT, (chunk_id, chunk_type, *self._extract_fts_fields(content)))
         except sqlite3.OperationalError:
             # FTS5 table may not exist yet (pre-migration)
             pass
 
+    def _match_fts(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        limit: int,
+        chunk_type: str | None,
+        columns: str,
+    ) -> sqlite3.Cursor | None:
+        """Run an FTS5 MATCH for the query, best rank first.
+
+        Args:
+            conn: Active database connection
+            query: Raw search query (escaped and expanded here)
+            limit: Maximum number of rows
+            chunk_type: Optional filter by chunk type
+            columns: Column list selected from ``chunks c``; ``activation`` and
+                ``fts_rank`` are appended
+
+        Returns:
+            Cursor over the matching rows, or None if the query has no terms
+
+        Raises:
+            sqlite3.OperationalError: On FTS5 syntax errors or a missing table
+
+        """
+        # Escape FTS5 special characters to prevent syntax errors
+        fts_query = self._escape_fts_query(query)
+        if not fts_query:
+            return None
+
+        # Build WHERE clause for optional type filtering
+        type_filter = ""
+        params: list[Any] = [fts_query]
+        if chunk_type:
+            type_filter = "AND f.chunk_type = ?"
+            params.append(chunk_type)
+        params.append(limit)
+
+        return conn.execute(
+            f"""
+            SELECT {columns},
+                   COALESCE(a.base_level, 0.0) AS activation,
+                   f.rank AS fts_rank
+            FROM chunks_fts f
+            JOIN chunks c ON f.chunk_id = c.id
+            LEFT JOIN activations a ON c.id = a.chunk_id
+            WHERE chunks_fts MATCH ? {type_filter}
+            ORDER BY f.rank
+            LIMIT ?
+            """,
+            params,
+        )
+
     def retrieve_by_fts(
         self,
         query: str,
@@ -685,34 +1019,16 @@ class SQLiteStore(Store):
 
         conn = self._get_connection()
         try:
-            # Escape FTS5 special characters to prevent syntax errors
-            fts_query = self._escape_fts_query(query)
-            if not fts_query:
-                return []
-
-            # Build WHERE clause for optional type filtering
-            type_filter = ""
-            params: list[Any] = [fts_query]
-            if chunk_type:
-                type_filter = "AND f.chunk_type = ?"
-                params.append(chunk_type)
-            params.append(limit)
-
             embed_col = "c.embeddings" if include_embeddings else "NULL as embeddings"
-            cursor = conn.execute(
-                f"""
-                SELECT c.id, c.type, c.content, c.metadata, {embed_col}, c.created_at, c.updated_at,
-                       COALESCE(a.base_level, 0.0) AS activation,
-                       f.rank AS fts_rank
-                FROM chunks_fts f
-                JOIN chunks c ON f.chunk_id = c.id
-                LEFT JOIN activations a ON c.id = a.chunk_id
-                WHERE chunks_fts MATCH ? {type_filter}
-                ORDER BY f.rank
-                LIMIT ?
-                """,
-                params,
+            cursor = self._match_fts(
+                conn,
+                query,
+                limit,
+                chunk_type,
+                f"c.id, c.type, c.content, c.metadata, {embed_col}, c.created_at, c.updated_at",
             )
+            if cursor is None:
+                return []
 
             chunks = []
             for row in cursor:
@@ -734,12 +1050,59 @@ class SQLiteStore(Store):
             logging.getLogger(__name__).debug(f"FTS5 query failed: {e}")
             return []
 
+    def retrieve_fts_candidates(
+        self,
+        query: str,
+        limit: int = 100,
+        include_embeddings: bool = True,
+        chunk_type: str | None = None,
+    ) -> list[CandidateRow]:
+        """Retrieve FTS5 matches as lightweight candidate rows.
+
+        Same matches and order as retrieve_by_fts(), but without reading or
+        parsing the content and metadata JSON. Ranking code scores these rows
+        and materializes only the winners with retrieve_by_ids().
+
+        Args:
+            query: Search query string
+            limit: Maximum number of candidates to return
+            include_embeddings: Whether to include embedding bytes
+            chunk_type: Optional filter by chunk type ('code' or 'kb')
+
+        Returns:
+            Candidate rows ordered by FTS5 rank (best first)
+
+        """
+        if not query or not query.strip():
+            return []
+
+        conn = self._get_connection()
+        try:
+            embed_col = "c.embeddings" if include_embeddings else "NULL"
+            cursor = self._match_fts(conn, query, limit, chunk_type, f"c.id, c.type, {embed_col}")
+            if cursor is None:
+                return []
+            return [
+                CandidateRow(chunk_id, chunk_type_, activation, fts_rank, embeddings)
+                for chunk_id, chunk_type_, embeddings, activation, fts_rank in cursor
+            ]
+
+        except sqlite3.OperationalError as e:
+            # FTS5 syntax errors or missing table — return empty gracefully
+            import logging
+
+            logging.getLogger(__name__).debug(f"FTS5 query failed: {e}")
+            return []
+
     @staticmethod
     def _escape_fts_query(query: str) -> str:
-        """Escape FTS5 special characters in query.
+        """Escape FTS5 special characters in query and expand identifiers.
 
         Wraps each token in double quotes to prevent FTS5 syntax errors
-        from special characters like *, -, etc.
+        from special characters like *, -, etc. Identifier tokens are also
+        expanded into their parts (``getUserData`` → ``get``, ``user``,
+        ``data``; ``auth.oauth`` → ``auth``, ``oauth``), which match the
+        ``subtokens`` column, so recall follows the BM25 scorer's tokenize().
 
         Args:
             query: Raw query string
@@ -748,11 +1111,17 @@ class SQLiteStore(Store):
             Escaped FTS5 query string with OR logic between tokens
 
         """
-        tokens = query.strip().split()
-        if not tokens:
+        terms: dict[str, str] = {}
+        for token in query.strip().split():
+            words = _FTS_WORD_RE.findall(token)
+            # The token itself, its snake_case/dotted words and its camelCase parts
+            expansions = [token, *(words if len(words) > 1 else []), *_fts_subtokens(token)]
+            for term in expansions:
+                terms.setdefault(term.lower(), term)
+        if not terms:
             return ""
-        # Quote each token and join with OR for broad matching
-        escaped = [f'"{t}"' for t in tokens if t]
+        # Quote each term (doubling embedded quotes) and join with OR for broad matching
+        escaped = ['"{}"'.format(t.replace('"', '""')) for t in terms.values()]
         return " OR ".join(escaped)
 
     def _migrate_to_fts5(self) -> None:
@@ -793,10 +1162,9 @@ class SQLiteStore(Store):
                     content = json.loads(row[2]) if row[2] else {}
                 except (json.JSONDecodeError, TypeError):
                     continue
-                name, body, file_path = self._extract_fts_fields(content)
                 conn.execute(
-                    "INSERT INTO chunks_fts (chunk_id, chunk_type, name, body, file_path) VALUES (?, ?, ?, ?, ?)",
-                    (chunk_id, chunk_type, name, body, file_path),
+                    _FTS_INSERT,
+                    (chunk_id, chunk_type, *self._extract_fts_fields(content)),
                 )
                 migrated += 1
 
@@ -810,91 +1178,309 @@ class SQLiteStore(Store):
             # Non-fatal — FTS5 will be populated on next save_chunk()
             pass
 
-    def fetch_embeddings_for_chunks(self, chunk_ids: list[ChunkID]) -> dict[ChunkID, bytes]:
-        """Fetch embeddings only for specified chunks.
+    def _migrate_fts_subtokens(self) -> None:
+        """Recreate the FTS5 table with the v10 ``subtokens`` column if needed.
 
-        This is used for two-phase retrieval optimization:
-        1. First retrieve chunks without embeddings (fast)
-        2. After BM25 filtering, fetch embeddings only for top candidates
+        FTS5 tables cannot be altered, so a pre-v10 ``chunks_fts`` is dropped
+        and recreated empty; ``_migrate_to_fts5()`` then repopulates it.
+        Idempotent — skips if the column already exists.
 
-        Args:
-            chunk_ids: List of chunk IDs to fetch embeddings for
+        """
+        conn = self._get_connection()
+        try:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(chunks_fts)")}
+            if not columns or "subtokens" in columns:
+                return
 
-        Returns:
-            Dictionary mapping chunk_id to embedding bytes
+            conn.execute("DROP TABLE chunks_fts")
+            conn.execute(CREATE_CHUNKS_FTS_TABLE)
+            conn.commit()
 
-        Raises:
-            StorageError: If storage operation fails
+        except sqlite3.Error:
+            # Non-fatal — keyword search keeps working without sub-token matches
+            pass
 
-        """
-        if not chunk_ids:
-            return {}
+    def _migrate_to_vector_index(self) -> None:
+        """Queue existing embedded chunks in the vector index if needed.
+
+        Called during schema initialization. Chunks written before v7 have no
+        vector_index row because the insert trigger did not exist yet. Idempotent —
+        skips if the vector index already has data.
 
+        """
         conn = self._get_connection()
         try:
-            # Use parameterized query with proper placeholder count
-            placeholders = ",".join("?" * len(chunk_ids))
+            cursor = conn.execute("SELECT 1 FROM vector_index LIMIT 1")
+            if cursor.fetchone() is not None:
+                return  # Already populated
+
             cursor = conn.execute(
-                f"""
-                SELECT id, embeddings
-                FROM chunks
-                WHERE id IN ({placeholders})
-                AND embeddings IS NOT NULL
+                """
+                INSERT OR IGNORE INTO vector_index (chunk_id, list_id)
+                SELECT id, -1 FROM chunks WHERE embeddings IS NOT NULL
                 """,
-                chunk_ids,
             )
+            conn.commit()
 
-            return {row["id"]: row["embeddings"] for row in cursor if row["embeddings"]}
-
-        except sqlite3.Error as e:
-            raise StorageError("Failed to fetch embeddings", details=str(e))
+            if cursor.rowcount > 0:
+                import logging
 
-    def add_relationship(
-        self,
-        from_id: ChunkID,
-        to_id: ChunkID,
-        rel_type: str,
-        weight: float = 1.0,
-    ) -> bool:
-        """Add a relationship between chunks.
+                logging.getLogger(__name__).info(
+                    f"Queued {cursor.rowcount} chunks for vector index",
+                )
 
-        Args:
-            from_id: Source chunk ID
-            to_id: Target chunk ID
-            rel_type: Relationship type
-            weight: Relationship strength
+        except sqlite3.Error:
+            # Non-fatal — vectors will be queued on next save_chunk()
+            pass
 
-        Returns:
-            True if relationship was added
+    def _migrate_to_chunk_symbols(self) -> None:
+        """Extract symbols of existing code chunks if needed.
 
-        Raises:
-            StorageError: If storage operation fails
-            ChunkNotFoundError: If either chunk doesn't exist
+        Called during schema initialization. Chunks written before v8 have no
+        chunk_symbols rows because the insert trigger did not exist yet. Idempotent —
+        skips if the symbol table already has data.
 
         """
-        with self._transaction() as conn:
-            try:
-                # Verify both chunks exist
-                cursor = conn.execute(
-                    "SELECT COUNT(*) as cnt FROM chunks WHERE id IN (?, ?)",
-                    (from_id, to_id),
-                )
-                count = cursor.fetchone()["cnt"]
-                if count < 2:
-                    raise ChunkNotFoundError(f"One or both chunks not found: {from_id}, {to_id}")
-
-                # Insert relationship
-                conn.execute(
-                    """
-                    INSERT INTO relationships (from_chunk, to_chunk, relationship_type, weight)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (from_id, to_id, rel_type, weight),
-                )
-
-                return True
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute("SELECT 1 FROM chunk_symbols LIMIT 1")
+            if cursor.fetchone() is not None:
+                return  # Already populated
 
-            except sqlite3.Error as e:
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO chunk_symbols (chunk_id, kind, name)
+                SELECT id, 'def', json_extract(content, '$.function') FROM chunks
+                WHERE type = 'code' AND json_extract(content, '$.function') IS NOT NULL
+                """,
+            )
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO chunk_symbols (chunk_id, kind, name)
+                SELECT c.id, 'ref', substr(d.value, 8)
+                FROM chunks c, json_each(c.content, '$.dependencies') d
+                WHERE c.type = 'code' AND d.value LIKE 'import:%'
+                """,
+            )
+            conn.commit()
+
+        except sqlite3.Error:
+            # Non-fatal — symbols are extracted on next save_chunk()
+            pass
+
+    def _migrate_to_access_log(self) -> None:
+        """Move JSON access histories into the access log if needed.
+
+        Called during schema initialization. Before v9 every access rewrote the
+        full ``activations.access_history`` JSON array. This adds the summary
+        columns, copies each history into ``access_log`` and clears the JSON.
+        Idempotent — the copy runs while any ``access_history`` is still set, so
+        an interrupted migration is retried on the next start.
+
+        """
+        conn = self._get_connection()
+        try:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(activations)")}
+            for column, column_type in (
+                ("recent_accesses", "JSON"),
+                ("history_count", "INTEGER DEFAULT 0"),
+                ("first_access_at", "REAL"),
+            ):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE activations ADD COLUMN {column} {column_type}")
+            conn.commit()
+
+            if "access_history" not in columns:
+                return  # Created at v9 or later
+
+            # Copy and clear in one transaction: a failure leaves every history in place
+            rows = conn.execute(
+                "SELECT chunk_id, access_history FROM activations "
+                "WHERE access_history IS NOT NULL",
+            ).fetchall()
+            for row in rows:
+                try:
+                    entries = [
+                        (
+                            row["chunk_id"],
+                            _to_epoch(
+                                datetime.fromisoformat(
+                                    str(entry["timestamp"]).replace("Z", "+00:00"),
+                                ),
+                            ),
+                            entry.get("context"),
+                        )
+                        for entry in json.loads(row["access_history"])
+                        if entry.get("timestamp")
+                    ]
+                except (ValueError, TypeError, AttributeError):
+                    # Unreadable history — it starts over from the next record_access()
+                    continue
+                if not entries:
+                    continue
+                times = sorted(accessed_at for _, accessed_at, _ in entries)
+                conn.executemany(
+                    "INSERT INTO access_log (chunk_id, accessed_at, context) VALUES (?, ?, ?)",
+                    entries,
+                )
+                conn.execute(
+                    """UPDATE activations
+                       SET recent_accesses = ?, history_count = ?, first_access_at = ?
+                       WHERE chunk_id = ?""",
+                    (
+                        json.dumps(times[-_RECENT_ACCESSES:]),
+                        len(times),
+                        times[0],
+                        row["chunk_id"],
+                    ),
+                )
+            if rows:
+                conn.execute("UPDATE activations SET access_history = NULL")
+            conn.commit()
+
+        except sqlite3.Error:
+            # Non-fatal — histories are kept and the copy is retried on the next start
+            conn.rollback()
+
+    def retrieve_by_ids(
+        self,
+        chunk_ids: list[ChunkID],
+        include_embeddings: bool = True,
+    ) -> list["Chunk"]:
+        """Retrieve several chunks by ID with their activation attached.
+
+        Used to materialize candidates that were found outside the FTS5 gate
+        (e.g. by the vector index), so they can be scored alongside FTS5 hits,
+        and to materialize the winners among retrieve_fts_candidates() rows.
+
+        Args:
+            chunk_ids: Chunk IDs to retrieve
+            include_embeddings: Whether to include embedding vectors
+
+        Returns:
+            List of chunks in the order of ``chunk_ids`` (missing IDs are skipped)
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        if not chunk_ids:
+            return []
+
+        conn = self._get_connection()
+        try:
+            placeholders = ",".join("?" * len(chunk_ids))
+            embed_col = "c.embeddings" if include_embeddings else "NULL as embeddings"
+            cursor = conn.execute(
+                f"""
+                SELECT c.id, c.type, c.content, c.metadata, {embed_col}, c.created_at, c.updated_at,
+                       COALESCE(a.base_level, 0.0) AS activation
+                FROM chunks c
+                LEFT JOIN activations a ON c.id = a.chunk_id
+                WHERE c.id IN ({placeholders})
+                """,
+                chunk_ids,
+            )
+
+            by_id: dict[str, Chunk] = {}
+            for row in cursor:
+                row_dict = dict(row)
+                activation_value = row_dict.pop("activation", 0.0)
+                chunk = self._deserialize_chunk(row_dict)
+                if chunk is not None:
+                    chunk.activation = activation_value  # type: ignore[attr-defined]
+                    by_id[chunk.id] = chunk
+
+            return [by_id[cid] for cid in chunk_ids if cid in by_id]
+
+        except sqlite3.Error as e:
+            raise StorageError("Failed to retrieve chunks by id", details=str(e))
+
+    def fetch_embeddings_for_chunks(self, chunk_ids: list[ChunkID]) -> dict[ChunkID, bytes]:
+        """Fetch embeddings only for specified chunks.
+
+        This is used for two-phase retrieval optimization:
+        1. First retrieve chunks without embeddings (fast)
+        2. After BM25 filtering, fetch embeddings only for top candidates
+
+        Args:
+            chunk_ids: List of chunk IDs to fetch embeddings for
+
+        Returns:
+            Dictionary mapping chunk_id to embedding bytes
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        if not chunk_ids:
+            return {}
+
+        conn = self._get_connection()
+        try:
+            # Use parameterized query with proper placeholder count
+            placeholders = ",".join("?" * len(chunk_ids))
+            cursor = conn.execute(
+                f"""
+                SELECT id, embeddings
+                FROM chunks
+                WHERE id IN ({placeholders})
+                AND embeddings IS NOT NULL
+                """,
+                chunk_ids,
+            )
+
+            return {row["id"]: row["embeddings"] for row in cursor if row["embeddings"]}
+
+        except sqlite3.Error as e:
+            raise StorageError("Failed to fetch embeddings", details=str(e))
+
+    def add_relationship(
+        self,
+        from_id: ChunkID,
+        to_id: ChunkID,
+        rel_type: str,
+        weight: float = 1.0,
+    ) -> bool:
+        """Add a relationship between chunks.
+
+        Args:
+            from_id: Source chunk ID
+            to_id: Target chunk ID
+            rel_type: Relationship type
+            weight: Relationship strength
+
+        Returns:
+            True if relationship was added
+
+        Raises:
+            StorageError: If storage operation fails
+            ChunkNotFoundError: If either chunk doesn't exist
+
+        """
+        with self._transaction() as conn:
+            try:
+                # Verify both chunks exist
+                cursor = conn.execute(
+                    "SELECT COUNT(*) as cnt FROM chunks WHERE id IN (?, ?)",
+                    (from_id, to_id),
+                )
+                count = cursor.fetchone()["cnt"]
+                if count < 2:
+                    raise ChunkNotFoundError(f"One or both chunks not found: {from_id}, {to_id}")
+
+                # Insert relationship
+                conn.execute(
+                    """
+                    INSERT INTO relationships (from_chunk, to_chunk, relationship_type, weight)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    (from_id, to_id, rel_type, weight),
+                )
+
+                return True
+
+            except sqlite3.Error as e:
                 raise StorageError(
                     f"Failed to add relationship: {from_id} -> {to_id}",
                     details=str(e),
@@ -959,6 +1545,195 @@ class SQLiteStore(Store):
         except sqlite3.Error as e:
             raise StorageError(f"Failed to retrieve related chunks for: {chunk_id}", details=str(e))
 
+    def add_relationships_bulk(
+        self,
+        relationships: list[tuple[ChunkID, ChunkID, str, float]],
+    ) -> int:
+        """Add a batch of relationships in one transaction.
+
+        Edges with a missing endpoint and edges that already exist (same
+        endpoints and type) are skipped inside the INSERT, so no per-edge
+        existence check round-trips are needed.
+
+        Args:
+            relationships: (from_id, to_id, rel_type, weight) tuples
+
+        Returns:
+            Number of relationships added
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        if not relationships:
+            return 0
+
+        with self._transaction() as conn:
+            try:
+                cursor = conn.executemany(
+                    """
+                    INSERT INTO relationships (from_chunk, to_chunk, relationship_type, weight)
+                    SELECT ?1, ?2, ?3, ?4
+                    WHERE EXISTS (SELECT 1 FROM chunks WHERE id = ?1)
+                      AND EXISTS (SELECT 1 FROM chunks WHERE id = ?2)
+                      AND NOT EXISTS (
+                          SELECT 1 FROM relationships
+                          WHERE from_chunk = ?1 AND to_chunk = ?2 AND relationship_type = ?3
+                      )
+                    """,
+                    relationships,
+                )
+                return max(cursor.rowcount, 0)
+            except sqlite3.Error as e:
+                raise StorageError(
+                    f"Failed to add {len(relationships)} relationships",
+                    details=str(e),
+                )
+
+    def link_symbol_references(self, chunk_ids: list[ChunkID], max_targets: int = 3) -> int:
+        """Add "imports" edges between chunks and the definitions of names they import.
+
+        Resolves references through the chunk_symbols table, in both
+        directions for the given chunks: imported names they use are linked
+        to their definitions, and chunks elsewhere that import names they
+        define are linked to them. Re-saving a file's chunks drops all edges
+        touching them (ON DELETE CASCADE), so calling this with the chunks of
+        the changed files restores the cross-file edges without relinking the
+        whole graph.
+
+        Names defined by more than max_targets chunks are too ambiguous to
+        resolve and are skipped; an edge to one of n definitions gets weight 1/n.
+
+        Args:
+            chunk_ids: Chunks whose references and definitions to link
+            max_targets: Maximum number of definitions a name may have
+
+        Returns:
+            Number of relationships added
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        if not chunk_ids:
+            return 0
+
+        with self._transaction() as conn:
+            try:
+                conn.execute(
+                    "CREATE TEMP TABLE IF NOT EXISTS link_scope (chunk_id TEXT PRIMARY KEY)",
+                )
+                conn.execute("DELETE FROM link_scope")
+                conn.executemany(
+                    "INSERT OR IGNORE INTO link_scope (chunk_id) VALUES (?)",
+                    ((chunk_id,) for chunk_id in chunk_ids),
+                )
+                # cursor.rowcount is not reported for statements starting with WITH
+                changes_before = conn.total_changes
+                conn.execute(
+                    """
+                    WITH scope_names AS (
+                        SELECT s.name FROM chunk_symbols s
+                        JOIN link_scope l ON l.chunk_id = s.chunk_id
+                    ),
+                    def_counts AS (
+                        SELECT name, COUNT(*) AS n FROM chunk_symbols
+                        WHERE kind = 'def' AND name IN (SELECT name FROM scope_names)
+                        GROUP BY name
+                        HAVING COUNT(*) <= ?
+                    ),
+                    pairs AS (
+                        SELECT r.chunk_id AS from_chunk, d.chunk_id AS to_chunk, 1.0 / dc.n AS weight
+                        FROM def_counts dc
+                        JOIN chunk_symbols d ON d.name = dc.name AND d.kind = 'def'
+                        JOIN chunk_symbols r ON r.name = dc.name AND r.kind = 'ref'
+                        WHERE r.chunk_id != d.chunk_id
+                          AND (
+                              r.chunk_id IN (SELECT chunk_id FROM link_scope)
+                              OR d.chunk_id IN (SELECT chunk_id FROM link_scope)
+                          )
+                    )
+                    INSERT INTO relationships (from_chunk, to_chunk, relationship_type, weight)
+                    SELECT DISTINCT p.from_chunk, p.to_chunk, 'imports', p.weight FROM pairs p
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM relationships
+                        WHERE from_chunk = p.from_chunk
+                          AND to_chunk = p.to_chunk
+                          AND relationship_type = 'imports'
+                    )
+                    """,
+                    (max_targets,),
+                )
+                added = conn.total_changes - changes_before
+                conn.execute("DELETE FROM link_scope")
+                return added
+            except sqlite3.Error as e:
+                raise StorageError("Failed to link symbol references", details=str(e))
+
+    def get_relationships(
+        self,
+        chunk_ids: list[ChunkID],
+        max_hops: int = 1,
+        limit: int = 1000,
+    ) -> list[tuple[ChunkID, ChunkID, str, float]]:
+        """Get the relationship edges around a set of chunks (both directions).
+
+        Expands one hop per round with indexed lookups on from_chunk and
+        to_chunk, so the cost depends on the neighbourhood, not the graph size.
+
+        Args:
+            chunk_ids: Chunk IDs to start from
+            max_hops: Number of hops to expand
+            limit: Maximum number of edges to return
+
+        Returns:
+            List of (from_id, to_id, rel_type, weight) tuples
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        conn = self._get_connection()
+        edges: dict[int, tuple[ChunkID, ChunkID, str, float]] = {}
+        visited = set(chunk_ids)
+        frontier = list(visited)
+
+        try:
+            for _ in range(max_hops):
+                next_frontier: list[ChunkID] = []
+                for start in range(0, len(frontier), _BULK_PARAM_LIMIT):
+                    block = frontier[start : start + _BULK_PARAM_LIMIT]
+                    placeholders = ",".join("?" * len(block))
+                    cursor = conn.execute(
+                        f"""
+                        SELECT id, from_chunk, to_chunk, relationship_type, weight
+                        FROM relationships WHERE from_chunk IN ({placeholders})
+                        UNION
+                        SELECT id, from_chunk, to_chunk, relationship_type, weight
+                        FROM relationships WHERE to_chunk IN ({placeholders})
+                        LIMIT ?
+                        """,
+                        # Rows for already collected edges come back too
+                        (*block, *block, limit + len(edges)),
+                    )
+                    for rel_id, from_id, to_id, rel_type, weight in cursor:
+                        if rel_id in edges:
+                            continue
+                        edges[rel_id] = (from_id, to_id, rel_type, weight)
+                        if len(edges) >= limit:
+                            return list(edges.values())
+                        for endpoint in (from_id, to_id):
+                            if endpoint not in visited:
+                                visited.add(endpoint)
+                                next_frontier.append(endpoint)
+                frontier = next_frontier
+                if not frontier:
+                    break
+        except sqlite3.Error as e:
+            raise StorageError("Failed to retrieve relationships", details=str(e))
+
+        return list(edges.values())
+
     def record_access(
         self,
         chunk_id: ChunkID,
@@ -967,9 +1742,11 @@ class SQLiteStore(Store):
     ) -> None:
         """Record an access to a chunk for ACT-R activation tracking.
 
-        This method updates the chunk's access history in the activations table,
-        which is used to calculate Base-Level Activation (BLA) based on frequency
-        and recency of access.
+        Appends one row to the access log and updates the chunk's bounded
+        summary in the activations table (last few access times, count, first
+        access). Base-Level Activation (BLA) is recomputed from that summary
+        with Petrov's hybrid approximation, so each access costs O(1) in CPU
+        and bytes written however often the chunk has been accessed.
 
         Args:
             chunk_id: The chunk that was accessed
@@ -981,11 +1758,10 @@ class SQLiteStore(Store):
             ChunkNotFoundError: If chunk_id does not exist
 
         """
-        from aurora_core.activation.base_level import AccessHistoryEntry, calculate_bla
-
         conn = self._get_connection()
         if access_time is None:
             access_time = datetime.now(timezone.utc)
+        accessed_at = _to_epoch(access_time)
 
         try:
             # First check if chunk exists
@@ -993,60 +1769,55 @@ class SQLiteStore(Store):
             if cursor.fetchone() is None:
                 raise ChunkNotFoundError(str(chunk_id))
 
-            # Get current access history from activations table
             cursor = conn.execute(
-                "SELECT access_history FROM activations WHERE chunk_id = ?",
+                """SELECT recent_accesses, history_count, first_access_at
+                   FROM activations WHERE chunk_id = ?""",
                 (chunk_id,),
             )
             row = cursor.fetchone()
 
-            if row is None:
-                # First access - initialize activation record
-                access_history = [{"timestamp": access_time.isoformat(), "context": context}]
-
-                # Calculate initial BLA (single access)
-                history_entries = [AccessHistoryEntry(timestamp=access_time)]
-                new_base_level = calculate_bla(
-                    history_entries,
-                    decay_rate=0.5,
-                    current_time=access_time,
-                )
+            recent, history_count, first_access_at, new_base_level = _summarize_accesses(
+                row,
+                [accessed_at],
+            )
 
+            conn.execute(
+                "INSERT INTO access_log (chunk_id, accessed_at, context) VALUES (?, ?, ?)",
+                (chunk_id, accessed_at, context),
+            )
+            if row is None:
                 conn.execute(
-                    """INSERT INTO activations (chunk_id, base_level, last_access, access_count, access_history)
-                       VALUES (?, ?, ?, 1, ?)""",
-                    (chunk_id, new_base_level, access_time, json.dumps(access_history)),
+                    """INSERT INTO activations
+                           (chunk_id, base_level, last_access, access_count,
+                            recent_accesses, history_count, first_access_at)
+                       VALUES (?, ?, ?, 1, ?, ?, ?)""",
+                    (
+                        chunk_id,
+                        new_base_level,
+                        access_time,
+                        json.dumps(recent),
+                        history_count,
+                        first_access_at,
+                    ),
                 )
             else:
-                # Subsequent access - update existing record
-                access_history = json.loads(row["access_history"]) if row["access_history"] else []
-                access_history.append({"timestamp": access_time.isoformat(), "context": context})
-
-                # Recalculate BLA based on updated access history
-                history_entries = [
-                    AccessHistoryEntry(
-                        timestamp=datetime.fromisoformat(
-                            str(entry["timestamp"]).replace("Z", "+00:00"),
-                        ),
-                    )
-                    for entry in access_history
-                    if entry.get("timestamp")
-                ]
-                new_base_level = calculate_bla(
-                    history_entries,
-                    decay_rate=0.5,
-                    current_time=access_time,
-                )
-
-                # Update activations table with new base_level
                 conn.execute(
                     """UPDATE activations
                        SET access_count = access_count + 1,
                            last_access = ?,
-                           access_history = ?,
+                           recent_accesses = ?,
+                           history_count = ?,
+                           first_access_at = ?,
                            base_level = ?
                        WHERE chunk_id = ?""",
-                    (access_time, json.dumps(access_history), new_base_level, chunk_id),
+                    (
+                        access_time,
+                        json.dumps(recent),
+                        history_count,
+                        first_access_at,
+                        new_base_level,
+                        chunk_id,
+                    ),
                 )
 
             # Update chunks table timestamps
@@ -1064,6 +1835,130 @@ class SQLiteStore(Store):
             conn.rollback()
             raise StorageError(f"Failed to record access for chunk: {chunk_id}", details=str(e))
 
+    def record_access_batch(
+        self,
+        accesses: list[tuple[ChunkID, datetime, str | None]],
+    ) -> int:
+        """Record several chunk accesses in a single transaction.
+
+        Accesses are grouped by chunk, so a chunk hit several times in the
+        batch gets one activations update covering all of its accesses. Every
+        access is still appended to the access log.
+
+        Args:
+            accesses: (chunk_id, access_time, context) tuples
+
+        Returns:
+            Number of accesses recorded (accesses to missing chunks are skipped)
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        by_chunk: dict[str, list[tuple[float, datetime, str | None]]] = {}
+        for accessed_id, access_time, context in accesses:
+            by_chunk.setdefault(str(accessed_id), []).append(
+                (_to_epoch(access_time), access_time, context),
+            )
+        if not by_chunk:
+            return 0
+
+        conn = self._get_connection()
+        try:
+            rows: dict[str, sqlite3.Row] = {}
+            chunk_ids = list(by_chunk)
+            for start in range(0, len(chunk_ids), _BULK_PARAM_LIMIT):
+                block = chunk_ids[start : start + _BULK_PARAM_LIMIT]
+                placeholders = ",".join("?" * len(block))
+                cursor = conn.execute(
+                    f"""SELECT c.id, a.chunk_id AS activation_id,
+                               a.recent_accesses, a.history_count, a.first_access_at
+                        FROM chunks c
+                        LEFT JOIN activations a ON a.chunk_id = c.id
+                        WHERE c.id IN ({placeholders})""",
+                    block,
+                )
+                rows.update((row["id"], row) for row in cursor)
+
+            log_rows: list[tuple[str, float, str | None]] = []
+            activation_inserts: list[tuple[Any, ...]] = []
+            activation_updates: list[tuple[Any, ...]] = []
+            chunk_updates: list[tuple[datetime, datetime, str]] = []
+            for chunk_id, entries in by_chunk.items():
+                row = rows.get(chunk_id)
+                if row is None:
+                    continue  # Chunk removed since the access was queued
+                entries.sort(key=lambda entry: entry[0])
+                recent, history_count, first_access_at, base_level = _summarize_accesses(
+                    row if row["activation_id"] is not None else None,
+                    [accessed_at for accessed_at, _, _ in entries],
+                )
+                first_time, last_time = entries[0][1], entries[-1][1]
+
+                log_rows.extend((chunk_id, accessed_at, context) for accessed_at, _, context in entries)
+                if row["activation_id"] is None:
+                    activation_inserts.append(
+                        (
+                            chunk_id,
+                            base_level,
+                            last_time,
+                            len(entries),
+                            json.dumps(recent),
+                            history_count,
+                            first_access_at,
+                        ),
+                    )
+                else:
+                    activation_updates.append(
+                        (
+                            len(entries),
+                            last_time,
+                            json.dumps(recent),
+                            history_count,
+                            first_access_at,
+                            base_level,
+                            chunk_id,
+                        ),
+                    )
+                chunk_updates.append((last_time, first_time, chunk_id))
+
+            conn.executemany(
+                "INSERT INTO access_log (chunk_id, accessed_at, context) VALUES (?, ?, ?)",
+                log_rows,
+            )
+            conn.executemany(
+                """INSERT INTO activations
+                       (chunk_id, base_level, last_access, access_count,
+                        recent_accesses, history_count, first_access_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                activation_inserts,
+            )
+            conn.executemany(
+                """UPDATE activations
+                   SET access_count = access_count + ?,
+                       last_access = ?,
+                       recent_accesses = ?,
+                       history_count = ?,
+                       first_access_at = ?,
+                       base_level = ?
+                   WHERE chunk_id = ?""",
+                activation_updates,
+            )
+            conn.executemany(
+                """UPDATE chunks
+                   SET last_access = ?,
+                       first_access = COALESCE(first_access, ?)
+                   WHERE id = ?""",
+                chunk_updates,
+            )
+            conn.commit()
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise StorageError("Failed to record access batch", details=str(e))
+
+        return len(log_rows)
+
     def get_access_history(
         self,
         chunk_id: ChunkID,
@@ -1093,26 +1988,22 @@ class SQLiteStore(Store):
             if cursor.fetchone() is None:
                 raise ChunkNotFoundError(str(chunk_id))
 
-            # Get access history from activations table
             cursor = conn.execute(
-                "SELECT access_history FROM activations WHERE chunk_id = ?",
-                (chunk_id,),
+                """SELECT accessed_at, context FROM access_log
+                   WHERE chunk_id = ?
+                   ORDER BY accessed_at DESC
+                   LIMIT ?""",
+                (chunk_id, -1 if limit is None else limit),
             )
-            row = cursor.fetchone()
-
-            if row is None or not row["access_history"]:
-                return []
-
-            access_history: list[dict[Any, Any]] = json.loads(row["access_history"])
-
-            # Sort by timestamp, most recent first
-            access_history.sort(key=lambda x: x["timestamp"], reverse=True)
-
-            # Apply limit if specified
-            if limit is not None:
-                access_history = access_history[:limit]
-
-            return access_history
+            return [
+                {
+                    "timestamp": datetime.fromtimestamp(
+                        row["accessed_at"], tz=timezone.utc
+                    ).isoformat(),
+                    "context": row["context"],
+                }
+                for row in cursor
+            ]
 
         except sqlite3.Error as e:
             raise StorageError(
@@ -1282,6 +2173,227 @@ class SQLiteStore(Store):
                     details=str(e),
                 )
 
+    def save_doc_chunks_bulk(self, chunks: list["DocChunk"]) -> int:
+        """Save a batch of document chunks with their hierarchy metadata.
+
+        Equivalent to calling save_doc_chunk() for every chunk, but chunk rows
+        go through save_chunks_bulk() and hierarchy rows are written with one
+        ``executemany``.
+
+        Args:
+            chunks: DocChunks to save (a later duplicate ID wins)
+
+        Returns:
+            Number of chunks written
+
+        Raises:
+            StorageError: If storage operation fails
+            ValidationError: If any chunk is not a valid DocChunk (nothing is written)
+
+        """
+        from aurora_core.chunks import DocChunk
+
+        for chunk in chunks:
+            if not isinstance(chunk, DocChunk):
+                raise ValidationError(
+                    f"Expected DocChunk, got {type(chunk).__name__}",
+                    details=f"chunk_id: {getattr(chunk, 'id', 'unknown')}",
+                )
+
+        written = self.save_chunks_bulk(chunks)
+        if not written:
+            return 0
+
+        hierarchy = {
+            chunk.id: (
+                chunk.id,
+                chunk.parent_chunk_id,
+                json.dumps(chunk.section_path),
+                chunk.section_level,
+                chunk.document_type,
+            )
+            for chunk in chunks
+        }
+        with self._transaction() as conn:
+            try:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO doc_hierarchy
+                        (chunk_id, parent_chunk_id, section_path, section_level, document_type)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    list(hierarchy.values()),
+                )
+            except sqlite3.Error as e:
+                raise StorageError(
+                    f"Failed to save doc hierarchy for batch of {len(hierarchy)} chunks",
+                    details=str(e),
+                )
+        return written
+
+    def delete_doc_chunks(self, file_path: str, keep_ids: Collection[str] = ()) -> int:
+        """Delete a document's chunks, except those in ``keep_ids``.
+
+        Removes the chunk rows with their hierarchy and FTS5 rows in one
+        transaction; other per-chunk rows go with ON DELETE CASCADE. The
+        lookup uses the ``idx_chunks_doc_file`` expression index.
+
+        Args:
+            file_path: Absolute path of the source document
+            keep_ids: IDs of the document's current chunks, which are kept
+
+        Returns:
+            Number of chunks deleted
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        with self._transaction() as conn:
+            try:
+                rows = conn.execute(
+                    """SELECT id FROM chunks
+                       WHERE type = 'doc' AND json_extract(content, '$.file_path') = ?""",
+                    (file_path,),
+                ).fetchall()
+                stale = [(row[0],) for row in rows if row[0] not in keep_ids]
+                if not stale:
+                    return 0
+                conn.executemany("DELETE FROM doc_hierarchy WHERE chunk_id = ?", stale)
+                conn.executemany("DELETE FROM chunks WHERE id = ?", stale)
+                if self._has_fts_table(conn):
+                    conn.executemany("DELETE FROM chunks_fts WHERE chunk_id = ?", stale)
+            except sqlite3.Error as e:
+                raise StorageError(
+                    f"Failed to delete doc chunks for: {file_path}",
+                    details=str(e),
+                )
+        return len(stale)
+
+    def load_file_index(self, suffixes: Collection[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Load the incremental-indexing record of every indexed file.
+
+        Args:
+            suffixes: Only return files with one of these extensions (lowercase,
+                without the dot); None returns every file
+
+        Returns:
+            Dictionary mapping file paths to {"hash": str, "mtime": float, "chunk_count": int}
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        conn = self._get_connection()
+        try:
+            rows = conn.execute(
+                "SELECT file_path, content_hash, mtime, chunk_count FROM file_index",
+            ).fetchall()
+        except sqlite3.Error as e:
+            raise StorageError("Failed to load file index", details=str(e))
+
+        return {
+            row[0]: {"hash": row[1], "mtime": row[2], "chunk_count": row[3] or 0}
+            for row in rows
+            if suffixes is None or Path(row[0]).suffix.lstrip(".").lower() in suffixes
+        }
+
+    def save_file_index(self, file_info: dict[str, dict[str, Any]]) -> None:
+        """Insert or replace incremental-indexing records.
+
+        Args:
+            file_info: Dictionary mapping file paths to {"hash": str, "mtime": float,
+                "chunk_count": int}
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        if not file_info:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        with self._transaction() as conn:
+            try:
+                conn.executemany(
+                    """INSERT OR REPLACE INTO file_index
+                       (file_path, content_hash, mtime, indexed_at, chunk_count)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    [
+                        (path, info["hash"], info["mtime"], now, info.get("chunk_count", 0))
+                        for path, info in file_info.items()
+                    ],
+                )
+            except sqlite3.Error as e:
+                raise StorageError("Failed to save file index", details=str(e))
+
+    def update_file_index_mtimes(self, mtimes: dict[str, float]) -> None:
+        """Refresh the recorded mtime of files whose content did not change.
+
+        Args:
+            mtimes: Dictionary mapping file paths to their current mtime
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        if not mtimes:
+            return
+        with self._transaction() as conn:
+            try:
+                conn.executemany(
+                    "UPDATE file_index SET mtime = ? WHERE file_path = ?",
+                    [(mtime, path) for path, mtime in mtimes.items()],
+                )
+            except sqlite3.Error as e:
+                raise StorageError("Failed to update file index", details=str(e))
+
+    def delete_file_index(self, file_paths: Collection[str]) -> int:
+        """Delete the incremental-indexing records of files.
+
+        Args:
+            file_paths: Paths whose records are deleted
+
+        Returns:
+            Number of records deleted
+
+        Raises:
+            StorageError: If storage operation fails
+
+        """
+        if not file_paths:
+            return 0
+        with self._transaction() as conn:
+            try:
+                cursor = conn.executemany(
+                    "DELETE FROM file_index WHERE file_path = ?",
+                    [(path,) for path in file_paths],
+                )
+            except sqlite3.Error as e:
+                raise StorageError("Failed to delete file index rows", details=str(e))
+        return cursor.rowcount
+
+    def convert_embeddings(self, embedding_format: str | None = None) -> int:
+        """Re-encode stored embeddings that are not in the given format.
+
+        New embeddings are written in ``embedding_format`` as they are saved;
+        this converts the ones stored earlier (see migrate_embedding_format()).
+
+        Args:
+            embedding_format: Target format (defaults to the store's format)
+
+        Returns:
+            Number of embeddings re-encoded
+
+        Raises:
+            ValueError: If the format is unknown
+            StorageError: If storage operation fails
+
+        """
+        return migrate_embedding_format(
+            self._get_connection(),
+            embedding_format or self.embedding_format,
+        )
+
     def close(self) -> None:
         """Close database connection and cleanup.
 
@@ -1384,4 +2496,4 @@ def backup_database(db_path: str) -> str:
         )
 
 
-__all__ = ["SQLiteStore", "backup_database"]
+__all__ = ["CandidateRow", "SQLiteStore", "backup_database"]
@@ -5,6 +5,7 @@ get_access_stats, get_access_stats_batch, save_doc_chunk, and
 schema version detection. All tests use real SQLite with tmp_path.
 """
 
+import json
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -121,6 +122,93 @@ class TestRecordAccess:
         assert bla_after_2 > bla_after_1
 
 
+    def test_summary_stays_bounded(self, tmp_path):
+        from aurora_core.activation.base_level import AccessHistoryEntry, calculate_bla
+
+        store = SQLiteStore(str(tmp_path / "test.db"))
+        store.save_chunk(make_chunk("c1"))
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        times = [start + timedelta(minutes=15 * i) for i in range(40)]
+
+        for t in times:
+            store.record_access("c1", access_time=t)
+
+        conn = store._get_connection()
+        row = conn.execute(
+            "SELECT * FROM activations WHERE chunk_id = ?",
+            ("c1",),
+        ).fetchone()
+        assert len(json.loads(row["recent_accesses"])) == 10
+        assert row["history_count"] == 40
+        assert row["first_access_at"] == times[0].timestamp()
+        # Every access is still kept in the append-only log
+        assert len(store.get_access_history("c1")) == 40
+
+        exact = calculate_bla(
+            [AccessHistoryEntry(timestamp=t) for t in times],
+            current_time=times[-1],
+        )
+        assert row["base_level"] == pytest.approx(exact, abs=0.05)
+
+    def test_seeded_activation_starts_history(self, tmp_path):
+        store = SQLiteStore(str(tmp_path / "test.db"))
+        store.save_chunks_bulk([make_chunk("c1")], initial_activations={"c1": (2.0, 12)})
+
+        store.record_access("c1")
+
+        stats = store.get_access_stats("c1")
+        assert stats["access_count"] == 13
+        assert len(store.get_access_history("c1")) == 1
+
+
+class TestRecordAccessBatch:
+    """Tests for SQLiteStore.record_access_batch()."""
+
+    def test_matches_sequential_record_access(self, tmp_path):
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        accesses = [
+            ("c1", start, "q1"),
+            ("c2", start, "q1"),
+            ("c1", start + timedelta(minutes=5), "q2"),
+            ("c1", start + timedelta(minutes=9), "q3"),
+        ]
+        sequential = SQLiteStore(str(tmp_path / "sequential.db"))
+        batched = SQLiteStore(str(tmp_path / "batched.db"))
+        for store in (sequential, batched):
+            store.save_chunk(make_chunk("c1", "a"))
+            store.save_chunk(make_chunk("c2", "b"))
+        for chunk_id, access_time, context in accesses:
+            sequential.record_access(chunk_id, access_time, context)
+
+        recorded = batched.record_access_batch(accesses)
+
+        assert recorded == 4
+        query = "SELECT * FROM activations ORDER BY chunk_id"
+        expected = [dict(row) for row in sequential._get_connection().execute(query)]
+        actual = [dict(row) for row in batched._get_connection().execute(query)]
+        for want, got in zip(expected, actual, strict=True):
+            assert got["base_level"] == pytest.approx(want["base_level"])
+            assert got["access_count"] == want["access_count"]
+            assert got["history_count"] == want["history_count"]
+            assert got["recent_accesses"] == want["recent_accesses"]
+        assert batched.get_access_history("c1") == sequential.get_access_history("c1")
+
+    def test_skips_missing_chunks(self, tmp_path):
+        store = SQLiteStore(str(tmp_path / "test.db"))
+        store.save_chunk(make_chunk("c1"))
+        now = datetime.now(timezone.utc)
+
+        recorded = store.record_access_batch([("c1", now, None), ("gone", now, None)])
+
+        assert recorded == 1
+        assert store.get_access_stats("c1")["access_count"] == 1
+
+    def test_empty_batch(self, tmp_path):
+        store = SQLiteStore(str(tmp_path / "test.db"))
+
+        assert store.record_access_batch([]) == 0
+
+
 class TestGetAccessHistory:
     """Tests for SQLiteStore.get_access_history()."""
 
@@ -321,6 +409,75 @@ class TestSaveDocChunk:
             store.save_doc_chunk(code_chunk)
 
 
+class TestSaveDocChunksBulk:
+    """Tests for SQLiteStore.save_doc_chunks_bulk()."""
+
+    def _make_doc_chunks(self) -> list[DocChunk]:
+        parent = DocChunk(
+            chunk_id="doc:guide:ch1",
+            file_path="/docs/guide.docx",
+            page_start=1,
+            page_end=4,
+            element_type="section",
+            name="Chapter 1",
+            content="Overview",
+            section_path=["Chapter 1"],
+            section_level=1,
+            document_type="docx",
+        )
+        children = [
+            DocChunk(
+                chunk_id=f"doc:guide:ch1.{i}",
+                file_path="/docs/guide.docx",
+                page_start=i,
+                page_end=i,
+                element_type="section",
+                name=f"1.{i} Topic",
+                content=f"Topic {i} details",
+                parent_chunk_id="doc:guide:ch1",
+                section_path=["Chapter 1", f"1.{i} Topic"],
+                section_level=2,
+                document_type="docx",
+            )
+            for i in range(1, 4)
+        ]
+        return [parent, *children]
+
+    def test_matches_sequential_save_doc_chunk(self, tmp_path):
+        bulk_store = SQLiteStore(str(tmp_path / "bulk.db"))
+        seq_store = SQLiteStore(str(tmp_path / "seq.db"))
+        chunks = self._make_doc_chunks()
+
+        assert bulk_store.save_doc_chunks_bulk(chunks) == 4
+        for chunk in chunks:
+            seq_store.save_doc_chunk(chunk)
+
+        query = (
+            "SELECT chunk_id, parent_chunk_id, section_path, section_level, document_type "
+            "FROM doc_hierarchy ORDER BY chunk_id"
+        )
+        bulk_rows = [tuple(row) for row in bulk_store._get_connection().execute(query)]
+        seq_rows = [tuple(row) for row in seq_store._get_connection().execute(query)]
+        assert bulk_rows == seq_rows
+        assert len(bulk_rows) == 4
+        assert bulk_store.get_chunk("doc:guide:ch1.2").section_path == ["Chapter 1", "1.2 Topic"]
+
+    def test_empty_batch(self, tmp_path):
+        store = SQLiteStore(str(tmp_path / "test.db"))
+
+        assert store.save_doc_chunks_bulk([]) == 0
+
+    def test_rejects_non_doc_chunk_without_writing(self, tmp_path):
+        from aurora_core.exceptions import ValidationError
+
+        store = SQLiteStore(str(tmp_path / "test.db"))
+        chunks = [*self._make_doc_chunks(), make_chunk("c1")]
+
+        with pytest.raises(ValidationError):
+            store.save_doc_chunks_bulk(chunks)
+        assert store.get_chunk("doc:guide:ch1") is None
+
+
 class TestSchemaDetection:
     """Tests for schema version detection."""
 
@@ -374,3 +531,75 @@ class TestSchemaDetection:
         store.save_chunk(make_chunk("c1"))
         retrieved = store.get_chunk("c1")
         assert retrieved is not None
+
+
+class TestAccessLogMigration:
+    """Tests for moving pre-v9 JSON access histories into the access log."""
+
+    def test_json_history_moved_to_access_log(self, tmp_path):
+        db_path = str(tmp_path / "test.db")
+        store = SQLiteStore(db_path)
+        store.save_chunk(make_chunk("c1"))
+        t1 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        t2 = datetime(2026, 1, 2, tzinfo=timezone.utc)
+
+        # Rewrite the database into the v8 layout with a JSON history
+        conn = store._get_connection()
+        for column in ("recent_accesses", "history_count", "first_access_at"):
+            conn.execute(f"ALTER TABLE activations DROP COLUMN {column}")
+        conn.execute("ALTER TABLE activations ADD COLUMN access_history JSON")
+        conn.execute("DROP TABLE access_log")
+        conn.execute("DELETE FROM schema_version")
+        conn.execute("INSERT INTO schema_version (version) VALUES (8)")
+        history = [
+            {"timestamp": t1.isoformat(), "context": "first"},
+            {"timestamp": t2.isoformat(), "context": None},
+        ]
+        conn.execute(
+            "UPDATE activations SET access_count = 2, access_history = ? WHERE chunk_id = 'c1'",
+            (json.dumps(history),),
+        )
+        conn.commit()
+        store.close()
+
+        store = SQLiteStore(db_path)
+
+        migrated = store.get_access_history("c1")
+        assert [entry["timestamp"] for entry in migrated] == [t2.isoformat(), t1.isoformat()]
+        assert migrated[1]["context"] == "first"
+        row = store._get_connection().execute(
+            "SELECT * FROM activations WHERE chunk_id = 'c1'",
+        ).fetchone()
+        assert row["history_count"] == 2
+        assert row["first_access_at"] == t1.timestamp()
+        assert row["access_history"] is None
+
+        store.record_access("c1", access_time=t2 + timedelta(hours=1))
+        assert len(store.get_access_history("c1")) == 3
+
+    def test_interrupted_migration_is_retried(self, tmp_path):
+        db_path = str(tmp_path / "test.db")
+        store = SQLiteStore(db_path)
+        store.save_chunk(make_chunk("c1"))
+        t1 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        # Summary columns were added but the copy never committed
+        conn = store._get_connection()
+        conn.execute("ALTER TABLE activations ADD COLUMN access_history JSON")
+        conn.execute(
+            "UPDATE activations SET access_count = 1, access_history = ? WHERE chunk_id = 'c1'",
+            (json.dumps([{"timestamp": t1.isoformat(), "context": None}]),),
+        )
+        conn.commit()
+        store.close()
+
+        store = SQLiteStore(db_path)
+
+        assert [entry["timestamp"] for entry in store.get_access_history("c1")] == [
+            t1.isoformat(),
+        ]
+        row = store._get_connection().execute(
+            "SELECT history_count, access_history FROM activations WHERE chunk_id = 'c1'",
+        ).fetchone()
+        assert row["history_count"] == 1
+        assert row["access_history"] is None
@@ -242,3 +242,133 @@ class TestFTS5Update:
         old_results = store.retrieve_by_fts("authentication", limit=10)
         matching = [c for c in old_results if c.id == "code:test.py:myfunc"]
         assert len(matching) == 0
+
+
+class TestFTS5IdentifierSubtokens:
+    """Test that camelCase, snake_case and dotted sub-identifiers match."""
+
+    @pytest.mark.parametrize(
+        "query",
+        ["user data", "getUserData", "fetch user", "http request", "HTTPRequest", "HTTP"],
+    )
+    def test_camel_case_parts_match(self, tmp_path, query):
+        """Words inside camelCase and acronym identifiers are searchable."""
+        store = SQLiteStore(str(tmp_path / "test.db"))
+        store.save_chunk(
+            _make_code_chunk(
+                "code:api.py:getUserData",
+                "getUserData",
+                "def getUserData(req: HTTPRequest):",
+                "Fetch a profile.",
+                "/test/src/api.py",
+            )
+        )
+        store.save_chunk(
+            _make_code_chunk(
+                "code:other.py:render",
+                "render",
+                "def render():",
+                "Render a template.",
+                "/test/src/other.py",
+            )
+        )
+
+        results = store.retrieve_by_fts(query, limit=10)
+        assert [c.id for c in results] == ["code:api.py:getUserData"]
+
+    @pytest.mark.parametrize("query", ["user_manager", "auth.oauth", "oauthClient"])
+    def test_compound_query_matches_parts(self, tmp_path, query):
+        """Compound query tokens also match chunks containing only one part."""
+        store = SQLiteStore(str(tmp_path / "test.db"))
+        store.save_chunk(
+            _make_code_chunk(
+                "code:auth.py:oauth",
+                "oauth",
+                "def oauth():",
+                "Log in with a user's token.",
+                "/test/src/auth.py",
+            )
+        )
+        store.save_chunk(
+            _make_code_chunk(
+                "code:users.py:manager",
+                "manager",
+                "def manager():",
+                "Manage accounts.",
+                "/test/src/users.py",
+            )
+        )
+
+        assert store.retrieve_by_fts(query, limit=10)
+
+    def test_escape_expands_identifiers(self):
+        """Query tokens are quoted and expanded into their parts once each."""
+        escaped = SQLiteStore._escape_fts_query("getUserData get_user")
+
+        assert escaped == '"getUserData" OR "get" OR "user" OR "data" OR "get_user"'
+
+    def test_pre_v10_fts_table_is_rebuilt(self, tmp_path):
+        """Opening a database whose FTS5 table lacks subtokens rebuilds it."""
+        db_path = str(tmp_path / "test.db")
+        store = SQLiteStore(db_path)
+        store.save_chunk(
+            _make_code_chunk(
+                "code:api.py:parseJsonBody",
+                "parseJsonBody",
+                "def parseJsonBody():",
+                "Decode a request.",
+                "/test/src/api.py",
+            )
+        )
+        conn = store._get_connection()
+        conn.execute("DROP TABLE chunks_fts")
+        conn.execute(
+            "CREATE VIRTUAL TABLE chunks_fts USING fts5(chunk_id UNINDEXED, "
+            "chunk_type UNINDEXED, name, body, file_path, tokenize='porter unicode61')"
+        )
+        conn.execute("DELETE FROM schema_version")
+        conn.execute("INSERT INTO schema_version (version) VALUES (9)")
+        conn.commit()
+        store.close()
+
+        reopened = SQLiteStore(db_path)
+
+        results = reopened.retrieve_by_fts("json body", limit=10)
+        assert [c.id for c in results] == ["code:api.py:parseJsonBody"]
+
+
+class TestFTS5CandidateRows:
+    """Test retrieve_fts_candidates() lightweight rows."""
+
+    def test_rows_match_retrieve_by_fts(self, tmp_path):
+        """Candidate rows carry the same ids, order, rank and embeddings."""
+        from aurora_core.store.sqlite import CandidateRow
+
+        store = SQLiteStore(str(tmp_path / "test.db"))
+        for i, doc in enumerate(["token refresh", "refresh token cache", "render page"]):
+            chunk = _make_code_chunk(
+                f"code:m{i}.py:f{i}", f"f{i}", f"def f{i}():", doc, f"/test/m{i}.py"
+            )
+            chunk.embeddings = bytes([i]) * 16
+            store.save_chunk(chunk)
+
+        chunks = store.retrieve_by_fts("refresh token", limit=10)
+        rows = store.retrieve_fts_candidates("refresh token", limit=10)
+
+        assert all(isinstance(row, CandidateRow) for row in rows)
+        assert [r.id for r in rows] == [c.id for c in chunks]
+        assert [r.fts_rank for r in rows] == [c.fts_rank for c in chunks]
+        assert [r.embeddings for r in rows] == [c.embeddings for c in chunks]
+        assert {r.type for r in rows} == {"code"}
+        assert all(r.activation == 0.0 for r in rows)
+
+    def test_without_embeddings_and_empty_query(self, tmp_path):
+        store = SQLiteStore(str(tmp_path / "test.db"))
+        chunk = _make_code_chunk("code:a.py:f", "f", "def f():", "refresh", "/test/a.py")
+        chunk.embeddings = b"\x00" * 16
+        store.save_chunk(chunk)
+
+        rows = store.retrieve_fts_candidates("refresh", include_embeddings=False)
+
+        assert [(r.id, r.embeddings) for r in rows] == [("code:a.py:f", None)]
+        assert store.retrieve_fts_candidates("   ") == []
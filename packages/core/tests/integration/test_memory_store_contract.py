@@ -118,6 +118,24 @@ class TestStoreContractSaveAndRetrieve:
         assert retrieved.language == original.language
 
 
+    def test_save_chunks_bulk_returns_count(self, store):
+        """Contract: save_chunks_bulk must save every chunk and return the count."""
+        chunks = [
+            CodeChunk(
+                chunk_id=f"code:test.py:func{i}",
+                file_path="/test.py",
+                element_type="function",
+                name=f"func{i}",
+                line_start=1,
+                line_end=5,
+            )
+            for i in range(3)
+        ]
+        assert store.save_chunks_bulk(chunks, {"code:test.py:func0": (0.5, 2)}) == 3
+        for chunk in chunks:
+            assert store.get_chunk(chunk.id) is not None
+
+
 class TestStoreContractActivation:
     """Contract tests for activation-related methods."""
 
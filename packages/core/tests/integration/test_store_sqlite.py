@@ -13,6 +13,7 @@ from pathlib import Path
 import pytest
 
 from aurora_core.chunks.code_chunk import CodeChunk
+from aurora_core.chunks.doc_chunk import DocChunk
 from aurora_core.exceptions import ValidationError
 from aurora_core.store.sqlite import SQLiteStore
 from aurora_core.types import ChunkID
@@ -406,4 +407,196 @@ class TestSQLiteStore(StoreContractTests):
         assert chunk1_retrieved.embeddings == chunk1.embeddings, "Embeddings should be preserved"
 
 
+    def test_save_chunks_bulk_populates_all_tables(self, store):
+        """Test that save_chunks_bulk writes chunks, activations and FTS5 rows."""
+        chunks = [create_test_code_chunk(f"test:chunk:{i}", f"bulk_func{i}") for i in range(5)]
+
+        written = store.save_chunks_bulk(chunks, {"test:chunk:1": (0.75, 3)})
+
+        assert written == 5
+        conn = store._get_connection()
+        assert conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0] == 5
+        rows = {
+            row[0]: (row[1], row[2])
+            for row in conn.execute("SELECT chunk_id, base_level, access_count FROM activations")
+        }
+        assert rows["test:chunk:1"] == (0.75, 3), "Initial activation should be applied"
+        assert rows["test:chunk:0"] == (0.0, 0), "Other chunks get default activation"
+        assert store.retrieve_by_fts("bulk_func3", limit=5)[0].id == "test:chunk:3"
+
+    def test_save_chunks_bulk_replaces_existing(self, store):
+        """Test that re-saving in bulk keeps a single FTS5 row per chunk."""
+        store.save_chunk(create_test_code_chunk("test:chunk:1", "old_name"))
+
+        store.save_chunks_bulk(
+            [
+                create_test_code_chunk("test:chunk:1", "first_name"),
+                create_test_code_chunk("test:chunk:1", "new_name"),
+            ]
+        )
+
+        conn = store._get_connection()
+        fts_rows = conn.execute(
+            "SELECT name FROM chunks_fts WHERE chunk_id = ?", ("test:chunk:1",)
+        ).fetchall()
+        assert [row[0] for row in fts_rows] == ["new_name"], "Last duplicate in the batch should win"
+
+    def test_save_chunks_bulk_validation_is_atomic(self, store):
+        """Test that one invalid chunk prevents the whole batch from being written."""
+        invalid = create_test_code_chunk("test:chunk:2", "bad")
+        invalid.line_end = 0
+
+        with pytest.raises(ValidationError):
+            store.save_chunks_bulk([create_test_code_chunk("test:chunk:1"), invalid])
+
+        conn = store._get_connection()
+        assert conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0] == 0
+
+    def test_delete_doc_chunks_keeps_current_chunks(self, store):
+        """Test that delete_doc_chunks removes only the document's stale chunks."""
+        store.save_doc_chunks_bulk(
+            [
+                DocChunk(chunk_id=f"doc:{i}", file_path="/docs/a.pdf", name=f"Section {i}")
+                for i in range(3)
+            ]
+            + [DocChunk(chunk_id="doc:other", file_path="/docs/b.pdf", name="Other")]
+        )
+
+        removed = store.delete_doc_chunks("/docs/a.pdf", keep_ids={"doc:0"})
+
+        assert removed == 2
+        conn = store._get_connection()
+        remaining = {row[0] for row in conn.execute("SELECT id FROM chunks")}
+        assert remaining == {"doc:0", "doc:other"}
+        hierarchy = {row[0] for row in conn.execute("SELECT chunk_id FROM doc_hierarchy")}
+        assert hierarchy == remaining
+        fts = {row[0] for row in conn.execute("SELECT chunk_id FROM chunks_fts")}
+        assert fts == remaining
+        assert store.delete_doc_chunks("/docs/a.pdf", keep_ids={"doc:0"}) == 0
+
+    def test_delete_doc_chunks_uses_file_path_index(self, store):
+        """Test that the document chunk lookup does not scan the chunks table."""
+        conn = store._get_connection()
+        plan = conn.execute(
+            """EXPLAIN QUERY PLAN SELECT id FROM chunks
+               WHERE type = 'doc' AND json_extract(content, '$.file_path') = ?""",
+            ("/docs/a.pdf",),
+        ).fetchall()
+
+        assert "idx_chunks_doc_file" in " ".join(row[-1] for row in plan)
+
+    def test_file_index_round_trip(self, store):
+        """Test saving, filtering, touching and deleting file_index records."""
+        store.save_file_index(
+            {
+                "/docs/a.pdf": {"hash": "aaa", "mtime": 1.0, "chunk_count": 3},
+                "/src/b.py": {"hash": "bbb", "mtime": 2.0},
+            }
+        )
+        store.update_file_index_mtimes({"/docs/a.pdf": 5.0})
+
+        assert store.load_file_index(("pdf", "docx")) == {
+            "/docs/a.pdf": {"hash": "aaa", "mtime": 5.0, "chunk_count": 3},
+        }
+        assert store.load_file_index()["/src/b.py"]["chunk_count"] == 0
+        assert store.delete_file_index(["/docs/a.pdf", "/docs/missing.pdf"]) == 1
+        assert set(store.load_file_index()) == {"/src/b.py"}
+
+    def test_add_relationships_bulk_skips_missing_and_duplicates(self, store):
+        """Test that bulk edges to unknown chunks and repeated edges are not written."""
+        store.save_chunks_bulk([create_test_code_chunk(f"test:chunk:{i}") for i in range(3)])
+
+        added = store.add_relationships_bulk(
+            [
+                ("test:chunk:0", "test:chunk:1", "calls", 1.0),
+                ("test:chunk:0", "test:chunk:1", "calls", 1.0),
+                ("test:chunk:1", "test:chunk:2", "contains", 0.5),
+                ("test:chunk:1", "test:chunk:missing", "calls", 1.0),
+            ],
+        )
+
+        assert added == 2
+        conn = store._get_connection()
+        assert conn.execute("SELECT COUNT(*) FROM relationships").fetchone()[0] == 2
+
+    def test_get_relationships_expands_both_directions(self, store):
+        """Test that edges are collected hop by hop along incoming and outgoing edges."""
+        store.save_chunks_bulk([create_test_code_chunk(f"test:chunk:{i}") for i in range(4)])
+        store.add_relationships_bulk(
+            [
+                ("test:chunk:0", "test:chunk:1", "calls", 1.0),
+                ("test:chunk:2", "test:chunk:1", "calls", 1.0),
+                ("test:chunk:3", "test:chunk:2", "imports", 0.5),
+            ],
+        )
+
+        one_hop = store.get_relationships(["test:chunk:1"], max_hops=1)
+        two_hops = store.get_relationships(["test:chunk:1"], max_hops=2)
+
+        assert {(f, t) for f, t, _, _ in one_hop} == {
+            ("test:chunk:0", "test:chunk:1"),
+            ("test:chunk:2", "test:chunk:1"),
+        }
+        assert ("test:chunk:3", "test:chunk:2", "imports", 0.5) in two_hops
+        assert len(two_hops) == 3
+        assert len(store.get_relationships(["test:chunk:1"], max_hops=2, limit=2)) == 2
+
+    def test_link_symbol_references_survives_resave(self, store):
+        """Test that import edges are restored for re-saved chunks in both directions."""
+
+        def chunk(chunk_id, name, file_path, dependencies=None):
+            return CodeChunk(
+                chunk_id=chunk_id,
+                file_path=file_path,
+                element_type="function",
+                name=name,
+                line_start=1,
+                line_end=5,
+                dependencies=dependencies,
+            )
+
+        helper = chunk("code:helper", "helper", "/repo/util.py")
+        caller = chunk("code:caller", "caller", "/repo/app.py", ["import:helper", "import:os"])
+        store.save_chunks_bulk([helper, caller])
+
+        assert store.link_symbol_references(["code:helper", "code:caller"]) == 1
+
+        # Re-indexing util.py replaces helper, dropping the edge from app.py
+        store.save_chunks_bulk([helper])
+        conn = store._get_connection()
+        assert conn.execute("SELECT COUNT(*) FROM relationships").fetchone()[0] == 0
+
+        # Linking only the changed file's chunks restores the incoming edge
+        assert store.link_symbol_references(["code:helper"]) == 1
+        assert store.get_relationships(["code:helper"]) == [
+            ("code:caller", "code:helper", "imports", 1.0),
+        ]
+
+    def test_link_symbol_references_splits_and_skips_ambiguous_names(self, store):
+        """Test weights for names with several definitions and the ambiguity cap."""
+        defs = [
+            CodeChunk(f"code:run{i}", f"/repo/m{i}.py", "function", "run", 1, 2) for i in range(4)
+        ]
+        defs += [
+            CodeChunk(f"code:load{i}", f"/repo/m{i}.py", "function", "load", 3, 4) for i in range(2)
+        ]
+        user = CodeChunk(
+            "code:user",
+            "/repo/main.py",
+            "function",
+            "main",
+            1,
+            9,
+            dependencies=["import:run", "import:load"],
+        )
+        store.save_chunks_bulk([*defs, user])
+
+        assert store.link_symbol_references(["code:user"], max_targets=3) == 2
+        edges = store.get_relationships(["code:user"])
+        assert sorted(edges) == [
+            ("code:user", "code:load0", "imports", 0.5),
+            ("code:user", "code:load1", "imports", 0.5),
+        ]
+
+
 __all__ = ["TestSQLiteStore"]
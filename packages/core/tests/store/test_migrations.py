@@ -17,10 +17,16 @@ from datetime import datetime, timezone
 from pathlib import Path
 from unittest import mock
 
+import numpy as np
 import pytest
 
 from aurora_core.exceptions import StorageError
-from aurora_core.store.migrations import Migration, MigrationManager, get_migration_manager
+from aurora_core.store.migrations import (
+    Migration,
+    MigrationManager,
+    get_migration_manager,
+    migrate_embedding_format,
+)
 
 
 class TestMigration:
@@ -767,3 +773,83 @@ class TestMigrationV2ToV3:
         assert embeddings_count == 1, "embeddings column should only exist once"
 
         conn.close()
+
+
+class TestEmbeddingFormatMigration:
+    """Test re-encoding stored embeddings with migrate_embedding_format()."""
+
+    def _store(self, tmp_path, count=20):
+        from aurora_core.chunks import CodeChunk
+        from aurora_core.store.sqlite import SQLiteStore
+
+        store = SQLiteStore(str(tmp_path / "embeddings.db"))
+        rng = np.random.default_rng(0)
+        for i in range(count):
+            chunk = CodeChunk(
+                chunk_id=f"code:mod.py:fn{i}",
+                name=f"fn{i}",
+                element_type="function",
+                signature=f"def fn{i}():",
+                docstring=None,
+                file_path="/test/mod.py",
+                line_start=1,
+                line_end=2,
+                language="python",
+            )
+            chunk.embeddings = rng.standard_normal(32).astype(np.float32).tobytes()
+            store.save_chunk(chunk)
+        return store
+
+    def test_converts_all_embeddings(self, tmp_path):
+        from aurora_core.store.quantization import stored_format
+
+        store = self._store(tmp_path)
+        conn = store._get_connection()
+
+        assert migrate_embedding_format(conn, "int8", batch_size=7) == 20
+
+        blobs = [row[0] for row in conn.execute("SELECT embeddings FROM chunks")]
+        assert {stored_format(blob) for blob in blobs} == {"int8"}
+        store.close()
+
+    def test_rerun_is_noop(self, tmp_path):
+        store = self._store(tmp_path)
+        conn = store._get_connection()
+
+        migrate_embedding_format(conn, "float16")
+        assert migrate_embedding_format(conn, "float16") == 0
+        store.close()
+
+    def test_keeps_vector_index_assignments(self, tmp_path):
+        store = self._store(tmp_path)
+        conn = store._get_connection()
+        conn.execute("UPDATE vector_index SET list_id = rowid % 4")
+        conn.commit()
+        before = {tuple(row) for row in conn.execute("SELECT chunk_id, list_id FROM vector_index")}
+
+        migrate_embedding_format(conn, "int8")
+
+        after = {tuple(row) for row in conn.execute("SELECT chunk_id, list_id FROM vector_index")}
+        assert after == before
+        assert min(list_id for _, list_id in after) >= 0
+        store.close()
+
+    def test_unknown_format(self, tmp_path):
+        store = self._store(tmp_path, count=1)
+        with pytest.raises(ValueError):
+            migrate_embedding_format(store._get_connection(), "int4")
+        store.close()
+
+    def test_store_converts_to_configured_format(self, tmp_path):
+        from aurora_core.store.quantization import stored_format
+        from aurora_core.store.sqlite import SQLiteStore
+
+        self._store(tmp_path).close()
+        store = SQLiteStore(str(tmp_path / "embeddings.db"), embedding_format="float16")
+
+        assert store.convert_embeddings() == 20
+        assert store.convert_embeddings() == 0
+        assert store.convert_embeddings("int8") == 20
+        blobs = [row[0] for row in store._get_connection().execute("SELECT embeddings FROM chunks")]
+        assert {stored_format(blob) for blob in blobs} == {"int8"}
+        store.close()
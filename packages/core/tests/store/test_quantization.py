@@ -0,0 +1,145 @@
+"""Tests for quantized embedding storage formats."""
+
+import numpy as np
+import pytest
+
+from aurora_core.chunks import CodeChunk
+from aurora_core.store.quantization import (
+    EMBEDDING_FORMATS,
+    decode_embedding,
+    decode_embedding_matrix,
+    encode_embedding,
+    encoded_size,
+    self_describing,
+    stored_format,
+)
+from aurora_core.store.sqlite import SQLiteStore
+
+
+@pytest.fixture
+def vector():
+    return np.random.default_rng(7).standard_normal(384).astype(np.float32)
+
+
+class TestEncodeDecode:
+    """Round trips and format tags."""
+
+    @pytest.mark.parametrize(
+        ("fmt", "size", "tolerance"),
+        [("float32", 1536, 0.0), ("float16", 772, 2e-3), ("int8", 392, 2e-2)],
+    )
+    def test_round_trip(self, vector, fmt, size, tolerance):
+        blob = encode_embedding(vector, fmt)
+
+        assert len(blob) == size == encoded_size(fmt, 384)
+        assert stored_format(blob) == fmt
+        assert np.abs(decode_embedding(blob) - vector).max() <= tolerance
+
+    def test_float32_stays_untagged(self, vector):
+        blob = encode_embedding(vector)
+        assert blob == vector.tobytes()
+        assert not self_describing(blob)
+
+    def test_tag_reads_as_nan(self, vector):
+        for fmt in ("float16", "int8"):
+            header = np.frombuffer(encode_embedding(vector, fmt)[:4], dtype=np.float32)
+            assert np.isnan(header[0])
+
+    def test_encoded_blobs_pass_through(self, vector):
+        int8_blob = encode_embedding(vector, "int8")
+        assert encode_embedding(int8_blob, "float16") == int8_blob
+        assert encode_embedding(vector.tobytes(), "int8") == int8_blob
+
+    def test_int8_zero_vector(self):
+        zero = np.zeros(8, dtype=np.float32)
+        assert decode_embedding(encode_embedding(zero, "int8")).tolist() == [0.0] * 8
+
+    def test_unknown_format(self, vector):
+        with pytest.raises(ValueError, match="Unknown embedding format"):
+            encode_embedding(vector, "int4")
+
+
+class TestDecodeMatrix:
+    """Batch decoding of mixed formats."""
+
+    def test_mixed_formats_keep_order(self):
+        vectors = np.random.default_rng(3).standard_normal((9, 16)).astype(np.float32)
+        blobs = [
+            encode_embedding(vec, EMBEDDING_FORMATS[i % 3]) for i, vec in enumerate(vectors)
+        ]
+
+        matrix, mask = decode_embedding_matrix(blobs, 16)
+
+        assert mask.all()
+        assert np.abs(matrix - vectors).max() < 0.05
+        assert np.array_equal(matrix[::3], vectors[::3])
+
+    def test_missing_and_mismatched_are_masked(self, vector):
+        blobs = [
+            encode_embedding(vector, "int8"),
+            None,
+            encode_embedding(vector[:100], "float16"),
+            vector.tobytes(),
+        ]
+
+        matrix, mask = decode_embedding_matrix(blobs, 384)
+
+        assert mask.tolist() == [True, False, False, True]
+        assert matrix.shape == (2, 384)
+        assert np.array_equal(matrix[1], vector)
+
+
+class TestRecall:
+    """Quantization barely changes nearest-neighbour results."""
+
+    @pytest.mark.parametrize(("fmt", "min_recall"), [("float16", 0.99), ("int8", 0.95)])
+    def test_recall_at_10_against_float32(self, fmt, min_recall):
+        rng = np.random.default_rng(0)
+        centers = rng.standard_normal((50, 384)).astype(np.float32)
+        corpus = centers[rng.integers(0, 50, 2000)]
+        corpus += 0.8 * rng.standard_normal(corpus.shape).astype(np.float32)
+        queries = corpus[:100] + 0.3 * rng.standard_normal((100, 384)).astype(np.float32)
+
+        def top10(matrix):
+            unit = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+            return np.argpartition(-(queries @ unit.T), 10, axis=1)[:, :10]
+
+        decoded, _ = decode_embedding_matrix([encode_embedding(v, fmt) for v in corpus], 384)
+        exact, approx = top10(corpus), top10(decoded)
+
+        recall = np.mean([len(set(e) & set(a)) / 10 for e, a in zip(exact, approx)])
+        assert recall >= min_recall
+
+
+class TestStoreEmbeddingFormat:
+    """SQLiteStore writes embeddings in its configured format."""
+
+    def _chunk(self, vector):
+        chunk = CodeChunk(
+            chunk_id="code:mod.py:fn",
+            name="fn",
+            element_type="function",
+            signature="def fn():",
+            docstring=None,
+            file_path="/test/mod.py",
+            line_start=1,
+            line_end=2,
+            language="python",
+        )
+        chunk.embeddings = vector.tobytes()
+        return chunk
+
+    @pytest.mark.parametrize("fmt", EMBEDDING_FORMATS)
+    def test_save_chunk_encodes(self, tmp_path, vector, fmt):
+        store = SQLiteStore(str(tmp_path / "q.db"), embedding_format=fmt)
+        store.save_chunk(self._chunk(vector))
+
+        blob = store.get_chunk("code:mod.py:fn").embeddings
+
+        assert stored_format(blob) == fmt
+        assert len(blob) == encoded_size(fmt, 384)
+        store.close()
+
+    def test_invalid_format_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            SQLiteStore(str(tmp_path / "q.db"), embedding_format="bfloat16")
@@ -13,6 +13,7 @@ Tests the complete ACT-R activation engine including:
 
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
 from aurora_core.activation.base_level import AccessHistoryEntry, BLAConfig
@@ -919,3 +920,77 @@ class TestActivationEngineFormula:
         )
 
         assert components.total == pytest.approx(manual_sum, abs=0.001)
+
+
+class TestCalculateTotalBatch:
+    """Test that the vectorized engine path matches calculate_total()."""
+
+    def _scenarios(self, now):
+        return [
+            # (access_history, last_access, spreading, chunk_keywords)
+            (
+                [AccessHistoryEntry(timestamp=now - timedelta(days=1))],
+                now - timedelta(days=1),
+                0.5,
+                {"database", "query"},
+            ),
+            ([], None, 0.0, set()),
+            (None, now - timedelta(days=30), 0.2, {"database"}),
+            (
+                [AccessHistoryEntry(timestamp=now - timedelta(hours=h)) for h in (1, 5, 48)],
+                now - timedelta(hours=1),
+                0.0,
+                {"cache"},
+            ),
+        ]
+
+    def _batch(self, engine, scenarios, query_keywords, now):
+        histories = [history or [] for history, _, _, _ in scenarios]
+        return engine.calculate_total_batch(
+            access_times=np.array([e.timestamp.timestamp() for h in histories for e in h]),
+            access_offsets=np.cumsum([0] + [len(h) for h in histories]),
+            has_history=np.array([history is not None for history, _, _, _ in scenarios]),
+            last_access=np.array(
+                [t.timestamp() if t is not None else np.nan for _, t, _, _ in scenarios]
+            ),
+            spreading_activation=np.array([spreading for _, _, spreading, _ in scenarios]),
+            query_keywords=query_keywords,
+            chunk_keywords=[keywords for _, _, _, keywords in scenarios],
+            current_time=now,
+        )
+
+    @pytest.mark.parametrize(
+        "config", [DEFAULT_CONFIG, BLA_FOCUSED_CONFIG, ActivationConfig(enable_decay=False)]
+    )
+    def test_matches_scalar_calculation(self, config):
+        engine = ActivationEngine(config)
+        now = datetime.now(timezone.utc)
+        scenarios = self._scenarios(now)
+        query_keywords = {"database", "optimize"}
+
+        batch = self._batch(engine, scenarios, query_keywords, now)
+
+        assert len(batch) == len(scenarios)
+        for i, (history, last_access, spreading, keywords) in enumerate(scenarios):
+            expected = engine.calculate_total(
+                access_history=history,
+                last_access=last_access,
+                spreading_activation=spreading,
+                query_keywords=query_keywords,
+                chunk_keywords=keywords,
+                current_time=now,
+            )
+            actual = batch.components(i)
+            for field in ("bla", "spreading", "context_boost", "decay", "total"):
+                assert getattr(actual, field) == pytest.approx(getattr(expected, field))
+
+    def test_missing_history_gets_no_bla(self):
+        engine = ActivationEngine()
+
+        batch = engine.calculate_total_batch(
+            access_times=np.array([]),
+            access_offsets=np.array([0, 0, 0]),
+            has_history=np.array([True, False]),
+        )
+
+        assert batch.bla.tolist() == [BLAConfig().default_activation, 0.0]
@@ -10,6 +10,7 @@ Tests the ACT-R BLA calculation including:
 import math
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
 from aurora_core.activation.base_level import (
@@ -17,6 +18,7 @@ from aurora_core.activation.base_level import (
     BaseLevelActivation,
     BLAConfig,
     calculate_bla,
+    calculate_bla_hybrid,
 )
 
 
@@ -274,6 +276,73 @@ class TestCalculateBlaFunction:
         assert activation < 0
 
 
+class TestCalculateBlaHybrid:
+    """Test the Petrov hybrid approximation used for incremental updates."""
+
+    def test_exact_when_all_accesses_are_recent(self):
+        """With n == k the approximation is the exact power-law sum."""
+        now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        times = [now - timedelta(hours=h) for h in (1, 5, 30)]
+
+        exact = calculate_bla([AccessHistoryEntry(timestamp=t) for t in times], current_time=now)
+        hybrid = calculate_bla_hybrid(
+            sorted(t.timestamp() for t in times),
+            access_count=3,
+            first_access=min(times).timestamp(),
+            current_time=now.timestamp(),
+        )
+
+        assert hybrid == pytest.approx(exact)
+
+    def test_exact_with_sub_second_lags(self):
+        """Sub-second lags are used as-is and only non-positive ones become 1s."""
+        now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        times = [now - timedelta(milliseconds=ms) for ms in (0, 250, 800)]
+
+        exact = calculate_bla([AccessHistoryEntry(timestamp=t) for t in times], current_time=now)
+        hybrid = calculate_bla_hybrid(
+            sorted(t.timestamp() for t in times),
+            access_count=3,
+            first_access=min(times).timestamp(),
+            current_time=now.timestamp(),
+        )
+
+        assert hybrid == pytest.approx(exact)
+
+    def test_approximates_evenly_spread_old_accesses(self):
+        """Older accesses summarized by count stay close to the exact value."""
+        now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        times = [now - timedelta(hours=h) for h in range(1, 201)]
+        epochs = sorted(t.timestamp() for t in times)
+
+        exact = calculate_bla([AccessHistoryEntry(timestamp=t) for t in times], current_time=now)
+        hybrid = calculate_bla_hybrid(
+            epochs[-10:],
+            access_count=len(epochs),
+            first_access=epochs[0],
+            current_time=now.timestamp(),
+        )
+
+        assert hybrid == pytest.approx(exact, abs=0.05)
+
+    @pytest.mark.parametrize("decay_rate", [0.0, 0.5, 1.0])
+    def test_supports_full_decay_range(self, decay_rate):
+        """The closed form handles d = 1 (logarithmic integral) and d = 0."""
+        activation = calculate_bla_hybrid(
+            [900.0, 990.0],
+            access_count=20,
+            first_access=0.0,
+            current_time=1000.0,
+            decay_rate=decay_rate,
+        )
+
+        assert math.isfinite(activation)
+
+    def test_no_accesses_returns_default(self):
+        """Empty summaries fall back to the default activation."""
+        assert calculate_bla_hybrid([], 0, 0.0, 100.0) == -5.0
+
+
 class TestACTRFormula:
     """Test that implementation matches ACT-R literature."""
 
@@ -359,5 +428,42 @@ class TestACTRFormula:
         assert activation_recent > activation_old
 
 
+class TestCalculateBatch:
+    """Test vectorized BLA over a flat array of access timestamps."""
+
+    def test_matches_scalar_calculation(self):
+        bla = BaseLevelActivation()
+        now = datetime.now(timezone.utc)
+        histories = [
+            [AccessHistoryEntry(timestamp=now - timedelta(days=d)) for d in range(1, 6)],
+            [],
+            [AccessHistoryEntry(timestamp=now - timedelta(hours=1))],
+            [AccessHistoryEntry(timestamp=now + timedelta(minutes=5))],  # future access
+            [AccessHistoryEntry(timestamp=now - timedelta(days=3650))],
+        ]
+        access_times = np.array(
+            [entry.timestamp.timestamp() for history in histories for entry in history]
+        )
+        access_offsets = np.cumsum([0] + [len(history) for history in histories])
+
+        batch = bla.calculate_batch(access_times, access_offsets, now)
+
+        expected = [bla.calculate(history, now) for history in histories]
+        assert batch.tolist() == pytest.approx(expected)
+
+    def test_clamps_to_min_activation(self):
+        bla = BaseLevelActivation(BLAConfig(min_activation=-3.0))
+        now = datetime.now(timezone.utc)
+        old = (now - timedelta(days=3650)).timestamp()
+
+        batch = bla.calculate_batch(np.array([old]), np.array([0, 1]), now)
+
+        assert batch.tolist() == [-3.0]
+
+    def test_empty_candidate_set(self):
+        batch = BaseLevelActivation().calculate_batch(np.array([]), np.array([0]))
+
+        assert batch.shape == (0,)
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
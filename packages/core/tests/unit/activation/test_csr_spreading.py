@@ -0,0 +1,146 @@
+"""Unit tests for the CSR spreading activation engine.
+
+Tests that CSRSpreadingActivation reproduces SpreadingActivation (BFS over
+RelationshipGraph) exactly, including:
+- Multi-hop decay, cycles, parallel and reverse edges
+- Directed vs bidirectional spreading
+- Batched source sets
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from aurora_core.activation.csr_spreading import CSRGraph, CSRSpreadingActivation
+from aurora_core.activation.spreading import (
+    RelationshipGraph,
+    SpreadingActivation,
+    SpreadingConfig,
+)
+
+
+def _random_graph(seed: int, nodes: int = 40, edges: int = 120) -> RelationshipGraph:
+    rng = random.Random(seed)
+    graph = RelationshipGraph()
+    for _ in range(edges):
+        graph.add_relationship(
+            f"n{rng.randrange(nodes)}",
+            f"n{rng.randrange(nodes)}",
+            rng.choice(["calls", "imports", "contains"]),
+            round(rng.uniform(0.0, 1.0), 2),
+        )
+    return graph
+
+
+def _assert_same(actual: dict[str, float], expected: dict[str, float]) -> None:
+    assert set(actual) == set(expected)
+    for chunk_id, score in expected.items():
+        assert actual[chunk_id] == pytest.approx(score)
+
+
+class TestCSRGraph:
+    """Test CSR graph construction."""
+
+    def test_from_edges_builds_rows(self):
+        graph = CSRGraph.from_edges(
+            [("a", "b", "calls", 1.0), ("a", "c", "calls", 0.5)],
+            bidirectional=False,
+        )
+
+        assert graph.ids == ["a", "b", "c"]
+        assert graph.indptr.tolist() == [0, 2, 2, 2]
+        assert graph.indices.tolist() == [1, 2]
+        assert graph.weights.tolist() == [1.0, 0.5]
+
+    def test_parallel_edges_keep_first(self):
+        graph = CSRGraph.from_edges(
+            [("a", "b", "calls", 0.3), ("a", "b", "imports", 0.9), ("b", "a", "calls", 0.6)]
+        )
+
+        # a -> b keeps the first forward edge; b -> a keeps its forward edge
+        assert graph.edge_count() == 2
+        a, b = graph.index["a"], graph.index["b"]
+        assert graph.weights[graph.indptr[a]] == 0.3
+        assert graph.weights[graph.indptr[b]] == 0.6
+
+    def test_min_weight_filters_before_dedup(self):
+        graph = CSRGraph.from_edges(
+            [("a", "b", "calls", 0.05), ("a", "b", "imports", 0.9)],
+            bidirectional=False,
+            min_weight=0.1,
+        )
+
+        assert graph.weights.tolist() == [0.9]
+
+    def test_empty_graph(self):
+        graph = CSRGraph.from_edges([])
+
+        assert graph.node_count() == 0
+        assert CSRSpreadingActivation().calculate(["a"], graph) == {}
+
+    def test_from_index_arrays_matches_from_edges(self):
+        edges = [("a", "b", "calls", 1.0), ("c", "a", "imports", 0.4), ("b", "c", "calls", 0.2)]
+        by_id = CSRGraph.from_edges(edges)
+        by_index = CSRGraph.from_index_arrays(
+            ["a", "b", "c"],
+            np.array([0, 2, 1]),
+            np.array([1, 0, 2]),
+            np.array([1.0, 0.4, 0.2]),
+        )
+
+        assert by_index.indptr.tolist() == by_id.indptr.tolist()
+        assert by_index.indices.tolist() == by_id.indices.tolist()
+        assert by_index.weights.tolist() == by_id.weights.tolist()
+
+
+class TestCSRSpreadingActivation:
+    """Test equivalence with the BFS engine."""
+
+    def test_simple_chain(self):
+        graph = CSRGraph.from_edges([("a", "b", "calls", 1.0), ("b", "c", "calls", 0.8)])
+        engine = CSRSpreadingActivation(SpreadingConfig(max_hops=2))
+
+        result = engine.calculate(["a"], graph)
+
+        assert result["b"] == pytest.approx(0.7)
+        assert result["c"] == pytest.approx(0.8 * 0.7**2)
+        assert "a" not in result
+
+    @pytest.mark.parametrize("seed", range(8))
+    @pytest.mark.parametrize("bidirectional", [True, False])
+    def test_matches_bfs_on_random_graphs(self, seed, bidirectional):
+        config = SpreadingConfig(max_hops=3, max_edges=100_000, min_weight=0.1)
+        rel_graph = _random_graph(seed)
+        csr_graph = CSRGraph.from_relationship_graph(
+            rel_graph, bidirectional=bidirectional, min_weight=config.min_weight
+        )
+        sources = [f"n{i}" for i in random.Random(seed).sample(range(40), 3)]
+
+        expected = SpreadingActivation(config).calculate(sources, rel_graph, bidirectional)
+        actual = CSRSpreadingActivation(config).calculate(sources, csr_graph)
+
+        _assert_same(actual, expected)
+
+    def test_batch_matches_individual_calls(self):
+        config = SpreadingConfig(max_hops=2, max_edges=100_000)
+        rel_graph = _random_graph(42)
+        csr_graph = CSRGraph.from_relationship_graph(rel_graph, min_weight=config.min_weight)
+        source_sets = [["n1"], ["n2", "n3"], [], ["missing"], ["n1", "n5"]]
+
+        batch = CSRSpreadingActivation(config).calculate_batch(source_sets, csr_graph)
+
+        bfs = SpreadingActivation(config)
+        assert len(batch) == len(source_sets)
+        for sources, result in zip(source_sets, batch):
+            _assert_same(result, bfs.calculate(sources, rel_graph))
+
+    def test_calculate_arrays_returns_indices(self):
+        graph = CSRGraph.from_edges([("a", "b", "calls", 1.0)])
+
+        set_ids, nodes, scores = CSRSpreadingActivation().calculate_arrays([["a"], ["b"]], graph)
+
+        assert set_ids.tolist() == [0, 1]
+        assert [graph.ids[i] for i in nodes] == ["b", "a"]
+        assert scores.tolist() == pytest.approx([0.7, 0.7])
+
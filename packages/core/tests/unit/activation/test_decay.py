@@ -15,6 +15,7 @@ Tests the ACT-R decay component including:
 import math
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
 from aurora_core.activation.decay import (
@@ -616,3 +617,29 @@ class TestLogarithmicBehavior:
 
         # Ratio should be 2:1
         assert abs(penalty_100 / penalty_10 - 2.0) < 0.1
+
+
+class TestCalculateBatch:
+    """Test vectorized decay over an array of last-access timestamps."""
+
+    @pytest.mark.parametrize("config", [DecayConfig(), AGGRESSIVE_DECAY, GENTLE_DECAY])
+    def test_matches_scalar_calculation(self, config):
+        calc = DecayCalculator(config)
+        now = datetime.now(timezone.utc)
+        last_accesses = [
+            now - timedelta(minutes=30),
+            now - timedelta(hours=12),
+            now - timedelta(days=3),
+            now - timedelta(days=400),
+            now + timedelta(hours=2),
+        ]
+
+        batch = calc.calculate_batch(np.array([t.timestamp() for t in last_accesses]), now)
+
+        expected = [calc.calculate(t, now) for t in last_accesses]
+        assert batch.tolist() == pytest.approx(expected)
+
+    def test_never_accessed_has_no_penalty(self):
+        batch = DecayCalculator().calculate_batch(np.array([np.nan]))
+
+        assert batch.tolist() == [0.0]
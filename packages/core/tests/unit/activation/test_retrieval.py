@@ -978,3 +978,59 @@ class TestRetrievalEdgeCases:
         # All should have same activation
         assert results[0].activation == pytest.approx(results[1].activation, abs=0.001)
         assert results[1].activation == pytest.approx(results[2].activation, abs=0.001)
+
+
+class TestVectorizedRetrieval:
+    """Test that vectorized retrieval ranks exactly like per-chunk scoring."""
+
+    def test_matches_calculate_total(self):
+        engine = ActivationEngine()
+        retriever = ActivationRetriever(engine, RetrievalConfig(threshold=-100.0, max_results=50))
+        now = datetime.now(timezone.utc)
+        candidates = [
+            MockChunk(
+                ChunkID(f"chunk_{i}"),
+                access_history=[
+                    AccessHistoryEntry(timestamp=now - timedelta(hours=(i + 1) * (j + 1)))
+                    for j in range(i % 4)
+                ],
+                last_access=now - timedelta(hours=i + 1) if i % 3 else None,
+                keywords={"database"} if i % 2 else {"network"},
+            )
+            for i in range(20)
+        ]
+        spreading_scores = {ChunkID("chunk_5"): 0.4, ChunkID("chunk_11"): 0.9}
+
+        results = retriever.retrieve(
+            candidates,
+            query_keywords={"database"},
+            spreading_scores=spreading_scores,
+            current_time=now,
+        )
+
+        expected = sorted(
+            (
+                engine.calculate_total(
+                    access_history=chunk.access_history,
+                    last_access=chunk.last_access,
+                    spreading_activation=spreading_scores.get(chunk.id, 0.0),
+                    query_keywords={"database"},
+                    chunk_keywords=chunk.keywords,
+                    current_time=now,
+                ).total,
+                chunk.id,
+            )
+            for chunk in candidates
+        )
+        assert [r.activation for r in results] == pytest.approx(
+            [total for total, _ in reversed(expected)]
+        )
+        assert [r.rank for r in results] == list(range(1, 21))
+
+    def test_ties_keep_candidate_order(self):
+        retriever = ActivationRetriever(ActivationEngine())
+        candidates = [MockChunk(ChunkID(f"chunk_{i}")) for i in range(5)]
+
+        results = retriever.retrieve(candidates, threshold=-100.0)
+
+        assert [r.chunk_id for r in results] == [c.id for c in candidates]
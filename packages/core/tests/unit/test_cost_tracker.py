@@ -501,3 +501,102 @@ class TestBudgetEnforcement:
         # Should still be within budget
         status = tracker.get_status()
         assert status["at_hard_limit"] is False
+
+
+class TestBudgetLedger:
+    """Test the append-only ledger behind CostTracker."""
+
+    @pytest.fixture
+    def temp_tracker_path(self, tmp_path):
+        """Create temporary tracker path."""
+        return tmp_path / "budget_tracker.json"
+
+    def test_startup_does_not_load_entries(self, temp_tracker_path):
+        """Test that status and budget checks only read the running total."""
+        tracker1 = CostTracker(monthly_limit_usd=100.0, tracker_path=temp_tracker_path)
+        for _ in range(5):
+            tracker1.record_cost("claude-sonnet-4-20250514", 1000, 500, "assess")
+
+        tracker2 = CostTracker(monthly_limit_usd=100.0, tracker_path=temp_tracker_path)
+        tracker2.check_budget(estimated_cost=0.01)
+        status = tracker2.get_status()
+        assert status["total_entries"] == 5
+        assert status["consumed_usd"] == pytest.approx(tracker1.budget.consumed_usd)
+        assert tracker2._entries_loaded is False
+        assert not temp_tracker_path.exists()  # no JSON rewrite
+
+    def test_breakdowns_from_ledger(self, temp_tracker_path):
+        """Test breakdowns after reload without materializing entries."""
+        tracker1 = CostTracker(monthly_limit_usd=100.0, tracker_path=temp_tracker_path)
+        tracker1.record_cost("claude-sonnet-4-20250514", 1000, 500, "assess")
+        tracker1.record_cost("claude-3-5-haiku-20241022", 1000, 500, "assess")
+        tracker1.record_cost("claude-3-5-haiku-20241022", 1000, 500, "verify")
+
+        tracker2 = CostTracker(monthly_limit_usd=100.0, tracker_path=temp_tracker_path)
+        assert tracker2.get_breakdown_by_operation() == pytest.approx(
+            tracker1.get_breakdown_by_operation(),
+        )
+        assert set(tracker2.get_breakdown_by_model()) == {
+            "claude-sonnet-4-20250514",
+            "claude-3-5-haiku-20241022",
+        }
+        assert tracker2._entries_loaded is False
+
+    def test_sees_costs_from_other_trackers(self, temp_tracker_path):
+        """Test that a tracker picks up costs recorded by another process."""
+        tracker1 = CostTracker(monthly_limit_usd=100.0, tracker_path=temp_tracker_path)
+        tracker2 = CostTracker(monthly_limit_usd=100.0, tracker_path=temp_tracker_path)
+
+        cost = tracker1.record_cost("claude-sonnet-4-20250514", 1000, 500, "assess")
+        assert tracker2.get_total_spent() == pytest.approx(cost)
+        assert len(tracker2.budget.entries) == 1
+
+        tracker2.record_cost("claude-sonnet-4-20250514", 1000, 500, "assess")
+        assert tracker2.budget.consumed_usd == pytest.approx(2 * cost)
+
+    def test_concurrent_appends(self, temp_tracker_path):
+        """Test that concurrent writers do not lose entries."""
+        import threading
+
+        trackers = [
+            CostTracker(monthly_limit_usd=100.0, tracker_path=temp_tracker_path) for _ in range(4)
+        ]
+
+        def record(tracker):
+            for _ in range(25):
+                tracker.record_cost("claude-sonnet-4-20250514", 1000, 500, "assess")
+
+        threads = [threading.Thread(target=record, args=(t,)) for t in trackers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        fresh = CostTracker(monthly_limit_usd=100.0, tracker_path=temp_tracker_path)
+        assert len(fresh.budget.entries) == 100
+        assert fresh.budget.consumed_usd == pytest.approx(100 * fresh.budget.entries[0].cost_usd)
+
+    def test_imports_legacy_json(self, temp_tracker_path):
+        """Test one-time import of a JSON tracker from earlier versions."""
+        period = datetime.now().strftime("%Y-%m")
+        entry = {
+            "timestamp": "2026-01-01T00:00:00",
+            "model": "gpt-4",
+            "input_tokens": 10,
+            "output_tokens": 20,
+            "cost_usd": 0.5,
+            "operation": "assess",
+            "query_id": None,
+        }
+        temp_tracker_path.write_text(
+            json.dumps(
+                {"period": period, "limit_usd": 20.0, "consumed_usd": 0.5, "entries": [entry]},
+            ),
+        )
+
+        tracker = CostTracker(monthly_limit_usd=100.0, tracker_path=temp_tracker_path)
+        assert tracker.monthly_limit_usd == 20.0
+        assert tracker.get_total_spent() == 0.5
+        assert tracker.budget.entries[0].model == "gpt-4"
+        assert not temp_tracker_path.exists()
+        assert temp_tracker_path.with_name("budget_tracker.json.migrated").exists()
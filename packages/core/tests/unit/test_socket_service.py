@@ -0,0 +1,118 @@
+"""Unit tests for the Unix socket service helper (aurora_core.socket_service)."""
+
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from aurora_core.socket_service import SocketService, SocketServiceClient, SocketServiceError
+
+
+class EchoService(SocketService):
+    """Echoes requests back; ``wait`` blocks until released."""
+
+    service_name = "Echo service"
+
+    def __init__(self, socket_path, idle_timeout=None):
+        super().__init__(socket_path, idle_timeout)
+        self.release = threading.Event()
+
+    def handle(self, request):
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "requests": self._requests}
+        if op == "echo":
+            return {"ok": True, "value": request["value"]}
+        if op == "wait":
+            self.release.wait(timeout=5)
+            return {"ok": True}
+        if op == "fail":
+            raise ValueError("bad request")
+        if op == "shutdown":
+            self.stop()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 characters, so avoid deep tmp_path dirs
+    directory = Path(tempfile.mkdtemp(prefix="asvc"))
+    yield directory / "service.sock"
+    for leftover in directory.iterdir():
+        leftover.unlink()
+    directory.rmdir()
+
+
+@pytest.fixture
+def service(socket_path):
+    service = EchoService(socket_path)
+    service.start()
+    thread = threading.Thread(target=service.serve_forever, kwargs={"poll_interval": 0.02})
+    thread.start()
+    yield service
+    service.release.set()
+    if socket_path.exists():
+        SocketServiceClient(socket_path, timeout=1.0).shutdown()
+    thread.join(timeout=5)
+
+
+class TestSocketService:
+    """Round trips, errors and socket ownership."""
+
+    def test_round_trip(self, service, socket_path):
+        client = SocketServiceClient(socket_path, timeout=1.0)
+
+        assert client.request("echo", value=[1, "a"])["value"] == [1, "a"]
+        assert client.ping()["requests"] == 2
+
+    def test_errors_raise_client_error(self, service, socket_path):
+        client = SocketServiceClient(socket_path, timeout=1.0)
+
+        with pytest.raises(SocketServiceError, match="ValueError: bad request"):
+            client.request("fail")
+        with pytest.raises(SocketServiceError, match="Unknown op"):
+            client.request("reindex")
+
+    def test_unreachable_names_service(self, socket_path):
+        class EchoClient(SocketServiceClient):
+            service_name = "Echo service"
+
+        with pytest.raises(SocketServiceError, match="Echo service unreachable"):
+            EchoClient(socket_path, timeout=1.0).ping()
+
+    def test_refuses_live_socket_and_replaces_stale_one(self, service, socket_path):
+        with pytest.raises(SocketServiceError, match="already running"):
+            EchoService(socket_path).start()
+
+        stale = socket_path.with_name("stale.sock")
+        stale.touch()
+        replacement = EchoService(stale)
+        replacement.start()
+        assert stale.is_socket()
+        replacement.close()
+        assert not stale.exists()
+
+    def test_idle_timeout_waits_for_in_flight_request(self, socket_path):
+        class ThreadedEcho(EchoService):
+            threaded = True
+
+        service = ThreadedEcho(socket_path, idle_timeout=0.1)
+        service.start()
+        thread = threading.Thread(target=service.serve_forever, kwargs={"poll_interval": 0.02})
+        thread.start()
+
+        waiter = threading.Thread(
+            target=SocketServiceClient(socket_path, timeout=5.0).request, args=("wait",)
+        )
+        waiter.start()
+        thread.join(timeout=0.5)
+        still_serving = thread.is_alive()
+        service.release.set()
+        waiter.join(timeout=5)
+        thread.join(timeout=5)
+
+        assert still_serving
+        assert not thread.is_alive()
+        assert not socket_path.exists()
@@ -5,15 +5,36 @@ Provides:
 - Dead code detection
 - Linting diagnostics
 - Call hierarchy (where supported)
+- A long-lived broker that keeps language servers warm across processes
 
 Built on multilspy (Microsoft) with custom import filtering and analysis layers.
+
+Note: Public classes are imported on first access, so that lightweight modules
+(``aurora_lsp.broker``, ``aurora_lsp.languages``) can be used without loading
+multilspy.
 """
 
-from aurora_lsp.analysis import CodeAnalyzer, SymbolKind
-from aurora_lsp.client import AuroraLSPClient
-from aurora_lsp.diagnostics import DiagnosticsFormatter
-from aurora_lsp.facade import AuroraLSP
-from aurora_lsp.filters import ImportFilter
+from importlib import import_module
+from typing import Any
+
+__version__ = "0.1.0"
+
+_LAZY_ATTRS = {
+    "AuroraLSP": "aurora_lsp.facade",
+    "AuroraLSPClient": "aurora_lsp.client",
+    "CodeAnalyzer": "aurora_lsp.analysis",
+    "DiagnosticsFormatter": "aurora_lsp.diagnostics",
+    "ImportFilter": "aurora_lsp.filters",
+    "SymbolKind": "aurora_lsp.analysis",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import public classes only when accessed."""
+    if name in _LAZY_ATTRS:
+        return getattr(import_module(_LAZY_ATTRS[name]), name)
+    raise AttributeError(f"module 'aurora_lsp' has no attribute {name!r}")
+
 
 __all__ = [
     "AuroraLSP",
@@ -23,5 +44,3 @@ __all__ = [
     "DiagnosticsFormatter",
     "SymbolKind",
 ]
-
-__version__ = "0.1.0"
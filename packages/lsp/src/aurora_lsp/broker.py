@@ -0,0 +1,586 @@
+"""Long-lived LSP broker shared by hooks and the MCP server.
+
+Every pre-edit hook runs in a fresh interpreter, so each ``AuroraLSP`` it
+creates cold-starts a language server and throws away the reference cache
+and open documents when it exits. The broker is a local background process
+that keeps one ``AuroraLSP`` (and therefore one warm server per language)
+per workspace and serves requests over a Unix domain socket, so only the
+first check after a broker start pays for server boot.
+
+Clients never depend on it: ``get_lsp()`` returns a ``BrokeredLSP`` proxy
+when a broker is reachable and an in-process ``AuroraLSP`` otherwise, and a
+proxy whose broker goes away falls back to an in-process instance. Before
+each request the broker re-syncs documents that changed on disk since they
+were opened (see ``AuroraLSP.refresh_changed_files``). The broker exits after
+``idle_timeout`` seconds without requests.
+
+Connections are served concurrently. Workspace-wide scans
+(``BACKGROUND_METHODS``) run on a background worker with its own language
+servers, so a slow dead code scan never holds up the per-symbol requests
+that pre-edit hooks make; those run on the interactive worker.
+
+This module only imports the standard library and ``aurora_core.socket_service``
+at load time, so hooks can talk to a running broker without importing multilspy.
+
+Protocol:
+    One JSON object per line in each direction, one request per connection::
+
+        {"op": "call", "workspace": "/repo", "method": "get_usage_summary",
+         "args": ["src/a.py", 9], "kwargs": {"col": 4}}
+        {"ok": true, "result": {...}}
+
+    Supported ops: ``ping``, ``call`` and ``shutdown``. ``method`` must be one
+    of ``BROKER_METHODS``. Failures are returned as ``{"ok": false, "error": "..."}``.
+
+Usage:
+    python -m aurora_lsp.broker --idle-timeout 900
+
+    >>> lsp = get_lsp(Path.cwd(), spawn=True)  # starts a broker if needed
+    >>> lsp.get_usage_summary("src/main.py", 10, col=4)
+"""
+
+from __future__ import annotations
+
+import argparse
+import builtins
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from aurora_core import socket_service
+from aurora_core.socket_service import SocketService, SocketServiceClient
+
+logger = logging.getLogger(__name__)
+
+# Set to "0" to make clients ignore (and never start) a broker
+BROKER_ENV_VAR = "AURORA_LSP_BROKER"
+
+PROTOCOL_VERSION = 1
+CONNECT_TIMEOUT = 0.5  # seconds, for the availability probe
+REQUEST_TIMEOUT = 300.0  # seconds; accurate dead code scans are slow
+DEFAULT_IDLE_TIMEOUT = 900.0  # seconds
+SPAWN_WAIT = 5.0  # seconds to wait for a freshly spawned broker
+MAX_WORKSPACES = 4  # per worker; least recently used workspaces beyond this are closed
+
+# AuroraLSP methods that can be called through the broker
+BROKER_METHODS = frozenset(
+    {
+        "find_dead_code",
+        "find_usages",
+        "get_callees",
+        "get_callers",
+        "get_imported_by",
+        "get_usage_summaries",
+        "get_usage_summary",
+        "lint",
+    }
+)
+
+# Methods that can scan a whole workspace; they run on the background worker
+BACKGROUND_METHODS = frozenset({"find_dead_code", "lint"})
+
+
+class LSPBrokerError(Exception):
+    """Raised when the LSP broker is unreachable or does not answer in time."""
+
+
+class LSPCallError(Exception):
+    """Raised when the broker answered but the request itself failed.
+
+    Covers rejected requests and exceptions raised by the called method whose
+    type is not a builtin exception (builtin ones are re-raised as such).
+
+    Attributes:
+        error_type: Class name of the exception raised in the broker, if any
+    """
+
+    def __init__(self, message: str, error_type: str | None = None) -> None:
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def broker_enabled() -> bool:
+    """Return False if clients were told to ignore the broker."""
+    return os.environ.get(BROKER_ENV_VAR, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def default_socket_path() -> Path:
+    """Return the socket path of the per-user broker (under ``$AURORA_HOME/run``)."""
+    aurora_home = os.environ.get("AURORA_HOME")
+    home = Path(aurora_home) if aurora_home else Path.home() / ".aurora"
+    return home / "run" / "lsp-broker.sock"
+
+
+class LSPBrokerClient(SocketServiceClient):
+    """Client for a running LSP broker.
+
+    Each request opens a fresh connection, so one client can be shared freely
+    and a broker restart never leaves it holding a dead socket.
+
+    Attributes:
+        socket_path: Unix socket the broker listens on
+        info: Result of the last ``ping`` (pid, workspaces, requests, ...)
+    """
+
+    service_name = "LSP broker"
+    error_class = LSPBrokerError
+
+    def __init__(self, socket_path: str | Path, timeout: float = REQUEST_TIMEOUT) -> None:
+        """Initialize the client.
+
+        Args:
+            socket_path: Unix socket the broker listens on
+            timeout: Per-request socket timeout in seconds
+        """
+        super().__init__(socket_path, timeout)
+
+    def _remote_error(self, response: dict[str, Any]) -> Exception:
+        """Rebuild the method's exception, so callers see the same type as in-process."""
+        error_type = response.get("error_type")
+        error_class = getattr(builtins, error_type, None) if error_type else None
+        if isinstance(error_class, type) and issubclass(error_class, Exception):
+            try:
+                return error_class(response.get("message", ""))
+            except Exception:
+                pass
+        return LSPCallError(response.get("error", "LSP broker request failed"), error_type)
+
+    @classmethod
+    def connect(cls, socket_path: str | Path | None = None) -> LSPBrokerClient | None:
+        """Return a client if a broker is listening, else None (never raises).
+
+        Args:
+            socket_path: Socket path override (default: ``default_socket_path``)
+
+        Returns:
+            Connected client, or None if no usable broker is running
+        """
+        if not broker_enabled():
+            return None
+
+        path = Path(socket_path) if socket_path else default_socket_path()
+        if not path.exists():
+            return None
+
+        client = cls(path, timeout=CONNECT_TIMEOUT)
+        try:
+            info = client.ping()
+        except LSPBrokerError as e:
+            logger.debug(f"LSP broker at {path} not usable: {e}")
+            return None
+        if info.get("protocol") != PROTOCOL_VERSION:
+            logger.debug(f"LSP broker at {path} speaks protocol {info.get('protocol')}")
+            return None
+
+        client.timeout = REQUEST_TIMEOUT
+        return client
+
+    def call(self, workspace: str | Path, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Call an ``AuroraLSP`` method on the broker's instance for ``workspace``.
+
+        Args:
+            workspace: Workspace root directory
+            method: Method name (one of ``BROKER_METHODS``)
+            *args: Positional arguments (JSON-serializable; paths become strings)
+            **kwargs: Keyword arguments
+
+        Returns:
+            The method's return value, decoded from JSON
+
+        Raises:
+            LSPBrokerError: If the broker is unreachable or times out
+            LSPCallError: If the broker rejected the request or the method raised
+                a non-builtin exception (builtin exceptions are re-raised as such)
+        """
+        response = self.request(
+            "call",
+            workspace=str(Path(workspace).resolve()),
+            method=method,
+            args=list(args),
+            kwargs=kwargs,
+        )
+        return response["result"]
+
+
+class BrokeredLSP:
+    """``AuroraLSP`` stand-in that forwards calls to the LSP broker.
+
+    Exposes the methods in ``BROKER_METHODS`` with the same signatures. If
+    the broker has gone away (e.g. after its idle timeout), one respawn is
+    attempted; after that the proxy falls back to an in-process ``AuroraLSP``.
+    Errors raised by the called method are passed to the caller and keep the
+    proxy on the broker.
+    """
+
+    def __init__(
+        self,
+        client: LSPBrokerClient,
+        workspace: str | Path,
+        spawn: bool = False,
+    ) -> None:
+        """Initialize with a connected client.
+
+        Args:
+            client: Connected broker client
+            workspace: Workspace root directory
+            spawn: Whether a lost broker may be respawned
+        """
+        self.workspace = Path(workspace).resolve()
+        self._client: LSPBrokerClient | None = client
+        self._spawn = spawn
+        self._local: Any = None
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name not in BROKER_METHODS:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        def method(*args: Any, **kwargs: Any) -> Any:
+            return self._call(name, *args, **kwargs)
+
+        return method
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        if self._client is not None:
+            try:
+                return self._client.call(self.workspace, method, *args, **kwargs)
+            except LSPBrokerError as e:
+                logger.info(f"LSP broker request failed ({e}); reconnecting")
+                self._client = ensure_broker() if self._spawn else LSPBrokerClient.connect()
+            if self._client is not None:
+                try:
+                    return self._client.call(self.workspace, method, *args, **kwargs)
+                except LSPBrokerError as e:
+                    logger.warning(f"LSP broker unavailable ({e}); using in-process LSP")
+                    self._client = None
+
+        if self._local is None:
+            from aurora_lsp.facade import AuroraLSP
+
+            self._local = AuroraLSP(self.workspace)
+        return getattr(self._local, method)(*args, **kwargs)
+
+    def close(self) -> None:
+        """Close the in-process fallback, if one was created (the broker keeps running)."""
+        if self._local is not None:
+            self._local.close()
+            self._local = None
+
+
+def ensure_broker(
+    socket_path: str | Path | None = None,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    wait: float = SPAWN_WAIT,
+) -> LSPBrokerClient | None:
+    """Connect to the broker, starting one in the background if none is running.
+
+    Args:
+        socket_path: Socket path override (default: ``default_socket_path``)
+        idle_timeout: Idle timeout passed to a newly started broker
+        wait: Seconds to wait for a newly started broker to accept connections
+
+    Returns:
+        Connected client, or None if the broker is disabled or did not come up
+    """
+    client = LSPBrokerClient.connect(socket_path)
+    if client is not None or not broker_enabled():
+        return client
+
+    path = Path(socket_path) if socket_path else default_socket_path()
+    try:
+        _spawn_broker(path, idle_timeout)
+    except OSError as e:
+        logger.warning(f"Could not start LSP broker: {e}")
+        return None
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        client = LSPBrokerClient.connect(path)
+        if client is not None:
+            return client
+    logger.info(f"LSP broker did not start within {wait:.1f}s")
+    return None
+
+
+def get_lsp(workspace: str | Path | None = None, spawn: bool = False) -> Any:
+    """Return an LSP interface for a workspace, preferring the broker.
+
+    Args:
+        workspace: Workspace root directory (default: current directory)
+        spawn: Start a broker if none is running (otherwise only use a running one)
+
+    Returns:
+        ``BrokeredLSP`` when a broker is reachable, else an in-process ``AuroraLSP``
+    """
+    ws = Path(workspace or Path.cwd()).resolve()
+    client = ensure_broker() if spawn else LSPBrokerClient.connect()
+    if client is not None:
+        return BrokeredLSP(client, ws, spawn=spawn)
+
+    from aurora_lsp.facade import AuroraLSP
+
+    return AuroraLSP(ws)
+
+
+def _spawn_broker(socket_path: Path, idle_timeout: float) -> None:
+    """Start a detached broker process (output goes to a log next to the socket)."""
+    # Source roots of aurora_lsp and aurora_core (separate in a source checkout)
+    roots = dict.fromkeys(
+        str(Path(module_file).resolve().parent.parent)
+        for module_file in (__file__, socket_service.__file__)
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (*roots, env.get("PYTHONPATH")) if p)
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(socket_path.with_suffix(".log"), "ab") as log:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "aurora_lsp.broker",
+                "--socket",
+                str(socket_path),
+                "--idle-timeout",
+                str(idle_timeout),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            env=env,
+            start_new_session=True,
+        )
+    logger.info(f"Started LSP broker on {socket_path}")
+
+
+class _Worker:
+    """One thread owning a set of warm LSP instances, keyed by workspace.
+
+    ``AuroraLSP`` drives its language servers from the event loop of the
+    thread that uses it, so each instance is only touched from its worker's
+    thread; ``run`` hands work to that thread and waits for the result.
+    """
+
+    def __init__(self, name: str, max_workspaces: int) -> None:
+        self.name = name
+        self.max_workspaces = max_workspaces
+        self.instances: OrderedDict[str, Any] = OrderedDict()
+        self.lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"lsp-{name}")
+        self.closed = False
+
+    def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        return self._executor.submit(fn, *args).result()
+
+    def workspaces(self) -> list[str]:
+        with self.lock:
+            return list(self.instances)
+
+    def shutdown(self) -> None:
+        self.closed = True
+        self._executor.shutdown(wait=True)
+
+
+class LSPBroker(SocketService):
+    """Long-lived process holding warm ``AuroraLSP`` instances per workspace.
+
+    Connections are served on their own threads. Calls run on one of two
+    workers, each with its own instances: ``BACKGROUND_METHODS`` on the
+    background worker and everything else on the interactive worker, so hook
+    requests wait for at most other short requests.
+
+    Attributes:
+        socket_path: Unix socket the broker listens on
+        idle_timeout: Exit after this many idle seconds (None = never)
+        max_workspaces: Workspaces kept warm per worker; the least recently
+            used is closed
+    """
+
+    service_name = "LSP broker"
+    error_class = LSPBrokerError
+    client_class = LSPBrokerClient
+    threaded = True
+
+    def __init__(
+        self,
+        socket_path: str | Path | None = None,
+        idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT,
+        max_workspaces: int = MAX_WORKSPACES,
+        lsp_factory: Callable[[Path], Any] | None = None,
+    ) -> None:
+        """Initialize the broker (nothing is started until ``start``).
+
+        Args:
+            socket_path: Socket path override (default: ``default_socket_path``)
+            idle_timeout: Exit after this many idle seconds (None = never)
+            max_workspaces: Workspaces kept warm at once per worker
+            lsp_factory: Creates the LSP instance for a workspace (default: AuroraLSP)
+        """
+        super().__init__(socket_path or default_socket_path(), idle_timeout)
+        self.max_workspaces = max(1, max_workspaces)
+        self._lsp_factory = lsp_factory
+        self._interactive = _Worker("interactive", self.max_workspaces)
+        self._background = _Worker("background", self.max_workspaces)
+
+    def start(self) -> None:
+        """Bind the socket.
+
+        Raises:
+            LSPBrokerError: If another broker is already serving this socket
+        """
+        if self._lsp_factory is None:
+            from aurora_lsp.facade import AuroraLSP
+
+            self._lsp_factory = AuroraLSP
+
+        super().start()
+        logger.info(f"LSP broker ready on {self.socket_path}")
+
+    def close(self) -> None:
+        """Close the socket and stop all language servers."""
+        super().close()
+        for worker in (self._interactive, self._background):
+            if not worker.closed:
+                worker.run(self._close_all, worker)
+                worker.shutdown()
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Dispatch one decoded request.
+
+        Args:
+            request: Request object with an ``op`` field
+
+        Returns:
+            Response object
+        """
+        op = request.get("op")
+
+        if op == "ping":
+            return {"ok": True, **self.status()}
+
+        if op == "call":
+            method = request.get("method")
+            if method not in BROKER_METHODS:
+                return {"ok": False, "error": f"Method not allowed: {method!r}"}
+            worker = self._background if method in BACKGROUND_METHODS else self._interactive
+            result = worker.run(
+                self._call,
+                worker,
+                request["workspace"],
+                method,
+                request.get("args", []),
+                request.get("kwargs", {}),
+            )
+            return {"ok": True, "result": result}
+
+        if op == "shutdown":
+            self.stop()
+            return {"ok": True}
+
+        return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+    def status(self) -> dict[str, Any]:
+        """Return broker status as reported by ``ping``."""
+        return {
+            "protocol": PROTOCOL_VERSION,
+            "pid": os.getpid(),
+            "workspaces": self._interactive.workspaces(),
+            "background_workspaces": self._background.workspaces(),
+            "uptime": self._uptime(),
+            "requests": self._requests,
+        }
+
+    def _call(
+        self,
+        worker: _Worker,
+        workspace: str,
+        method: str,
+        args: list[Any],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Run one LSP method on ``worker``'s thread."""
+        lsp = self._instance(worker, workspace)
+        lsp.refresh_changed_files()
+        return getattr(lsp, method)(*args, **kwargs)
+
+    def _instance(self, worker: _Worker, workspace: str) -> Any:
+        """Return the worker's warm LSP instance for a workspace, creating it if needed."""
+        key = str(Path(workspace).resolve())
+        with worker.lock:
+            if key in worker.instances:
+                worker.instances.move_to_end(key)
+                return worker.instances[key]
+            evicted = []
+            while len(worker.instances) >= worker.max_workspaces:
+                evicted.append(worker.instances.popitem(last=False))
+
+        for evicted_key, lsp in evicted:
+            self._close_instance(evicted_key, lsp)
+        assert self._lsp_factory is not None
+        logger.info(f"LSP broker opening workspace {key} ({worker.name})")
+        lsp = self._lsp_factory(Path(key))
+        with worker.lock:
+            worker.instances[key] = lsp
+        return lsp
+
+    def _close_all(self, worker: _Worker) -> None:
+        """Close every instance of a worker (runs on the worker's thread)."""
+        with worker.lock:
+            instances = list(worker.instances.items())
+            worker.instances.clear()
+        for workspace, lsp in instances:
+            self._close_instance(workspace, lsp)
+
+    @staticmethod
+    def _close_instance(workspace: str, lsp: Any) -> None:
+        try:
+            lsp.close()
+        except Exception as e:
+            logger.warning(f"Error closing LSP for {workspace}: {e}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run an LSP broker in the foreground."""
+    parser = argparse.ArgumentParser(description="Aurora LSP broker")
+    parser.add_argument("--socket", default=None, help="Unix socket path override")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help=f"Exit after this many idle seconds, 0 = never (default: {DEFAULT_IDLE_TIMEOUT:.0f})",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    logging.getLogger("multilspy").setLevel(logging.WARNING)
+    try:
+        LSPBroker(args.socket, idle_timeout=args.idle_timeout or None).serve_forever()
+    except LSPBrokerError as e:
+        logger.info(str(e))
+
+
+__all__ = [
+    "BACKGROUND_METHODS",
+    "BROKER_ENV_VAR",
+    "BROKER_METHODS",
+    "BrokeredLSP",
+    "LSPBroker",
+    "LSPBrokerClient",
+    "LSPBrokerError",
+    "LSPCallError",
+    "default_socket_path",
+    "ensure_broker",
+    "get_lsp",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -58,6 +58,7 @@ class AuroraLSPClient:
         self._contexts: dict[str, Any] = {}  # Language -> context manager
         self._open_files: set[str] = set()  # Tracks opened files
         self._file_contexts: dict[str, Any] = {}  # rel_path -> entered context manager
+        self._open_mtimes: dict[str, float | None] = {}  # rel_path -> mtime when opened
         self._lock = asyncio.Lock()
         self._logger: Any = None
         self._started = False
@@ -155,6 +156,46 @@ class AuroraLSPClient:
             ctx.__enter__()
             self._file_contexts[rel_path] = ctx
             self._open_files.add(rel_path)
+            self._open_mtimes[rel_path] = self._mtime(rel_path)
+
+    def refresh_changed_files(self) -> int:
+        """Close open documents that changed on disk since they were opened.
+
+        Language servers keep the text sent with didOpen, so a long-lived
+        client (e.g. in the LSP broker) would otherwise answer from stale
+        contents after an edit. Changed files are closed (didClose) and get
+        reopened with fresh contents on their next request; the reference
+        cache is cleared because cached locations may have shifted.
+
+        Returns:
+            Number of documents that were closed
+        """
+        changed = [
+            rel_path
+            for rel_path, mtime in self._open_mtimes.items()
+            if self._mtime(rel_path) != mtime
+        ]
+        for rel_path in changed:
+            ctx = self._file_contexts.pop(rel_path, None)
+            if ctx is not None:
+                try:
+                    ctx.__exit__(None, None, None)
+                except Exception as e:
+                    logger.debug(f"Error closing file {rel_path}: {e}")
+            self._open_files.discard(rel_path)
+            del self._open_mtimes[rel_path]
+
+        if changed:
+            logger.debug(f"Re-syncing {len(changed)} changed documents")
+            self._ref_cache.clear()
+        return len(changed)
+
+    def _mtime(self, rel_path: str) -> float | None:
+        """Return a file's mtime (None if it does not exist)."""
+        try:
+            return (self.workspace / rel_path).stat().st_mtime
+        except OSError:
+            return None
 
     async def request_references(
         self,
@@ -308,6 +349,7 @@ class AuroraLSPClient:
                 except Exception as e:
                     logger.debug(f"Error closing file {rel_path}: {e}")
             self._file_contexts.clear()
+            self._open_mtimes.clear()
 
             # Exit server context managers
             for lang_key, ctx in self._contexts.items():
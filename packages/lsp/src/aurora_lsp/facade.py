@@ -146,6 +146,46 @@ class AuroraLSP:
         """
         return self._run_async(self.analyzer.get_usage_summary(file_path, line, col, symbol_name))
 
+    def get_usage_summaries(
+        self,
+        targets: list[tuple[str | Path, int, int]],
+        max_concurrency: int = 4,
+    ) -> list[dict]:
+        """Get usage summaries for several symbols with bounded concurrency.
+
+        Requests run concurrently on one event loop (at most max_concurrency
+        in flight), so latency grows with len(targets) / max_concurrency
+        instead of len(targets).
+
+        Args:
+            targets: (file_path, line, col) per symbol; line and col are 0-indexed.
+            max_concurrency: Maximum number of in-flight LSP requests.
+
+        Returns:
+            One summary dict per target, in order (see get_usage_summary).
+            Targets whose lookup failed get an empty dict.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def summarize(file_path: str | Path, line: int, col: int) -> dict:
+            async with semaphore:
+                return await self.analyzer.get_usage_summary(file_path, line, col)
+
+        async def gather() -> list[Any]:
+            return await asyncio.gather(
+                *(summarize(*target) for target in targets), return_exceptions=True
+            )
+
+        results = self._run_async(gather())
+        summaries: list[dict] = []
+        for target, result in zip(targets, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.debug(f"Usage summary failed for {target[0]}:{target[1]}: {result}")
+                summaries.append({})
+            else:
+                summaries.append(result)
+        return summaries
+
     # =========================================================================
     # IMPORTANT: Dead Code Detection
     # =========================================================================
@@ -660,6 +700,22 @@ class AuroraLSP:
                 result.extend(self._flatten_symbols(children))
         return result
 
+    def refresh_changed_files(self) -> int:
+        """Drop state that went stale because files changed on disk.
+
+        Long-lived instances (the LSP broker) call this before each request:
+        open documents edited since they were opened are re-synced and the
+        analyzer's per-file line cache is cleared.
+
+        Returns:
+            Number of open documents that were re-synced
+        """
+        if self._analyzer is not None:
+            self._analyzer._file_cache.clear()
+        if self._client is None:
+            return 0
+        return self._client.refresh_changed_files()
+
     def close(self) -> None:
         """Close all language server connections."""
         if self._client:
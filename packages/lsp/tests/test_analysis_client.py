@@ -4,7 +4,9 @@ Tests pure logic — no running language servers, no network.
 """
 
 import json
+import os
 import subprocess
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -421,3 +423,47 @@ class TestReferenceCache:
         client._ref_cache[("src/a.py", 1, 0)] = (0.0, [{"file": "x", "line": 0, "col": 0}])
         await client.close()
         assert len(client._ref_cache) == 0
+
+
+class TestRefreshChangedFiles:
+    """Tests for re-syncing documents edited on disk (used by the LSP broker)."""
+
+    @pytest.mark.asyncio
+    async def test_changed_file_is_closed_and_reopened(self, tmp_path):
+        """An edit closes the open document and clears cached references."""
+        source = tmp_path / "a.py"
+        source.write_text("def a():\n    pass\n")
+        client = AuroraLSPClient(workspace=tmp_path)
+
+        fake_server = AsyncMock()
+        fake_server.request_references = AsyncMock(return_value=[])
+        contexts = [MagicMock(), MagicMock()]
+        fake_server.open_file = MagicMock(side_effect=contexts)
+
+        with patch.object(client, "_ensure_server", return_value=fake_server):
+            await client.request_references("a.py", 0, 4)
+            assert client.refresh_changed_files() == 0
+
+            source.write_text("def a():\n    return 1\n")
+            os.utime(source, (time.time() + 10, time.time() + 10))
+            assert client.refresh_changed_files() == 1
+            assert client._ref_cache == {}
+            contexts[0].__exit__.assert_called_once()
+
+            await client.request_references("a.py", 0, 4)
+
+        assert fake_server.open_file.call_count == 2
+        assert fake_server.request_references.call_count == 2
+
+    def test_deleted_file_counts_as_changed(self, tmp_path):
+        """A deleted document is closed too."""
+        source = tmp_path / "gone.py"
+        source.write_text("x = 1\n")
+        client = AuroraLSPClient(workspace=tmp_path)
+        client._open_files.add("gone.py")
+        client._open_mtimes["gone.py"] = client._mtime("gone.py")
+
+        source.unlink()
+
+        assert client.refresh_changed_files() == 1
+        assert "gone.py" not in client._open_files
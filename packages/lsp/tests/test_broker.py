@@ -0,0 +1,291 @@
+"""Tests for the LSP broker (aurora_lsp.broker).
+
+A fake LSP factory stands in for AuroraLSP, so no language servers are
+started; the broker itself runs in a thread on a temporary Unix socket.
+"""
+
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from aurora_lsp.broker import (
+    BROKER_ENV_VAR,
+    BrokeredLSP,
+    LSPBroker,
+    LSPBrokerClient,
+    LSPBrokerError,
+    LSPCallError,
+    default_socket_path,
+    get_lsp,
+)
+
+
+class FakeLSP:
+    """Records calls made through the broker."""
+
+    def __init__(self, workspace: Path):
+        self.workspace = workspace
+        self.calls: list[tuple] = []
+        self.refreshes = 0
+        self.closed = False
+
+    def refresh_changed_files(self) -> int:
+        self.refreshes += 1
+        return 0
+
+    def get_usage_summary(self, path, line, col=0):
+        self.calls.append(("get_usage_summary", path, line, col))
+        return {"total_usages": 3, "files_affected": 1, "workspace": str(self.workspace)}
+
+    def get_usage_summaries(self, targets, max_concurrency=4):
+        self.calls.append(("get_usage_summaries", targets))
+        return [{"line": line} for _, line, _ in targets]
+
+    def find_dead_code(self, path=None, include_private=False, accurate=False):
+        raise RuntimeError("boom")
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to ~100 characters, so avoid deep tmp_path dirs
+    directory = Path(tempfile.mkdtemp(prefix="alsp"))
+    yield directory / "broker.sock"
+    for leftover in directory.iterdir():
+        leftover.unlink()
+    directory.rmdir()
+
+
+@pytest.fixture
+def broker(socket_path, monkeypatch):
+    monkeypatch.setenv(BROKER_ENV_VAR, "1")
+    instances: list[FakeLSP] = []
+
+    def factory(workspace):
+        instances.append(FakeLSP(workspace))
+        return instances[-1]
+
+    server = LSPBroker(socket_path, idle_timeout=None, max_workspaces=2, lsp_factory=factory)
+    server.start()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+    thread.start()
+    server.instances = instances
+    yield server
+    try:
+        LSPBrokerClient(socket_path).shutdown()
+    except LSPBrokerError:
+        pass
+    thread.join(timeout=5)
+
+
+class TestBrokerRoundTrip:
+    """Requests served over the socket."""
+
+    def test_ping(self, broker, socket_path):
+        client = LSPBrokerClient.connect(socket_path)
+
+        assert client is not None
+        assert client.info["protocol"] == 1
+        assert client.info["workspaces"] == []
+
+    def test_call_reuses_workspace_instance(self, broker, socket_path, tmp_path):
+        client = LSPBrokerClient.connect(socket_path)
+
+        first = client.call(tmp_path, "get_usage_summary", "src/a.py", 9, col=4)
+        client.call(tmp_path, "get_usage_summary", Path("src/b.py"), 2)
+
+        assert first["total_usages"] == 3
+        assert len(broker.instances) == 1
+        lsp = broker.instances[0]
+        assert lsp.calls == [
+            ("get_usage_summary", "src/a.py", 9, 4),
+            ("get_usage_summary", "src/b.py", 2, 0),
+        ]
+        assert lsp.refreshes == 2
+
+    def test_batch_arguments_round_trip(self, broker, socket_path, tmp_path):
+        client = LSPBrokerClient.connect(socket_path)
+
+        result = client.call(tmp_path, "get_usage_summaries", [("a.py", 1, 0), ("b.py", 5, 2)])
+
+        assert result == [{"line": 1}, {"line": 5}]
+
+    def test_method_errors_are_reported(self, broker, socket_path, tmp_path):
+        client = LSPBrokerClient.connect(socket_path)
+
+        with pytest.raises(RuntimeError, match="^boom$"):
+            client.call(tmp_path, "find_dead_code")
+        # The broker survives a failed request
+        assert client.ping()["requests"] >= 2
+
+    def test_methods_outside_whitelist_rejected(self, broker, socket_path, tmp_path):
+        client = LSPBrokerClient.connect(socket_path)
+
+        with pytest.raises(LSPCallError, match="not allowed"):
+            client.call(tmp_path, "close")
+
+    def test_least_recently_used_workspace_closed(self, broker, socket_path, tmp_path):
+        client = LSPBrokerClient.connect(socket_path)
+        workspaces = [tmp_path / name for name in ("a", "b", "c")]
+
+        for workspace in workspaces:
+            client.call(workspace, "get_usage_summary", "x.py", 0)
+
+        assert [lsp.closed for lsp in broker.instances] == [True, False, False]
+        assert client.ping()["workspaces"] == [str(w.resolve()) for w in workspaces[1:]]
+
+    def test_second_broker_refuses_socket(self, broker, socket_path):
+        with pytest.raises(LSPBrokerError, match="already running"):
+            LSPBroker(socket_path, lsp_factory=FakeLSP).start()
+
+
+class SlowScanLSP(FakeLSP):
+    """FakeLSP whose dead code scan blocks until released."""
+
+    scan_started = threading.Event()
+    release_scan = threading.Event()
+
+    def find_dead_code(self, path=None, include_private=False, accurate=False):
+        self.scan_started.set()
+        self.release_scan.wait(timeout=10)
+        return []
+
+
+class TestBrokerWorkers:
+    """Workspace scans run beside, not ahead of, hook requests."""
+
+    def test_hook_call_not_blocked_by_background_scan(self, socket_path, tmp_path, monkeypatch):
+        monkeypatch.setenv(BROKER_ENV_VAR, "1")
+        SlowScanLSP.scan_started.clear()
+        SlowScanLSP.release_scan.clear()
+        server = LSPBroker(socket_path, idle_timeout=None, lsp_factory=SlowScanLSP)
+        server.start()
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+        thread.start()
+        scan_results = []
+        scan = threading.Thread(
+            target=lambda: scan_results.append(
+                LSPBrokerClient(socket_path).call(tmp_path, "find_dead_code")
+            )
+        )
+        try:
+            scan.start()
+            assert SlowScanLSP.scan_started.wait(timeout=5)
+
+            client = LSPBrokerClient(socket_path, timeout=2.0)
+            summary = client.call(tmp_path, "get_usage_summary", "a.py", 1)
+            status = client.ping()
+        finally:
+            SlowScanLSP.release_scan.set()
+            scan.join(timeout=5)
+            LSPBrokerClient(socket_path).shutdown()
+            thread.join(timeout=5)
+
+        assert summary["total_usages"] == 3
+        assert scan_results == [[]]
+        workspace = str(tmp_path.resolve())
+        assert status["workspaces"] == [workspace]
+        assert status["background_workspaces"] == [workspace]
+        assert not socket_path.exists()
+
+
+class TestBrokerLifecycle:
+    """Startup, idle shutdown and stale sockets."""
+
+    def test_idle_timeout_exits_and_closes(self, socket_path):
+        lsp = FakeLSP(Path("/tmp"))
+        server = LSPBroker(socket_path, idle_timeout=0.1, lsp_factory=lambda ws: lsp)
+        server.start()
+        server.handle(
+            {"op": "call", "workspace": "/tmp", "method": "get_usage_summary", "args": ["a.py", 0]}
+        )
+
+        server.serve_forever(poll_interval=0.02)
+
+        assert lsp.closed
+        assert not socket_path.exists()
+
+    def test_stale_socket_is_replaced(self, socket_path):
+        socket_path.touch()
+        server = LSPBroker(socket_path, lsp_factory=FakeLSP)
+
+        server.start()
+
+        assert socket_path.is_socket()
+        server.close()
+
+    def test_default_socket_path_honours_aurora_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("AURORA_HOME", str(tmp_path))
+        assert default_socket_path() == tmp_path / "run" / "lsp-broker.sock"
+
+
+class TestClients:
+    """Client-side selection and fallback."""
+
+    def test_connect_without_broker(self, socket_path):
+        assert LSPBrokerClient.connect(socket_path) is None
+
+    def test_connect_disabled(self, broker, socket_path, monkeypatch):
+        monkeypatch.setenv(BROKER_ENV_VAR, "0")
+        assert LSPBrokerClient.connect(socket_path) is None
+
+    def test_proxy_forwards_calls(self, broker, socket_path, tmp_path):
+        proxy = BrokeredLSP(LSPBrokerClient.connect(socket_path), tmp_path)
+
+        assert proxy.get_usage_summary("a.py", 1, col=2)["total_usages"] == 3
+        with pytest.raises(AttributeError):
+            proxy.refresh_changed_files  # noqa: B018
+
+    def test_method_error_keeps_proxy_on_broker(self, broker, socket_path, tmp_path):
+        proxy = BrokeredLSP(LSPBrokerClient.connect(socket_path), tmp_path)
+
+        with patch("aurora_lsp.broker.LSPBrokerClient.connect") as reconnect:
+            with pytest.raises(RuntimeError, match="^boom$"):
+                proxy.find_dead_code()
+            assert proxy.get_usage_summary("a.py", 1)["total_usages"] == 3
+
+        reconnect.assert_not_called()
+        assert proxy._client is not None
+        assert proxy._local is None
+        # One instance per worker; the usage lookup was served by the broker
+        assert broker.instances[-1].calls == [("get_usage_summary", "a.py", 1, 0)]
+
+    def test_non_builtin_method_error_keeps_type_name(self, broker, socket_path, tmp_path):
+        class MultilspyException(Exception):
+            pass
+
+        def fail(self, *args, **kwargs):
+            raise MultilspyException("server crashed")
+
+        client = LSPBrokerClient.connect(socket_path)
+        with patch.object(FakeLSP, "get_callers", fail, create=True):
+            with pytest.raises(LSPCallError, match="server crashed") as excinfo:
+                client.call(tmp_path, "get_callers", "a.py", 1)
+
+        assert excinfo.value.error_type == "MultilspyException"
+
+    def test_proxy_falls_back_in_process(self, tmp_path):
+        client = MagicMock()
+        client.call.side_effect = LSPBrokerError("gone")
+        proxy = BrokeredLSP(client, tmp_path)
+
+        with (
+            patch("aurora_lsp.broker.LSPBrokerClient.connect", return_value=None),
+            patch("aurora_lsp.facade.AuroraLSP", FakeLSP),
+        ):
+            result = proxy.get_usage_summary("a.py", 1)
+
+        assert result["workspace"] == str(tmp_path.resolve())
+
+    def test_get_lsp_without_broker_is_in_process(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(BROKER_ENV_VAR, "0")
+
+        with patch("aurora_lsp.facade.AuroraLSP", FakeLSP):
+            lsp = get_lsp(tmp_path, spawn=True)
+
+        assert isinstance(lsp, FakeLSP)
@@ -2,6 +2,7 @@
 
 __version__ = "0.1.0"
 
+from .llm_cache import CachingLLMClient, LLMCacheMetrics, LLMResponseCache
 from .llm_client import (
     AnthropicClient,
     LLMClient,
@@ -19,6 +20,9 @@ __all__ = [
     "OpenAIClient",
     "OllamaClient",
     "extract_json_from_text",
+    "CachingLLMClient",
+    "LLMCacheMetrics",
+    "LLMResponseCache",
     "SynthesisResult",
     "synthesize_results",
     "verify_synthesis",
@@ -0,0 +1,563 @@
+"""Content-addressed response cache for LLM clients.
+
+Identical prompts are re-sent whenever a SOAR run is repeated or resumed.
+CachingLLMClient wraps any LLMClient and answers such repeats from a local
+SQLite file instead of calling the provider again.
+
+Cache Strategy:
+- Key: SHA-256 of (model, system, prompt, phase, max_tokens, temperature)
+- TTL-based expiration (default: 7 days)
+- LRU eviction once the cache holds max_entries responses
+- Hit/miss/eviction counters for observability
+
+The cache is opt-in: nothing is cached unless a client is explicitly wrapped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .llm_client import JSON_ONLY_INSTRUCTION, LLMClient, LLMResponse, extract_json_from_text
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LLMCacheMetrics:
+    """Counters for LLM response cache operations."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Calculate cache hit rate (0.0-1.0)."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class LLMResponseCache:
+    """SQLite-backed store of LLM responses keyed by request content.
+
+    Storage errors are logged and treated as misses, so a broken or locked
+    cache file never fails an LLM call.
+
+    Examples:
+        >>> cache = LLMResponseCache(Path(".aurora/soar/llm_cache.db"))
+        >>> key = cache.make_key("sonnet", "Hello", system=None)
+        >>> cache.get(key) is None
+        True
+
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_hours: float = 168,
+        max_entries: int = 1000,
+    ):
+        """Initialize the response cache.
+
+        Args:
+            path: Path to the SQLite cache file (created if missing)
+            ttl_hours: Time-to-live for cached responses in hours (default: 168)
+            max_entries: Maximum number of cached responses (default: 1000)
+
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.metrics = LLMCacheMetrics()
+        self._lock = threading.Lock()
+        self._init_storage()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        prompt: str,
+        *,
+        system: str | None = None,
+        phase: str | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> str:
+        """Compute the content address of a generation request.
+
+        Args:
+            model: Tool or model identifier that answers the request
+            prompt: The user prompt
+            system: Optional system prompt
+            phase: Optional pipeline phase name
+            max_tokens: Maximum tokens requested
+            temperature: Sampling temperature requested
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+
+        """
+        payload = json.dumps(
+            [model, system, prompt, phase, max_tokens, temperature],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Look up a cached response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached LLMResponse, or None on miss or expiry
+
+        """
+        now = time.time()
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT response, created_at FROM llm_cache WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+
+                if row is not None and now - row[1] > self.ttl_seconds:
+                    conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+                    self.metrics.expired += 1
+                    row = None
+
+                if row is None:
+                    self.metrics.misses += 1
+                    return None
+
+                conn.execute(
+                    "UPDATE llm_cache SET last_used_at = ?, hit_count = hit_count + 1 "
+                    "WHERE cache_key = ?",
+                    (now, key),
+                )
+                self.metrics.hits += 1
+            return LLMResponse.model_validate_json(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"LLM cache lookup failed: {e}")
+            self.metrics.misses += 1
+            return None
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response, evicting expired and least recently used entries.
+
+        Args:
+            key: Key from make_key()
+            response: Response to cache
+
+        """
+        now = time.time()
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache "
+                    "(cache_key, response, created_at, last_used_at, hit_count) "
+                    "VALUES (?, ?, ?, ?, 0)",
+                    (key, response.model_dump_json(), now, now),
+                )
+                self.metrics.writes += 1
+
+                evicted = conn.execute(
+                    "DELETE FROM llm_cache WHERE created_at < ?",
+                    (now - self.ttl_seconds,),
+                ).rowcount
+                evicted += conn.execute(
+                    "DELETE FROM llm_cache WHERE cache_key IN ("
+                    "  SELECT cache_key FROM llm_cache "
+                    "  ORDER BY last_used_at DESC LIMIT -1 OFFSET ?"
+                    ")",
+                    (self.max_entries,),
+                ).rowcount
+                self.metrics.evictions += evicted
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def delete(self, key: str) -> None:
+        """Remove a single cached response.
+
+        Args:
+            key: Key from make_key()
+
+        """
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache delete failed: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute("DELETE FROM llm_cache")
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache clear failed: {e}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, hit/miss counters and hit rate
+
+        """
+        entries = 0
+        try:
+            with self._lock, self._connect() as conn:
+                entries = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache stats failed: {e}")
+
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.metrics.hits,
+            "misses": self.metrics.misses,
+            "expired": self.metrics.expired,
+            "writes": self.metrics.writes,
+            "evictions": self.metrics.evictions,
+            "hit_rate": self.metrics.hit_rate,
+        }
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_storage(self) -> None:
+        """Create the cache table if it does not exist."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS llm_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        response TEXT NOT NULL,
+                        created_at REAL NOT NULL,
+                        last_used_at REAL NOT NULL,
+                        hit_count INTEGER DEFAULT 0
+                    )
+                    """,
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used "
+                    "ON llm_cache(last_used_at)",
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"LLM cache unavailable at {self.path}: {e}")
+
+
+class CachingLLMClient(LLMClient):
+    """LLMClient wrapper that serves repeated requests from an LLMResponseCache.
+
+    Cached responses are returned with metadata["cache_hit"] set to True.
+    Everything else (token counting, default model, provider errors) is
+    delegated to the wrapped client.
+
+    Examples:
+        >>> client = CachingLLMClient(
+        ...     AnthropicClient(),
+        ...     LLMResponseCache(Path(".aurora/soar/llm_cache.db")),
+        ... )
+        >>> client.generate("Explain ACT-R", phase_name="decompose")
+
+    """
+
+    def __init__(self, client: LLMClient, cache: LLMResponseCache):
+        """Initialize the caching wrapper.
+
+        Args:
+            client: LLM client to delegate cache misses to
+            cache: Response cache to read from and write to
+
+        """
+        self.client = client
+        self.cache = cache
+
+    def generate(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate text completion, answering from the cache when possible.
+
+        Args:
+            prompt: The user prompt/question
+            model: Optional model override
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system: Optional system prompt
+            **kwargs: Passed to the wrapped client; phase_name is part of the key
+
+        Returns:
+            LLMResponse from the cache or the wrapped client
+
+        Raises:
+            ValueError: If prompt is empty
+            RuntimeError: If the wrapped client fails
+
+        """
+        response, _ = self._generate_cached(
+            prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            **kwargs,
+        )
+        return response
+
+    def generate_json(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Generate JSON-structured output, answering from the cache when possible.
+
+        Args:
+            prompt: The user prompt/question (should request JSON output)
+            model: Optional model override
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system: Optional system prompt
+            **kwargs: Passed to the wrapped client; phase_name is part of the key
+
+        Returns:
+            Parsed JSON object
+
+        Raises:
+            ValueError: If prompt is empty or output is not valid JSON
+            RuntimeError: If the wrapped client fails
+
+        """
+        response, key = self._generate_cached(
+            prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=((system or "") + JSON_ONLY_INSTRUCTION).strip(),
+            **kwargs,
+        )
+
+        try:
+            return extract_json_from_text(response.content)
+        except ValueError as e:
+            # Don't replay an unparseable answer on the next run
+            self.cache.delete(key)
+            raise ValueError(f"Failed to extract JSON from response: {e}") from e
+
+    async def agenerate(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Asynchronously generate text completion, answering from the cache when possible.
+
+        Args:
+            prompt: The user prompt/question
+            model: Optional model override
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system: Optional system prompt
+            **kwargs: Passed to the wrapped client; phase_name is part of the key
+
+        Returns:
+            LLMResponse from the cache or the wrapped client
+
+        Raises:
+            ValueError: If prompt is empty
+            RuntimeError: If the wrapped client fails
+
+        """
+        response, _ = await self._agenerate_cached(
+            prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            **kwargs,
+        )
+        return response
+
+    async def agenerate_json(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Asynchronously generate JSON output, answering from the cache when possible.
+
+        Args:
+            prompt: The user prompt/question (should request JSON output)
+            model: Optional model override
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system: Optional system prompt
+            **kwargs: Passed to the wrapped client; phase_name is part of the key
+
+        Returns:
+            Parsed JSON object
+
+        Raises:
+            ValueError: If prompt is empty or output is not valid JSON
+            RuntimeError: If the wrapped client fails
+
+        """
+        response, key = await self._agenerate_cached(
+            prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=((system or "") + JSON_ONLY_INSTRUCTION).strip(),
+            **kwargs,
+        )
+
+        try:
+            return extract_json_from_text(response.content)
+        except ValueError as e:
+            # Don't replay an unparseable answer on the next run
+            self.cache.delete(key)
+            raise ValueError(f"Failed to extract JSON from response: {e}") from e
+
+    def _generate_cached(
+        self,
+        prompt: str,
+        *,
+        model: str | None,
+        max_tokens: int,
+        temperature: float,
+        system: str | None,
+        **kwargs: Any,
+    ) -> tuple[LLMResponse, str]:
+        """Serve a request from the cache or the wrapped client.
+
+        Returns:
+            Tuple of (response, cache key)
+
+        """
+        key, cached = self._lookup(prompt, model, max_tokens, temperature, system, kwargs)
+        if cached is not None:
+            return cached, key
+
+        response = self.client.generate(
+            prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            **kwargs,
+        )
+        self.cache.put(key, response)
+        return response, key
+
+    async def _agenerate_cached(
+        self,
+        prompt: str,
+        *,
+        model: str | None,
+        max_tokens: int,
+        temperature: float,
+        system: str | None,
+        **kwargs: Any,
+    ) -> tuple[LLMResponse, str]:
+        """Async counterpart of _generate_cached()."""
+        key, cached = self._lookup(prompt, model, max_tokens, temperature, system, kwargs)
+        if cached is not None:
+            return cached, key
+
+        response = await self.client.agenerate(
+            prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            **kwargs,
+        )
+        self.cache.put(key, response)
+        return response, key
+
+    def _lookup(
+        self,
+        prompt: str,
+        model: str | None,
+        max_tokens: int,
+        temperature: float,
+        system: str | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[str, LLMResponse | None]:
+        """Compute the cache key of a request and look it up.
+
+        Returns:
+            Tuple of (cache key, cached response or None)
+
+        """
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+
+        key = self.cache.make_key(
+            model or self.client.default_model,
+            prompt,
+            system=system,
+            phase=kwargs.get("phase_name"),
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            cached.metadata = {**cached.metadata, "cache_hit": True}
+        return key, cached
+
+    def count_tokens(self, text: str) -> int:
+        """Estimate token count for text using the wrapped client."""
+        return self.client.count_tokens(text)
+
+    @property
+    def default_model(self) -> str:
+        """Get the default model identifier of the wrapped client."""
+        return self.client.default_model
+
+
+__all__ = [
+    "LLMCacheMetrics",
+    "LLMResponseCache",
+    "CachingLLMClient",
+]
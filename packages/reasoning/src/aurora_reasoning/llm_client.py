@@ -1,10 +1,12 @@
 """Abstract LLM client interface and implementations for AURORA reasoning."""
 
+import asyncio
 import json
 import os
 import re
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any, cast
 
 from pydantic import BaseModel
@@ -99,6 +101,89 @@ class LLMClient(ABC):
 
         """
 
+    async def agenerate(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate text completion from prompt without blocking the event loop.
+
+        Independent calls can run concurrently on one loop, e.g. with
+        asyncio.gather(). The default implementation runs generate() in a
+        worker thread; clients with a native async transport override it.
+
+        Args:
+            prompt: The user prompt/question
+            model: Optional model override (uses default if not specified)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
+            system: Optional system prompt
+            **kwargs: Provider-specific parameters
+
+        Returns:
+            LLMResponse with generated content and metadata
+
+        Raises:
+            ValueError: If prompt is empty or invalid
+            RuntimeError: If API call fails after retries
+
+        """
+        return await asyncio.to_thread(
+            self.generate,
+            prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            **kwargs,
+        )
+
+    async def agenerate_json(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Generate JSON-structured output without blocking the event loop.
+
+        The default implementation runs generate_json() in a worker thread;
+        clients with a native async transport override it.
+
+        Args:
+            prompt: The user prompt/question (should request JSON output)
+            model: Optional model override (uses default if not specified)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0 = deterministic, 1.0 = creative)
+            system: Optional system prompt
+            **kwargs: Provider-specific parameters
+
+        Returns:
+            Parsed JSON object as Python dict
+
+        Raises:
+            ValueError: If prompt is empty, invalid, or output is not valid JSON
+            RuntimeError: If API call fails after retries
+
+        """
+        return await asyncio.to_thread(
+            self.generate_json,
+            prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            **kwargs,
+        )
+
     @abstractmethod
     def count_tokens(self, text: str) -> int:
         """Estimate token count for text.
@@ -117,6 +202,80 @@ class LLMClient(ABC):
         """Get the default model identifier for this client."""
 
 
+# Appended to the system prompt by generate_json() implementations
+JSON_ONLY_INSTRUCTION = (
+    "\n\nYou MUST respond with valid JSON only. Do not include markdown code blocks, "
+    "explanations, or any text outside the JSON object."
+)
+
+
+class _AsyncRateLimiter:
+    """Spaces out request starts on an event loop without blocking it."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._next_start = 0.0
+        self._lock: asyncio.Lock | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def wait(self) -> None:
+        """Sleep until the next request may start."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # asyncio.Lock is bound to the loop it is first used on
+            self._lock = asyncio.Lock()
+            self._loop = loop
+
+        assert self._lock is not None
+        async with self._lock:
+            delay = self._next_start - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start = time.monotonic() + self.min_interval
+
+
+class _LoopBoundClient:
+    """Lazily creates an SDK async client per event loop.
+
+    SDK async clients hold connection pools bound to the loop they were first
+    used on, so a client cached across ``asyncio.run()`` calls fails on the
+    next loop. The client is recreated whenever the running loop changes.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._client: Any = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def get(self) -> Any:
+        """Return the client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._client = self._factory()
+            self._loop = loop
+        return self._client
+
+
+async def _agenerate_json(
+    client: LLMClient,
+    prompt: str,
+    *,
+    system: str | None,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Shared agenerate_json() for clients with a native agenerate()."""
+    response = await client.agenerate(
+        prompt=prompt,
+        system=((system or "") + JSON_ONLY_INSTRUCTION).strip(),
+        **kwargs,
+    )
+
+    try:
+        return extract_json_from_text(response.content)
+    except ValueError as e:
+        raise ValueError(f"Failed to extract JSON from response: {e}") from e
+
+
 def extract_json_from_text(text: str) -> dict[str, Any]:
     """Extract JSON from text that may contain markdown code blocks or extra text.
 
@@ -195,6 +354,10 @@ class AnthropicClient(LLMClient):
         self._default_model = default_model
         self._last_request_time = 0.0
         self._min_request_interval = 0.1  # 100ms between requests for rate limiting
+        self._async_rate_limiter = _AsyncRateLimiter(self._min_request_interval)
+        self._async_client = _LoopBoundClient(
+            lambda: self._anthropic.AsyncAnthropic(api_key=self._api_key)
+        )
 
         # Lazy import to avoid requiring anthropic if not used
         try:
@@ -262,21 +425,76 @@ class AnthropicClient(LLMClient):
                 messages=[{"role": "user", "content": prompt}],
                 **kwargs,
             )
+            return self._to_llm_response(response)
+        except Exception as e:
+            raise RuntimeError(f"Anthropic API call failed: {e}") from e
 
-            return LLMResponse(
-                content=response.content[0].text,
-                model=response.model,
-                input_tokens=response.usage.input_tokens,
-                output_tokens=response.usage.output_tokens,
-                finish_reason=response.stop_reason or "unknown",
-                metadata={
-                    "id": response.id,
-                    "stop_sequence": response.stop_sequence,
-                },
+    @retry(
+        retry=retry_if_exception_type(Exception),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.1, min=0.1, max=0.4),
+        reraise=True,
+    )
+    async def agenerate(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate text completion with the async Anthropic client.
+
+        Args:
+            prompt: The user prompt/question
+            model: Optional model override
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system: Optional system prompt
+            **kwargs: Additional Anthropic API parameters
+
+        Returns:
+            LLMResponse with generated content and metadata
+
+        Raises:
+            ValueError: If prompt is empty
+            RuntimeError: If API call fails after retries
+
+        """
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+
+        await self._async_rate_limiter.wait()
+
+        try:
+            response = await self._async_client.get().messages.create(
+                model=model or self._default_model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=system or "",
+                messages=[{"role": "user", "content": prompt}],
+                **kwargs,
             )
+            return self._to_llm_response(response)
         except Exception as e:
             raise RuntimeError(f"Anthropic API call failed: {e}") from e
 
+    def _to_llm_response(self, response: Any) -> LLMResponse:
+        """Convert an Anthropic Messages API response to an LLMResponse."""
+        return LLMResponse(
+            content=response.content[0].text,
+            model=response.model,
+            input_tokens=response.usage.input_tokens,
+            output_tokens=response.usage.output_tokens,
+            finish_reason=response.stop_reason or "unknown",
+            metadata={
+                "id": response.id,
+                "stop_sequence": response.stop_sequence,
+            },
+        )
+
     def generate_json(
         self,
         prompt: str,
@@ -325,6 +543,44 @@ class AnthropicClient(LLMClient):
         except ValueError as e:
             raise ValueError(f"Failed to extract JSON from response: {e}") from e
 
+    async def agenerate_json(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Generate JSON-structured output through agenerate().
+
+        Args:
+            prompt: The user prompt/question (should request JSON output)
+            model: Optional model override
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system: Optional system prompt
+            **kwargs: Additional Anthropic API parameters
+
+        Returns:
+            Parsed JSON object
+
+        Raises:
+            ValueError: If prompt is empty or output is not valid JSON
+            RuntimeError: If API call fails after retries
+
+        """
+        return await _agenerate_json(
+            self,
+            prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            **kwargs,
+        )
+
     def count_tokens(self, text: str) -> int:
         """Estimate token count for text.
 
@@ -381,6 +637,10 @@ class OpenAIClient(LLMClient):
         self._default_model = default_model
         self._last_request_time = 0.0
         self._min_request_interval = 0.1  # 100ms between requests for rate limiting
+        self._async_rate_limiter = _AsyncRateLimiter(self._min_request_interval)
+        self._async_client = _LoopBoundClient(
+            lambda: self._openai.AsyncOpenAI(api_key=self._api_key)
+        )
 
         # Lazy import to avoid requiring openai if not used
         try:
@@ -438,34 +698,92 @@ class OpenAIClient(LLMClient):
         self._rate_limit()
 
         try:
-            messages: list[dict[str, str]] = []
-            if system:
-                messages.append({"role": "system", "content": system})
-            messages.append({"role": "user", "content": prompt})
-
             response = self._client.chat.completions.create(
                 model=model or self._default_model,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                messages=cast(Any, messages),  # OpenAI SDK expects specific message types
+                messages=self._build_messages(prompt, system),
                 **kwargs,
             )
+            return self._to_llm_response(response)
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API call failed: {e}") from e
 
-            choice = response.choices[0]
-            return LLMResponse(
-                content=choice.message.content or "",
-                model=response.model,
-                input_tokens=response.usage.prompt_tokens if response.usage else 0,
-                output_tokens=response.usage.completion_tokens if response.usage else 0,
-                finish_reason=choice.finish_reason or "unknown",
-                metadata={
-                    "id": response.id,
-                    "created": response.created,
-                },
+    @retry(
+        retry=retry_if_exception_type(Exception),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.1, min=0.1, max=0.4),
+        reraise=True,
+    )
+    async def agenerate(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate text completion with the async OpenAI client.
+
+        Args:
+            prompt: The user prompt/question
+            model: Optional model override
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system: Optional system prompt
+            **kwargs: Additional OpenAI API parameters
+
+        Returns:
+            LLMResponse with generated content and metadata
+
+        Raises:
+            ValueError: If prompt is empty
+            RuntimeError: If API call fails after retries
+
+        """
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+
+        await self._async_rate_limiter.wait()
+
+        try:
+            response = await self._async_client.get().chat.completions.create(
+                model=model or self._default_model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=self._build_messages(prompt, system),
+                **kwargs,
             )
+            return self._to_llm_response(response)
         except Exception as e:
             raise RuntimeError(f"OpenAI API call failed: {e}") from e
 
+    @staticmethod
+    def _build_messages(prompt: str, system: str | None) -> Any:
+        """Build the chat message list for a prompt."""
+        messages: list[dict[str, str]] = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        return cast(Any, messages)  # OpenAI SDK expects specific message types
+
+    def _to_llm_response(self, response: Any) -> LLMResponse:
+        """Convert an OpenAI chat completion to an LLMResponse."""
+        choice = response.choices[0]
+        return LLMResponse(
+            content=choice.message.content or "",
+            model=response.model,
+            input_tokens=response.usage.prompt_tokens if response.usage else 0,
+            output_tokens=response.usage.completion_tokens if response.usage else 0,
+            finish_reason=choice.finish_reason or "unknown",
+            metadata={
+                "id": response.id,
+                "created": response.created,
+            },
+        )
+
     def generate_json(
         self,
         prompt: str,
@@ -518,6 +836,44 @@ class OpenAIClient(LLMClient):
         except ValueError as e:
             raise ValueError(f"Failed to extract JSON from response: {e}") from e
 
+    async def agenerate_json(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Generate JSON-structured output through agenerate().
+
+        Args:
+            prompt: The user prompt/question (should request JSON output)
+            model: Optional model override
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system: Optional system prompt
+            **kwargs: Additional OpenAI API parameters
+
+        Returns:
+            Parsed JSON object
+
+        Raises:
+            ValueError: If prompt is empty or output is not valid JSON
+            RuntimeError: If API call fails after retries
+
+        """
+        return await _agenerate_json(
+            self,
+            prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            **kwargs,
+        )
+
     def count_tokens(self, text: str) -> int:
         """Estimate token count for text.
 
@@ -565,6 +921,10 @@ class OllamaClient(LLMClient):
         self._default_model = default_model
         self._last_request_time = 0.0
         self._min_request_interval = 0.05  # 50ms between requests for local models
+        self._async_rate_limiter = _AsyncRateLimiter(self._min_request_interval)
+        self._async_client = _LoopBoundClient(
+            lambda: self._ollama.AsyncClient(host=self._endpoint)
+        )
 
         # Lazy import to avoid requiring ollama if not used
         try:
@@ -636,31 +996,92 @@ class OllamaClient(LLMClient):
                     **kwargs.get("options", {}),
                 },
             )
+            return self._to_llm_response(response, prompt, system)
+        except Exception as e:
+            raise RuntimeError(f"Ollama API call failed: {e}") from e
 
-            # Ollama response structure
-            content = response.get("message", {}).get("content", "")
-            model_used = response.get("model", self._default_model)
-
-            # Estimate tokens (Ollama doesn't always provide this)
-            input_tokens = self.count_tokens(prompt + (system or ""))
-            output_tokens = self.count_tokens(content)
-
-            return LLMResponse(
-                content=content,
-                model=model_used,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                finish_reason=response.get("done_reason", "stop"),
-                metadata={
-                    "total_duration": response.get("total_duration"),
-                    "load_duration": response.get("load_duration"),
-                    "prompt_eval_count": response.get("prompt_eval_count"),
-                    "eval_count": response.get("eval_count"),
+    @retry(
+        retry=retry_if_exception_type(Exception),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.1, min=0.1, max=0.4),
+        reraise=True,
+    )
+    async def agenerate(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate text completion with the async Ollama client.
+
+        Args:
+            prompt: The user prompt/question
+            model: Optional model override
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system: Optional system prompt
+            **kwargs: Additional Ollama API parameters
+
+        Returns:
+            LLMResponse with generated content and metadata
+
+        Raises:
+            ValueError: If prompt is empty
+            RuntimeError: If API call fails after retries
+
+        """
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+
+        await self._async_rate_limiter.wait()
+
+        try:
+            messages = []
+            if system:
+                messages.append({"role": "system", "content": system})
+            messages.append({"role": "user", "content": prompt})
+
+            response = await self._async_client.get().chat(
+                model=model or self._default_model,
+                messages=messages,
+                options={
+                    "temperature": temperature,
+                    "num_predict": max_tokens,
+                    **kwargs.get("options", {}),
                 },
             )
+            return self._to_llm_response(response, prompt, system)
         except Exception as e:
             raise RuntimeError(f"Ollama API call failed: {e}") from e
 
+    def _to_llm_response(self, response: Any, prompt: str, system: str | None) -> LLMResponse:
+        """Convert an Ollama chat response to an LLMResponse."""
+        # Ollama response structure
+        content = response.get("message", {}).get("content", "")
+        model_used = response.get("model", self._default_model)
+
+        # Estimate tokens (Ollama doesn't always provide this)
+        input_tokens = self.count_tokens(prompt + (system or ""))
+        output_tokens = self.count_tokens(content)
+
+        return LLMResponse(
+            content=content,
+            model=model_used,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            finish_reason=response.get("done_reason", "stop"),
+            metadata={
+                "total_duration": response.get("total_duration"),
+                "load_duration": response.get("load_duration"),
+                "prompt_eval_count": response.get("prompt_eval_count"),
+                "eval_count": response.get("eval_count"),
+            },
+        )
+
     def generate_json(
         self,
         prompt: str,
@@ -709,6 +1130,44 @@ class OllamaClient(LLMClient):
         except ValueError as e:
             raise ValueError(f"Failed to extract JSON from response: {e}") from e
 
+    async def agenerate_json(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Generate JSON-structured output through agenerate().
+
+        Args:
+            prompt: The user prompt/question (should request JSON output)
+            model: Optional model override
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system: Optional system prompt
+            **kwargs: Additional Ollama API parameters
+
+        Returns:
+            Parsed JSON object
+
+        Raises:
+            ValueError: If prompt is empty or output is not valid JSON
+            RuntimeError: If API call fails after retries
+
+        """
+        return await _agenerate_json(
+            self,
+            prompt,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            **kwargs,
+        )
+
     def count_tokens(self, text: str) -> int:
         """Estimate token count for text.
 
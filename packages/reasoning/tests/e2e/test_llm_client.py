@@ -1,8 +1,9 @@
 """Unit tests for LLM client interface and implementations."""
 
+import asyncio
 import os
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -362,6 +363,73 @@ class TestAnthropicClient:
         # The sleep function is called at least once to enforce rate limiting
         assert mock_time.sleep.call_count >= 1
 
+    @pytest.mark.asyncio
+    async def test_agenerate_uses_async_client(self, mock_anthropic_module):
+        """Test agenerate awaits the AsyncAnthropic client."""
+        mock_module, mock_client_instance = mock_anthropic_module
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text='{"ok": true}')]
+        mock_response.model = "claude-sonnet-4-20250514"
+        mock_response.usage.input_tokens = 10
+        mock_response.usage.output_tokens = 5
+        mock_response.stop_reason = "end_turn"
+        mock_response.id = "msg_123"
+        mock_response.stop_sequence = None
+        mock_async_client = MagicMock()
+        mock_async_client.messages.create = AsyncMock(return_value=mock_response)
+        mock_module.AsyncAnthropic.return_value = mock_async_client
+
+        client = AnthropicClient(api_key="test-key")
+        response = await client.agenerate("Test prompt", system="sys")
+        result = await client.agenerate_json("Test prompt")
+
+        assert response.content == '{"ok": true}'
+        assert result == {"ok": True}
+        mock_module.AsyncAnthropic.assert_called_once_with(api_key="test-key")
+        assert mock_async_client.messages.create.call_args_list[0][1]["system"] == "sys"
+        assert "valid JSON only" in mock_async_client.messages.create.call_args_list[1][1]["system"]
+        mock_client_instance.messages.create.assert_not_called()
+
+    def test_agenerate_across_event_loops(self, mock_anthropic_module):
+        """Test agenerate works from two event loops used one after the other."""
+        mock_module, _ = mock_anthropic_module
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="ok")]
+        mock_response.model = "claude-sonnet-4-20250514"
+        mock_response.usage.input_tokens = 10
+        mock_response.usage.output_tokens = 5
+        mock_response.stop_reason = "end_turn"
+
+        def make_async_client(**kwargs):
+            # Mimic an SDK client whose connection pool is bound to one loop
+            bound_loop = asyncio.get_running_loop()
+
+            async def create(**create_kwargs):
+                assert asyncio.get_running_loop() is bound_loop
+                return mock_response
+
+            async_client = MagicMock()
+            async_client.messages.create = create
+            return async_client
+
+        mock_module.AsyncAnthropic.side_effect = make_async_client
+
+        client = AnthropicClient(api_key="test-key")
+        responses = []
+        # Explicit loops: asyncio.run() may reuse one loop once nest_asyncio is applied
+        for prompt in ("First prompt", "Second prompt"):
+            loop = asyncio.new_event_loop()
+            try:
+                responses.append(loop.run_until_complete(client.agenerate(prompt)))
+            finally:
+                loop.close()
+        first, second = responses
+
+        assert first.content == second.content == "ok"
+        assert mock_module.AsyncAnthropic.call_count == 2
+
 
 class TestOpenAIClient:
     """Test OpenAIClient implementation."""
@@ -554,6 +622,32 @@ class TestOpenAIClient:
         tokens = client.count_tokens("This is a test")
         assert tokens == len("This is a test") // 4
 
+    @pytest.mark.asyncio
+    async def test_agenerate_uses_async_client(self, mock_openai_module):
+        """Test agenerate awaits the AsyncOpenAI client."""
+        mock_module, mock_client_instance = mock_openai_module
+
+        mock_choice = MagicMock()
+        mock_choice.message.content = "Generated response"
+        mock_choice.finish_reason = "stop"
+        mock_response = MagicMock()
+        mock_response.choices = [mock_choice]
+        mock_response.model = "gpt-4-turbo-preview"
+        mock_response.usage.prompt_tokens = 10
+        mock_response.usage.completion_tokens = 5
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_module.AsyncOpenAI.return_value = mock_async_client
+
+        client = OpenAIClient(api_key="test-key")
+        response = await client.agenerate("Test prompt", system="sys")
+
+        assert response.content == "Generated response"
+        assert response.input_tokens == 10
+        messages = mock_async_client.chat.completions.create.call_args[1]["messages"]
+        assert messages[0] == {"role": "system", "content": "sys"}
+        mock_client_instance.chat.completions.create.assert_not_called()
+
 
 class TestOllamaClient:
     """Test OllamaClient implementation."""
@@ -709,3 +803,21 @@ class TestOllamaClient:
         client = OllamaClient()
         tokens = client.count_tokens("This is a test")
         assert tokens == len("This is a test") // 4
+
+    @pytest.mark.asyncio
+    async def test_agenerate_uses_async_client(self, mock_ollama_module):
+        """Test agenerate awaits the ollama AsyncClient."""
+        mock_module, mock_client_instance = mock_ollama_module
+
+        mock_async_client = MagicMock()
+        mock_async_client.chat = AsyncMock(
+            return_value={"message": {"content": "Generated response"}, "model": "llama2"}
+        )
+        mock_module.AsyncClient.return_value = mock_async_client
+
+        client = OllamaClient(endpoint="http://custom:8080")
+        response = await client.agenerate("Test prompt")
+
+        assert response.content == "Generated response"
+        mock_module.AsyncClient.assert_called_once_with(host="http://custom:8080")
+        mock_client_instance.chat.assert_not_called()
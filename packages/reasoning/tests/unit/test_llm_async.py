@@ -0,0 +1,83 @@
+"""Unit tests for the async LLMClient API."""
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from aurora_reasoning.llm_client import LLMClient, LLMResponse, _AsyncRateLimiter
+
+
+class BlockingClient(LLMClient):
+    """Sync-only client whose generate() blocks until enough calls are in flight."""
+
+    def __init__(self, parties: int):
+        self._barrier = threading.Barrier(parties, timeout=5)
+
+    def generate(self, prompt: str, **kwargs: Any) -> LLMResponse:
+        self._barrier.wait()
+        return LLMResponse(
+            content=f'{{"prompt": "{prompt}"}}',
+            model="blocking",
+            input_tokens=1,
+            output_tokens=1,
+            finish_reason="stop",
+        )
+
+    def generate_json(self, prompt: str, **kwargs: Any) -> dict[str, Any]:
+        self._barrier.wait()
+        return {"prompt": prompt, "system": kwargs.get("system")}
+
+    def count_tokens(self, text: str) -> int:
+        return len(text) // 4
+
+    @property
+    def default_model(self) -> str:
+        return "blocking"
+
+
+class TestDefaultAsyncMethods:
+    """Tests for the thread-offloading defaults on LLMClient."""
+
+    @pytest.mark.asyncio
+    async def test_agenerate_runs_calls_concurrently(self):
+        # Each generate() only returns once all three are running at the same time
+        client = BlockingClient(parties=3)
+
+        responses = await asyncio.gather(*(client.agenerate(f"p{i}") for i in range(3)))
+
+        assert [r.content for r in responses] == [f'{{"prompt": "p{i}"}}' for i in range(3)]
+
+    @pytest.mark.asyncio
+    async def test_agenerate_json_delegates_to_generate_json(self):
+        client = BlockingClient(parties=1)
+
+        result = await client.agenerate_json("p", system="sys")
+
+        assert result == {"prompt": "p", "system": "sys"}
+
+
+class TestAsyncRateLimiter:
+    """Tests for the non-blocking request spacing."""
+
+    @pytest.mark.asyncio
+    async def test_spaces_out_request_starts(self):
+        limiter = _AsyncRateLimiter(0.05)
+        starts: list[float] = []
+
+        async def request() -> None:
+            await limiter.wait()
+            starts.append(time.monotonic())
+
+        await asyncio.gather(*(request() for _ in range(3)))
+
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+
+    def test_usable_across_event_loops(self):
+        limiter = _AsyncRateLimiter(0.0)
+
+        asyncio.run(limiter.wait())
+        asyncio.run(limiter.wait())
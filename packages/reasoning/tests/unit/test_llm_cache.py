@@ -0,0 +1,193 @@
+"""Unit tests for the LLM response cache."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from aurora_reasoning.llm_cache import CachingLLMClient, LLMResponseCache
+from aurora_reasoning.llm_client import LLMClient, LLMResponse
+
+
+class CountingClient(LLMClient):
+    """LLM client stub that counts generate() calls."""
+
+    def __init__(self, content: str = "answer"):
+        self.content = content
+        self.calls: list[dict[str, Any]] = []
+
+    def generate(self, prompt: str, **kwargs: Any) -> LLMResponse:
+        self.calls.append({"prompt": prompt, **kwargs})
+        return LLMResponse(
+            content=self.content,
+            model="stub-model",
+            input_tokens=1,
+            output_tokens=1,
+            finish_reason="stop",
+        )
+
+    def generate_json(self, prompt: str, **kwargs: Any) -> dict[str, Any]:
+        raise AssertionError("CachingLLMClient must not delegate generate_json")
+
+    def count_tokens(self, text: str) -> int:
+        return len(text) // 4
+
+    @property
+    def default_model(self) -> str:
+        return "stub-model"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(tmp_path / "llm_cache.db")
+
+
+class TestLLMResponseCache:
+    """Tests for the SQLite response store."""
+
+    def test_key_covers_request_fields(self):
+        base = LLMResponseCache.make_key("sonnet", "prompt", system="sys", phase="decompose")
+
+        assert base == LLMResponseCache.make_key(
+            "sonnet", "prompt", system="sys", phase="decompose"
+        )
+        assert base != LLMResponseCache.make_key("opus", "prompt", system="sys", phase="decompose")
+        assert base != LLMResponseCache.make_key("sonnet", "prompt", system=None, phase="decompose")
+        assert base != LLMResponseCache.make_key("sonnet", "prompt", system="sys", phase="verify")
+
+    def test_round_trip_and_metrics(self, cache):
+        response = LLMResponse(
+            content="hi", model="m", input_tokens=1, output_tokens=2, finish_reason="stop"
+        )
+
+        assert cache.get("k") is None
+        cache.put("k", response)
+
+        assert cache.get("k") == response
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_expired_entries_are_misses(self, tmp_path, monkeypatch):
+        cache = LLMResponseCache(tmp_path / "llm_cache.db", ttl_hours=1)
+        response = LLMResponse(
+            content="hi", model="m", input_tokens=1, output_tokens=1, finish_reason="stop"
+        )
+        now = 1_000_000.0
+        monkeypatch.setattr("aurora_reasoning.llm_cache.time.time", lambda: now)
+        cache.put("k", response)
+
+        now += 3601
+        assert cache.get("k") is None
+        assert cache.metrics.expired == 1
+        assert cache.get_stats()["entries"] == 0
+
+    def test_evicts_least_recently_used(self, tmp_path, monkeypatch):
+        cache = LLMResponseCache(tmp_path / "llm_cache.db", max_entries=2)
+        response = LLMResponse(
+            content="hi", model="m", input_tokens=1, output_tokens=1, finish_reason="stop"
+        )
+        clock = iter(range(1_000_000, 1_000_100))
+        monkeypatch.setattr("aurora_reasoning.llm_cache.time.time", lambda: float(next(clock)))
+
+        cache.put("a", response)
+        cache.put("b", response)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", response)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.metrics.evictions == 1
+
+    def test_unusable_path_degrades_to_misses(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = LLMResponseCache(blocker / "llm_cache.db")
+        response = LLMResponse(
+            content="hi", model="m", input_tokens=1, output_tokens=1, finish_reason="stop"
+        )
+
+        cache.put("k", response)
+
+        assert cache.get("k") is None
+
+
+class TestCachingLLMClient:
+    """Tests for the caching client wrapper."""
+
+    def test_repeated_prompt_served_from_cache(self, cache):
+        inner = CountingClient()
+        client = CachingLLMClient(inner, cache)
+
+        first = client.generate("Explain SOAR", system="sys", phase_name="decompose")
+        second = client.generate("Explain SOAR", system="sys", phase_name="decompose")
+
+        assert len(inner.calls) == 1
+        assert inner.calls[0]["phase_name"] == "decompose"
+        assert second.content == first.content
+        assert second.metadata["cache_hit"] is True
+        assert "cache_hit" not in first.metadata
+
+    def test_different_phase_misses(self, cache):
+        inner = CountingClient()
+        client = CachingLLMClient(inner, cache)
+
+        client.generate("Explain SOAR", phase_name="decompose")
+        client.generate("Explain SOAR", phase_name="verify")
+
+        assert len(inner.calls) == 2
+
+    def test_cache_shared_across_client_instances(self, tmp_path):
+        path = tmp_path / "llm_cache.db"
+        first_inner, second_inner = CountingClient(), CountingClient()
+
+        CachingLLMClient(first_inner, LLMResponseCache(path)).generate("prompt")
+        CachingLLMClient(second_inner, LLMResponseCache(path)).generate("prompt")
+
+        assert len(first_inner.calls) == 1
+        assert second_inner.calls == []
+
+    def test_generate_json_uses_cache(self, cache):
+        inner = CountingClient('{"subgoals": []}')
+        client = CachingLLMClient(inner, cache)
+
+        assert client.generate_json("decompose this") == {"subgoals": []}
+        assert client.generate_json("decompose this") == {"subgoals": []}
+        assert len(inner.calls) == 1
+        assert "valid JSON only" in inner.calls[0]["system"]
+
+    def test_unparseable_json_is_not_replayed(self, cache):
+        inner = CountingClient("not json")
+        client = CachingLLMClient(inner, cache)
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Failed to extract JSON"):
+                client.generate_json("decompose this")
+
+        assert len(inner.calls) == 2
+
+    def test_empty_prompt_rejected(self, cache):
+        with pytest.raises(ValueError, match="Prompt cannot be empty"):
+            CachingLLMClient(CountingClient(), cache).generate("  ")
+
+    @pytest.mark.asyncio
+    async def test_agenerate_served_from_cache(self, cache):
+        inner = CountingClient('{"ok": true}')
+        client = CachingLLMClient(inner, cache)
+
+        results = [await client.agenerate_json("verify", phase_name="verify") for _ in range(2)]
+
+        assert results == [{"ok": True}, {"ok": True}]
+        assert len(inner.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_agenerate_concurrent_distinct_prompts(self, cache):
+        inner = CountingClient()
+        client = CachingLLMClient(inner, cache)
+
+        responses = await asyncio.gather(*(client.agenerate(f"prompt {i}") for i in range(4)))
+
+        assert [r.content for r in responses] == ["answer"] * 4
+        assert sorted(call["prompt"] for call in inner.calls) == [f"prompt {i}" for i in range(4)]
+
@@ -307,9 +307,17 @@ async def execute_agents(
 
     SOAR-specific handling:
     - Converts agent_assignments to SpawnTask list
+    - Schedules subgoals as a dependency DAG: each subgoal starts as soon as
+      all of its depends_on predecessors finished (at most 4 agents at once),
+      instead of waiting for the whole previous wave
+    - Injects predecessor outputs into each prompt when the subgoal starts
     - Handles is_spawn ad-hoc agent prompts
     - Converts SpawnResult list to AgentOutput list
 
+    Waves from topological_sort() are still used for reporting: a wave is
+    announced when its first subgoal starts and logged as complete when its
+    last subgoal finishes.
+
     Args:
         agent_assignments: List of (subgoal_index, AgentInfo) tuples
         subgoals: List of subgoal dictionaries from decomposition
@@ -325,225 +333,184 @@ async def execute_agents(
     """
     start_time = time.time()
 
-    # Build subgoal map for lookup
-    subgoal_map = {}
-    for i, sg in enumerate(subgoals):
-        idx = sg.get("subgoal_index", i)
-        subgoal_map[idx] = sg
-
     # Build agent assignment map
     agent_map = {subgoal_idx: agent for subgoal_idx, agent in agent_assignments}
 
-    # Perform topological sort to get dependency waves
+    # Perform topological sort to get dependency waves (for ordering and reporting)
     waves = topological_sort(subgoals)
+    wave_of = {
+        sg["subgoal_index"]: wave_num for wave_num, wave in enumerate(waves, 1) for sg in wave
+    }
 
-    # Track outputs and failures across waves
-    outputs: dict[int, SpawnResult] = {}
-    failed_subgoals: set[int] = set()
-    agent_outputs: list[AgentOutput] = []
-    fallback_agents: list[str] = []
-    total_failed = 0
-    total_fallback = 0
-    agent_matcher = None
-
-    # Execute waves sequentially
-    for wave_num, wave in enumerate(waves, 1):
-        wave_msg = f"Wave {wave_num}/{len(waves)} ({len(wave)} subgoals)..."
-        logger.info(wave_msg)
-        print(f"\n  {wave_msg}", file=sys.stderr, flush=True)  # Force visible output
-
-        # Build SpawnTask list for this wave with context injection
-        spawn_tasks: list[SpawnTask] = []
-        task_metadata: list[dict[str, Any]] = []
-
-        for sg in wave:
-            subgoal_idx = sg["subgoal_index"]
-            agent = agent_map.get(subgoal_idx)
-            if not agent:
-                logger.warning(f"No agent assigned for subgoal {subgoal_idx}, skipping")
-                continue
-
-            # Inject previous outputs for dependencies
-            raw_deps = sg.get("depends_on", [])
-            # Normalize dependencies: handle both int (0) and string ("sg-1") formats
-            deps = _normalize_dependencies(raw_deps)
-            original_prompt = sg.get("prompt") or sg.get("description", "")
-
-            if deps:
-                successful_deps = [idx for idx in deps if idx in outputs and outputs[idx].success]
-                failed_deps = [idx for idx in deps if idx in outputs and not outputs[idx].success]
-
-                dep_outputs = []
-                # Add successful outputs with ✓ marker
-                for idx in successful_deps:
-                    dep_outputs.append(f"✓ [sg-{idx}]: {outputs[idx].output}")
-
-                # Add failure markers with ✗
-                for idx in failed_deps:
-                    error_summary = outputs[idx].error or "Unknown error"
-                    dep_outputs.append(f"✗ [sg-{idx}]: FAILED - {error_summary}")
-
-                if dep_outputs:
-                    accumulated = "\n".join(dep_outputs)
-                    warning = ""
-                    if failed_deps:
-                        warning = f"\n\nWARNING: {len(failed_deps)}/{len(deps)} dependencies failed. Proceed with available context."
-
-                    modified_prompt = f"{original_prompt}\n\nPrevious context ({len(successful_deps)}/{len(deps)} dependencies):\n{accumulated}{warning}"
-                    sg["has_partial_context"] = len(failed_deps) > 0
-
-                    # DEBUG: Log context assembly
-                    logger.debug(
-                        f"Subgoal {subgoal_idx}: assembled context from {len(successful_deps)} successful "
-                        f"+ {len(failed_deps)} failed dependencies ({len(accumulated)} chars)",
-                    )
-                else:
-                    modified_prompt = original_prompt
-            else:
-                modified_prompt = original_prompt
-
-            # Build prompt (regular or ad-hoc spawn)
-            is_spawn = agent.config.get("is_spawn", False)
-
-            if is_spawn:
-                # Ad-hoc spawn: use spawn prompt from AgentMatcher
-                if agent_matcher is None:
-                    agent_matcher = _get_agent_matcher()
-
-                if agent_matcher:
-                    prompt = agent_matcher._create_spawn_prompt(
-                        agent_name=agent.id,
-                        agent_desc=getattr(agent, "description", ""),
-                        task_description=modified_prompt,
-                    )
-                else:
-                    # Fallback: build a simple spawn prompt without AgentMatcher
-                    prompt = f"""For this specific request, act as a {agent.id} specialist - {getattr(agent, "description", "specialist agent")}.
+    # Schedule every subgoal with an assigned agent, in wave order
+    task_metadata: list[dict[str, Any]] = []
+    for sg in (sg for wave in waves for sg in wave):
+        subgoal_idx = sg["subgoal_index"]
+        agent = agent_map.get(subgoal_idx)
+        if not agent:
+            logger.warning(f"No agent assigned for subgoal {subgoal_idx}, skipping")
+            continue
+        task_metadata.append(
+            {
+                "subgoal_idx": subgoal_idx,
+                "agent": agent,
+                "is_spawn": agent.config.get("is_spawn", False),
+                "subgoal": sg,
+            },
+        )
 
-Task: {modified_prompt}
+    # Predecessors of each scheduled task (dependencies that are not scheduled are ignored)
+    position = {meta["subgoal_idx"]: i for i, meta in enumerate(task_metadata)}
+    depends_on = [
+        list(
+            dict.fromkeys(
+                position[dep]
+                for dep in _normalize_dependencies(meta["subgoal"].get("depends_on", []))
+                if dep in position
+            ),
+        )
+        for meta in task_metadata
+    ]
 
-IMPORTANT: Emit brief progress updates (e.g., "Analyzing...", "Found X...") as you work.
+    # Placeholder tasks; prompts are built in prepare_task once dependencies finished
+    spawn_tasks = [
+        SpawnTask(
+            prompt=meta["subgoal"].get("prompt") or meta["subgoal"].get("description", ""),
+            agent=None if meta["is_spawn"] else meta["agent"].id,
+            policy_name="patient",
+            display_name=meta["agent"].id,
+        )
+        for meta in task_metadata
+    ]
 
-Please complete this task directly without additional questions or preamble. Provide the complete deliverable."""
+    # Track outputs and per-wave progress
+    outputs: dict[int, SpawnResult] = {}
+    wave_sizes: dict[int, int] = {}
+    for meta in task_metadata:
+        wave_num = wave_of[meta["subgoal_idx"]]
+        wave_sizes[wave_num] = wave_sizes.get(wave_num, 0) + 1
+    started_waves: set[int] = set()
+    finished_by_wave: dict[int, list[int]] = {wave_num: [] for wave_num in wave_sizes}
+    agent_matcher = None
 
-                logger.info(f"Ad-hoc spawning agent '{agent.id}' for subgoal {subgoal_idx}")
-                spawn_agent = None  # Direct LLM call for ad-hoc
-            else:
-                # Regular agent: use modified prompt (already includes context if deps exist)
-                prompt = modified_prompt
-                spawn_agent = agent.id
-
-            spawn_tasks.append(
-                SpawnTask(
-                    prompt=prompt,
-                    agent=spawn_agent,
-                    policy_name="patient",
-                    display_name=agent.id,
-                ),
-            )
-            task_metadata.append(
-                {
-                    "subgoal_idx": subgoal_idx,
-                    "agent": agent,
-                    "is_spawn": is_spawn,
-                    "subgoal": sg,
-                },
+    def prepare_task(task_idx: int) -> SpawnTask:
+        """Build the SpawnTask for a subgoal whose dependencies have finished."""
+        nonlocal agent_matcher
+        meta = task_metadata[task_idx]
+
+        wave_num = wave_of[meta["subgoal_idx"]]
+        if wave_num not in started_waves:
+            started_waves.add(wave_num)
+            wave_msg = f"Wave {wave_num}/{len(waves)} ({wave_sizes[wave_num]} subgoals)..."
+            logger.info(wave_msg)
+            print(f"\n  {wave_msg}", file=sys.stderr, flush=True)  # Force visible output
+
+        if meta["is_spawn"] and agent_matcher is None:
+            agent_matcher = _get_agent_matcher()
+
+        return _build_subgoal_task(meta["subgoal"], meta["agent"], outputs, agent_matcher)
+
+    def on_result(task_idx: int, result: SpawnResult) -> None:
+        """Store a finished subgoal's output and report completed waves."""
+        subgoal_idx = task_metadata[task_idx]["subgoal_idx"]
+
+        # Store result for context passing to dependent subgoals
+        outputs[subgoal_idx] = result
+
+        wave_num = wave_of[subgoal_idx]
+        finished_by_wave[wave_num].append(task_idx)
+        if len(finished_by_wave[wave_num]) == wave_sizes[wave_num]:
+            _log_wave_complete(
+                wave_num,
+                len(waves),
+                [outputs[task_metadata[i]["subgoal_idx"]] for i in finished_by_wave[wave_num]],
+                [task_metadata[i] for i in finished_by_wave[wave_num]],
             )
 
-        # Execute this wave using spawn_parallel_tracked
-        results, exec_metadata = await spawn_parallel_tracked(
-            tasks=spawn_tasks,
-            max_concurrent=4,
-            stagger_delay=5.0,
-            policy_name="patient",
-            on_progress=on_progress,
-            fallback_to_llm=fallback_to_llm,
-            max_retries=max_retries,
-        )
+    # Execute all subgoals; each starts as soon as its own dependencies finished
+    results, _exec_metadata = await spawn_parallel_tracked(
+        tasks=spawn_tasks,
+        max_concurrent=4,
+        stagger_delay=5.0,
+        policy_name="patient",
+        on_progress=on_progress,
+        fallback_to_llm=fallback_to_llm,
+        max_retries=max_retries,
+        depends_on=depends_on,
+        prepare_task=prepare_task,
+        on_result=on_result,
+    )
 
-        # Process results from this wave
-        for i, result in enumerate(results):
-            meta = task_metadata[i]
-            subgoal_idx = meta["subgoal_idx"]
-            agent = meta["agent"]
-            is_spawn = meta["is_spawn"]
-            sg = meta["subgoal"]
+    # Track outputs and failures
+    agent_outputs: list[AgentOutput] = []
+    fallback_agents: list[str] = []
+    total_failed = 0
+    total_fallback = 0
 
-            # Store result for context passing to dependent subgoals
-            outputs[subgoal_idx] = result
+    # Process results in wave order
+    for i, result in enumerate(results):
+        meta = task_metadata[i]
+        subgoal_idx = meta["subgoal_idx"]
+        agent = meta["agent"]
+        is_spawn = meta["is_spawn"]
+        sg = meta["subgoal"]
+
+        outputs[subgoal_idx] = result
+
+        # DEBUG: Log spawn result details
+        logger.debug(
+            f"Subgoal {subgoal_idx} result: success={result.success}, "
+            f"exit_code={result.exit_code}, output_len={len(result.output) if result.output else 0}, "
+            f"fallback={getattr(result, 'fallback', False)}",
+        )
 
-            # DEBUG: Log spawn result details
-            logger.debug(
-                f"Subgoal {subgoal_idx} result: success={result.success}, "
-                f"exit_code={result.exit_code}, output_len={len(result.output) if result.output else 0}, "
-                f"fallback={getattr(result, 'fallback', False)}",
+        if not result.success:
+            total_failed += 1
+            logger.warning(
+                f"Subgoal {subgoal_idx} failed after retries, dependents will receive partial context",
             )
 
-            if not result.success:
-                failed_subgoals.add(subgoal_idx)
-                total_failed += 1
-                logger.warning(
-                    f"Subgoal {subgoal_idx} failed after retries, dependents will receive partial context",
-                )
-
-            # Track fallback usage
-            if getattr(result, "fallback", False):
-                fallback_agents.append(agent.id)
-                total_fallback += 1
-
-            # Build AgentOutput
-            if result.success:
-                agent_outputs.append(
-                    AgentOutput(
-                        subgoal_index=subgoal_idx,
-                        agent_id=agent.id,
-                        success=True,
-                        summary=result.output,
-                        confidence=0.85,
-                        execution_metadata={
-                            "exit_code": result.exit_code,
-                            "spawned": is_spawn,
-                            "termination_reason": getattr(result, "termination_reason", None),
-                            "fallback": getattr(result, "fallback", False),
-                            "partial_context": sg.get("has_partial_context", False),
-                        },
-                    ),
-                )
-                if sg.get("has_partial_context"):
-                    logger.info(f"Subgoal {subgoal_idx} completed with partial context (⚠)")
-            else:
-                agent_outputs.append(
-                    AgentOutput(
-                        subgoal_index=subgoal_idx,
-                        agent_id=agent.id,
-                        success=False,
-                        summary="",
-                        confidence=0.0,
-                        error=result.error or "Agent execution failed",
-                        execution_metadata={
-                            "exit_code": result.exit_code,
-                            "spawned": is_spawn,
-                            "termination_reason": getattr(result, "termination_reason", None),
-                        },
-                    ),
-                )
-
-        # Log wave completion with emoji markers
-        wave_success_count = sum(1 for r in results if r.success)
-        wave_fail_count = sum(1 for r in results if not r.success)
-        wave_partial_count = sum(
-            1 for m in task_metadata if m["subgoal"].get("has_partial_context", False)
-        )
-
-        markers = []
-        if wave_success_count > 0:
-            markers.append(f"✓ {wave_success_count}")
-        if wave_fail_count > 0:
-            markers.append(f"✗ {wave_fail_count}")
-        if wave_partial_count > 0:
-            markers.append(f"⚠ {wave_partial_count}")
+        # Track fallback usage
+        if getattr(result, "fallback", False):
+            fallback_agents.append(agent.id)
+            total_fallback += 1
 
-        logger.info(f"Wave {wave_num}/{len(waves)} complete: {' '.join(markers)}")
+        # Build AgentOutput
+        if result.success:
+            agent_outputs.append(
+                AgentOutput(
+                    subgoal_index=subgoal_idx,
+                    agent_id=agent.id,
+                    success=True,
+                    summary=result.output,
+                    confidence=0.85,
+                    execution_metadata={
+                        "exit_code": result.exit_code,
+                        "spawned": is_spawn,
+                        "termination_reason": getattr(result, "termination_reason", None),
+                        "fallback": getattr(result, "fallback", False),
+                        "partial_context": sg.get("has_partial_context", False),
+                    },
+                ),
+            )
+            if sg.get("has_partial_context"):
+                logger.info(f"Subgoal {subgoal_idx} completed with partial context (⚠)")
+        else:
+            agent_outputs.append(
+                AgentOutput(
+                    subgoal_index=subgoal_idx,
+                    agent_id=agent.id,
+                    success=False,
+                    summary="",
+                    confidence=0.0,
+                    error=result.error or "Agent execution failed",
+                    execution_metadata={
+                        "exit_code": result.exit_code,
+                        "spawned": is_spawn,
+                        "termination_reason": getattr(result, "termination_reason", None),
+                    },
+                ),
+            )
 
     # Build execution metadata
     execution_metadata = {
@@ -557,6 +524,7 @@ Please complete this task directly without additional questions or preamble. Pro
         "retried_agents": [],
         "spawned_agents": [m["agent"].id for m in task_metadata if m["is_spawn"]],
         "spawn_count": sum(1 for m in task_metadata if m["is_spawn"]),
+        "waves": len(waves),
     }
 
     # Calculate final summary counts
@@ -577,6 +545,125 @@ Please complete this task directly without additional questions or preamble. Pro
     )
 
 
+def _build_subgoal_task(
+    sg: dict[str, Any],
+    agent: AgentInfo,
+    outputs: dict[int, SpawnResult],
+    agent_matcher: Any,
+) -> SpawnTask:
+    """Build the SpawnTask for a subgoal, injecting finished dependency outputs.
+
+    Args:
+        sg: Subgoal dictionary
+        agent: Agent assigned to the subgoal
+        outputs: Results of finished subgoals by subgoal index
+        agent_matcher: AgentMatcher for ad-hoc spawn prompts (None for fallback prompt)
+
+    Returns:
+        SpawnTask ready to execute
+
+    """
+    subgoal_idx = sg["subgoal_index"]
+
+    # Inject previous outputs for dependencies
+    raw_deps = sg.get("depends_on", [])
+    # Normalize dependencies: handle both int (0) and string ("sg-1") formats
+    deps = _normalize_dependencies(raw_deps)
+    original_prompt = sg.get("prompt") or sg.get("description", "")
+
+    if deps:
+        successful_deps = [idx for idx in deps if idx in outputs and outputs[idx].success]
+        failed_deps = [idx for idx in deps if idx in outputs and not outputs[idx].success]
+
+        dep_outputs = []
+        # Add successful outputs with ✓ marker
+        for idx in successful_deps:
+            dep_outputs.append(f"✓ [sg-{idx}]: {outputs[idx].output}")
+
+        # Add failure markers with ✗
+        for idx in failed_deps:
+            error_summary = outputs[idx].error or "Unknown error"
+            dep_outputs.append(f"✗ [sg-{idx}]: FAILED - {error_summary}")
+
+        if dep_outputs:
+            accumulated = "\n".join(dep_outputs)
+            warning = ""
+            if failed_deps:
+                warning = f"\n\nWARNING: {len(failed_deps)}/{len(deps)} dependencies failed. Proceed with available context."
+
+            modified_prompt = f"{original_prompt}\n\nPrevious context ({len(successful_deps)}/{len(deps)} dependencies):\n{accumulated}{warning}"
+            sg["has_partial_context"] = len(failed_deps) > 0
+
+            # DEBUG: Log context assembly
+            logger.debug(
+                f"Subgoal {subgoal_idx}: assembled context from {len(successful_deps)} successful "
+                f"+ {len(failed_deps)} failed dependencies ({len(accumulated)} chars)",
+            )
+        else:
+            modified_prompt = original_prompt
+    else:
+        modified_prompt = original_prompt
+
+    # Build prompt (regular or ad-hoc spawn)
+    is_spawn = agent.config.get("is_spawn", False)
+
+    if is_spawn:
+        # Ad-hoc spawn: use spawn prompt from AgentMatcher
+        if agent_matcher:
+            prompt = agent_matcher._create_spawn_prompt(
+                agent_name=agent.id,
+                agent_desc=getattr(agent, "description", ""),
+                task_description=modified_prompt,
+            )
+        else:
+            # Fallback: build a simple spawn prompt without AgentMatcher
+            prompt = f"""For this specific request, act as a {agent.id} specialist - {getattr(agent, "description", "specialist agent")}.
+
+Task: {modified_prompt}
+
+IMPORTANT: Emit brief progress updates (e.g., "Analyzing...", "Found X...") as you work.
+
+Please complete this task directly without additional questions or preamble. Provide the complete deliverable."""
+
+        logger.info(f"Ad-hoc spawning agent '{agent.id}' for subgoal {subgoal_idx}")
+        spawn_agent = None  # Direct LLM call for ad-hoc
+    else:
+        # Regular agent: use modified prompt (already includes context if deps exist)
+        prompt = modified_prompt
+        spawn_agent = agent.id
+
+    return SpawnTask(
+        prompt=prompt,
+        agent=spawn_agent,
+        policy_name="patient",
+        display_name=agent.id,
+    )
+
+
+def _log_wave_complete(
+    wave_num: int,
+    total_waves: int,
+    results: list[SpawnResult],
+    task_metadata: list[dict[str, Any]],
+) -> None:
+    """Log wave completion with emoji markers."""
+    wave_success_count = sum(1 for r in results if r.success)
+    wave_fail_count = sum(1 for r in results if not r.success)
+    wave_partial_count = sum(
+        1 for m in task_metadata if m["subgoal"].get("has_partial_context", False)
+    )
+
+    markers = []
+    if wave_success_count > 0:
+        markers.append(f"✓ {wave_success_count}")
+    if wave_fail_count > 0:
+        markers.append(f"✗ {wave_fail_count}")
+    if wave_partial_count > 0:
+        markers.append(f"⚠ {wave_partial_count}")
+
+    logger.info(f"Wave {wave_num}/{total_waves} complete: {' '.join(markers)}")
+
+
 async def _execute_parallel_subgoals(
     subgoals: list[dict[str, Any]],
     agent_map: dict[int, AgentInfo],
@@ -1,6 +1,16 @@
-"""Tests for SOAR collect phase (topological sort)."""
+"""Tests for SOAR collect phase (topological sort, dependency scheduling)."""
 
-from aurora_soar.phases.collect import topological_sort
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from aurora_soar.phases import collect
+from aurora_soar.phases.collect import execute_agents, topological_sort
+from aurora_spawner import SpawnResult, spawn_parallel_tracked
 
 # ============================================================================
 # Helpers
@@ -72,3 +82,58 @@ class TestTopologicalSort:
         assert len(waves) == 2
         assert {sg["subgoal_index"] for sg in waves[0]} == {1, 3}
         assert {sg["subgoal_index"] for sg in waves[1]} == {2, 4}
+
+
+# ============================================================================
+# Dependency scheduling
+# ============================================================================
+
+
+class TestExecuteAgentsScheduling:
+    @pytest.fixture
+    def fake_spawn(self):
+        """Fake agent runs: prompts starting with "slow" take longer."""
+        finished: dict[str, float] = {}
+        prompts: dict[str, str] = {}
+
+        async def run(task, **kwargs):
+            prompts[task.prompt.split()[0]] = task.prompt
+            await asyncio.sleep(0.3 if task.prompt.startswith("slow") else 0.01)
+            finished[task.prompt.split()[0]] = time.monotonic()
+            return SpawnResult(
+                success=True, output=f"done {task.prompt.split()[0]}", error=None, exit_code=0
+            )
+
+        async def no_stagger(**kwargs):
+            return await spawn_parallel_tracked(
+                **kwargs | {"stagger_delay": 0.0, "enable_heartbeat": False}
+            )
+
+        with (
+            patch("aurora_spawner.spawner.spawn_with_retry_and_fallback", side_effect=run),
+            patch.object(collect, "spawn_parallel_tracked", side_effect=no_stagger),
+        ):
+            yield SimpleNamespace(finished=finished, prompts=prompts)
+
+    @pytest.mark.asyncio
+    async def test_dependent_does_not_wait_for_wave(self, fake_spawn, caplog):
+        subgoals = [
+            _subgoal(0, "slow-A"),
+            _subgoal(1, "fast-B"),
+            _subgoal(2, "after-B", depends_on=[1]),
+        ]
+        agent = SimpleNamespace(id="worker", config={}, description="")
+        assignments = [(sg["subgoal_index"], agent) for sg in subgoals]
+
+        with caplog.at_level(logging.INFO, logger="aurora_soar.phases.collect"):
+            result = await execute_agents(assignments, subgoals, {})
+
+        # after-B ran with B's output and finished while A was still running
+        assert "done fast-B" in fake_spawn.prompts["after-B"]
+        assert fake_spawn.finished["after-B"] < fake_spawn.finished["slow-A"]
+
+        assert [o.subgoal_index for o in result.agent_outputs] == [0, 1, 2]
+        assert all(o.success for o in result.agent_outputs)
+        assert result.execution_metadata["waves"] == 2
+        assert "Wave 1/2 complete: ✓ 2" in caplog.text
+        assert "Wave 2/2 complete: ✓ 1" in caplog.text
@@ -903,6 +903,52 @@ async def spawn_sequential(
     return results
 
 
+def _dependency_depth(depends_on: list[list[int]], total_tasks: int) -> int:
+    """Validate a task dependency graph and return its longest chain length.
+
+    Args:
+        depends_on: Predecessor task indices per task
+        total_tasks: Number of tasks
+
+    Returns:
+        Number of tasks on the longest dependency chain
+
+    Raises:
+        ValueError: If depends_on does not match the tasks or contains a cycle
+
+    """
+    if len(depends_on) != total_tasks:
+        raise ValueError(f"depends_on has {len(depends_on)} entries for {total_tasks} tasks")
+
+    dependents: list[list[int]] = [[] for _ in range(total_tasks)]
+    in_degree = [0] * total_tasks
+    for idx, deps in enumerate(depends_on):
+        for dep in set(deps):
+            if not 0 <= dep < total_tasks or dep == idx:
+                raise ValueError(f"Task {idx} has invalid dependency {dep}")
+            dependents[dep].append(idx)
+            in_degree[idx] += 1
+
+    # Kahn's algorithm, level by level
+    level = [idx for idx in range(total_tasks) if in_degree[idx] == 0]
+    depth = 0
+    visited = 0
+    while level:
+        depth += 1
+        visited += len(level)
+        next_level = []
+        for idx in level:
+            for dependent in dependents[idx]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    next_level.append(dependent)
+        level = next_level
+
+    if visited != total_tasks:
+        raise ValueError("Task dependencies contain a cycle")
+    return depth
+
+
 async def spawn_parallel_tracked(
     tasks: list[SpawnTask],
     max_concurrent: int = 4,
@@ -913,6 +959,9 @@ async def spawn_parallel_tracked(
     global_timeout_buffer: float = 120.0,
     fallback_to_llm: bool = True,
     max_retries: int = 2,
+    depends_on: list[list[int]] | None = None,
+    prepare_task: Callable[[int], SpawnTask] | None = None,
+    on_result: Callable[[int, SpawnResult], None] | None = None,
     **kwargs: Any,
 ) -> tuple[list[SpawnResult], dict[str, Any]]:
     """Spawn subprocesses in parallel with full tracking, staggering, and heartbeat.
@@ -928,6 +977,10 @@ async def spawn_parallel_tracked(
     - Circuit breaker pre-checks for fast-fail
     - Retry with exponential backoff + LLM fallback
     - Execution metadata collection
+    - Optional dependency scheduling: with depends_on, each task starts as soon
+      as all of its predecessors finished (no wave barriers). Waiting tasks do
+      not hold a concurrency slot, and stagger_delay becomes the minimum gap
+      between consecutive starts.
 
     Args:
         tasks: List of SpawnTask to execute in parallel
@@ -939,11 +992,19 @@ async def spawn_parallel_tracked(
         global_timeout_buffer: Additional buffer for global timeout (default: 120s)
         fallback_to_llm: Fall back to LLM if agent fails (default: True)
         max_retries: Maximum retries per task (default: 2)
+        depends_on: Optional predecessor task indices per task (must be acyclic)
+        prepare_task: Optional callback(idx) returning the task to run, called
+            when task idx starts (e.g. to inject predecessor outputs into its prompt)
+        on_result: Optional callback(idx, result) called when task idx finishes,
+            before its dependents are released
         **kwargs: Additional arguments passed to spawn()
 
     Returns:
         Tuple of (results list, execution metadata dict)
 
+    Raises:
+        ValueError: If depends_on does not match tasks or contains a cycle
+
     Metadata includes:
         - total_duration_ms: Total execution time
         - early_terminations: List of early termination events
@@ -984,10 +1045,13 @@ async def spawn_parallel_tracked(
     policy = SpawnPolicy.from_name(policy_name)
     policy_max_timeout = policy.timeout_policy.max_timeout
 
+    # Longest dependency chain (1 without dependencies)
+    dependency_depth = _dependency_depth(depends_on, total_tasks) if depends_on is not None else 1
+
     # Calculate global timeout
     # Must accommodate: waves * max_timeout + stagger + buffer
     stagger_delay_total = (total_tasks - 1) * stagger_delay
-    num_waves = math.ceil(total_tasks / max_concurrent) if total_tasks > 0 else 1
+    num_waves = max(math.ceil(total_tasks / max_concurrent), dependency_depth)
     global_timeout = (num_waves * policy_max_timeout) + stagger_delay_total + global_timeout_buffer
 
     logger.info(
@@ -1000,6 +1064,20 @@ async def spawn_parallel_tracked(
     completed_count = 0
     results: list[SpawnResult | None] = [None] * total_tasks  # Preserve order
 
+    # Dependency scheduling: per-task completion events and start slots
+    finished = [asyncio.Event() for _ in tasks]
+    next_start = 0.0
+
+    def reserve_start(idx: int) -> float:
+        """Return how long task idx waits before starting (stagger)."""
+        nonlocal next_start
+        if depends_on is None:
+            return idx * stagger_delay
+        now = time.monotonic()
+        start_at = max(now, next_start)
+        next_start = start_at + stagger_delay
+        return start_at - now
+
     async def tracked_spawn(idx: int, task: SpawnTask) -> SpawnResult:
         """Spawn single task with stagger, heartbeat, and tracking."""
         nonlocal completed_count
@@ -1008,7 +1086,7 @@ async def spawn_parallel_tracked(
         task_id = f"tracked_{idx}_{agent_id}"
 
         # Stagger delay to avoid API burst
-        task_stagger = idx * stagger_delay
+        task_stagger = reserve_start(idx)
         if task_stagger > 0:
             if on_progress:
                 on_progress(
@@ -1168,11 +1246,30 @@ async def spawn_parallel_tracked(
     semaphore = asyncio.Semaphore(max_concurrent)
 
     async def rate_limited_spawn(idx: int, task: SpawnTask) -> SpawnResult:
-        """Spawn with concurrency limiting."""
-        async with semaphore:
-            result = await tracked_spawn(idx, task)
-            results[idx] = result  # Store in order
-            return result
+        """Spawn with concurrency limiting (after all predecessors finished)."""
+        nonlocal completed_count
+        try:
+            for dep in depends_on[idx] if depends_on is not None else ():
+                await finished[dep].wait()
+
+            async with semaphore:
+                try:
+                    if prepare_task is not None:
+                        task = prepare_task(idx)
+                except Exception as e:
+                    completed_count += 1
+                    metadata["failed_tasks"] += 1
+                    logger.error(f"Task {idx} preparation failed: {e}")
+                    result = SpawnResult(success=False, output="", error=str(e), exit_code=-1)
+                else:
+                    result = await tracked_spawn(idx, task)
+                results[idx] = result  # Store in order
+                if on_result is not None:
+                    on_result(idx, result)
+                return result
+        finally:
+            # Release dependents even if this task failed or was cancelled
+            finished[idx].set()
 
     # Create all tasks
     spawn_tasks = [asyncio.create_task(rate_limited_spawn(i, task)) for i, task in enumerate(tasks)]
@@ -0,0 +1,122 @@
+"""Unit tests for dependency scheduling in spawn_parallel_tracked.
+
+Tests that with depends_on each task starts as soon as its own predecessors
+finished (no wave barrier), that tasks are prepared lazily with predecessor
+results, and that invalid dependency graphs are rejected.
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from aurora_spawner import SpawnResult, SpawnTask, spawn_parallel_tracked
+from aurora_spawner.spawner import _dependency_depth
+
+# Simulated run time per task prompt (seconds)
+DURATIONS = {"slow": 0.3, "fast": 0.01, "after-fast": 0.01, "after-all": 0.01}
+
+
+@pytest.fixture
+def timeline():
+    """Record (event, prompt, time) for every fake spawn."""
+    events: list[tuple[str, str, float]] = []
+
+    async def fake_spawn(task, **kwargs):
+        events.append(("start", task.prompt, time.monotonic()))
+        await asyncio.sleep(DURATIONS.get(task.prompt.split("|")[0], 0.01))
+        events.append(("end", task.prompt, time.monotonic()))
+        return SpawnResult(success=True, output=f"out:{task.prompt}", error=None, exit_code=0)
+
+    with patch("aurora_spawner.spawner.spawn_with_retry_and_fallback", side_effect=fake_spawn):
+        yield events
+
+
+def _run(tasks, **kwargs):
+    return spawn_parallel_tracked(
+        tasks=tasks,
+        stagger_delay=0.0,
+        enable_heartbeat=False,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_dependent_starts_before_unrelated_slow_task_finishes(timeline):
+    """A task whose dependencies are done does not wait for the rest of its wave."""
+    tasks = [SpawnTask(prompt=p) for p in ("slow", "fast", "after-fast", "after-all")]
+
+    results, _ = await _run(tasks, depends_on=[[], [], [1], [0, 2]])
+
+    assert all(r.success for r in results)
+    times = {(event, prompt): t for event, prompt, t in timeline}
+    assert times[("end", "after-fast")] < times[("end", "slow")]
+    assert times[("start", "after-all")] >= times[("end", "slow")]
+
+
+@pytest.mark.asyncio
+async def test_prepare_task_sees_predecessor_results(timeline):
+    """prepare_task is called at start time with predecessor results available."""
+    tasks = [SpawnTask(prompt="fast"), SpawnTask(prompt="after-fast")]
+    finished: dict[int, SpawnResult] = {}
+
+    def prepare(idx):
+        if idx == 1:
+            return SpawnTask(prompt=f"after-fast|{finished[0].output}")
+        return tasks[idx]
+
+    results, _ = await _run(
+        tasks,
+        depends_on=[[], [0]],
+        prepare_task=prepare,
+        on_result=finished.__setitem__,
+    )
+
+    assert results[1].output == "out:after-fast|out:fast"
+    assert set(finished) == {0, 1}
+
+
+@pytest.mark.asyncio
+async def test_waiting_tasks_do_not_hold_slots(timeline):
+    """Blocked tasks leave concurrency slots to runnable ones."""
+    tasks = [SpawnTask(prompt=p) for p in ("slow", "after-all", "fast")]
+
+    await _run(tasks, max_concurrent=2, depends_on=[[], [0], []])
+
+    times = {(event, prompt): t for event, prompt, t in timeline}
+    assert times[("end", "fast")] < times[("end", "slow")]
+
+
+@pytest.mark.asyncio
+async def test_prepare_failure_releases_dependents(timeline):
+    """A task that cannot be prepared fails without blocking its dependents."""
+    tasks = [SpawnTask(prompt="fast"), SpawnTask(prompt="after-fast")]
+
+    def prepare(idx):
+        if idx == 0:
+            raise RuntimeError("bad prompt")
+        return tasks[idx]
+
+    results, metadata = await _run(tasks, depends_on=[[], [0]], prepare_task=prepare)
+
+    assert not results[0].success
+    assert "bad prompt" in results[0].error
+    assert results[1].success
+    assert metadata["failed_tasks"] == 1
+
+
+class TestDependencyDepth:
+    """Validation of dependency graphs."""
+
+    def test_depth(self):
+        assert _dependency_depth([[], [], [1], [0, 2]], 4) == 3
+        assert _dependency_depth([[], []], 2) == 1
+
+    @pytest.mark.parametrize(
+        "depends_on",
+        [[[1], [0]], [[0]], [[5], []], [[]]],
+    )
+    def test_invalid_graphs(self, depends_on):
+        with pytest.raises(ValueError):
+            _dependency_depth(depends_on, 2)
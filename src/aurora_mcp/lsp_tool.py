@@ -26,9 +26,11 @@ def _get_lsp(workspace: Path | None = None):
     # Reinitialize if workspace changed
     if _lsp_instance is None or _workspace_root != ws:
         try:
-            from aurora_lsp.facade import AuroraLSP
+            from aurora_lsp.broker import get_lsp
 
-            _lsp_instance = AuroraLSP(ws)
+            # Shares warm language servers with pre-edit hooks via the LSP
+            # broker (started on demand), else falls back to in-process
+            _lsp_instance = get_lsp(ws, spawn=True)
             _workspace_root = ws
             logger.info(f"Initialized LSP for workspace: {ws}")
         except ImportError:
@@ -6,7 +6,6 @@ Provides enhanced search with call relationships, complexity, and risk assessmen
 from __future__ import annotations
 
 import logging
-import subprocess
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -148,6 +147,7 @@ def _calculate_risk(files: int, refs: int, complexity: int) -> str:
 _store = None
 _retriever = None
 _lsp_instance = None
+_blame_cache = None
 
 
 def _get_store(workspace: Path | None = None):
@@ -196,10 +196,10 @@ def _get_lsp(workspace: Path | None = None):
 
     if _lsp_instance is None:
         try:
-            from aurora_lsp.facade import AuroraLSP
+            from aurora_lsp.broker import get_lsp
 
             ws = workspace or Path.cwd()
-            _lsp_instance = AuroraLSP(ws)
+            _lsp_instance = get_lsp(ws)
             logger.info(f"Initialized LSP for workspace: {ws}")
         except ImportError:
             logger.warning("aurora-lsp not available - results will not include LSP enrichment")
@@ -208,50 +208,77 @@ def _get_lsp(workspace: Path | None = None):
     return _lsp_instance
 
 
-def _get_git_info(file_path: str, workspace: Path) -> str:
-    """Get git commit count and last modified time for a file.
+def _get_git_extractor(workspace: Path):
+    """Create a git signal extractor backed by the persistent blame cache.
+
+    The cache lives next to the memory database and is shared with indexing,
+    so files indexed since their last change are never blamed again. A fresh
+    extractor is created per search so edits and new commits are picked up.
+    """
+    global _blame_cache
+
+    try:
+        from aurora_context_code.git import GitSignalExtractor
+        from aurora_context_code.git_cache import GitBlameCache
+    except ImportError:
+        return None
+
+    db_dir = workspace / ".aurora"
+    if _blame_cache is None and (db_dir / "memory.db").exists():
+        try:
+            _blame_cache = GitBlameCache(db_dir / "git_signals.db")
+        except Exception as e:
+            logger.debug(f"Could not open git blame cache: {e}")
+
+    return GitSignalExtractor(blame_cache=_blame_cache)
+
+
+def _get_git_info(
+    file_path: str,
+    workspace: Path,
+    line_start: int | None = None,
+    line_end: int | None = None,
+    extractor: Any = None,
+) -> str:
+    """Get commit count and last change time for a symbol from git blame.
+
+    Blame is read from the persistent GitBlameCache (keyed on blob hash and
+    HEAD), so a file is blamed at most once per content change instead of
+    spawning git subprocesses for every result.
 
     Args:
         file_path: Relative file path
         workspace: Workspace root directory
+        line_start: First line of the symbol (1-indexed; whole file if None)
+        line_end: Last line of the symbol (1-indexed, inclusive)
+        extractor: GitSignalExtractor to reuse (from _get_git_extractor)
 
     Returns:
-        Git info string like "41 commits, 11h ago" or "-"
+        Git info string like "4 commits, 11h ago" (commits owning lines in the
+        symbol's range) or "-"
     """
     try:
         full_path = workspace / file_path
         if not full_path.exists():
             return "-"
 
-        # Get commit count
-        result = subprocess.run(
-            ["git", "rev-list", "--count", "HEAD", "--", str(full_path)],
-            cwd=workspace,
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
-
-        if result.returncode != 0:
-            return "-"
-
-        commit_count = result.stdout.strip()
+        if extractor is None:
+            extractor = _get_git_extractor(workspace)
+            if extractor is None:
+                return "-"
 
-        # Get last modified time
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%ct", "--", str(full_path)],
-            cwd=workspace,
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
+        if line_start is None:
+            line_start = 1
+            line_end = len(full_path.read_bytes().splitlines())
+        elif line_end is None:
+            line_end = line_start
 
-        if result.returncode != 0 or not result.stdout.strip():
-            return f"{commit_count} commits"
+        timestamps = extractor.get_function_commit_times(str(full_path), line_start, line_end)
+        if not timestamps:
+            return "-"
 
-        timestamp = int(result.stdout.strip())
-        now = datetime.now().timestamp()
-        delta_seconds = int(now - timestamp)
+        commit_count = len(timestamps)
+        delta_seconds = int(datetime.now().timestamp() - timestamps[0])
 
         # Format time ago
         if delta_seconds < 3600:  # < 1 hour
@@ -266,7 +293,7 @@ def _get_git_info(file_path: str, workspace: Path) -> str:
 
         return f"{commit_count} commits, {time_ago}"
 
-    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, ValueError):
+    except (OSError, ValueError):
         return "-"
 
 
@@ -285,158 +312,138 @@ def _ext_to_rg_type(ext: str) -> str:
     }.get(ext, "py")
 
 
-def _count_text_matches(symbol_name: str, workspace: Path, file_path: str = "") -> tuple[int, int]:
-    """Count text matches for a symbol using ripgrep.
+# Maximum in-flight LSP reference requests while enriching search results
+_LSP_CONCURRENCY = 4
 
-    Uses word boundary matching to reduce false positives.
 
-    Args:
-        symbol_name: Name of the symbol to search
-        workspace: Workspace root directory
-        file_path: Optional file path to derive language type from
-
-    Returns:
-        Tuple of (file_count, total_matches)
-    """
-    if not symbol_name:
-        return 0, 0
-
-    rg_type = _ext_to_rg_type(Path(file_path).suffix.lower()) if file_path else "py"
-
-    try:
-        # Use ripgrep with word boundary, count matches per file
-        result = subprocess.run(
-            ["rg", "-w", "-c", "--type", rg_type, symbol_name, "."],
-            cwd=workspace,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-
-        if result.returncode not in (0, 1):  # 1 means no matches
-            return 0, 0
-
-        # Parse output: each line is "file:count"
-        file_count = 0
-        total_matches = 0
-        for line in result.stdout.strip().split("\n"):
-            if ":" in line:
-                file_count += 1
-                try:
-                    count = int(line.split(":")[-1])
-                    total_matches += count
-                except ValueError:
-                    total_matches += 1
-
-        return file_count, total_matches
+def _set_no_usage(result: dict[str, Any]) -> None:
+    result["used_by"] = "-"
+    result["risk"] = "-"
 
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return 0, 0
 
+def _get_usage_batch(results: list[dict[str, Any]], workspace: Path) -> list[dict[str, Any]]:
+    """Add usage count, complexity, and risk to several results at once (fast).
 
-def _get_usage_only(result: dict[str, Any], workspace: Path) -> dict[str, Any]:
-    """Get usage count, complexity, and risk (fast).
-
-    Includes hybrid fallback: if LSP returns 0 refs, uses ripgrep text search
-    to detect cross-package references.
+    Cost does not grow with one subprocess and one file parse per result:
+    - LSP usage lookups run concurrently (at most _LSP_CONCURRENCY in flight)
+    - Symbols with 0 LSP refs share one ripgrep run (hybrid fallback for
+      cross-package references)
+    - Complexity comes from the index-time complexity_score when available
 
     Args:
-        result: Search result dict with metadata
+        results: Search result dicts with metadata
         workspace: Workspace root directory
 
     Returns:
-        Result with usage, risk fields added.
+        The same results with used_by, risk (and unused) fields added.
         Format: "19f 43r c:74" where f=files, r=refs, c=complexity%
     """
-    metadata = result.get("metadata", {})
-    chunk_type = metadata.get("type", "")
+    # (result, file_path, start_line, end_line, symbol_name) per enrichable code result
+    targets: list[tuple[dict[str, Any], str, int, int, str]] = []
+    for result in results:
+        metadata = result.get("metadata", {})
+        file_path = metadata.get("file_path", "")
+        line_start = metadata.get("line_start")
+        line_end = metadata.get("line_end")
 
-    # Only enrich code chunks
-    if chunk_type != "code":
-        result["used_by"] = "-"
-        result["risk"] = "-"
-        return result
+        # Only enrich code chunks
+        if metadata.get("type", "") != "code" or not file_path or not line_start:
+            _set_no_usage(result)
+            continue
 
-    file_path = metadata.get("file_path", "")
-    line_start = metadata.get("line_start")
-    line_end = metadata.get("line_end")
-    symbol_name = metadata.get("name", "")
+        try:
+            start_line = int(line_start)
+            end_line = int(line_end) if line_end else start_line + 50
+        except (ValueError, TypeError):
+            _set_no_usage(result)
+            continue
 
-    if not file_path or not line_start:
-        result["used_by"] = "-"
-        result["risk"] = "-"
-        return result
+        targets.append((result, file_path, start_line, end_line, metadata.get("name", "")))
 
-    try:
-        start_line = int(line_start)
-        end_line = int(line_end) if line_end else start_line + 50
-    except (ValueError, TypeError):
-        result["used_by"] = "-"
-        result["risk"] = "-"
-        return result
+    if not targets:
+        return results
 
-    # Get complexity from tree-sitter (fast, ~10ms)
-    complexity = _get_complexity(file_path, start_line, end_line)
+    files_affected = [0] * len(targets)
+    total_usages = [0] * len(targets)
 
-    # Get usage from LSP
+    # Get usage from LSP; col=10 hits symbol names after 'class ', 'def '
     lsp = _get_lsp(workspace)
-    files_affected = 0
-    total_usages = 0
-
     if lsp is not None:
         try:
-            line_0indexed = start_line - 1
-            col = 10  # Hit symbol names after 'class ', 'def '
-            summary = lsp.get_usage_summary(file_path, line_0indexed, col=col)
-            total_usages = summary.get("total_usages", 0)
-            files_affected = summary.get("files_affected", 0)
-        except Exception as e:
-            logger.debug(f"LSP usage check failed for {file_path}:{start_line}: {e}")
-
-    # Hybrid fallback: if LSP found 0 refs, try text search
-    text_fallback = False
-    if total_usages == 0 and symbol_name:
-        text_files, text_matches = _count_text_matches(symbol_name, workspace, file_path=file_path)
-        if text_matches > 0:
-            # Use text search results as fallback
-            files_affected = text_files
-            total_usages = text_matches
-            text_fallback = True
-            logger.debug(
-                f"Hybrid fallback for {symbol_name}: {text_matches} text matches in {text_files} files"
+            summaries = lsp.get_usage_summaries(
+                [(file_path, start - 1, 10) for _, file_path, start, _, _ in targets],
+                max_concurrency=_LSP_CONCURRENCY,
             )
+            for i, summary in enumerate(summaries):
+                total_usages[i] = summary.get("total_usages", 0)
+                files_affected[i] = summary.get("files_affected", 0)
+        except Exception as e:
+            logger.debug(f"LSP usage check failed: {e}")
 
-    # Format: "19f 43r c:74" or "~19f ~43r c:74" for text fallback
-    if files_affected > 0 or complexity >= 0:
-        parts = []
-        if files_affected > 0:
-            # Use ~ prefix to indicate text search (approximate)
-            prefix = "~" if text_fallback else ""
-            parts.append(f"{prefix}{files_affected}f {prefix}{total_usages}r")
-        if complexity >= 0:
-            parts.append(f"c:{complexity}")
-        result["used_by"] = " ".join(parts) if parts else "-"
-    else:
-        result["used_by"] = "-"
-
-    # Calculate risk
-    result["risk"] = _calculate_risk(files_affected, total_usages, complexity)
-
-    # #UNUSED marker: flag symbols with very low usage (candidates for removal)
-    if total_usages <= 2:
-        result["unused"] = True
+    # Hybrid fallback: symbols with 0 LSP refs share a single text search
+    no_refs = [i for i, target in enumerate(targets) if total_usages[i] == 0 and target[4]]
+    text_fallback: set[int] = set()
+    if no_refs:
+        from aurora_cli.commands.memory import count_text_matches_batch
 
-    return result
+        rg_types = [_ext_to_rg_type(Path(targets[i][1]).suffix.lower()) for i in no_refs]
+        text_counts = count_text_matches_batch(
+            [targets[i][4] for i in no_refs], workspace, rg_types=rg_types
+        )
+        for i in no_refs:
+            symbol_name = targets[i][4]
+            text_files, text_matches, _ = text_counts.get(symbol_name, (0, 0, []))
+            if text_matches > 0:
+                files_affected[i] = text_files
+                total_usages[i] = text_matches
+                text_fallback.add(i)
+                logger.debug(
+                    f"Hybrid fallback for {symbol_name}: "
+                    f"{text_matches} text matches in {text_files} files"
+                )
+
+    for i, (result, file_path, start_line, end_line, _) in enumerate(targets):
+        # Complexity: index-time score if available, else re-parse with tree-sitter
+        complexity_score = result["metadata"].get("complexity_score")
+        if complexity_score is not None:
+            complexity = min(int(float(complexity_score) * 100), 99)
+        else:
+            complexity = _get_complexity(file_path, start_line, end_line)
+
+        # Format: "19f 43r c:74" or "~19f ~43r c:74" for text fallback
+        if files_affected[i] > 0 or complexity >= 0:
+            parts = []
+            if files_affected[i] > 0:
+                # Use ~ prefix to indicate text search (approximate)
+                prefix = "~" if i in text_fallback else ""
+                parts.append(f"{prefix}{files_affected[i]}f {prefix}{total_usages[i]}r")
+            if complexity >= 0:
+                parts.append(f"c:{complexity}")
+            result["used_by"] = " ".join(parts) if parts else "-"
+        else:
+            result["used_by"] = "-"
 
+        # Calculate risk
+        result["risk"] = _calculate_risk(files_affected[i], total_usages[i], complexity)
 
-def _enrich_full(result: dict[str, Any], workspace: Path) -> dict[str, Any]:
+        # #UNUSED marker: flag symbols with very low usage (candidates for removal)
+        if total_usages[i] <= 2:
+            result["unused"] = True
+
+    return results
+
+
+def _enrich_full(
+    result: dict[str, Any], workspace: Path, git_extractor: Any = None
+) -> dict[str, Any]:
     """Full enrichment with callers/callees/git (slow).
 
-    Assumes _get_usage_only was already called.
+    Assumes _get_usage_batch was already called.
 
     Args:
         result: Search result dict with metadata (already has used_by)
         workspace: Workspace root directory
+        git_extractor: GitSignalExtractor shared across the results of one search
 
     Returns:
         Enriched result with called_by, calling, git fields added
@@ -453,11 +460,22 @@ def _enrich_full(result: dict[str, Any], workspace: Path) -> dict[str, Any]:
     lsp = _get_lsp(workspace)
     file_path = metadata.get("file_path", "")
     line_start = metadata.get("line_start")
+    line_end = metadata.get("line_end")
+
+    def git_info() -> str:
+        if not file_path:
+            return "-"
+        try:
+            start = int(line_start) if line_start else None
+            end = int(line_end) if line_end else None
+        except (ValueError, TypeError):
+            start = end = None
+        return _get_git_info(file_path, workspace, start, end, extractor=git_extractor)
 
     if lsp is None or not file_path or not line_start:
         result["called_by"] = []
         result["calling"] = []
-        result["git"] = _get_git_info(file_path, workspace) if file_path else "-"
+        result["git"] = git_info()
         return result
 
     try:
@@ -498,7 +516,7 @@ def _enrich_full(result: dict[str, Any], workspace: Path) -> dict[str, Any]:
         result["calling"] = []
 
     # Add git info
-    result["git"] = _get_git_info(file_path, workspace)
+    result["git"] = git_info()
     return result
 
 
@@ -525,9 +543,9 @@ def mem_search(
 
     IMPLEMENTATION FILES:
     - MCP tool: src/aurora_mcp/mem_search_tool.py (this file)
-    - Complexity: _get_complexity() in this file (Python only, tree-sitter)
+    - Complexity: index-time complexity_score; _get_complexity() fallback (tree-sitter)
     - Risk calc: _calculate_risk() in this file
-    - LSP usage: _get_usage_only() in this file → LSP facade
+    - LSP usage: _get_usage_batch() in this file → LSP facade
     - Retrieval: packages/cli/src/aurora_cli/memory/retrieval.py
     - LSP facade: packages/lsp/src/aurora_lsp/facade.py
 
@@ -571,6 +589,10 @@ def mem_search(
         logger.error(f"Search failed: {e}")
         return []
 
+    # One extractor per search: each file is blamed at most once (or not at all
+    # when the persistent cache is current)
+    git_extractor = _get_git_extractor(workspace) if enrich else None
+
     # Convert and enrich results
     enriched_results = []
     for result in raw_results:
@@ -601,22 +623,28 @@ def mem_search(
             "path": full_path,  # Full path for navigation
             "name": metadata.get("name", ""),  # Function/class name
             "lines": lines_str,
-            "used_by": "-",  # Will be set by _get_usage_only
-            "risk": "-",  # Will be set by _get_usage_only
+            "used_by": "-",  # Will be set by _get_usage_batch
+            "risk": "-",  # Will be set by _get_usage_batch
             "score": round(result.get("hybrid_score", 0.0), 3),
             "metadata": metadata,  # Include metadata for LSP enrichment
         }
 
-        # Always get usage count (fast, matches CLI behavior)
-        enriched = _get_usage_only(enriched, workspace)
+        enriched_results.append(enriched)
+
+    enriched_results = enriched_results[:limit]  # Ensure limit
 
+    # Always get usage counts, in one batch for all results (fast, matches CLI behavior)
+    _get_usage_batch(enriched_results, workspace)
+
+    for enriched in enriched_results:
         # Optional full enrichment (slow - adds callers, callees, git)
         if enrich:
-            enriched = _enrich_full(enriched, workspace)
+            _enrich_full(enriched, workspace, git_extractor)
 
         # Remove metadata from final output (internal use only)
         enriched.pop("metadata", None)
 
-        enriched_results.append(enriched)
+    if _blame_cache is not None and git_extractor is not None:
+        _blame_cache.flush()
 
-    return enriched_results[:limit]  # Ensure limit
+    return enriched_results
@@ -0,0 +1,13 @@
+"""Pytest fixtures for MCP tool tests.
+
+Keeps tests off the shared LSP broker so they use (patched) in-process
+AuroraLSP instances and never start background processes.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def disable_lsp_broker(monkeypatch):
+    """Disable the LSP broker for every test."""
+    monkeypatch.setenv("AURORA_LSP_BROKER", "0")
@@ -0,0 +1,146 @@
+"""Unit tests for mem_search MCP tool enrichment helpers."""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import aurora_mcp.mem_search_tool as mem_search_module
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.delenv("AURORA_SKIP_GIT", raising=False)
+    _git(tmp_path, "init", "-q")
+    (tmp_path / "mod.py").write_text("def a():\n    return 1\n\n\ndef b():\n    return 2\n")
+    _git(tmp_path, "add", "mod.py")
+    _git(tmp_path, "commit", "-q", "-m", "first")
+    (tmp_path / "mod.py").write_text("def a():\n    return 1\n\n\ndef b():\n    return 3\n")
+    _git(tmp_path, "commit", "-q", "-am", "second")
+    (tmp_path / ".aurora").mkdir()
+    (tmp_path / ".aurora" / "memory.db").touch()
+
+    monkeypatch.setattr(mem_search_module, "_blame_cache", None)
+    yield tmp_path
+    if mem_search_module._blame_cache is not None:
+        mem_search_module._blame_cache.close()
+
+
+class TestGitInfo:
+    """Git enrichment reads blame through the persistent GitBlameCache."""
+
+    def test_counts_commits_in_symbol_range(self, repo):
+        extractor = mem_search_module._get_git_extractor(repo)
+
+        assert mem_search_module._get_git_info("mod.py", repo, 1, 2, extractor).startswith(
+            "1 commits, "
+        )
+        assert mem_search_module._get_git_info("mod.py", repo, 1, 6, extractor).startswith(
+            "2 commits, "
+        )
+        assert mem_search_module._get_git_info("mod.py", repo, extractor=extractor).startswith(
+            "2 commits, "
+        )
+
+    def test_cached_blame_reused_across_searches(self, repo):
+        mem_search_module._get_git_info("mod.py", repo, 1, 2)
+        mem_search_module._blame_cache.flush()
+
+        commands = []
+        real_run = subprocess.run
+
+        def recording_run(cmd, *args, **kwargs):
+            commands.append(cmd)
+            return real_run(cmd, *args, **kwargs)
+
+        with patch("aurora_context_code.git.subprocess.run", side_effect=recording_run):
+            info = mem_search_module._get_git_info("mod.py", repo, 6, 6)
+
+        assert info.startswith("1 commits, ")
+        assert not any("blame" in cmd for cmd in commands)
+        assert (repo / ".aurora" / "git_signals.db").exists()
+
+    def test_missing_file(self, repo):
+        assert mem_search_module._get_git_info("missing.py", repo, 1, 2) == "-"
+
+
+def _code_result(name, line_start, complexity_score=0.2, file_path="pkg/mod.py"):
+    return {
+        "name": name,
+        "metadata": {
+            "type": "code",
+            "name": name,
+            "file_path": file_path,
+            "line_start": line_start,
+            "line_end": line_start + 3,
+            "complexity_score": complexity_score,
+        },
+    }
+
+
+@pytest.fixture
+def fake_lsp(monkeypatch):
+    lsp = MagicMock()
+    monkeypatch.setattr(mem_search_module, "_lsp_instance", lsp)
+    return lsp
+
+
+class TestUsageBatch:
+    """Usage enrichment runs once per search, not once per result."""
+
+    def test_one_lsp_batch_and_stored_complexity(self, fake_lsp, tmp_path):
+        fake_lsp.get_usage_summaries.return_value = [
+            {"total_usages": 12, "files_affected": 3},
+            {"total_usages": 4, "files_affected": 1},
+        ]
+        results = [_code_result("alpha", 1, 0.5), _code_result("beta", 10, 0.0)]
+
+        with patch.object(mem_search_module, "_get_complexity") as get_complexity:
+            mem_search_module._get_usage_batch(results, tmp_path)
+
+        fake_lsp.get_usage_summaries.assert_called_once_with(
+            [("pkg/mod.py", 0, 10), ("pkg/mod.py", 9, 10)],
+            max_concurrency=mem_search_module._LSP_CONCURRENCY,
+        )
+        get_complexity.assert_not_called()
+        assert results[0]["used_by"] == "3f 12r c:50"
+        assert results[0]["risk"] == "MED"
+        assert results[1]["used_by"] == "1f 4r c:0"
+
+    def test_zero_refs_share_one_text_search(self, fake_lsp, tmp_path):
+        fake_lsp.get_usage_summaries.return_value = [{}, {}, {}]
+        results = [
+            _code_result("alpha", 1),
+            _code_result("beta", 10),
+            _code_result("gamma", 1, file_path="web/app.ts"),
+        ]
+        rg_output = "./pkg/a.py:3:alpha\n./pkg/b.py:1:alpha\n./pkg/b.py:4:beta\n"
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=rg_output)
+
+        with patch("subprocess.run", return_value=completed) as run:
+            mem_search_module._get_usage_batch(results, tmp_path)
+
+        assert run.call_count == 1
+        args = run.call_args.args[0]
+        assert args.count("--type") == 2 and "ts" in args
+        assert results[0]["used_by"] == "~2f ~2r c:20"
+        assert results[1]["used_by"] == "~1f ~1r c:20"
+        assert results[2]["used_by"] == "c:20"
+
+    def test_non_code_results_skipped(self, fake_lsp, tmp_path):
+        results = [{"metadata": {"type": "kb", "file_path": "docs/a.md", "line_start": 1}}]
+
+        mem_search_module._get_usage_batch(results, tmp_path)
+
+        fake_lsp.get_usage_summaries.assert_not_called()
+        assert results[0]["used_by"] == "-"
+        assert results[0]["risk"] == "-"
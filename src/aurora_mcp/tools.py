@@ -12,6 +12,7 @@ import logging
 from typing import Any
 
 from aurora_cli.memory_manager import MemoryManager
+from aurora_cli.search_daemon import DaemonEmbeddingProvider, SearchDaemonClient
 from aurora_context_code.registry import get_global_registry
 from aurora_context_code.semantic import EmbeddingProvider
 from aurora_context_code.semantic.hybrid_retriever import HybridRetriever
@@ -41,7 +42,7 @@ class AuroraMCPTools:
         # Initialize components lazily (on first use)
         self._store: SQLiteStore | None = None
         self._activation_engine: ActivationEngine | None = None
-        self._embedding_provider: EmbeddingProvider | None = None
+        self._embedding_provider: EmbeddingProvider | DaemonEmbeddingProvider | None = None
         self._retriever: HybridRetriever | None = None
         self._memory_manager: MemoryManager | None = None
         self._parser_registry = None  # Lazy initialization
@@ -59,7 +60,13 @@ class AuroraMCPTools:
             self._activation_engine = ActivationEngine()
 
         if self._embedding_provider is None:
-            self._embedding_provider = EmbeddingProvider()
+            # Borrow the warm model from a running search daemon if there is one
+            daemon = SearchDaemonClient.connect(self.db_path)
+            if daemon is not None:
+                logger.info(f"Using search daemon at {daemon.socket_path} for embeddings")
+                self._embedding_provider = DaemonEmbeddingProvider(daemon)
+            else:
+                self._embedding_provider = EmbeddingProvider()
 
         if self._retriever is None:
             self._retriever = HybridRetriever(